@@ -0,0 +1,227 @@
+# File: src/api/cache.py
+
+"""
+Two-tier cache for API responses.
+
+Responses are kept in an in-memory LRU and, once a persistent store is
+attached (AppDataDB), in DuckDB so they survive restarts. Each endpoint
+has a TTL from the API profile's "cache_ttl" section. When an entry is
+past its TTL but younger than the stale limit (the profile's "max_stale"
+for the endpoint, or the cache-wide default), it is returned at once and
+refreshed on a background thread (stale-while-revalidate). Stored
+entries past the stale limit are never served again, so they are pruned
+whenever a store is attached.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Protocol, Set, Tuple
+
+from src.config.config import DEFAULT_API_PROFILE, get_active_api_config
+from src.utils.validation import _sanitize_for_logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+# Stale entries older than this are treated as missing.
+DEFAULT_MAX_STALE_SECONDS = 24 * 3600
+
+
+class ResponseStore(Protocol):
+    """Persistent second tier; implemented by AppDataDB."""
+
+    def load_cached_response(self, key: str) -> Optional[Tuple[Any, float]]: ...
+
+    def save_cached_response(self, key: str, value: Any, stored_at: float) -> None: ...
+
+    def prune_cached_responses(self, max_age_seconds: float) -> None: ...
+
+
+def endpoint_ttl(endpoint_key: str) -> float:
+    """TTL in seconds for an endpoint; 0 disables caching."""
+    ttls: Dict[str, Any] = get_active_api_config().get("cache_ttl") or {}
+    default_ttls: Dict[str, Any] = DEFAULT_API_PROFILE.get("cache_ttl", {})
+    try:
+        return float(ttls.get(endpoint_key, default_ttls.get(endpoint_key, 0)))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def endpoint_max_stale(endpoint_key: str) -> Optional[float]:
+    """Stale limit in seconds for an endpoint; None uses the cache default."""
+    limits: Dict[str, Any] = get_active_api_config().get("max_stale") or {}
+    default_limits: Dict[str, Any] = DEFAULT_API_PROFILE.get("max_stale", {})
+    limit = limits.get(endpoint_key, default_limits.get(endpoint_key))
+    if limit is None:
+        return None
+    try:
+        return float(limit)
+    except (TypeError, ValueError):
+        return None
+
+
+class ResponseCache:
+    """In-memory LRU in front of an optional persistent store."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_stale_seconds: float = DEFAULT_MAX_STALE_SECONDS,
+        store: Optional[ResponseStore] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_stale_seconds = max_stale_seconds
+        self._store = store
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._revalidating: Set[str] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stats: Dict[str, int] = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "store_hits": 0,
+            "revalidations": 0,
+            "errors": 0,
+        }
+
+    def attach_store(self, store: Optional[ResponseStore]) -> None:
+        self._store = store
+        if store is None:
+            return
+        try:
+            store.prune_cached_responses(self.max_stale_seconds)
+        except Exception as e:
+            logger.warning(f"Response cache store prune failed: {_sanitize_for_logging(e)}")
+
+    def get(
+        self,
+        key: str,
+        ttl: float,
+        fetch: Callable[[], Any],
+        max_stale: Optional[float] = None,
+    ) -> Any:
+        """
+        Returns the cached value for key, calling fetch() on a miss.
+        An entry past ttl is served while it is refreshed only while it is
+        younger than max_stale (default: max_stale_seconds).
+        None results are not cached.
+        """
+        if max_stale is None:
+            max_stale = self.max_stale_seconds
+        entry = self._lookup(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = time.time() - stored_at
+            if age < ttl:
+                self._count("hits")
+                return value
+            if age < max_stale:
+                self._count("stale_hits")
+                self._revalidate(key, fetch)
+                return value
+
+        self._count("misses")
+        return self._fetch_and_store(key, fetch)
+
+    def _lookup(self, key: str) -> Optional[Tuple[Any, float]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self._store is None:
+            return None
+        try:
+            entry = self._store.load_cached_response(key)
+        except Exception as e:
+            logger.warning(f"Response cache store read failed: {_sanitize_for_logging(e)}")
+            return None
+        if entry is not None:
+            self._count("store_hits")
+            self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: Tuple[Any, float]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _fetch_and_store(self, key: str, fetch: Callable[[], Any]) -> Any:
+        try:
+            value = fetch()
+        except Exception:
+            self._count("errors")
+            raise
+        if value is None:
+            self._count("errors")
+            return None
+        stored_at = time.time()
+        self._remember(key, (value, stored_at))
+        if self._store is not None:
+            try:
+                self._store.save_cached_response(key, value, stored_at)
+            except Exception as e:
+                logger.warning(
+                    f"Response cache store write failed: {_sanitize_for_logging(e)}"
+                )
+        return value
+
+    def _revalidate(self, key: str, fetch: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="CacheRevalidate"
+                )
+            executor = self._executor
+        self._count("revalidations")
+
+        def run() -> None:
+            try:
+                self._fetch_and_store(key, fetch)
+            except Exception as e:
+                logger.debug(f"Background revalidation failed: {_sanitize_for_logging(e)}")
+            finally:
+                with self._lock:
+                    self._revalidating.discard(key)
+
+        executor.submit(run)
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters plus the current in-memory size and hit ratio."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_ratio"] = (
+            (stats["hits"] + stats["stale_hits"]) / lookups if lookups else 0.0
+        )
+        return stats
+
+    def clear(self) -> None:
+        """Drops the in-memory tier; the persistent tier is left alone."""
+        with self._lock:
+            self._entries.clear()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+In-process mock of the Kaspa REST API for offline load tests.
+
+MockKaspaAPI serves every endpoint of DEFAULT_API_PROFILE on 127.0.0.1 from
+a background thread, so the real fetch pipeline (requests session,
+retries, response cache, rate limiter) can be driven without
+api.kaspa.org:
+
+    with MockKaspaAPI(histories={address: 100_000}, latency=0.05) as api:
+        CONFIG["api"]["profiles"]["Mock"] = api.api_profile()
+        ...
+
+Address histories are synthetic full transactions of any size. They are
+generated in chunks of HISTORY_CHUNK transactions on demand (see
+synthetic_data.generate_raw_transactions), so paging through a 10M
+transaction history never holds it in memory, and the same seed always
+serves the same pages.
+
+Faults are configurable per server: a fixed latency plus random jitter,
+a share of requests answered with a 5xx, a share answered with 429 and
+Retry-After, and an optional server-side requests-per-second limit that
+answers 429 with the exact wait, like the real API's limiter.
+
+It can also be run standalone and used from the app through a custom
+API profile:
+
+    python -m src.api.mock_server --port 8000 --history 50000 --latency 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from src.config.config import DEFAULT_API_PROFILE
+from src.utils.synthetic_data import (
+    DEFAULT_START_TIME_MS,
+    SOMPI_PER_KAS,
+    generate_raw_transactions,
+    random_address,
+)
+
+logger = logging.getLogger(__name__)
+
+# Transactions generated together; chunks never overlap in time because a
+# generated transaction is at most MAX_TX_SPACING_MS after the previous one.
+HISTORY_CHUNK: int = 500
+MAX_TX_SPACING_MS: int = 600_000
+MAX_CACHED_CHUNKS: int = 256
+MAX_PAGE_LIMIT: int = 500
+DEFAULT_PAGE_LIMIT: int = 50
+DEFAULT_NAME_COUNT: int = 50
+TOP_ADDRESS_COUNT: int = 100
+
+Response = Tuple[int, Any, Dict[str, str]]
+
+
+def _derived_seed(seed: int, *parts: Any) -> int:
+    key = ":".join(str(p) for p in (seed, *parts))
+    return zlib.crc32(key.encode("utf-8"))
+
+
+@dataclass
+class MockRequest:
+    """A routed GET: path parameters, query string and headers."""
+
+    params: Dict[str, str]
+    query: Dict[str, List[str]]
+    headers: Dict[str, str]
+
+    def query_int(self, name: str, default: int) -> int:
+        values = self.query.get(name)
+        return int(values[0]) if values else default
+
+
+class MockKaspaAPI:
+    """A threaded HTTP server imitating api.kaspa.org."""
+
+    def __init__(
+        self,
+        histories: Optional[Dict[str, int]] = None,
+        default_history: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        requests_per_second: Optional[float] = None,
+        burst: int = 10,
+        names: Optional[List[Dict[str, str]]] = None,
+        seed: int = 0,
+        port: int = 0,
+    ) -> None:
+        self.histories: Dict[str, int] = dict(histories or {})
+        self.default_history = default_history
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.seed = seed
+        self.port = port
+
+        rng = random.Random(seed)
+        self.names: List[Dict[str, str]] = (
+            names
+            if names is not None
+            else [
+                {"address": random_address(rng), "name": f"Mock Name {i}"}
+                for i in range(DEFAULT_NAME_COUNT)
+            ]
+        )
+        self.names_etag = f'"{zlib.crc32(json.dumps(self.names).encode()):08x}"'
+        self.names_modified = formatdate(DEFAULT_START_TIME_MS / 1000, usegmt=True)
+
+        self.requests: Counter[str] = Counter()
+        self.responses: Counter[int] = Counter()
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._chunks: OrderedDict[Tuple[str, int, int], List[Dict[str, Any]]] = OrderedDict()
+
+        self._routes: List[Tuple[str, re.Pattern[str], Callable[[MockRequest], Response]]] = [
+            ("balance", re.compile(r"/addresses/(?P<address>[^/]+)/balance"), self._balance),
+            (
+                "full_transactions",
+                re.compile(r"/addresses/(?P<address>[^/]+)/full-transactions"),
+                self._full_transactions,
+            ),
+            ("top_addresses", re.compile(r"/addresses/top"), self._top_addresses),
+            ("address_names", re.compile(r"/addresses/names"), self._address_names),
+            ("blockdag_info", re.compile(r"/info/blockdag"), self._blockdag_info),
+            ("blockreward", re.compile(r"/info/blockreward"), self._blockreward),
+            ("coinsupply", re.compile(r"/info/coinsupply"), self._coinsupply),
+            ("halving", re.compile(r"/info/halving"), self._halving),
+            ("max_hashrate", re.compile(r"/info/hashrate/max"), self._max_hashrate),
+            ("hashrate", re.compile(r"/info/hashrate"), self._hashrate),
+            ("network", re.compile(r"/info/network"), self._blockdag_info),
+            ("kaspad", re.compile(r"/info/kaspad"), self._kaspad),
+        ]
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # --- Lifecycle ---
+
+    @property
+    def base_url(self) -> str:
+        if self._httpd is None:
+            raise RuntimeError("Mock API server is not running.")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """Starts serving and returns the base URL."""
+        if self._httpd is not None:
+            return self.base_url
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", self.port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            kwargs={"poll_interval": 0.1},
+            daemon=True,
+            name="MockKaspaAPI",
+        )
+        self._thread.start()
+        logger.info(f"Mock Kaspa API listening on {self.base_url}")
+        return self.base_url
+
+    def stop(self) -> None:
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._httpd = None
+        self._thread = None
+
+    def __enter__(self) -> "MockKaspaAPI":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def api_profile(self, **overrides: Any) -> Dict[str, Any]:
+        """A copy of DEFAULT_API_PROFILE pointing at this server."""
+        profile = copy.deepcopy(DEFAULT_API_PROFILE)
+        profile["base_url"] = self.base_url
+        profile.update(overrides)
+        return profile
+
+    def stats(self) -> Dict[str, Any]:
+        """Requests per endpoint and responses per status code."""
+        with self._lock:
+            return {
+                "requests": dict(self.requests),
+                "responses": dict(self.responses),
+                "total": sum(self.requests.values()),
+            }
+
+    # --- Request handling ---
+
+    def _handler_class(self) -> type:
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug("Mock API: " + format % args)
+
+            def do_GET(self) -> None:
+                status, body, headers = api.handle(self.path, dict(self.headers.items()))
+                payload = b"" if body is None else json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if body is not None:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                try:
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # The client gave up (timeout or cancel).
+
+        return Handler
+
+    def handle(self, path: str, headers: Dict[str, str]) -> Response:
+        """Status, JSON body and headers for a GET of path."""
+        parsed = urlparse(path)
+        name, params, route = self._route(parsed.path)
+        with self._lock:
+            self.requests[name] += 1
+        response = self._inject_faults() or (
+            route(MockRequest(params, parse_qs(parsed.query), headers))
+            if route is not None
+            else (404, {"detail": "Not Found"}, {})
+        )
+        with self._lock:
+            self.responses[response[0]] += 1
+        return response
+
+    def _route(
+        self, path: str
+    ) -> Tuple[str, Dict[str, str], Optional[Callable[[MockRequest], Response]]]:
+        for name, pattern, route in self._routes:
+            match = pattern.fullmatch(path)
+            if match:
+                return name, match.groupdict(), route
+        return "unknown", {}, None
+
+    def _rate_limited(self) -> Optional[float]:
+        """Seconds until a token is free, or None if the request may pass."""
+        if not self.requests_per_second:
+            return None
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.burst),
+                self._tokens + (now - self._last_refill) * self.requests_per_second,
+            )
+            self._last_refill = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return None
+            return (1 - self._tokens) / self.requests_per_second
+
+    def _inject_faults(self) -> Optional[Response]:
+        wait = self._rate_limited()
+        if wait is not None:
+            return (
+                429,
+                {"detail": "Too Many Requests"},
+                {"Retry-After": str(math.ceil(wait))},
+            )
+        with self._lock:
+            delay = self.latency + self._rng.random() * self.jitter
+            roll = self._rng.random()
+        if delay > 0:
+            time.sleep(delay)
+        if roll < self.throttle_rate:
+            return (
+                429,
+                {"detail": "Too Many Requests"},
+                {"Retry-After": str(math.ceil(self.retry_after))},
+            )
+        if roll < self.throttle_rate + self.error_rate:
+            return self.error_status, {"detail": "Simulated server error"}, {}
+        return None
+
+    # --- Synthetic histories ---
+
+    def history_size(self, address: str) -> int:
+        return self.histories.get(address, self.default_history)
+
+    def _chunk(self, address: str, index: int, size: int) -> List[Dict[str, Any]]:
+        """Transactions index * HISTORY_CHUNK onwards, oldest first."""
+        key = (address, index, size)
+        with self._lock:
+            chunk = self._chunks.get(key)
+            if chunk is not None:
+                self._chunks.move_to_end(key)
+                return chunk
+        chunk = generate_raw_transactions(
+            address,
+            size,
+            seed=_derived_seed(self.seed, address, index),
+            start_time_ms=DEFAULT_START_TIME_MS + index * HISTORY_CHUNK * MAX_TX_SPACING_MS,
+        )
+        chunk.reverse()
+        with self._lock:
+            self._chunks[key] = chunk
+            while len(self._chunks) > MAX_CACHED_CHUNKS:
+                self._chunks.popitem(last=False)
+        return chunk
+
+    def history_page(self, address: str, offset: int, limit: int) -> List[Dict[str, Any]]:
+        """Transactions offset .. offset + limit - 1 of address, newest first."""
+        count = self.history_size(address)
+        page: List[Dict[str, Any]] = []
+        # Position in the oldest-first history of each transaction on the page.
+        newest = count - 1 - offset
+        oldest = max(0, count - offset - limit)
+        for position in range(newest, oldest - 1, -1):
+            index = position // HISTORY_CHUNK
+            size = min(HISTORY_CHUNK, count - index * HISTORY_CHUNK)
+            page.append(self._chunk(address, index, size)[position % HISTORY_CHUNK])
+        return page
+
+    # --- Endpoints ---
+
+    @staticmethod
+    def _invalid(detail: str) -> Response:
+        return 422, {"detail": detail}, {}
+
+    def _balance(self, request: MockRequest) -> Response:
+        address = request.params["address"]
+        if not address.startswith("kaspa:"):
+            return 400, {"detail": "Invalid address"}, {}
+        rng = random.Random(_derived_seed(self.seed, address, "balance"))
+        balance = rng.randint(0, 10_000_000) * SOMPI_PER_KAS // 100
+        return 200, {"address": address, "balance": balance}, {}
+
+    def _full_transactions(self, request: MockRequest) -> Response:
+        address = request.params["address"]
+        if not address.startswith("kaspa:"):
+            return 400, {"detail": "Invalid address"}, {}
+        try:
+            limit = request.query_int("limit", DEFAULT_PAGE_LIMIT)
+            offset = request.query_int("offset", 0)
+        except ValueError:
+            return self._invalid("limit and offset must be integers")
+        if not 1 <= limit <= MAX_PAGE_LIMIT or offset < 0:
+            return self._invalid(f"limit must be 1-{MAX_PAGE_LIMIT} and offset >= 0")
+        return 200, self.history_page(address, offset, limit), {}
+
+    def _top_addresses(self, request: MockRequest) -> Response:
+        try:
+            snapshots = max(1, request.query_int("limit", 1))
+        except ValueError:
+            return self._invalid("limit must be an integer")
+        rng = random.Random(_derived_seed(self.seed, "top"))
+        amounts = sorted((rng.uniform(1e6, 1e9) for _ in range(TOP_ADDRESS_COUNT)), reverse=True)
+        ranking = [
+            {"rank": rank, "address": random_address(rng), "amount": round(amount, 8)}
+            for rank, amount in enumerate(amounts)
+        ]
+        now_ms = int(time.time() * 1000)
+        body = [
+            {"timestamp": now_ms - i * 3_600_000, "ranking": ranking} for i in range(snapshots)
+        ]
+        return 200, body, {}
+
+    def _address_names(self, request: MockRequest) -> Response:
+        validators = {"ETag": self.names_etag, "Last-Modified": self.names_modified}
+        if request.headers.get("If-None-Match") == self.names_etag:
+            return 304, None, validators
+        return 200, self.names, validators
+
+    def _blockdag_info(self, request: MockRequest) -> Response:
+        daa_score = int(time.time() * 10)
+        return (
+            200,
+            {
+                "networkName": "kaspa-mainnet",
+                "blockCount": str(daa_score // 3),
+                "headerCount": str(daa_score // 3),
+                "tipHashes": ["%064x" % daa_score],
+                "difficulty": 4.4e15,
+                "pastMedianTime": str(int(time.time() * 1000) - 60_000),
+                "virtualParentHashes": ["%064x" % (daa_score - 1)],
+                "pruningPointHash": "%064x" % (daa_score // 2),
+                "virtualDaaScore": str(daa_score),
+            },
+            {},
+        )
+
+    def _blockreward(self, request: MockRequest) -> Response:
+        return 200, {"blockreward": 3.27}, {}
+
+    def _coinsupply(self, request: MockRequest) -> Response:
+        return (
+            200,
+            {
+                "circulatingSupply": str(26_300_000_000 * SOMPI_PER_KAS),
+                "maxSupply": str(28_700_000_000 * SOMPI_PER_KAS),
+            },
+            {},
+        )
+
+    def _halving(self, request: MockRequest) -> Response:
+        next_halving = int(time.time()) + 30 * 86_400
+        return (
+            200,
+            {
+                "nextHalvingTimestamp": next_halving,
+                "nextHalvingDate": formatdate(next_halving, usegmt=True),
+                "nextHalvingAmount": 3.08,
+            },
+            {},
+        )
+
+    def _hashrate(self, request: MockRequest) -> Response:
+        return 200, {"hashrate": 425_000.0}, {}
+
+    def _max_hashrate(self, request: MockRequest) -> Response:
+        return (
+            200,
+            {
+                "hashrate": 1_200_000.0,
+                "blockheader": {"hash": "%064x" % 1, "timestamp": "1735689600000"},
+            },
+            {},
+        )
+
+    def _kaspad(self, request: MockRequest) -> Response:
+        return (
+            200,
+            {
+                "mempoolSize": "42",
+                "serverVersion": "1.0.0",
+                "isUtxoIndexed": True,
+                "isSynced": True,
+                "p2pIdHashed": "%064x" % self.seed,
+            },
+            {},
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Mock Kaspa REST API server")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--history", type=int, default=10_000, help="Transactions served for every address."
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added to each response."
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Random extra seconds, 0..jitter."
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of 503 responses.")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Share of 429 responses.")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--rps", type=float, default=None, help="Server-side rate limit.")
+    parser.add_argument("--seed", type=int, default=0)
+    options = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    api = MockKaspaAPI(
+        default_history=options.history,
+        latency=options.latency,
+        jitter=options.jitter,
+        error_rate=options.error_rate,
+        throttle_rate=options.throttle_rate,
+        retry_after=options.retry_after,
+        requests_per_second=options.rps,
+        seed=options.seed,
+        port=options.port,
+    )
+    print(f"Serving the mock Kaspa API at {api.start()} (Ctrl+C to stop)", flush=True)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api.stop()
+        print(json.dumps(api.stats(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,6 +11,9 @@ from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 import requests
 
+from src.api.cache import endpoint_max_stale, endpoint_ttl, response_cache
+from src.api.rate_limit import get_host_guard
+from src.api.single_flight import SingleFlight
 from src.config.config import APP_NAME, APP_VERSION, CONFIG, get_active_api_config
 from src.utils.errors import APIError
 from src.utils.formatting import mask_address
@@ -31,6 +34,12 @@ _session.headers.update(
     }
 )
 
+# Upper bound of the exponential backoff between failed attempts.
+MAX_BACKOFF_SECONDS: float = 30.0
+
+# Concurrent identical GETs share one request; see _get_with_retries.
+_in_flight: SingleFlight[Optional[requests.Response]] = SingleFlight()
+
 
 def _sanitize_url_for_logging(url: str) -> str:
     """Removes sensitive query parameters from a URL for safe logging."""
@@ -72,39 +81,124 @@ def _make_api_request(url: str) -> Optional[Any]:
     Returns:
          The JSON response as a Python object, or None if the request fails.
     """
+    response = _get_with_retries(url)
+    if response is None:
+        return None
+    try:
+        return response.json()
+    except ValueError as e:
+        logger.error(
+            f"Invalid JSON from {_sanitize_url_for_logging(url)}: {_sanitize_for_logging(e)}"
+        )
+        return None
+
+
+def _cached_api_request(url: str, endpoint_key: str) -> Optional[Any]:
+    """
+    _make_api_request through the shared response cache, using the TTL the
+    API profile sets for endpoint_key. Stale entries within the endpoint's
+    stale limit are returned at once and refreshed in the background.
+    """
+    ttl: float = endpoint_ttl(endpoint_key)
+    if ttl <= 0:
+        return _make_api_request(url)
+    return response_cache.get(
+        url, ttl, lambda: _make_api_request(url), endpoint_max_stale(endpoint_key)
+    )
+
+
+def _get_with_retries(
+    url: str, headers: Optional[Dict[str, str]] = None
+) -> Optional[requests.Response]:
+    """
+    GETs the URL with the configured retries and backoff. Returns the
+    response (2xx or 304), or None if every attempt failed.
+
+    Requests are paced by the host's rate limiter and refused at once while
+    its circuit breaker is open (see src.api.rate_limit). A 429 waits for
+    Retry-After instead of the exponential backoff; other 4xx responses are
+    not retried.
+
+    Identical requests (same URL and headers) made while one is already in
+    flight wait for it and share its response. Each caller still parses the
+    body itself, so callers never share the same decoded objects.
+    """
+    key = (url, tuple(sorted(headers.items())) if headers else ())
+    return _in_flight.do(key, lambda: _get_with_retries_uncoalesced(url, headers))
+
+
+def api_request_stats() -> Dict[str, Any]:
+    """Counters of the request coalescing layer (calls, executed, coalesced)."""
+    return _in_flight.stats()
+
+
+def _get_with_retries_uncoalesced(
+    url: str, headers: Optional[Dict[str, str]] = None
+) -> Optional[requests.Response]:
     # Failsafe: Auto-correct duplicate URLs before sending the request
     if url.count("https://") > 1:
         parts = url.split("https://")
         url = "https://" + parts[-1].lstrip('/')
         logger.info(f"Auto-corrected duplicate URL to: {url}")
 
+    guard = get_host_guard(url)
+    safe_url: str = _sanitize_url_for_logging(url)
     try:
         retry_attempts: int = int(CONFIG["performance"]["retry_attempts"])
         timeout: int = int(CONFIG["performance"]["timeout"])
         backoff_factor: float = float(CONFIG["performance"]["backoff_factor"])
 
         for attempt in range(retry_attempts):
+            refused: Optional[str] = guard.before_request()
+            if refused:
+                raise APIError(f"Skipped request to {safe_url}: {refused}.")
             try:
-                response = _session.get(url, timeout=timeout, verify=True)
-                response.raise_for_status()
-                return response.json()
-            except (
-                requests.exceptions.RequestException,
-                requests.exceptions.HTTPError,
-            ) as e:
-                logger.warning(
-                    f"API request to {_sanitize_url_for_logging(url)} failed on attempt {attempt + 1}/{retry_attempts}: {_sanitize_for_logging(e)}"
+                response = _session.get(
+                    url, headers=headers, timeout=timeout, verify=True
                 )
-                if attempt + 1 == retry_attempts:
+                guard.record_response(response.status_code, response.headers)
+                if response.status_code == 429:
+                    # The limiter has paused for Retry-After; the next
+                    # before_request() waits for it instead of backing off.
+                    logger.warning(
+                        f"API request to {safe_url} was rate limited on attempt {attempt + 1}/{retry_attempts}."
+                    )
+                    if attempt + 1 == retry_attempts:
+                        raise APIError(f"Rate limited by {safe_url} after {retry_attempts} attempts.")
+                    continue
+                response.raise_for_status()
+                return response
+            except requests.exceptions.HTTPError as e:
+                status: Optional[int] = getattr(e.response, "status_code", None)
+                if isinstance(status, int) and status < 500:
+                    # Client errors will not change on a retry.
                     raise APIError(
-                        f"Failed to fetch data from {_sanitize_url_for_logging(url)} after {retry_attempts} attempts."
+                        f"Request to {safe_url} failed: {_sanitize_for_logging(e)}"
                     ) from e
-                time.sleep((2**attempt) * backoff_factor)
+                if status is None:
+                    guard.record_failure()
+                _log_failed_attempt(safe_url, attempt, retry_attempts, e)
+            except requests.exceptions.RequestException as e:
+                guard.record_failure()
+                _log_failed_attempt(safe_url, attempt, retry_attempts, e)
+            if attempt + 1 == retry_attempts:
+                raise APIError(
+                    f"Failed to fetch data from {safe_url} after {retry_attempts} attempts."
+                )
+            time.sleep(min((2**attempt) * backoff_factor, MAX_BACKOFF_SECONDS))
     except APIError as e:
         logger.error(_sanitize_for_logging(e))
     return None
 
 
+def _log_failed_attempt(
+    safe_url: str, attempt: int, retry_attempts: int, error: Exception
+) -> None:
+    logger.warning(
+        f"API request to {safe_url} failed on attempt {attempt + 1}/{retry_attempts}: {_sanitize_for_logging(error)}"
+    )
+
+
 def fetch_address_balance(address: str) -> Optional[float]:
     """Fetches the balance for a single Kaspa address."""
     api_config: Dict[str, Any] = get_active_api_config()
@@ -116,7 +210,7 @@ def fetch_address_balance(address: str) -> Optional[float]:
     url: str = f"{base}{endpoint}".format(kaspaAddress=address)
 >>>>>>> dev-latest
 
-    data: Optional[Any] = _make_api_request(url)
+    data: Optional[Any] = _cached_api_request(url, "balance")
     try:
         if (
             isinstance(data, dict)
@@ -160,6 +254,49 @@ def fetch_address_names() -> Optional[List[Dict[str, str]]]:
     return data if isinstance(data, list) else None
 
 
+def fetch_address_names_if_modified(
+    validators: Optional[Dict[str, str]] = None,
+) -> Tuple[Optional[List[Dict[str, str]]], Dict[str, str]]:
+    """
+    Conditionally fetches the known address names.
+
+    Args:
+        validators: The "etag" and/or "last_modified" values returned by the
+            previous fetch. They are sent as If-None-Match/If-Modified-Since.
+
+    Returns:
+        (names, validators). names is None when the server reports the list
+        as unchanged (304) or the request fails.
+    """
+    api_config: Dict[str, Any] = get_active_api_config()
+    url: str = f"{api_config['base_url']}{api_config['endpoints']['address_names']}"
+    headers: Dict[str, str] = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = _get_with_retries(url, headers)
+    if response is None:
+        return None, {}
+    if response.status_code == 304:
+        logger.info("Address names are unchanged on the server.")
+        return None, dict(validators or {})
+
+    new_validators: Dict[str, str] = {}
+    if response.headers.get("ETag"):
+        new_validators["etag"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        new_validators["last_modified"] = response.headers["Last-Modified"]
+    try:
+        data: Any = response.json()
+    except ValueError as e:
+        logger.error(f"Invalid address names response: {_sanitize_for_logging(e)}")
+        return None, {}
+    return (data if isinstance(data, list) else None), new_validators
+
+
 def fetch_top_addresses() -> Optional[List[Any]]:
     """Fetches the top addresses from the API."""
     api_config: Dict[str, Any] = get_active_api_config()
@@ -182,7 +319,7 @@ def fetch_network_stats() -> Dict[str, Optional[float]]:
 
     try:
         url_hash: str = f"{base}{api_config['endpoints']['hashrate']}"
-        hashrate_data: Optional[Any] = _make_api_request(url_hash)
+        hashrate_data: Optional[Any] = _cached_api_request(url_hash, "hashrate")
         if (
             isinstance(hashrate_data, dict)
             and "hashrate" in hashrate_data
@@ -204,7 +341,7 @@ def fetch_network_stats() -> Dict[str, Optional[float]]:
 
     try:
         url_diff: str = f"{base}{api_config['endpoints']['network']}"
-        difficulty_data: Optional[Any] = _make_api_request(url_diff)
+        difficulty_data: Optional[Any] = _cached_api_request(url_diff, "network")
         if (
             isinstance(difficulty_data, dict)
             and "difficulty" in difficulty_data
@@ -245,7 +382,7 @@ def fetch_kaspa_info() -> Dict[str, Any]:
         endpoint: Optional[str] = api_config["endpoints"].get(endpoint_key)
         if endpoint:
             url: str = f"{base}{endpoint}"
-            data: Optional[Any] = _make_api_request(url)
+            data: Optional[Any] = _cached_api_request(url, endpoint_key)
             if data and isinstance(data, (dict, list)):
                 return key, data
         return key, None
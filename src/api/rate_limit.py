@@ -0,0 +1,383 @@
+# File: src/api/rate_limit.py
+
+"""
+Client-side rate limiting and circuit breaking per API host.
+
+Every host the app talks to (the profile base URLs, CoinGecko, ...) gets a
+HostGuard made of:
+
+- a token bucket that paces requests. Its rate starts at the profile's
+  "requests_per_second" and adapts to the server: a 429 halves it and
+  pauses the bucket for Retry-After, X-RateLimit-Remaining/Reset spread
+  the remaining budget over the rest of the window, and successful
+  responses slowly restore the configured rate;
+- a circuit breaker that opens after "failure_threshold" consecutive
+  failures (connection errors, timeouts, 5xx). While open, requests fail
+  fast instead of waiting through retries; after "open_seconds" one trial
+  request is let through (half-open) to probe the host.
+
+Settings come from the "rate_limit" section of the API profile whose
+base_url matches the host, falling back to DEFAULT_API_PROFILE.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from src.config.config import CONFIG, DEFAULT_API_PROFILE
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+# Share of the configured rate restored after each successful response.
+RATE_RECOVERY_STEP = 0.1
+MIN_REQUESTS_PER_SECOND = 0.05
+# Pause applied on a 429 that carries no Retry-After header.
+DEFAULT_THROTTLE_PAUSE_SECONDS = 1.0
+# X-RateLimit-Reset values above this are epoch timestamps, not deltas.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _header_float(headers: Any, name: str) -> Optional[float]:
+    try:
+        value = headers.get(name)
+        return None if value is None else float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(str(value)).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose rate can change at runtime."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        start = max(self._updated, self._paused_until)
+        if now > start:
+            self._tokens = min(self.capacity, self._tokens + (now - start) * self.rate)
+        self._updated = max(self._updated, now)
+
+    def _wait_time(self, now: float) -> float:
+        self._refill(now)
+        if now < self._paused_until:
+            return self._paused_until - now + max(0.0, 1 - self._tokens) / self.rate
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def acquire(self, max_wait: float) -> Optional[float]:
+        """
+        Takes one token, sleeping until one is available. Returns the time
+        spent waiting, or None if that would take longer than max_wait.
+        """
+        start = self._clock()
+        while True:
+            with self._lock:
+                now = self._clock()
+                wait = self._wait_time(now)
+                if wait <= 0:
+                    self._tokens -= 1
+                    return now - start
+            if now - start + wait > max_wait:
+                return None
+            self._sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hands out no tokens for the next `seconds` and drains the bucket."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = 0.0
+            self._paused_until = max(self._paused_until, now + seconds)
+
+    def configure(self, rate: float, capacity: float) -> None:
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = rate
+            self.capacity = capacity
+            self._tokens = min(self._tokens, capacity)
+
+    def paused_for(self) -> float:
+        with self._lock:
+            return max(0.0, self._paused_until - self._clock())
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures; half-opens after a cool-down."""
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        open_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self._clock = clock
+        self._state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if (
+            self._state == CIRCUIT_OPEN
+            and self._clock() - self._opened_at >= self.open_seconds
+        ):
+            self._state = CIRCUIT_HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """True if a request may be sent now."""
+        with self._lock:
+            state = self._current_state()
+            if state == CIRCUIT_CLOSED:
+                return True
+            if state == CIRCUIT_HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def retry_in(self) -> float:
+        with self._lock:
+            if self._current_state() != CIRCUIT_OPEN:
+                return 0.0
+            return max(0.0, self.open_seconds - (self._clock() - self._opened_at))
+
+    def release_trial(self) -> None:
+        """Lets another half-open trial through when one was never sent."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CIRCUIT_CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Counts a failure; returns True if this opened the circuit."""
+        with self._lock:
+            state = self._current_state()
+            self._failures += 1
+            if state == CIRCUIT_HALF_OPEN or (
+                state == CIRCUIT_CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = CIRCUIT_OPEN
+                self._opened_at = self._clock()
+                self._trial_in_flight = False
+                return True
+            return False
+
+
+class HostGuard:
+    """Rate limiter, circuit breaker and counters for one API host."""
+
+    def __init__(
+        self,
+        host: str,
+        settings: Dict[str, Any],
+        profile: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.host = host
+        self.profile = profile
+        self.settings = dict(settings)
+        self.max_rate = float(settings["requests_per_second"])
+        self.max_wait = float(settings["max_wait_seconds"])
+        self.bucket = TokenBucket(self.max_rate, float(settings["burst"]), clock, sleep)
+        self.breaker = CircuitBreaker(
+            int(settings["failure_threshold"]), float(settings["open_seconds"]), clock
+        )
+        self._lock = threading.Lock()
+        self._stats: Dict[str, float] = {
+            "requests": 0,
+            "throttled": 0,
+            "failures": 0,
+            "rejected": 0,
+            "wait_seconds": 0.0,
+        }
+
+    def configure(self, settings: Dict[str, Any], profile: Optional[str]) -> None:
+        """Applies changed profile settings while keeping learned state."""
+        self.settings = dict(settings)
+        self.profile = profile
+        self.max_rate = float(settings["requests_per_second"])
+        self.max_wait = float(settings["max_wait_seconds"])
+        self.bucket.configure(
+            min(self.bucket.rate, self.max_rate), float(settings["burst"])
+        )
+        self.breaker.failure_threshold = int(settings["failure_threshold"])
+        self.breaker.open_seconds = float(settings["open_seconds"])
+
+    def _count(self, stat: str, amount: float = 1) -> None:
+        with self._lock:
+            self._stats[stat] += amount
+
+    def before_request(self) -> Optional[str]:
+        """
+        Waits for a token. Returns None when the request may go out, or the
+        reason it was refused (circuit open, or the wait would be too long).
+        """
+        if not self.breaker.allow():
+            self._count("rejected")
+            return f"circuit open, retrying in {self.breaker.retry_in():.0f}s"
+        waited = self.bucket.acquire(self.max_wait)
+        if waited is None:
+            self._count("rejected")
+            self.breaker.release_trial()
+            return f"rate limited for another {self.bucket.paused_for():.0f}s"
+        self._count("requests")
+        self._count("wait_seconds", waited)
+        return None
+
+    def record_response(self, status_code: Any, headers: Any) -> None:
+        """Learns from a response; 5xx counts as a failure, 429 as throttling."""
+        if status_code == 429:
+            self._count("throttled")
+            retry_after = None
+            if isinstance(headers, Mapping):
+                retry_after = parse_retry_after(headers.get("Retry-After"))
+            self.bucket.configure(
+                max(MIN_REQUESTS_PER_SECOND, self.bucket.rate / 2), self.bucket.capacity
+            )
+            self.bucket.pause(
+                DEFAULT_THROTTLE_PAUSE_SECONDS if retry_after is None else retry_after
+            )
+            # The host is reachable, it just wants us to slow down.
+            self.breaker.record_success()
+            return
+        if isinstance(status_code, int) and status_code >= 500:
+            self.record_failure()
+            return
+        self.breaker.record_success()
+        if isinstance(headers, Mapping):
+            self._learn_rate_limit(headers)
+
+    def _learn_rate_limit(self, headers: Mapping) -> None:
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        reset = _header_float(headers, "X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            rate = min(self.max_rate, self.bucket.rate + self.max_rate * RATE_RECOVERY_STEP)
+            if rate != self.bucket.rate:
+                self.bucket.configure(rate, self.bucket.capacity)
+            return
+        reset_in = reset - time.time() if reset > _EPOCH_THRESHOLD else reset
+        reset_in = max(reset_in, 1.0)
+        if remaining <= 0:
+            self.bucket.pause(reset_in)
+            return
+        rate = min(self.max_rate, max(MIN_REQUESTS_PER_SECOND, remaining / reset_in))
+        self.bucket.configure(rate, self.bucket.capacity)
+
+    def record_failure(self) -> None:
+        self._count("failures")
+        if self.breaker.record_failure():
+            logger.warning(
+                f"Circuit opened for {self.host} for {self.breaker.open_seconds:.0f}s "
+                "after repeated failures."
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+        stats.update(
+            host=self.host,
+            profile=self.profile,
+            state=self.breaker.state,
+            rate=self.bucket.rate,
+            max_rate=self.max_rate,
+            paused_for=self.bucket.paused_for(),
+        )
+        return stats
+
+
+_guards: Dict[str, HostGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def _host_key(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+
+def _settings_for_host(host: str) -> Tuple[Dict[str, Any], Optional[str]]:
+    """(settings, profile name) for a host; profiles are matched on base_url."""
+    defaults: Dict[str, Any] = DEFAULT_API_PROFILE["rate_limit"]
+    profiles: Dict[str, Any] = CONFIG.get("api", {}).get("profiles", {})
+    for name, profile in profiles.items():
+        if isinstance(profile, dict) and _host_key(profile.get("base_url", "")) == host:
+            return {**defaults, **(profile.get("rate_limit") or {})}, name
+    return dict(defaults), None
+
+
+def get_host_guard(url: str) -> HostGuard:
+    """Returns the guard for the URL's host, applying current profile settings."""
+    host = _host_key(url)
+    settings, profile = _settings_for_host(host)
+    with _guards_lock:
+        guard = _guards.get(host)
+        if guard is None:
+            guard = _guards[host] = HostGuard(host, settings, profile)
+        elif guard.settings != settings or guard.profile != profile:
+            guard.configure(settings, profile)
+    return guard
+
+
+def host_guard_stats() -> List[Dict[str, Any]]:
+    """Stats of every host contacted so far, for the settings panel."""
+    with _guards_lock:
+        guards = list(_guards.values())
+    return [guard.stats() for guard in sorted(guards, key=lambda g: g.host)]
+
+
+def reset_host_guards() -> None:
+    """Forgets all learned limits and breaker state."""
+    with _guards_lock:
+        _guards.clear()
@@ -244,6 +244,36 @@ DEFAULT_API_PROFILE: Dict[str, Any] = {
         "network": "/info/network",
         "kaspad": "/info/kaspad",
     },
+    # Seconds a cached response stays fresh, per endpoint (0 = not cached).
+    # "prices" and "network_stats" apply to the values stored at startup.
+    "cache_ttl": {
+        "balance": 30,
+        "blockdag_info": 10,
+        "blockreward": 300,
+        "coinsupply": 60,
+        "halving": 3600,
+        "hashrate": 60,
+        "max_hashrate": 600,
+        "network": 60,
+        "kaspad": 300,
+        "prices": 3600,
+        "network_stats": 3600,
+    },
+    # Oldest age in seconds at which an expired response is still served
+    # while it is refreshed in the background, per endpoint. Endpoints not
+    # listed use the cache's default (one day); 0 makes an expired response
+    # a blocking refetch, for values shown without a refresh path.
+    "max_stale": {
+        "balance": 0,
+    },
+    # Client-side pacing and circuit breaking for this profile's host.
+    "rate_limit": {
+        "requests_per_second": 5,
+        "burst": 10,
+        "max_wait_seconds": 30,
+        "failure_threshold": 5,
+        "open_seconds": 30,
+    },
     "explorer": {
         "address": "https://explorer.kaspa.org/addresses/{kaspaAddress}",
         "transaction": "https://explorer.kaspa.org/txs/{txid}",
@@ -423,6 +453,7 @@ def _initialize_defaults(user_data_root: str) -> None:
             "export": os.path.join(user_data_root, "exports"),
             "log": os.path.join(user_data_root, "logs"),
             "backup": os.path.join(user_data_root, "backups"),
+            "cache": os.path.join(user_data_root, "cache"),
         },
         "db_filenames": {
             "transactions": "Transactions.duckdb",
@@ -444,6 +475,17 @@ def _initialize_defaults(user_data_root: str) -> None:
             "network_cache_hours": 0.25,
             "auto_refresh_enabled": False,
             "auto_refresh_interval_seconds": 60,
+            "process_sample_interval_seconds": 2.0,
+            "process_history_size": 1800,
+            "rich_list_cache_minutes": 10,
+            "max_concurrent_exports": 2,
+            "import_budget_seconds": 2.0,
+            "metrics_enabled": True,
+            "metrics_resource_sample_every": 50,
+            "profiler_enabled": False,
+            "profiler_interval_ms": 20,
+            "stall_detector_enabled": True,
+            "stall_threshold_ms": 250,
         },
         "api": {
             "active_profile": "Default",
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 
 from src.gui.main_window import MainWindow
 from src.utils.errors import KaspaError
+from src.utils.startup_trace import startup_tracer
 
 # Handle circular type hint for MainWindow if it needs KaspaApp
 if TYPE_CHECKING:
@@ -30,7 +31,8 @@ class KaspaApp:
             logger.info("Initializing application core...")
 
             start_mw = time.perf_counter()
-            self.main_window = MainWindow()
+            with startup_tracer.span("MainWindow()"):
+                self.main_window = MainWindow()
             end_mw = time.perf_counter()
 
             logger.info(
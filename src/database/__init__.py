@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from .database import AddressDB, AppDataDB, TransactionDB
 from .db_manager import DatabaseManager
+from .db_open import open_databases, open_databases_async
 from .db_schema import (
     initialize_addr_schema,
     initialize_app_data_schema,
@@ -18,6 +19,8 @@ __all__ = [
     "AddressDB",
     "AppDataDB",
     "DatabaseManager",
+    "open_databases",
+    "open_databases_async",
     "initialize_tx_schema",
     "initialize_addr_schema",
     "initialize_app_data_schema",
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import time
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
@@ -24,7 +25,7 @@ from src.database.db_schema import (
 from src.utils.db_utils import retry_on_schema_error
 from src.utils.errors import DatabaseError
 from src.utils.formatting import mask_address
-from src.utils.i18n import get_all_translations_for_key
+from src.utils.i18n import is_translation_of
 from src.utils.profiling import log_performance
 
 if TYPE_CHECKING:
@@ -32,6 +33,24 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Number of rich-list snapshots kept for diffs; older ones are pruned.
+RICH_LIST_SNAPSHOTS_TO_KEEP: int = 48
+
+# Max age of cached prices/network stats unless the caller passes its TTL.
+DEFAULT_CACHE_MAX_AGE: float = 3600.0
+# Key prefix of API responses stored in the cache table by ResponseCache.
+RESPONSE_CACHE_PREFIX: str = "api:"
+
+# Allowed ORDER BY expressions for query_rich_list(), keyed by sort name.
+_RICH_LIST_SORT_COLUMNS: Dict[str, str] = {
+    "rank": 'e."rank"',
+    "name": "lower(COALESCE(n.name, ''))",
+    "address": "e.address",
+    "balance": "e.balance",
+    "rank_change": 'p."rank" - e."rank"',
+    "balance_change": "e.balance - p.balance",
+}
+
 
 class TransactionDB(DatabaseManager):
     """Manages the transaction database."""
@@ -99,9 +118,7 @@ class TransactionDB(DatabaseManager):
             )
             return False
 
-    @log_performance
-    @retry_on_schema_error(initialize_tx_schema)
-    def filter_transactions(
+    def build_filter_clause(
         self,
         address: str,
         start_date: Optional[datetime] = None,
@@ -110,11 +127,12 @@ class TransactionDB(DatabaseManager):
         direction_filter: str = "ALL",
         search_query: Optional[str] = None,
         **kwargs: Any,
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[str, List[Any]]:
         """
-        Filters transactions for a given address.
+        Builds the WHERE clause (without the keyword) and its parameters for
+        the explorer filters, so other queries can reuse the same selection.
         """
-        query = "SELECT * FROM transactions WHERE address = ?"
+        clause = "address = ?"
 <<<<<<< HEAD
         params: List[Any] = [address.lower()]
 =======
@@ -122,34 +140,59 @@ class TransactionDB(DatabaseManager):
 >>>>>>> dev-latest
 
         if start_date:
-            query += " AND timestamp >= ?"
+            clause += " AND timestamp >= ?"
             params.append(int(start_date.timestamp()))
 
         if end_date:
-            query += " AND timestamp <= ?"
+            clause += " AND timestamp <= ?"
             params.append(int(end_date.timestamp()))
 
-        all_key_translations: Set[str] = get_all_translations_for_key("ALL")
-
-        if type_filter and type_filter not in all_key_translations:
-            query += ' AND "type" = ?'
-            if type_filter in get_all_translations_for_key("coinbase"):
+        if type_filter and not is_translation_of(type_filter, "ALL"):
+            clause += ' AND "type" = ?'
+            if is_translation_of(type_filter, "coinbase"):
                 params.append("coinbase")
             else:
                 params.append("transfer")
 
-        if direction_filter and direction_filter not in all_key_translations:
-            query += " AND direction = ?"
-            if direction_filter in get_all_translations_for_key("incoming"):
+        if direction_filter and not is_translation_of(direction_filter, "ALL"):
+            clause += " AND direction = ?"
+            if is_translation_of(direction_filter, "incoming"):
                 params.append("incoming")
             else:
                 params.append("outgoing")
 
         if search_query:
-            query += " AND (txid LIKE ? OR from_address LIKE ? OR to_address LIKE ?)"
+            clause += " AND (txid LIKE ? OR from_address LIKE ? OR to_address LIKE ?)"
             like_query = f"%{search_query}%"
             params.extend([like_query, like_query, like_query])
 
+        return clause, params
+
+    @log_performance
+    @retry_on_schema_error(initialize_tx_schema)
+    def filter_transactions(
+        self,
+        address: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type_filter: str = "ALL",
+        direction_filter: str = "ALL",
+        search_query: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Filters transactions for a given address.
+        """
+        clause, params = self.build_filter_clause(
+            address,
+            start_date=start_date,
+            end_date=end_date,
+            type_filter=type_filter,
+            direction_filter=direction_filter,
+            search_query=search_query,
+        )
+        # The clause only contains placeholders; values are bound separately.
+        query = "SELECT * FROM transactions WHERE " + clause  # nosec B608
         query += " ORDER BY timestamp DESC"
 
         # LOG THE QUERY FOR DEBUGGING
@@ -207,29 +250,6 @@ class AddressDB(DatabaseManager):
                 f"Failed to initialize schema for {self.db_name}: {e}"
             ) from e
 
-    @retry_on_schema_error(initialize_addr_schema)
-    def migrate_schema(self) -> None:
-        try:
-            with self.connect() as con:
-                columns: List[Tuple[Any, ...]] = con.execute(
-                    "PRAGMA table_info('addresses')"
-                ).fetchall()
-                col_names: List[str] = [col[1] for col in columns]
-
-                if "created_at" not in col_names:
-                    logger.info(
-                        "Migrating addresses schema: Adding 'created_at' column."
-                    )
-                    con.execute(
-                        "ALTER TABLE addresses ADD COLUMN created_at "
-                        "BIGINT DEFAULT (EXTRACT(EPOCH FROM CURRENT_TIMESTAMP)::BIGINT)"
-                    )
-
-        except Exception as e:
-            logger.error(
-                f"Failed during schema migration for addresses: {e}", exc_info=True
-            )
-
     @retry_on_schema_error(initialize_addr_schema)
     def get_all_addresses(self) -> List[Dict[str, Any]]:
         query = "SELECT address, name, created_at FROM addresses ORDER BY name, created_at DESC"
@@ -274,6 +294,11 @@ class AppDataDB(DatabaseManager):
         """
 >>>>>>> dev-latest
         super().__init__(db_path)
+        # Read-through copy of known_names; rebuilt when the version moves.
+        self._names_lock = threading.Lock()
+        self._names_version = 0
+        self._names_map: Optional[Dict[str, str]] = None
+        self._names_map_version = -1
         try:
             with self.connect() as con:
                 schema_init(con)
@@ -295,16 +320,20 @@ class AppDataDB(DatabaseManager):
         self.execute_query(query, (key, value))
 
     @retry_on_schema_error(initialize_app_data_schema)
-    def get_cached_prices(self, expired: bool = False) -> Optional[Dict[str, float]]:
+    def get_cached_prices(
+        self, expired: bool = False, max_age_seconds: float = DEFAULT_CACHE_MAX_AGE
+    ) -> Optional[Dict[str, float]]:
 <<<<<<< HEAD
 =======
         """RetrieVes cached prices, handling only valid JSON."""
 >>>>>>> dev-latest
         query = "SELECT prices_json, last_updated FROM cache WHERE key = 'prices'"
+        params: Tuple[Any, ...] = ()
         if not expired:
-            query += " AND last_updated >= NOW() - INTERVAL '1 hour'"
+            query += " AND last_updated >= NOW() - to_seconds(?)"
+            params = (max_age_seconds,)
 
-        result = self.fetch_one(query)
+        result = self.fetch_one(query, params)
 
         if not result or not result[0]:
             return None
@@ -335,7 +364,7 @@ class AppDataDB(DatabaseManager):
 
     @retry_on_schema_error(initialize_app_data_schema)
     def get_cached_network_data(
-        self, expired: bool = False
+        self, expired: bool = False, max_age_seconds: float = DEFAULT_CACHE_MAX_AGE
     ) -> Optional[Tuple[Optional[float], Optional[float]]]:
 <<<<<<< HEAD
 =======
@@ -344,10 +373,12 @@ class AppDataDB(DatabaseManager):
         query = (
             "SELECT prices_json, last_updated FROM cache WHERE key = 'network_stats'"
         )
+        params: Tuple[Any, ...] = ()
         if not expired:
-            query += " AND last_updated >= NOW() - INTERVAL '1 hour'"
+            query += " AND last_updated >= NOW() - to_seconds(?)"
+            params = (max_age_seconds,)
 
-        result = self.fetch_one(query)
+        result = self.fetch_one(query, params)
         if result and result[0]:
             try:
                 data: Dict[str, Optional[float]] = json.loads(result[0])
@@ -369,6 +400,36 @@ class AppDataDB(DatabaseManager):
         query = "INSERT OR REPLACE INTO cache (key, prices_json, last_updated) VALUES ('network_stats', ?, NOW())"
         self.execute_query(query, (data_json,))
 
+    @retry_on_schema_error(initialize_app_data_schema)
+    def load_cached_response(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Second tier of the API response cache: (value, stored_at epoch)."""
+        result = self.fetch_one(
+            "SELECT prices_json FROM cache WHERE key = ?", (RESPONSE_CACHE_PREFIX + key,)
+        )
+        if not result or not result[0]:
+            return None
+        try:
+            entry: Dict[str, Any] = json.loads(result[0])
+            return entry["data"], float(entry["stored_at"])
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            logger.warning("Discarding unreadable cached API response.")
+            return None
+
+    @retry_on_schema_error(initialize_app_data_schema)
+    def save_cached_response(self, key: str, value: Any, stored_at: float) -> None:
+        query = "INSERT OR REPLACE INTO cache (key, prices_json, last_updated) VALUES (?, ?, NOW())"
+        payload = json.dumps({"stored_at": stored_at, "data": value})
+        self.execute_query(query, (RESPONSE_CACHE_PREFIX + key, payload))
+
+    @retry_on_schema_error(initialize_app_data_schema)
+    def prune_cached_responses(self, max_age_seconds: float) -> None:
+        """Deletes cached API responses stored more than max_age_seconds ago."""
+        self.execute_query(
+            "DELETE FROM cache WHERE starts_with(key, ?) "
+            "AND (last_updated IS NULL OR last_updated < NOW() - to_seconds(?))",
+            (RESPONSE_CACHE_PREFIX, max_age_seconds),
+        )
+
     @retry_on_schema_error(initialize_app_data_schema)
     def get_cached_prices_count(self) -> int:
         result = self.fetch_one("SELECT COUNT(*) FROM cache WHERE key = 'prices'")
@@ -380,37 +441,252 @@ class AppDataDB(DatabaseManager):
 
     @log_performance
     @retry_on_schema_error(initialize_app_data_schema)
-    def save_address_names(self, names_list: List[Dict[str, str]]) -> None:
-        query = "INSERT OR REPLACE INTO known_names (address, name) VALUES (?, ?)"
-        data: List[Tuple[str, str]] = [
-            (item["address"], item["name"])
-            for item in names_list
-            if "address" in item and "name" in item
-        ]
-
-        if not data:
-            return
+    def save_address_names(
+        self,
+        names_list: List[Dict[str, str]],
+        validators: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """
+        Makes known_names match names_list, writing only the difference:
+        new or renamed addresses are upserted from one registered batch and
+        addresses missing from the list are deleted. The HTTP validators of
+        the fetch are stored for the next conditional request.
+        Returns the number of rows changed.
+        """
+        names = pd.DataFrame(
+            [
+                (str(item["address"]), str(item["name"]))
+                for item in names_list
+                if item.get("address") and item.get("name") is not None
+            ],
+            columns=["address", "name"],
+        ).drop_duplicates("address", keep="last")
+
+        if names.empty:
+            return 0
 
         try:
-            with self.connect() as con:
-                con.execute("DELETE FROM known_names")
-                con.executemany(query, data)
-            logger.info(f"Successfully saved {len(data)} known names.")
+            with self.connect() as shared_con:
+                # A cursor gives the sync its own transaction on the shared database.
+                con = shared_con.cursor()
+                con.register("fetched_names", names)
+                try:
+                    con.execute("BEGIN TRANSACTION")
+                    (upserted,) = con.execute(
+                        "INSERT OR REPLACE INTO known_names "
+                        "SELECT f.address, f.name FROM fetched_names AS f "
+                        "LEFT JOIN known_names AS k ON k.address = f.address "
+                        "WHERE k.address IS NULL OR k.name IS DISTINCT FROM f.name"
+                    ).fetchone()
+                    (deleted,) = con.execute(
+                        "DELETE FROM known_names WHERE address NOT IN "
+                        "(SELECT address FROM fetched_names)"
+                    ).fetchone()
+                    con.execute("COMMIT")
+                except Exception:
+                    con.execute("ROLLBACK")
+                    raise
+                finally:
+                    con.close()
+            changed = upserted + deleted
+            if changed:
+                with self._names_lock:
+                    self._names_version += 1
+            self.save_address_names_validators(validators or {})
+            logger.info(
+                f"Known names synced: {upserted} upserted, {deleted} removed, "
+                f"{len(names) - upserted} unchanged."
+            )
+            return changed
         except Exception as e:
             logger.error(f"Failed to save address names: {e}", exc_info=True)
+            return 0
 
     @log_performance
     @retry_on_schema_error(initialize_app_data_schema)
     def get_address_names_map(self) -> Dict[str, str]:
+        """
+        Returns address -> name. The table is only read again after
+        save_address_names changed it; otherwise a copy of the cached map
+        is returned.
+        """
+        with self._names_lock:
+            if (
+                self._names_map is not None
+                and self._names_map_version == self._names_version
+            ):
+                return dict(self._names_map)
+            version = self._names_version
+
         query = "SELECT address, name FROM known_names"
         results: List[Tuple[str, str]] = self.fetch_all(query)
-        return {row[0]: row[1] for row in results}
+        names_map = {row[0]: row[1] for row in results}
+        with self._names_lock:
+            self._names_map = names_map
+            self._names_map_version = version
+        return dict(names_map)
+
+    @retry_on_schema_error(initialize_app_data_schema)
+    def get_address_names_validators(self) -> Dict[str, str]:
+        """ETag/Last-Modified of the stored names, if they are still present."""
+        result = self.fetch_one(
+            "SELECT prices_json FROM cache WHERE key = 'address_names'"
+        )
+        if not result or not result[0] or not self.get_address_names_count():
+            return {}
+        try:
+            validators = json.loads(result[0])
+        except json.JSONDecodeError:
+            logger.warning("Failed to decode cached address-name validators.")
+            return {}
+        return validators if isinstance(validators, dict) else {}
+
+    @retry_on_schema_error(initialize_app_data_schema)
+    def save_address_names_validators(self, validators: Dict[str, str]) -> None:
+        query = "INSERT OR REPLACE INTO cache (key, prices_json, last_updated) VALUES ('address_names', ?, NOW())"
+        self.execute_query(query, (json.dumps(validators),))
 
     @retry_on_schema_error(initialize_app_data_schema)
     def get_address_names_count(self) -> int:
         result = self.fetch_one("SELECT COUNT(*) FROM known_names")
         return result[0] if result else 0
 
+    @log_performance
+    @retry_on_schema_error(initialize_app_data_schema)
+    def save_rich_list_snapshot(
+        self, entries: pd.DataFrame, keep: int = RICH_LIST_SNAPSHOTS_TO_KEEP
+    ) -> Optional[int]:
+        """
+        Stores a rich list (columns: rank, address, balance) as a new snapshot
+        and prunes the oldest snapshots beyond 'keep'. Returns the snapshot id.
+        """
+        if entries.empty:
+            return None
+        try:
+            with self.connect() as con:
+                row = con.execute(
+                    "SELECT COALESCE(MAX(snapshot_id), 0) + 1 FROM rich_list_snapshots"
+                ).fetchone()
+                snapshot_id: int = row[0]
+                con.register("rich_list_view", entries[["rank", "address", "balance"]])
+                con.execute(
+                    "INSERT OR REPLACE INTO rich_list_entries "
+                    'SELECT ?, "rank", address, balance FROM rich_list_view',
+                    (snapshot_id,),
+                )
+                con.unregister("rich_list_view")
+                con.execute(
+                    "INSERT INTO rich_list_snapshots VALUES (?, ?, ?)",
+                    (snapshot_id, int(time.time()), len(entries)),
+                )
+                con.execute(
+                    "DELETE FROM rich_list_entries WHERE snapshot_id <= ?",
+                    (snapshot_id - keep,),
+                )
+                con.execute(
+                    "DELETE FROM rich_list_snapshots WHERE snapshot_id <= ?",
+                    (snapshot_id - keep,),
+                )
+            logger.info(
+                f"Saved rich-list snapshot {snapshot_id} with {len(entries)} addresses."
+            )
+            return snapshot_id
+        except Exception as e:
+            logger.error(f"Failed to save rich-list snapshot: {e}", exc_info=True)
+            return None
+
+    @retry_on_schema_error(initialize_app_data_schema)
+    def get_rich_list_snapshots(self, limit: int = 2) -> List[Tuple[int, int]]:
+        """Returns (snapshot_id, taken_at epoch) pairs, newest first."""
+        query = (
+            "SELECT snapshot_id, taken_at FROM rich_list_snapshots "
+            "ORDER BY snapshot_id DESC LIMIT ?"
+        )
+        return [(row[0], row[1]) for row in self.fetch_all(query, (limit,))]
+
+    @staticmethod
+    def build_rich_list_clause(
+        search: Optional[str] = None, sort_by: str = "rank", descending: bool = False
+    ) -> Tuple[str, List[Any], str]:
+        """
+        Builds the extra WHERE conditions (each starting with AND), their
+        parameters and the ORDER BY list for a rich-list query over
+        rich_list_entries e, known_names n and the previous snapshot p, so
+        exports select and order rows exactly like the table.
+        """
+        order_expr = _RICH_LIST_SORT_COLUMNS.get(sort_by, _RICH_LIST_SORT_COLUMNS["rank"])
+        direction = "DESC" if descending else "ASC"
+        clause = ""
+        params: List[Any] = []
+        if search:
+            term = search.strip().lower()
+            clause = (
+                " AND (contains(lower(e.address), ?)"
+                " OR contains(lower(COALESCE(n.name, '')), ?)"
+                ' OR CAST(e."rank" AS VARCHAR) = ?)'
+            )
+            params = [term, term, term]
+        return clause, params, f'{order_expr} {direction} NULLS LAST, e."rank"'
+
+    @log_performance
+    @retry_on_schema_error(initialize_app_data_schema)
+    def query_rich_list(
+        self,
+        snapshot_id: int,
+        compare_snapshot_id: Optional[int] = None,
+        search: Optional[str] = None,
+        sort_by: str = "rank",
+        descending: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Filters, sorts and windows a rich-list snapshot in SQL, joined with the
+        known names and diffed against compare_snapshot_id (rank_change is
+        positive when an address moved up). Returns (rows, total_matches).
+        """
+        clause, filter_params, order_by = self.build_rich_list_clause(
+            search, sort_by, descending
+        )
+        params: List[Any] = [compare_snapshot_id, snapshot_id, *filter_params]
+
+        # The clause only holds placeholders and allowlisted sort expressions.
+        query = f"""
+            SELECT
+                e."rank", COALESCE(n.name, '') AS name, e.address, e.balance,
+                p."rank" - e."rank" AS rank_change,
+                e.balance - p.balance AS balance_change,
+                p.address IS NULL AS is_new,
+                COUNT(*) OVER () AS total
+            FROM rich_list_entries e
+            LEFT JOIN known_names n ON n.address = e.address
+            LEFT JOIN rich_list_entries p
+                ON p.snapshot_id = ? AND p.address = e.address
+            WHERE e.snapshot_id = ?{clause}
+            ORDER BY {order_by}
+        """  # nosec B608
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+
+        rows = self.fetch_all(query, tuple(params))
+        # Total matches come from the window function, so an empty window
+        # (offset past the end) reports 0.
+        total: int = rows[0][7] if rows else 0
+        has_previous = compare_snapshot_id is not None
+        return [
+            {
+                "rank": row[0],
+                "name": row[1],
+                "address": row[2],
+                "balance": row[3],
+                "rank_change": row[4],
+                "balance_change": row[5],
+                "is_new": bool(row[6]) and has_previous,
+            }
+            for row in rows
+        ], total
+
     @retry_on_schema_error(initialize_app_data_schema)
     def get_last_update_timestamp(self) -> Optional[str]:
 <<<<<<< HEAD
@@ -2,11 +2,12 @@ import logging
 import os
 import shutil
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import duckdb
 
 from src.config.config import CONFIG
+from src.database.db_schema import cluster_transactions
 from src.utils.i18n import translate
 
 logger = logging.getLogger(__name__)
@@ -162,12 +163,17 @@ class DatabaseManager:
             logger.error(f"Restore failed for {target_db_name}: {e}", exc_info=True)
             return False, f"{translate('Restore failed')}: {e}"
 
-    def compact_database(self, db_name: str) -> Tuple[bool, str]:
+    def compact_database(
+        self, db_name: str, progress: Optional[Callable[[float], None]] = None
+    ) -> Tuple[bool, str]:
         """
-        Compacts a database file using VACUUM and CHECKPOINT.
+        Compacts a database file using VACUUM and CHECKPOINT. A transactions
+        file is first rewritten in (address, timestamp) order, which needs
+        free disk space for a second copy of the table while it runs.
 
         Args:
             db_name: The filename of the database to compact.
+            progress: Called with the fraction (0..1) of transactions rewritten.
 
         Returns:
             A tuple (bool success, str message).
@@ -179,6 +185,9 @@ class DatabaseManager:
         logger.info(f"Starting compaction for '{db_name}'...")
         try:
             with duckdb.connect(database=db_path) as con:
+                tables = {row[0] for row in con.execute("SHOW TABLES").fetchall()}
+                if "transactions" in tables:
+                    cluster_transactions(con, progress)
                 con.execute("VACUUM")
                 con.execute("CHECKPOINT")
             logger.info(f"Compaction successful for '{db_name}'.")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Opens the application's DuckDB files concurrently.
+
+Each database constructor connects and initializes its schema, which on a
+large file with a cold page cache can take seconds. The files are
+independent, so they are opened on separate threads: startup waits for the
+slowest one instead of the sum, and callers that only need one database
+can continue as soon as that one is ready.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, Tuple, Type
+
+from src.config.config import CONFIG
+from src.database.database import AddressDB, AppDataDB, TransactionDB
+from src.database.db_base import DatabaseManager
+from src.database.db_schema import (
+    initialize_addr_schema,
+    initialize_app_data_schema,
+    initialize_tx_schema,
+)
+from src.utils.startup_trace import startup_tracer
+
+logger = logging.getLogger(__name__)
+
+# Keys match CONFIG["db_filenames"].
+DATABASE_TYPES: Dict[str, Tuple[Type[DatabaseManager], Callable]] = {
+    "transactions": (TransactionDB, initialize_tx_schema),
+    "addresses": (AddressDB, initialize_addr_schema),
+    "app_data": (AppDataDB, initialize_app_data_schema),
+}
+
+
+def _open_database(name: str, path: str) -> DatabaseManager:
+    db_class, schema_init = DATABASE_TYPES[name]
+    with startup_tracer.span(f"open {db_class.__name__}"):
+        return db_class(path, schema_init)
+
+
+def open_databases_async(
+    data_dir: str, names: Optional[Iterable[str]] = None
+) -> Dict[str, "Future[DatabaseManager]"]:
+    """
+    Starts opening the named databases (default: all) in parallel and
+    returns a future per name. A failed open surfaces as the DatabaseError
+    raised by that future's result().
+    """
+    names = list(names or DATABASE_TYPES)
+    filenames: Dict[str, str] = CONFIG["db_filenames"]
+    executor = ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="DBOpen")
+    try:
+        return {
+            name: executor.submit(
+                _open_database, name, os.path.join(data_dir, filenames[name])
+            )
+            for name in names
+        }
+    finally:
+        # Lets the workers exit once their database is open.
+        executor.shutdown(wait=False)
+
+
+def open_databases(
+    data_dir: str, names: Optional[Iterable[str]] = None
+) -> Dict[str, DatabaseManager]:
+    """
+    Opens the named databases in parallel and waits for all of them. If any
+    fails, the ones that did open are closed again and the error is raised.
+    """
+    futures = open_databases_async(data_dir, names)
+    opened: Dict[str, DatabaseManager] = {}
+    error: Optional[BaseException] = None
+    for name, future in futures.items():
+        try:
+            opened[name] = future.result()
+        except Exception as e:
+            logger.critical(f"Failed to open the {name} database: {e}")
+            error = error or e
+    if error is not None:
+        for db in opened.values():
+            db.close()
+        raise error
+    return opened
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Versioned schema migrations for the DuckDB files.
+
+Each database has an ordered list of Migration steps. The version a file
+is at is recorded in its schema_version table, one row per applied step.
+Opening an up-to-date file costs a single version compare; otherwise the
+pending steps run in order, each in its own transaction, and are recorded.
+
+Steps must be idempotent (check before changing anything), because the
+first step of every list adopts files created before migrations existed.
+Long steps report progress through the callback they are given; progress
+is logged and forwarded to the listener installed with
+set_progress_listener() (the status bar, at startup).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Optional, Sequence
+
+import duckdb
+
+from src.utils.errors import DatabaseError
+
+if TYPE_CHECKING:
+    from duckdb import DuckDBPyConnection
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION_TABLE: str = "schema_version"
+# Minimum seconds between two progress log lines of one migration.
+PROGRESS_LOG_INTERVAL_SECONDS: float = 2.0
+
+# fraction done (0..1) of the running step
+StepProgress = Callable[[float], None]
+# (database name, step description, overall fraction done)
+ProgressListener = Callable[[str, str, float], None]
+
+_listener_lock = threading.Lock()
+_progress_listener: Optional[ProgressListener] = None
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema or data change, applied when a file is below version."""
+
+    version: int
+    description: str
+    apply: Callable[["DuckDBPyConnection", StepProgress], None]
+
+
+def set_progress_listener(listener: Optional[ProgressListener]) -> None:
+    """Installs (or with None removes) the receiver of migration progress."""
+    global _progress_listener
+    with _listener_lock:
+        _progress_listener = listener
+
+
+def _notify(database: str, description: str, fraction: float) -> None:
+    with _listener_lock:
+        listener = _progress_listener
+    if listener is not None:
+        try:
+            listener(database, description, fraction)
+        except Exception as e:
+            logger.warning(f"Migration progress listener failed: {e}")
+
+
+def check_migrations(migrations: Sequence[Migration]) -> Sequence[Migration]:
+    """Validates that versions start at 1 and increase by one."""
+    for expected, migration in enumerate(migrations, start=1):
+        if migration.version != expected:
+            raise ValueError(
+                f"Migration '{migration.description}' has version "
+                f"{migration.version}, expected {expected}."
+            )
+    return migrations
+
+
+def current_version(con: DuckDBPyConnection) -> int:
+    """Version of the file behind con; 0 if it has never been migrated."""
+    try:
+        row = con.execute(
+            f"SELECT max(version) FROM {SCHEMA_VERSION_TABLE}"  # nosec B608
+        ).fetchone()
+    except duckdb.CatalogException:
+        return 0
+    return int(row[0]) if row and row[0] is not None else 0
+
+
+def _ensure_version_table(con: DuckDBPyConnection) -> None:
+    con.execute(
+        f"CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE}("
+        "version INTEGER PRIMARY KEY, "
+        "description VARCHAR, "
+        "applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+    )
+
+
+class _ProgressReporter:
+    """Turns one step's progress into throttled logs and listener calls."""
+
+    def __init__(self, database: str, migration: Migration, index: int, total: int) -> None:
+        self._database = database
+        self._migration = migration
+        self._index = index
+        self._total = total
+        self._last_log = time.monotonic()
+
+    def __call__(self, fraction: float) -> None:
+        fraction = min(max(fraction, 0.0), 1.0)
+        overall = (self._index + fraction) / self._total
+        _notify(self._database, self._migration.description, overall)
+        now = time.monotonic()
+        if now - self._last_log >= PROGRESS_LOG_INTERVAL_SECONDS:
+            self._last_log = now
+            logger.info(
+                f"Migrating {self._database} to v{self._migration.version} "
+                f"({self._migration.description}): {fraction:.0%}"
+            )
+
+
+def migrate(
+    con: DuckDBPyConnection, migrations: Sequence[Migration], database: str = "database"
+) -> int:
+    """
+    Brings the file behind con up to the last migration's version and
+    returns that version. Raises DatabaseError if a step fails; the failed
+    step is rolled back and the file stays at the previous version.
+    """
+    latest = migrations[-1].version if migrations else 0
+    version = current_version(con)
+    if version == latest:
+        return version
+    if version > latest:
+        logger.warning(
+            f"{database} is at schema v{version}, newer than this build (v{latest}). "
+            "Leaving it untouched."
+        )
+        return version
+
+    pending = [migration for migration in migrations if migration.version > version]
+    for index, migration in enumerate(pending):
+        logger.info(f"Migrating {database} to v{migration.version}: {migration.description}")
+        report = _ProgressReporter(database, migration, index, len(pending))
+        report(0.0)
+        start = time.perf_counter()
+        try:
+            con.execute("BEGIN TRANSACTION")
+            _ensure_version_table(con)
+            migration.apply(con, report)
+            con.execute(
+                f"INSERT INTO {SCHEMA_VERSION_TABLE} (version, description) "  # nosec B608
+                "VALUES (?, ?)",
+                (migration.version, migration.description),
+            )
+            con.execute("COMMIT")
+        except Exception as e:
+            # Any failure, not only duckdb.Error, must end the transaction.
+            try:
+                con.execute("ROLLBACK")
+            except duckdb.Error:
+                pass
+            logger.critical(
+                f"Migration of {database} to v{migration.version} failed: {e}",
+                exc_info=True,
+            )
+            raise DatabaseError(
+                f"Migration of {database} to v{migration.version} failed: {e}"
+            ) from e
+        report(1.0)
+        logger.info(
+            f"PERF: {database} migrated to v{migration.version} in "
+            f"{time.perf_counter() - start:.3f}s"
+        )
+    return latest
@@ -1,9 +1,80 @@
-from .analysis_csv_export import export_analysis_to_csv
-from .analysis_html_export import export_analysis_to_html
-from .analysis_pdf_export import export_analysis_to_pdf
-from .csv_export import export_to_csv as export_df_to_csv
-from .html_export import export_to_html as export_df_to_html
-from .pdf_export import export_to_pdf as export_df_to_pdf
-from .top_addresses_csv_export import export_top_addresses_to_csv
-from .top_addresses_html_export import export_top_addresses_to_html
-from .top_addresses_pdf_export import export_top_addresses_to_pdf
+"""
+Export backends.
+
+The public functions are resolved lazily: importing this package, or a
+function from it, does not import the backend module (and with it pandas
+helpers, ReportLab and its fonts) until the function is first called.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+from src.utils.lazy_import import lazy_callable, timed_import
+
+# Public name -> (backend module, attribute).
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "export_analysis_to_csv": ("analysis_csv_export", "export_analysis_to_csv"),
+    "export_analysis_to_html": ("analysis_html_export", "export_analysis_to_html"),
+    "export_analysis_to_pdf": ("analysis_pdf_export", "export_analysis_to_pdf"),
+    "export_transactions_to_formats": ("batch_export", "export_transactions_to_formats"),
+    "export_analysis_to_arrow": ("columnar_export", "export_analysis_to_arrow"),
+    "export_analysis_to_parquet": ("columnar_export", "export_analysis_to_parquet"),
+    "export_top_addresses_to_arrow": ("columnar_export", "export_top_addresses_to_arrow"),
+    "export_top_addresses_to_parquet": ("columnar_export", "export_top_addresses_to_parquet"),
+    "export_transactions_to_arrow": ("columnar_export", "export_transactions_to_arrow"),
+    "export_transactions_to_parquet": ("columnar_export", "export_transactions_to_parquet"),
+    "export_df_to_csv": ("csv_export", "export_to_csv"),
+    "export_transactions_to_csv": ("csv_export", "export_transactions_to_csv"),
+    "export_df_to_html": ("html_export", "export_to_html"),
+    "export_transactions_to_html": ("html_export", "export_transactions_to_html"),
+    "export_df_to_pdf": ("pdf_export", "export_to_pdf"),
+    "export_process_stats_to_csv": ("process_stats_csv_export", "export_process_stats_to_csv"),
+    "export_top_addresses_to_csv": ("top_addresses_csv_export", "export_top_addresses_to_csv"),
+    "export_top_addresses_to_html": ("top_addresses_html_export", "export_top_addresses_to_html"),
+    "export_top_addresses_to_pdf": ("top_addresses_pdf_export", "export_top_addresses_to_pdf"),
+}
+# Values that are needed as-is, so their module is imported on access.
+_CONSTANTS: Dict[str, Tuple[str, str]] = {
+    "ARROW_AVAILABLE": ("columnar_export", "ARROW_AVAILABLE"),
+    "COLUMNAR_FORMATS": ("columnar_export", "COLUMNAR_FORMATS"),
+}
+
+__all__ = sorted([*_EXPORTS, *_CONSTANTS])
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        module, attr = _EXPORTS[name]
+        value: Any = lazy_callable(f"{__name__}.{module}", attr)
+    elif name in _CONSTANTS:
+        module, attr = _CONSTANTS[name]
+        value = getattr(timed_import(f"{__name__}.{module}"), attr)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+if TYPE_CHECKING:
+    from .analysis_csv_export import export_analysis_to_csv
+    from .analysis_html_export import export_analysis_to_html
+    from .analysis_pdf_export import export_analysis_to_pdf
+    from .batch_export import export_transactions_to_formats
+    from .columnar_export import (
+        ARROW_AVAILABLE,
+        COLUMNAR_FORMATS,
+        export_analysis_to_arrow,
+        export_analysis_to_parquet,
+        export_top_addresses_to_arrow,
+        export_top_addresses_to_parquet,
+        export_transactions_to_arrow,
+        export_transactions_to_parquet,
+    )
+    from .csv_export import export_to_csv as export_df_to_csv
+    from .csv_export import export_transactions_to_csv
+    from .html_export import export_to_html as export_df_to_html
+    from .html_export import export_transactions_to_html
+    from .pdf_export import export_to_pdf as export_df_to_pdf
+    from .process_stats_csv_export import export_process_stats_to_csv
+    from .top_addresses_csv_export import export_top_addresses_to_csv
+    from .top_addresses_html_export import export_top_addresses_to_html
+    from .top_addresses_pdf_export import export_top_addresses_to_pdf
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-import base64
 import html
-import io
 import logging
 import os
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, TextIO, Tuple
 
 import pandas as pd
 
 from src.config.config import APP_NAME, CONFIG, get_active_api_config
+from src.export.html_utils import (
+    VTABLE_SCRIPT,
+    VTABLE_STYLE,
+    VirtualTableWriter,
+    dataframe_batches,
+    transaction_columns,
+)
 from src.utils.i18n import translate
 
 logger = logging.getLogger(__name__)
@@ -40,90 +45,31 @@ STYLE: str = """
 """
 
 
-def _df_to_html_table(df: pd.DataFrame, currency: str) -> str:
-    """Converts a DataFrame of transactions to an HTML table with a summary footer."""
+def _write_counterparty_table(
+    out: TextIO, table_id: str, df: pd.DataFrame, currency: str, tx_url_base: str
+) -> None:
+    """Streams a counterparty's transactions as a virtual table with a totals footer."""
     if df.empty:
-        return f"<p>{translate('No transactions for this counterparty.')}</p>"
-
-    api_config: Dict[str, Any] = get_active_api_config()
-    export_df = df.copy(deep=True).reset_index(drop=True)
-    export_df.insert(0, translate("No."), range(1, len(export_df) + 1))
-
-    export_columns: List[str] = [translate("No.")]
-    tx_url_base: str = api_config.get("explorer", {}).get("transaction", "")
+        out.write(f"<p>{translate('No transactions for this counterparty.')}</p>")
+        return
 
     value_col_key = f"value_{currency.lower()}"
-    value_col_name = translate(f"Value ({currency.upper()})")
-
-    column_definitions: List[Tuple[str, str, Callable[[Any], str]]] = [
-        (
-            "timestamp",
-            "Date/Time",
-            lambda x: pd.to_datetime(x, unit="s").strftime("%Y-%m-%d %H:%M:%S"),
-        ),
-        (
-            "txid",
-            "Transaction ID",
-            lambda x: (
-                f"<a href='{tx_url_base.format(txid=x)}' target='_blank'>{html.escape(x)}</a>"
-                if tx_url_base
-                else html.escape(x)
-            ),
-        ),
-        (
-            "direction",
-            "Direction",
-            lambda x: html.escape(translate(str(x).capitalize())),
-        ),
-        ("amount", "Amount (KAS)", lambda x: f"{x:,.8f}" if pd.notnull(x) else "N/A"),
-        (
-            value_col_key,
-            value_col_name,
-            lambda x: (
-                f"{x:,.2f} {html.escape(currency.upper())}" if pd.notnull(x) else "N/A"
-            ),
-        ),
-        ("block_height", "Block Score", lambda x: str(x)),
-        ("type", "Type", lambda x: html.escape(translate(str(x).capitalize()))),
-    ]
-
-    for col_key, col_name_key, formatter in column_definitions:
-        if col_key in export_df.columns:
-            col_name: str = (
-                col_name_key if col_key == value_col_key else translate(col_name_key)
-            )
-            export_df[col_name] = export_df[col_key].apply(formatter)
-            export_columns.append(col_name)
-
-    table_html: str = export_df[export_columns].to_html(
-        index=False, border=0, classes="kaspa-table", justify="left", escape=False
-    )
-
-    total_amount: float = df["amount"].sum()
-    total_value: float = df[value_col_key].sum() if value_col_key in df else 0.0
-
-    try:
-        amount_idx: int = export_columns.index(translate("Amount (KAS)"))
-        value_idx: int = export_columns.index(value_col_name)
-        total_label_idx: int = amount_idx - 1
-    except (ValueError, IndexError):
-        return table_html
-
-    footer_cells: str = ""
-    for i in range(len(export_columns)):
-        if i == total_label_idx:
-            footer_cells += f"<td>{translate('Total')}</td>"
-        elif i == amount_idx:
-            footer_cells += f"<td style='text-align: left;'>{total_amount:,.8f}</td>"
-        elif i == value_idx:
-            footer_cells += f"<td style='text-align: left;'>{total_value:,.2f} {html.escape(currency.upper())}</td>"
-        else:
-            footer_cells += "<td></td>"
+    sources, columns = transaction_columns(list(df.columns), currency, tx_url_base)
 
-    footer_html: str = f"<tfoot><tr>{footer_cells}</tr></tfoot>"
-    table_html = table_html.replace("</tbody>", f"{footer_html}</tbody>", 1)
+    footer: Optional[List[str]] = None
+    if "amount" in sources and value_col_key in sources:
+        # columns[0] is the row number, so field i is shown in column i + 1.
+        amount_idx = sources.index("amount") + 1
+        value_idx = sources.index(value_col_key) + 1
+        footer = [""] * len(columns)
+        footer[amount_idx - 1] = translate("Total")
+        footer[amount_idx] = f"{df['amount'].sum():,.8f}"
+        footer[value_idx] = f"{df[value_col_key].sum():,.2f} {currency.upper()}"
 
-    return table_html
+    table = VirtualTableWriter(out, table_id, columns, footer)
+    for rows in dataframe_batches(df, sources):
+        table.write_rows(rows)
+    table.close()
 
 
 def export_analysis_to_html(
@@ -168,42 +114,42 @@ def export_analysis_to_html(
             f'<footer><p>{APP_NAME} {translate("Version")} {CONFIG.get("version", "N/A")}</p><p>{translate("Exported On")}: {timestamp_str}</p></footer>'
         )
 
-        main_content: str = ""
         report_title_key: str = "Kaspa Analysis Report"
-
-        if analysis_data:
-            summary_html = f'<h2>{translate("Summary")}</h2><div class="summary-grid">'
-            for key, value in analysis_data.get("summary", {}).items():
-                summary_html += f'<div class="summary-item"><div class="title">{translate(key)}</div><div class="value">{html.escape(str(value))}</div></div>'
-            summary_html += "</div>"
-            main_content += summary_html
-
-            # Chart section fully removed
-
-        main_content += f'<h2>{translate("Counterparty Breakdown")}</h2>'
-        for cp_address, tx_list in counterparties.items():
-            cp_name: str = known_names_map.get(cp_address, "")
-            cp_name_str: str = f"({html.escape(cp_name)})" if cp_name else ""
-            cp_link: str = (
-                f'<a href="{addr_url_base.format(kaspaAddress=cp_address)}" target="_blank">{html.escape(cp_address)}</a>'
-                if addr_url_base
-                else html.escape(cp_address)
-            )
-            main_content += (
-                f'<h3>{translate("Counterparty")}: {cp_link} {cp_name_str}</h3>'
-            )
-
-            df_cp = pd.DataFrame(tx_list)
-            main_content += _df_to_html_table(df_cp, currency)
-
         html_title: str = f"{APP_NAME} - {translate(report_title_key)}"
-        full_html: str = (
-            f'<!DOCTYPE html><html lang="{CONFIG.get("language", "en")}"><html><head><meta charset="UTF-8"><title>{html.escape(html_title)}</title>{STYLE}</head>{body_tag}<h1>{html.escape(translate(report_title_key))}</h1>{report_header}{main_content}{footer}</body></html>'
+        tx_url_base: str = (
+            get_active_api_config().get("explorer", {}).get("transaction", "")
         )
 
         logger.info(f"Exporting data to HTML: {file_path}")
+        # Sections are written as they are produced so large analyses never
+        # exist as one string in memory.
         with open(file_path, "w", encoding="utf-8") as f:
-            f.write(full_html)
+            f.write(
+                f'<!DOCTYPE html><html lang="{CONFIG.get("language", "en")}"><head><meta charset="UTF-8"><title>{html.escape(html_title)}</title>{STYLE}{VTABLE_STYLE}{VTABLE_SCRIPT}</head>{body_tag}<h1>{html.escape(translate(report_title_key))}</h1>{report_header}'
+            )
+
+            if analysis_data:
+                summary_html = f'<h2>{translate("Summary")}</h2><div class="summary-grid">'
+                for key, value in analysis_data.get("summary", {}).items():
+                    summary_html += f'<div class="summary-item"><div class="title">{translate(key)}</div><div class="value">{html.escape(str(value))}</div></div>'
+                summary_html += "</div>"
+                f.write(summary_html)
+
+            f.write(f'<h2>{translate("Counterparty Breakdown")}</h2>')
+            for index, (cp_address, tx_list) in enumerate(counterparties.items()):
+                cp_name: str = known_names_map.get(cp_address, "")
+                cp_name_str: str = f"({html.escape(cp_name)})" if cp_name else ""
+                cp_link: str = (
+                    f'<a href="{addr_url_base.format(kaspaAddress=cp_address)}" target="_blank">{html.escape(cp_address)}</a>'
+                    if addr_url_base
+                    else html.escape(cp_address)
+                )
+                f.write(f'<h3>{translate("Counterparty")}: {cp_link} {cp_name_str}</h3>')
+                _write_counterparty_table(
+                    f, f"counterparty-{index}", pd.DataFrame(tx_list), currency, tx_url_base
+                )
+
+            f.write(f"{footer}</body></html>")
 
         return True, "Export Successful", os.path.basename(file_path)
     except Exception as e:
@@ -4,11 +4,12 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
-from src.config.config import CONFIG, get_active_api_config, get_assets_path
+from src.config.config import CONFIG, get_active_api_config
 from src.export.pdf_utils import (
     REPORTLAB_AVAILABLE,
     ReportPDFTemplate,
     create_paragraph,
+    register_pdf_fonts,
 )
 from src.utils.i18n import translate
 
@@ -20,19 +21,8 @@ if REPORTLAB_AVAILABLE:
     from reportlab.lib.pagesizes import landscape, letter
     from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
     from reportlab.lib.units import inch
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
     from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
     from reportlab.platypus.flowables import Flowable
-
-    font_path = get_assets_path(os.path.join("fonts", "DejaVuSans.ttf"))
-    if os.path.exists(font_path):
-        pdfmetrics.registerFont(TTFont("DejaVuSans", font_path))
-        pdfmetrics.registerFont(TTFont("DejaVuSans-Bold", font_path))
-    else:
-        logger.warning(
-            f"Font not found at {font_path}, PDF export may not render correctly."
-        )
 else:
     # Define dummy classes if reportlab is not available
     Flowable = object
@@ -66,6 +56,7 @@ def export_analysis_to_pdf(
         return False, "Error", "Missing required PDF libraries. See logs for details."
     if not file_path.lower().endswith(".pdf"):
         file_path += ".pdf"
+    register_pdf_fonts()
 
     try:
         is_rtl: bool = CONFIG.get("language", "en") == "ar"
@@ -0,0 +1,209 @@
+"""
+Writes several export formats from a single read of the transaction database.
+
+The filtered transactions are copied once into a private, temporary DuckDB
+file; every requested format is then produced from that copy, so the
+shared database is scanned only once and the copy can be interrupted
+safely when the export job is cancelled. The copy lives on disk (in the
+user's cache directory) so a large history is not held in memory twice.
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import duckdb
+import pandas as pd
+
+from src.config.config import CONFIG
+from src.export.columnar_export import (
+    export_transactions_to_arrow,
+    export_transactions_to_parquet,
+)
+from src.export.csv_export import export_transactions_to_csv
+from src.export.html_export import export_transactions_to_html
+from src.export.pdf_export import export_to_pdf
+from src.utils.i18n import translate
+
+if TYPE_CHECKING:
+    from duckdb import DuckDBPyConnection
+
+    from src.database import TransactionDB
+    from src.export.jobs import ExportJob
+
+logger = logging.getLogger(__name__)
+
+# Memory the private copy may use before DuckDB spills to its temp directory.
+COPY_MEMORY_LIMIT = "512MB"
+# Columns the PDF report renders (plus the value column of the currency).
+PDF_COLUMNS: Tuple[str, ...] = ("timestamp", "direction", "amount", "txid", "type")
+
+
+class MaterializedTransactions:
+    """
+    Filtered transactions held in a private, temporary DuckDB file. Provides
+    the parts of TransactionDB the exporters use (connect,
+    build_filter_clause), so they run unchanged against the copy. close()
+    deletes the file.
+    """
+
+    def __init__(
+        self,
+        tx_db: "TransactionDB",
+        kaspa_address: str,
+        filters: Optional[Dict[str, Any]] = None,
+        job: Optional["ExportJob"] = None,
+    ) -> None:
+        cache_dir = CONFIG.get("paths", {}).get("cache")
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._tmp_dir = tempfile.mkdtemp(prefix="export_", dir=cache_dir or None)
+        self._job = job
+        path = os.path.join(self._tmp_dir, "transactions.duckdb")
+        try:
+            self.row_count = self._copy(tx_db, path, kaspa_address, filters or {})
+            self._con: "DuckDBPyConnection" = duckdb.connect(
+                path,
+                config={"memory_limit": COPY_MEMORY_LIMIT, "temp_directory": self._tmp_dir},
+            )
+            self._columns: List[str] = [
+                row[0] for row in self._con.execute("DESCRIBE transactions").fetchall()
+            ]
+        except Exception:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+            raise
+        if job:
+            job.bind_connection(self._con)
+
+    def _copy(
+        self,
+        tx_db: "TransactionDB",
+        path: str,
+        kaspa_address: str,
+        filters: Dict[str, Any],
+    ) -> int:
+        """Writes the filtered rows into a new file at path in one statement."""
+        clause, params = tx_db.build_filter_clause(kaspa_address, **filters)
+        # Attached databases are visible to every cursor of the shared
+        # connection, so the alias must be unique to this copy.
+        alias = f"export_copy_{uuid.uuid4().hex}"
+        quoted_path = "'" + path.replace("'", "''") + "'"
+        if self._job:
+            self._job.raise_if_cancelled()
+        with tx_db.connect(read_only=True) as shared:
+            con = shared.cursor()
+            if self._job:
+                self._job.bind_connection(con)
+            try:
+                con.execute(f"ATTACH {quoted_path} AS {alias}")
+                try:
+                    # The clause only holds placeholders; values are in params.
+                    (row_count,) = con.execute(
+                        f"CREATE TABLE {alias}.transactions AS "  # nosec B608
+                        f"SELECT * FROM transactions WHERE {clause}",
+                        params,
+                    ).fetchone()
+                finally:
+                    con.execute(f"DETACH {alias}")
+            finally:
+                if self._job:
+                    self._job.unbind_connection(con)
+                con.close()
+        if self._job:
+            self._job.raise_if_cancelled()
+        return row_count
+
+    @contextmanager
+    def connect(self, read_only: bool = False) -> Iterator["DuckDBPyConnection"]:
+        yield self._con
+
+    def build_filter_clause(
+        self, address: str, **kwargs: Any
+    ) -> Tuple[str, List[Any]]:
+        # The copy only holds rows that already passed the filters.
+        return "TRUE", []
+
+    def to_dataframe(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """The copy, newest first; only the given columns that exist, if any."""
+        if columns is None:
+            select_list = "*"
+        else:
+            select_list = ", ".join(
+                f'"{name}"' for name in columns if name in self._columns
+            )
+        # Column names are checked against the copied schema.
+        return self._con.execute(
+            f"SELECT {select_list} FROM transactions ORDER BY timestamp DESC"  # nosec B608
+        ).df()
+
+    def close(self) -> None:
+        if self._job:
+            self._job.unbind_connection(self._con)
+        try:
+            self._con.close()
+        finally:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+
+def export_transactions_to_formats(
+    tx_db: "TransactionDB",
+    targets: Dict[str, str],
+    kaspa_address: str,
+    address_name: str,
+    currency: str,
+    filters: Optional[Dict[str, Any]] = None,
+    job: Optional["ExportJob"] = None,
+    **kwargs: Any,
+) -> Dict[str, Tuple[bool, str, str]]:
+    """
+    Exports the filtered transactions to every format in `targets`
+    ({format: file_path}) from one read of the database.
+    """
+    db_exporters = {
+        "csv": export_transactions_to_csv,
+        "html": export_transactions_to_html,
+        "parquet": export_transactions_to_parquet,
+        "arrow": export_transactions_to_arrow,
+    }
+    unknown = set(targets) - set(db_exporters) - {"pdf"}
+    if unknown:
+        raise ValueError(f"No export function found for format: {sorted(unknown)}")
+
+    results: Dict[str, Tuple[bool, str, str]] = {}
+    source = MaterializedTransactions(tx_db, kaspa_address, filters, job=job)
+    try:
+        logger.info(
+            f"Exporting {source.row_count} transactions to {', '.join(targets)}"
+        )
+        for export_format, file_path in targets.items():
+            if job:
+                job.raise_if_cancelled()
+            common = {
+                "file_path": file_path,
+                "kaspa_address": kaspa_address,
+                "address_name": address_name,
+                "currency": currency,
+                "known_names_map": kwargs.get("known_names_map"),
+                "job": job,
+            }
+            if export_format == "pdf":
+                value_col = f"value_{currency.lower()}"
+                results[export_format] = export_to_pdf(
+                    source.to_dataframe((*PDF_COLUMNS, value_col)), **common
+                )
+            else:
+                results[export_format] = db_exporters[export_format](
+                    source, **common
+                )
+    finally:
+        source.close()
+
+    if job and job.cancelled:
+        results = {
+            fmt: (False, "Error", translate("Export cancelled.")) for fmt in targets
+        }
+    return results
@@ -0,0 +1,403 @@
+"""
+Typed, columnar exports (Parquet and Arrow IPC) written directly from DuckDB.
+
+Parquet files are produced with DuckDB's COPY (zstd compressed). Arrow IPC
+files are streamed batch by batch from the query result and need pyarrow,
+which is optional. Neither path builds a pandas DataFrame.
+"""
+
+import importlib.util
+import logging
+import os
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from src.config.config import APP_NAME, APP_VERSION
+from src.utils.i18n import translate
+
+if TYPE_CHECKING:
+    from duckdb import DuckDBPyConnection
+
+    from src.database import AppDataDB, TransactionDB
+    from src.export.jobs import ExportJob
+
+logger = logging.getLogger(__name__)
+
+# pyarrow is only imported when an Arrow file is actually written.
+ARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# Formats written by this module, in the order they are offered in the UI.
+COLUMNAR_FORMATS: Tuple[str, ...] = ("parquet", "arrow")
+
+# Rows per Parquet row group: large enough to compress well, small enough
+# that readers can still skip groups in very large exports.
+ROW_GROUP_SIZE = 1_048_576
+ARROW_BATCH_SIZE = 65_536
+
+
+def _sql_literal(value: str) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _file_metadata(**extra: Any) -> Dict[str, str]:
+    metadata = {
+        "generator": f"{APP_NAME} {APP_VERSION}",
+        "exported_on": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    metadata.update({k: str(v) for k, v in extra.items() if v not in (None, "")})
+    return metadata
+
+
+def _write_query(
+    export_format: str,
+    con: "DuckDBPyConnection",
+    query: str,
+    params: Sequence[Any],
+    file_path: str,
+    metadata: Dict[str, str],
+    job: Optional["ExportJob"] = None,
+) -> int:
+    """Writes the query result to file_path and returns the row count."""
+    if job:
+        job.raise_if_cancelled()
+
+    if export_format == "parquet":
+        kv = ", ".join(
+            f'"{k.replace(chr(34), "")}": {_sql_literal(v)}'
+            for k, v in metadata.items()
+        )
+        # COPY returns the number of rows it wrote.
+        row_count = con.execute(
+            f"COPY ({query}) TO {_sql_literal(file_path)} "
+            f"(FORMAT PARQUET, COMPRESSION ZSTD, "
+            f"ROW_GROUP_SIZE {ROW_GROUP_SIZE}, KV_METADATA {{{kv}}})",
+            list(params),
+        ).fetchone()[0]
+        if job:
+            job.add_rows(row_count)
+        return row_count
+
+    if not ARROW_AVAILABLE:
+        raise RuntimeError(translate("Arrow export requires pyarrow."))
+    import pyarrow as pa
+    import pyarrow.ipc
+
+    reader = con.execute(query, list(params)).fetch_record_batch(ARROW_BATCH_SIZE)
+    schema = reader.schema.with_metadata(metadata)
+    row_count = 0
+    with pa.OSFile(file_path, "wb") as sink:
+        with pa.ipc.new_file(sink, schema) as writer:
+            for batch in reader:
+                if job:
+                    job.raise_if_cancelled()
+                writer.write_batch(batch)
+                row_count += batch.num_rows
+                if job:
+                    job.add_rows(batch.num_rows)
+    return row_count
+
+
+def _ensure_extension(file_path: str, export_format: str) -> str:
+    if not file_path.lower().endswith(f".{export_format}"):
+        file_path += f".{export_format}"
+    return file_path
+
+
+def _export_transactions(
+    export_format: str,
+    tx_db: "TransactionDB",
+    file_path: str,
+    kaspa_address: str,
+    address_name: str,
+    currency: str,
+    filters: Optional[Dict[str, Any]],
+    job: Optional["ExportJob"] = None,
+) -> Tuple[bool, str, str]:
+    file_path = _ensure_extension(file_path, export_format)
+    try:
+        value_col = f"value_{currency.lower()}"
+        clause, params = tx_db.build_filter_clause(kaspa_address, **(filters or {}))
+        # Column names are fixed; the clause only holds placeholders.
+        query = f"""
+            SELECT
+                txid, address, direction, "type", from_address, to_address,
+                amount, "{value_col}" AS value, block_height,
+                make_timestamp(CAST("timestamp" AS BIGINT) * 1000000) AS "timestamp"
+            FROM transactions
+            WHERE {clause}
+            ORDER BY "timestamp" DESC
+        """  # nosec B608
+        metadata = _file_metadata(
+            kaspa_address=kaspa_address,
+            address_name=address_name,
+            currency=currency.upper(),
+        )
+        with tx_db.connect(read_only=True) as con:
+            rows = _write_query(
+                export_format, con, query, params, file_path, metadata, job
+            )
+        logger.info(f"Exported {rows} transactions to {export_format}: {file_path}")
+        return True, "Export Successful", os.path.basename(file_path)
+    except Exception as e:
+        logger.error(f"{export_format.capitalize()} Export Error: {e}")
+        return False, "Error", str(e)
+
+
+def _export_analysis(
+    export_format: str,
+    tx_db: "TransactionDB",
+    file_path: str,
+    kaspa_address: str,
+    address_name: str,
+    currency: str,
+    counterparties: Dict[str, List[Dict[str, Any]]],
+    known_names_map: Dict[str, str],
+    analysis_data: Optional[Dict[str, Any]],
+    job: Optional["ExportJob"] = None,
+) -> Tuple[bool, str, str]:
+    file_path = _ensure_extension(file_path, export_format)
+    try:
+        cp_addresses: List[str] = []
+        cp_names: List[str] = []
+        txids: List[str] = []
+        for cp_address, tx_list in counterparties.items():
+            name = known_names_map.get(cp_address, "")
+            for tx in tx_list:
+                cp_addresses.append(cp_address)
+                cp_names.append(name)
+                txids.append(str(tx.get("txid")))
+
+        value_col = f"value_{currency.lower()}"
+        # The counterparty/txid pairs are bound as list parameters and joined
+        # against the stored transactions to keep their column types.
+        query = f"""
+            SELECT
+                cp.counterparty, NULLIF(cp.counterparty_name, '') AS counterparty_name,
+                t.txid, t.direction, t."type", t.amount, t."{value_col}" AS value,
+                t.block_height,
+                make_timestamp(CAST(t."timestamp" AS BIGINT) * 1000000) AS "timestamp"
+            FROM (
+                SELECT
+                    unnest(?::VARCHAR[]) AS counterparty,
+                    unnest(?::VARCHAR[]) AS counterparty_name,
+                    unnest(?::VARCHAR[]) AS txid
+            ) AS cp
+            JOIN transactions AS t ON t.txid = cp.txid
+            ORDER BY cp.counterparty, t."timestamp"
+        """  # nosec B608
+        summary = (analysis_data or {}).get("summary") or {}
+        metadata = _file_metadata(
+            kaspa_address=kaspa_address,
+            address_name=address_name,
+            currency=currency.upper(),
+            **{f"summary.{k}": v for k, v in summary.items()},
+        )
+        with tx_db.connect(read_only=True) as con:
+            rows = _write_query(
+                export_format,
+                con,
+                query,
+                [cp_addresses, cp_names, txids],
+                file_path,
+                metadata,
+                job,
+            )
+        logger.info(f"Exported {rows} analysis rows to {export_format}: {file_path}")
+        return True, "Export Successful", os.path.basename(file_path)
+    except Exception as e:
+        logger.error(f"{export_format.capitalize()} Export Error: {e}")
+        return False, "Error", str(e)
+
+
+def _export_top_addresses(
+    export_format: str,
+    app_data_db: "AppDataDB",
+    snapshot_id: int,
+    file_path: str,
+    currency: str,
+    price: float,
+    compare_snapshot_id: Optional[int],
+    search: Optional[str],
+    sort_by: str,
+    descending: bool,
+    job: Optional["ExportJob"] = None,
+) -> Tuple[bool, str, str]:
+    file_path = _ensure_extension(file_path, export_format)
+    try:
+        clause, filter_params, order_by = app_data_db.build_rich_list_clause(
+            search, sort_by, descending
+        )
+        # Same selection and order as AppDataDB.query_rich_list; the clause
+        # only holds placeholders and allowlisted sort expressions.
+        query = f"""
+            SELECT
+                e."rank", e.address, n.name, e.balance,
+                e.balance * CAST(? AS DOUBLE) AS value,
+                make_timestamp(s.taken_at * 1000000) AS taken_at
+            FROM rich_list_entries AS e
+            JOIN rich_list_snapshots AS s ON s.snapshot_id = e.snapshot_id
+            LEFT JOIN known_names AS n ON n.address = e.address
+            LEFT JOIN rich_list_entries AS p
+                ON p.snapshot_id = ? AND p.address = e.address
+            WHERE e.snapshot_id = ?{clause}
+            ORDER BY {order_by}
+        """  # nosec B608
+        params = [price, compare_snapshot_id, snapshot_id, *filter_params]
+        metadata = _file_metadata(
+            snapshot_id=snapshot_id, currency=currency.upper(), search=search
+        )
+        with app_data_db.connect(read_only=True) as con:
+            rows = _write_query(
+                export_format, con, query, params, file_path, metadata, job
+            )
+        logger.info(f"Exported {rows} top addresses to {export_format}: {file_path}")
+        return True, "Export Successful", os.path.basename(file_path)
+    except Exception as e:
+        logger.error(f"{export_format.capitalize()} Export Error: {e}")
+        return False, "Error", str(e)
+
+
+def export_transactions_to_parquet(
+    tx_db: "TransactionDB",
+    file_path: str,
+    kaspa_address: str,
+    address_name: str,
+    currency: str,
+    filters: Optional[Dict[str, Any]] = None,
+    **kwargs,
+) -> Tuple[bool, str, str]:
+    return _export_transactions(
+        "parquet",
+        tx_db,
+        file_path,
+        kaspa_address,
+        address_name,
+        currency,
+        filters,
+        kwargs.get("job"),
+    )
+
+
+def export_transactions_to_arrow(
+    tx_db: "TransactionDB",
+    file_path: str,
+    kaspa_address: str,
+    address_name: str,
+    currency: str,
+    filters: Optional[Dict[str, Any]] = None,
+    **kwargs,
+) -> Tuple[bool, str, str]:
+    return _export_transactions(
+        "arrow",
+        tx_db,
+        file_path,
+        kaspa_address,
+        address_name,
+        currency,
+        filters,
+        kwargs.get("job"),
+    )
+
+
+def export_analysis_to_parquet(
+    tx_db: "TransactionDB",
+    file_path: str,
+    kaspa_address: str,
+    address_name: str,
+    currency: str,
+    counterparties: Dict[str, List[Dict[str, Any]]],
+    known_names_map: Dict[str, str],
+    analysis_data: Optional[Dict[str, Any]] = None,
+    **kwargs,
+) -> Tuple[bool, str, str]:
+    return _export_analysis(
+        "parquet",
+        tx_db,
+        file_path,
+        kaspa_address,
+        address_name,
+        currency,
+        counterparties,
+        known_names_map,
+        analysis_data,
+        kwargs.get("job"),
+    )
+
+
+def export_analysis_to_arrow(
+    tx_db: "TransactionDB",
+    file_path: str,
+    kaspa_address: str,
+    address_name: str,
+    currency: str,
+    counterparties: Dict[str, List[Dict[str, Any]]],
+    known_names_map: Dict[str, str],
+    analysis_data: Optional[Dict[str, Any]] = None,
+    **kwargs,
+) -> Tuple[bool, str, str]:
+    return _export_analysis(
+        "arrow",
+        tx_db,
+        file_path,
+        kaspa_address,
+        address_name,
+        currency,
+        counterparties,
+        known_names_map,
+        analysis_data,
+        kwargs.get("job"),
+    )
+
+
+def export_top_addresses_to_parquet(
+    app_data_db: "AppDataDB",
+    snapshot_id: int,
+    file_path: str,
+    currency: str = "USD",
+    price: float = 0.0,
+    compare_snapshot_id: Optional[int] = None,
+    search: Optional[str] = None,
+    sort_by: str = "rank",
+    descending: bool = False,
+    **kwargs,
+) -> Tuple[bool, str, str]:
+    return _export_top_addresses(
+        "parquet",
+        app_data_db,
+        snapshot_id,
+        file_path,
+        currency,
+        price,
+        compare_snapshot_id,
+        search,
+        sort_by,
+        descending,
+        kwargs.get("job"),
+    )
+
+
+def export_top_addresses_to_arrow(
+    app_data_db: "AppDataDB",
+    snapshot_id: int,
+    file_path: str,
+    currency: str = "USD",
+    price: float = 0.0,
+    compare_snapshot_id: Optional[int] = None,
+    search: Optional[str] = None,
+    sort_by: str = "rank",
+    descending: bool = False,
+    **kwargs,
+) -> Tuple[bool, str, str]:
+    return _export_top_addresses(
+        "arrow",
+        app_data_db,
+        snapshot_id,
+        file_path,
+        currency,
+        price,
+        compare_snapshot_id,
+        search,
+        sort_by,
+        descending,
+        kwargs.get("job"),
+    )
@@ -1,15 +1,155 @@
 import logging
 import os
+import shutil
 from datetime import datetime
-from typing import Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
+import duckdb
 import pandas as pd
 
 from src.config.config import APP_NAME, APP_VERSION, get_active_api_config
+from src.export.known_names import known_names_sql, register_known_names
 from src.utils.i18n import translate
+from src.utils.validation import sanitize_csv_cell
+
+if TYPE_CHECKING:
+    from duckdb import DuckDBPyConnection
+
+    from src.database import TransactionDB
+    from src.export.jobs import ExportJob
 
 logger = logging.getLogger(__name__)
 
+# Buffer used when appending DuckDB's CSV output after the metadata header.
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _quote_ident(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _header_text(kaspa_address: str, address_name: str, currency: str) -> str:
+    timestamp_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    header = f'# {APP_NAME} {translate("Version")} {APP_VERSION}\n'
+    header += f'# {translate("Kaspa Address")}: {kaspa_address}\n'
+    if address_name:
+        header += f'# {translate("Address Name")}: {address_name}\n'
+    header += f'# {translate("Currency")}: {currency.upper()}\n'
+    header += f'# {translate("Exported On")}: {timestamp_str}\n\n'
+    return header
+
+
+def _build_projection(
+    con: "DuckDBPyConnection",
+    source: str,
+    source_params: Sequence[Any],
+    columns: List[str],
+    currency: str,
+    resolve_names: bool = False,
+) -> Tuple[str, List[Any]]:
+    """
+    Builds the SELECT list that formats the export in SQL: translated
+    direction/type labels, currency strings, dates and explorer URLs.
+    With `resolve_names`, addresses are replaced by the names registered
+    via register_known_names().
+    Returns the select list and its parameters (which precede the source's).
+    """
+    tx_url_base = get_active_api_config()["explorer"]["transaction"]
+    currency_upper = currency.upper()
+    value_col_key = f"value_{currency.lower()}"
+    rename_map = {
+        "txid": translate("Transaction ID"),
+        "direction": translate("Direction"),
+        "from_address": translate("From Address(es)"),
+        "to_address": translate("To Address(es)"),
+        "amount": translate("Amount (KAS)"),
+        "block_height": translate("Block Score"),
+        "type": translate("Type:"),
+        value_col_key: translate(f"Value ({currency_upper})"),
+    }
+
+    select_items: List[str] = []
+    params: List[Any] = []
+    # Identifiers are quoted and all values are bound as parameters.
+    for col in columns:
+        ident = _quote_ident(col)
+        if col in ("direction", "type"):
+            # Only a handful of distinct values exist, so the labels are
+            # translated once here and mapped in SQL with a CASE expression.
+            values = con.execute(
+                f"SELECT DISTINCT {ident} FROM {source} WHERE {ident} IS NOT NULL",  # nosec B608
+                list(source_params),
+            ).fetchall()
+            if values:
+                whens = " ".join("WHEN ? THEN ?" for _ in values)
+                expr = f"CASE CAST({ident} AS VARCHAR) {whens} END"
+                for (value,) in values:
+                    params.extend([str(value), translate(str(value).capitalize())])
+            else:
+                expr = ident
+        elif col == value_col_key:
+            as_double = f"CAST({ident} AS DOUBLE)"
+            expr = (
+                f"CASE WHEN {ident} IS NULL OR isnan({as_double}) THEN 'N/A' "
+                f"ELSE format('{{:,.2f}}', {as_double}) || ? END"
+            )
+            params.append(f" {currency_upper}")
+        elif resolve_names and col in ("from_address", "to_address"):
+            expr = known_names_sql(ident)
+        else:
+            expr = ident
+        select_items.append(f"{expr} AS {_quote_ident(rename_map.get(col, col))}")
+
+    if "timestamp" in columns:
+        select_items.append(
+            "strftime(make_timestamp(CAST(timestamp AS BIGINT) * 1000000), "
+            "'%Y-%m-%d %H:%M:%S') AS \"Date/Time\""
+        )
+    if "txid" in columns:
+        prefix, sep, suffix = tx_url_base.partition("{txid}")
+        if sep:
+            select_items.append('? || txid || ? AS "Transaction URL"')
+            params.extend([prefix, suffix])
+        else:
+            select_items.append('? AS "Transaction URL"')
+            params.append(tx_url_base)
+
+    return ", ".join(select_items), params
+
+
+def _copy_with_header(
+    con: "DuckDBPyConnection",
+    query: str,
+    params: List[Any],
+    file_path: str,
+    header: str,
+    job: Optional["ExportJob"] = None,
+) -> None:
+    """
+    Streams the query result to CSV with DuckDB's COPY, then writes the
+    metadata header followed by that output. Memory use does not depend on
+    the number of rows.
+    """
+    tmp_path = file_path + ".part"
+    escaped_path = tmp_path.replace("'", "''")
+    try:
+        if job:
+            job.raise_if_cancelled()
+        (row_count,) = con.execute(
+            f"COPY ({query}) TO '{escaped_path}' (FORMAT CSV, HEADER, DELIMITER ',')",
+            params,
+        ).fetchone()
+        if job:
+            job.raise_if_cancelled()
+            job.add_rows(row_count)
+        with open(file_path, "wb") as out:
+            out.write(header.encode("utf-8-sig"))
+            with open(tmp_path, "rb") as body:
+                shutil.copyfileobj(body, out, COPY_BUFFER_SIZE)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
 
 def export_to_csv(
     df: pd.DataFrame,
@@ -22,61 +162,86 @@ def export_to_csv(
     if not file_path.lower().endswith(".csv"):
         file_path += ".csv"
     try:
-        export_df = df.copy(deep=True)
-        api_config = get_active_api_config()
-        tx_url_base = api_config["explorer"]["transaction"]
-
-        if "direction" in export_df.columns:
-            export_df["direction"] = export_df["direction"].apply(
-                lambda x: translate(str(x).capitalize())
+        logger.info(f"Exporting data to CSV: {file_path}")
+        # The DataFrame is scanned in place by DuckDB; no copy is made.
+        with duckdb.connect() as con:
+            con.register("export_df", df)
+            resolve_names = register_known_names(
+                con, kwargs.get("known_names_map"), sanitize_csv_cell
             )
-        if "type" in export_df.columns:
-            export_df["type"] = export_df["type"].apply(
-                lambda x: translate(str(x).capitalize())
+            select_list, params = _build_projection(
+                con,
+                "export_df",
+                [],
+                [str(c) for c in df.columns],
+                currency,
+                resolve_names,
             )
-        if "timestamp" in export_df.columns:
-            export_df["Date/Time"] = pd.to_datetime(
-                export_df["timestamp"], unit="s"
-            ).dt.tz_localize(None)
-        if "txid" in export_df.columns:
-            export_df["Transaction URL"] = export_df["txid"].apply(
-                lambda x: tx_url_base.format(txid=x)
+            _copy_with_header(
+                con,
+                f"SELECT {select_list} FROM export_df",  # nosec B608
+                params,
+                file_path,
+                _header_text(kaspa_address, address_name, currency),
+                kwargs.get("job"),
             )
+        return True, "Export Successful", os.path.basename(file_path)
+    except (OSError, KeyError, Exception) as e:
+        logger.error(f"CSV Export Error: {e}")
+        return False, "Error", str(e)
 
-        currency_upper = currency.upper()
-        value_col_key = f"value_{currency.lower()}"
-        value_col_name = translate(f"Value ({currency_upper})")
-
-        if value_col_key in export_df.columns:
-            export_df[value_col_key] = export_df[value_col_key].apply(
-                lambda x: f"{x:,.2f} {currency_upper}" if pd.notnull(x) else "N/A"
-            )
-
-        rename_map = {
-            "txid": translate("Transaction ID"),
-            "direction": translate("Direction"),
-            "from_address": translate("From Address(es)"),
-            "to_address": translate("To Address(es)"),
-            "amount": translate("Amount (KAS)"),
-            "block_height": translate("Block Score"),
-            "type": translate("Type:"),
-            value_col_key: value_col_name,
-        }
-        cols_to_rename = {k: v for k, v in rename_map.items() if k in export_df.columns}
-        export_df.rename(columns=cols_to_rename, inplace=True)
-
-        timestamp_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Exporting data to CSV: {file_path}")
-
-        with open(file_path, "w", encoding="utf-8-sig", newline="") as f:
-            f.write(f'# {APP_NAME} {translate("Version")} {APP_VERSION}\n')
-            f.write(f'# {translate("Kaspa Address")}: {kaspa_address}\n')
-            if address_name:
-                f.write(f'# {translate("Address Name")}: {address_name}\n')
-            f.write(f'# {translate("Currency")}: {currency_upper}\n')
-            f.write(f'# {translate("Exported On")}: {timestamp_str}\n\n')
-            export_df.to_csv(f, index=False)
 
+def export_transactions_to_csv(
+    tx_db: "TransactionDB",
+    file_path: str,
+    kaspa_address: str,
+    address_name: str,
+    currency: str,
+    filters: Optional[Dict[str, Any]] = None,
+    **kwargs,
+) -> Tuple[bool, str, str]:
+    """
+    Exports an address's transactions straight from the transaction
+    database, applying the same filters as the explorer view.
+    """
+    if not file_path.lower().endswith(".csv"):
+        file_path += ".csv"
+    try:
+        clause, where_params = tx_db.build_filter_clause(
+            kaspa_address, **(filters or {})
+        )
+        # The clause only holds placeholders; values are in where_params.
+        source = f"(SELECT * FROM transactions WHERE {clause}) AS src"  # nosec B608
+        logger.info(f"Streaming transactions to CSV: {file_path}")
+        job = kwargs.get("job")
+        with tx_db.connect(read_only=True) as shared_con:
+            # A cursor keeps the registered names private to this export and
+            # lets a cancelled job interrupt only its own query.
+            con = shared_con.cursor()
+            if job:
+                job.bind_connection(con)
+            try:
+                resolve_names = register_known_names(
+                    con, kwargs.get("known_names_map"), sanitize_csv_cell
+                )
+                columns = [
+                    row[0] for row in con.execute("DESCRIBE transactions").fetchall()
+                ]
+                select_list, params = _build_projection(
+                    con, source, where_params, columns, currency, resolve_names
+                )
+                _copy_with_header(
+                    con,
+                    f"SELECT {select_list} FROM {source} ORDER BY timestamp DESC",  # nosec B608
+                    params + where_params,
+                    file_path,
+                    _header_text(kaspa_address, address_name, currency),
+                    job,
+                )
+            finally:
+                if job:
+                    job.unbind_connection(con)
+                con.close()
         return True, "Export Successful", os.path.basename(file_path)
     except (OSError, KeyError, Exception) as e:
         logger.error(f"CSV Export Error: {e}")
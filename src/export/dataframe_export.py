@@ -7,11 +7,13 @@ from typing import Any, Dict, List, Tuple, cast
 
 import pandas as pd
 
-from src.config.config import APP_NAME, CONFIG, get_active_api_config, get_assets_path
+from src.config.config import APP_NAME, CONFIG, get_active_api_config
+from src.export.known_names import resolve_known_names
 from src.export.pdf_utils import (
     REPORTLAB_AVAILABLE,
     ReportPDFTemplate,
     create_paragraph,
+    register_pdf_fonts,
 )
 from src.utils.i18n import translate
 from src.utils.validation import sanitize_csv_cell
@@ -42,15 +44,8 @@ if REPORTLAB_AVAILABLE:
     from reportlab.lib.pagesizes import landscape, letter
     from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
     from reportlab.lib.units import inch
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
     from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
 
-    font_path = get_assets_path(os.path.join("fonts", "DejaVuSans.ttf"))
-    if os.path.exists(font_path):
-        pdfmetrics.registerFont(TTFont("DejaVuSans", font_path))
-        pdfmetrics.registerFont(TTFont("DejaVuSans-Bold", font_path))
-
 
 def _create_report_header_text(
     kaspa_address: str, address_name: str, currency: str
@@ -99,20 +94,11 @@ def _prepare_dataframe_for_export(
 
     for addr_col in ["from_address", "to_address"]:
         if addr_col in export_df.columns:
-            if sanitize_for_csv:
-                export_df[addr_col] = export_df[addr_col].apply(
-                    lambda x: ", ".join(
-                        sanitize_csv_cell(known_names_map.get(addr, addr))
-                        for addr in str(x).split(", ")
-                    )
-                )
-            else:
-                export_df[addr_col] = export_df[addr_col].apply(
-                    lambda x: ", ".join(
-                        html.escape(known_names_map.get(addr, addr))
-                        for addr in str(x).split(", ")
-                    )
-                )
+            export_df[addr_col] = resolve_known_names(
+                export_df[addr_col],
+                known_names_map,
+                sanitize_csv_cell if sanitize_for_csv else html.escape,
+            )
 
     if "timestamp" in export_df.columns:
         export_df["timestamp"] = pd.to_datetime(export_df["timestamp"], unit="s")
@@ -276,6 +262,7 @@ def export_df_to_pdf(
         return False, "Error", "Missing required PDF libraries."
     if not file_path.lower().endswith(".pdf"):
         file_path += ".pdf"
+    register_pdf_fonts()
 
     try:
         is_rtl: bool = CONFIG.get("language", "en") == "ar"
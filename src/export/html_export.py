@@ -2,13 +2,36 @@ import html
 import logging
 import os
 from datetime import datetime
-from typing import Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import pandas as pd
 
 from src.config.config import APP_NAME, APP_VERSION, get_active_api_config
+from src.export.html_utils import (
+    CHUNK_ROWS,
+    VTABLE_SCRIPT,
+    VTABLE_STYLE,
+    VirtualTableWriter,
+    dataframe_batches,
+    transaction_columns,
+)
 from src.utils.i18n import translate
 
+if TYPE_CHECKING:
+    from src.database import TransactionDB
+    from src.export.jobs import ExportJob
+
 logger = logging.getLogger(__name__)
 
 STYLE = """
@@ -30,6 +53,84 @@ STYLE = """
 """
 
 
+def _report_head(title: str, is_rtl: bool) -> str:
+    body_tag = f'<body class="{"rtl" if is_rtl else ""}">'
+    return (
+        f'<!DOCTYPE html><html><head><meta charset="UTF-8">'
+        f"<title>{html.escape(title)}</title>{STYLE}{VTABLE_STYLE}{VTABLE_SCRIPT}"
+        f"</head>{body_tag}"
+    )
+
+
+def _report_header(
+    addr_url_base: str, kaspa_address: str, address_name: str, currency: str
+) -> str:
+    address_name_html = (
+        f'<p><strong>{translate("Address Name")}:</strong> {html.escape(address_name)}</p>'
+        if address_name
+        else ""
+    )
+    return f"""
+        <h1>{html.escape(translate("Kaspa Transaction Report"))}</h1>
+        <div class="report-info">
+            <p><strong>{translate("Kaspa Address")}:</strong> <a href='{addr_url_base.format(kaspaAddress=kaspa_address)}' target='_blank'>{html.escape(kaspa_address)}</a></p>
+            {address_name_html}
+            <p><strong>{translate("Currency")}:</strong> {html.escape(currency.upper())}</p>
+        </div>
+        """
+
+
+def _report_footer() -> str:
+    timestamp_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return f"""
+        <footer>
+            <p>{APP_NAME} {translate('Version')} {APP_VERSION}</p>
+            <p>{translate("Exported On")}: {timestamp_str}</p>
+        </footer>
+        </body></html>"""
+
+
+def _write_report(
+    file_path: str,
+    kaspa_address: str,
+    address_name: str,
+    currency: str,
+    available_columns: Sequence[str],
+    batches: Callable[[List[str]], Iterable[List[Sequence[Any]]]],
+    job: Optional["ExportJob"] = None,
+) -> int:
+    """
+    Writes the report to file_path table chunk by table chunk. `batches`
+    receives the source columns to read and yields lists of row values.
+    """
+    api_config = get_active_api_config()
+    is_rtl = api_config.get("language", "en") == "ar"
+    sources, columns = transaction_columns(
+        available_columns, currency, api_config["explorer"]["transaction"]
+    )
+    html_title = f"{APP_NAME} - {translate('Kaspa Transaction Report')}"
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(_report_head(html_title, is_rtl))
+        f.write(
+            _report_header(
+                api_config["explorer"]["address"],
+                kaspa_address,
+                address_name,
+                currency,
+            )
+        )
+        table = VirtualTableWriter(f, "transactions", columns)
+        for rows in batches(sources):
+            if job:
+                job.raise_if_cancelled()
+            table.write_rows(rows)
+            if job:
+                job.add_rows(len(rows))
+        row_count = table.close()
+        f.write(_report_footer())
+    return row_count
+
+
 def export_to_html(
     df: pd.DataFrame,
     file_path: str,
@@ -41,82 +142,70 @@ def export_to_html(
     if not file_path.lower().endswith(".html"):
         file_path += ".html"
     try:
-        api_config = get_active_api_config()
-        addr_url_base = api_config["explorer"]["address"]
-        tx_url_base = api_config["explorer"]["transaction"]
-
-        is_rtl = get_active_api_config().get("language", "en") == "ar"
-        body_tag = f'<body class="{"rtl" if is_rtl else ""}">'
-        export_df = df.copy(deep=True)
-        if "status" in export_df.columns:
-            export_df.drop(columns=["status"], inplace=True)
-        export_df = export_df.reset_index(drop=True)
-        export_df.insert(0, translate("No."), range(1, len(export_df) + 1))
-
-        export_columns = [translate("No.")]
-
-        column_definitions = [
-            (
-                "timestamp",
-                "Date/Time",
-                lambda x: pd.to_datetime(x, unit="s").strftime("%Y-%m-%d %H:%M:%S"),
-            ),
-            (
-                "txid",
-                "Transaction ID",
-                lambda x: f"<a href='{tx_url_base.format(txid=x)}' target='_blank'>{html.escape(x)}</a>",
-            ),
-            (
-                "direction",
-                "Direction",
-                lambda x: html.escape(translate(str(x).capitalize())),
-            ),
-            ("amount", "Amount (KAS)", lambda x: f"{x:,.8f}"),
-            (
-                f"value_{currency.lower()}",
-                f"Value ({currency.upper()})",
-                lambda x: f"{x:,.2f} {currency.upper()}" if pd.notnull(x) else "N/A",
-            ),
-            ("block_height", "Block Score", lambda x: str(x)),
-            ("type", "Type", lambda x: html.escape(translate(str(x).capitalize()))),
-        ]
-
-        for col_key, col_name_key, formatter in column_definitions:
-            if col_key in export_df.columns:
-                col_name = translate(col_name_key)
-                export_df[col_name] = export_df[col_key].apply(formatter)
-                export_columns.append(col_name)
-
-        html_table = export_df[export_columns].to_html(
-            index=False, border=0, classes="kaspa-table", escape=False
+        logger.info(f"Exporting data to HTML: {file_path}")
+        _write_report(
+            file_path,
+            kaspa_address,
+            address_name,
+            currency,
+            [str(c) for c in df.columns],
+            lambda sources: dataframe_batches(df, sources),
+            kwargs.get("job"),
         )
-        timestamp_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        address_name_html = (
-            f'<p><strong>{translate("Address Name")}:</strong> {html.escape(address_name)}</p>'
-            if address_name
-            else ""
+        return True, "Export Successful", os.path.basename(file_path)
+    except Exception as e:
+        logger.error(f"HTML Export Error: {e}")
+        return False, "Error", str(e)
+
+
+def export_transactions_to_html(
+    tx_db: "TransactionDB",
+    file_path: str,
+    kaspa_address: str,
+    address_name: str,
+    currency: str,
+    filters: Optional[Dict[str, Any]] = None,
+    **kwargs,
+) -> Tuple[bool, str, str]:
+    """
+    Exports an address's transactions straight from the transaction
+    database, applying the same filters as the explorer view. Rows are
+    fetched and written one chunk at a time.
+    """
+    if not file_path.lower().endswith(".html"):
+        file_path += ".html"
+    try:
+        clause, where_params = tx_db.build_filter_clause(
+            kaspa_address, **(filters or {})
         )
-        report_header = f"""
-        <div class="report-info">
-            <p><strong>{translate("Kaspa Address")}:</strong> <a href='{addr_url_base.format(kaspaAddress=kaspa_address)}' target='_blank'>{html.escape(kaspa_address)}</a></p>
-            {address_name_html}
-            <p><strong>{translate("Currency")}:</strong> {html.escape(currency.upper())}</p>
-        </div>
-        """
-        footer = f"""
-        <footer>
-            <p>{APP_NAME} {translate('Version')} {APP_VERSION}</p>
-            <p>{translate("Exported On")}: {timestamp_str}</p>
-        </footer>
-        """
-        html_title = f"{APP_NAME} - {translate('Kaspa Transaction Report')}"
-        report_title = translate("Kaspa Transaction Report")
-        full_html = f'<!DOCTYPE html><html><head><meta charset="UTF-8"><title>{html.escape(html_title)}</title>{STYLE}</head>{body_tag}<h1>{html.escape(report_title)}</h1>{report_header}{html_table}{footer}</body></html>'
+        logger.info(f"Streaming transactions to HTML: {file_path}")
+        with tx_db.connect(read_only=True) as con:
+            available = [row[0] for row in con.execute("DESCRIBE transactions").fetchall()]
 
-        logger.info(f"Exporting data to HTML: {file_path}")
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(full_html)
+            def batches(sources: List[str]) -> Iterator[List[Sequence[Any]]]:
+                # NaN is not valid JSON, so doubles are mapped to NULL first.
+                select_list = ", ".join(
+                    f'CASE WHEN isnan("{key}") THEN NULL ELSE "{key}" END'
+                    if key == "amount" or key.startswith("value_")
+                    else f'"{key}"'
+                    for key in sources
+                )
+                # Column names come from the table itself; the clause only
+                # holds placeholders.
+                query = f"SELECT {select_list} FROM transactions WHERE {clause} ORDER BY timestamp DESC"  # nosec B608
+                cursor = con.execute(query, where_params)
+                while rows := cursor.fetchmany(CHUNK_ROWS):
+                    yield rows
 
+            _write_report(
+                file_path,
+                kaspa_address,
+                address_name,
+                currency,
+                available,
+                batches,
+                kwargs.get("job"),
+            )
         return True, "Export Successful", os.path.basename(file_path)
     except Exception as e:
         logger.error(f"HTML Export Error: {e}")
@@ -0,0 +1,305 @@
+"""
+Shared pieces for HTML reports whose tables are streamed to disk.
+
+Table rows are written as compact JSON chunks inside
+``<script type="application/json">`` blocks while they are produced, so
+memory use does not grow with the number of rows. A small script parses a
+chunk only when its rows scroll into view and keeps just the visible rows
+in the DOM, which lets browsers open reports with hundreds of thousands of
+transactions.
+"""
+
+import html
+import json
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+import pandas as pd
+
+from src.utils.i18n import translate
+
+# Rows per JSON chunk; a chunk is the unit the viewer parses on demand.
+CHUNK_ROWS = 2_000
+
+VTABLE_STYLE = """
+<style>
+    .vtable-scroll { max-height: 70vh; overflow: auto; box-shadow: 0 2px 5px rgba(0,0,0,0.15); background-color: #fff; margin-top: 1em; margin-bottom: 2em; }
+    .vtable-scroll .kaspa-table { box-shadow: none; margin: 0; }
+    .vtable-scroll thead th { position: sticky; top: 0; z-index: 1; }
+    .vtable-scroll tbody td { height: 20px; line-height: 20px; padding: 4px 12px; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; word-break: normal; }
+    .vtable-scroll tr.vtable-spacer td { padding: 0; border: 0; height: auto; }
+    .vtable-count { font-size: 0.85em; color: #6c757d; margin: 0.5em 0; }
+</style>
+"""
+
+VTABLE_SCRIPT = """
+<script>
+(function () {
+  "use strict";
+  var OVERSCAN = 30;
+
+  function pad(n) { return n < 10 ? "0" + n : String(n); }
+
+  function formatCell(col, value, index, labels) {
+    if (col.kind === "index") { return String(index + 1); }
+    if (value === null || value === undefined) { return col.empty || ""; }
+    switch (col.kind) {
+      case "date":
+        var d = new Date(value * 1000);
+        return d.getUTCFullYear() + "-" + pad(d.getUTCMonth() + 1) + "-" + pad(d.getUTCDate()) +
+          " " + pad(d.getUTCHours()) + ":" + pad(d.getUTCMinutes()) + ":" + pad(d.getUTCSeconds());
+      case "number":
+        return Number(value).toLocaleString("en-US", {
+          minimumFractionDigits: col.decimals, maximumFractionDigits: col.decimals
+        }) + (col.suffix || "");
+      case "label":
+        return labels.hasOwnProperty(value) ? labels[value] : String(value);
+      default:
+        return String(value);
+    }
+  }
+
+  function VirtualTable(config) {
+    this.config = config;
+    this.scroller = document.getElementById(config.id);
+    this.body = this.scroller.querySelector("tbody");
+    this.chunks = Array.prototype.slice.call(
+      document.querySelectorAll('script[data-vtable="' + config.id + '"]'));
+    this.starts = this.chunks.map(function (el) { return Number(el.getAttribute("data-start")); });
+    this.parsed = {};
+    this.rowHeight = 29;
+    this.first = -1;
+    this.last = -1;
+    var self = this;
+    var pending = false;
+    this.scroller.addEventListener("scroll", function () {
+      if (pending) { return; }
+      pending = true;
+      window.requestAnimationFrame(function () { pending = false; self.render(); });
+    });
+    window.addEventListener("resize", function () { self.render(true); });
+    this.render(true);
+  }
+
+  VirtualTable.prototype.row = function (i) {
+    var lo = 0, hi = this.starts.length - 1;
+    while (lo < hi) {
+      var mid = (lo + hi + 1) >> 1;
+      if (this.starts[mid] <= i) { lo = mid; } else { hi = mid - 1; }
+    }
+    if (!this.parsed[lo]) { this.parsed[lo] = JSON.parse(this.chunks[lo].textContent); }
+    return this.parsed[lo][i - this.starts[lo]];
+  };
+
+  VirtualTable.prototype.spacer = function (height) {
+    var tr = document.createElement("tr");
+    var td = document.createElement("td");
+    tr.className = "vtable-spacer";
+    td.colSpan = this.config.columns.length;
+    td.style.height = height + "px";
+    tr.appendChild(td);
+    return tr;
+  };
+
+  VirtualTable.prototype.render = function (force) {
+    var cfg = this.config, total = cfg.rows;
+    var top = this.scroller.scrollTop;
+    var visible = Math.ceil(this.scroller.clientHeight / this.rowHeight) || 1;
+    var first = Math.max(0, Math.floor(top / this.rowHeight) - OVERSCAN);
+    var last = Math.min(total, first + visible + 2 * OVERSCAN);
+    if (!force && first === this.first && last === this.last) { return; }
+    this.first = first;
+    this.last = last;
+
+    var fragment = document.createDocumentFragment();
+    if (first > 0) { fragment.appendChild(this.spacer(first * this.rowHeight)); }
+    for (var i = first; i < last; i++) {
+      var data = this.row(i), tr = document.createElement("tr");
+      for (var c = 0; c < cfg.columns.length; c++) {
+        var col = cfg.columns[c], td = document.createElement("td");
+        var value = col.kind === "index" ? null : data[col.field];
+        var text = formatCell(col, value, i, cfg.labels[c] || {});
+        if (col.kind === "link" && value !== null && value !== undefined) {
+          var a = document.createElement("a");
+          a.href = col.prefix + value + col.suffix;
+          a.target = "_blank";
+          a.rel = "noopener";
+          a.textContent = text;
+          td.appendChild(a);
+        } else {
+          td.textContent = text;
+        }
+        td.title = text;
+        tr.appendChild(td);
+      }
+      fragment.appendChild(tr);
+    }
+    if (last < total) { fragment.appendChild(this.spacer((total - last) * this.rowHeight)); }
+    this.body.replaceChildren(fragment);
+
+    var sample = this.body.querySelector("tr:not(.vtable-spacer)");
+    if (sample && sample.offsetHeight && Math.abs(sample.offsetHeight - this.rowHeight) > 0.5) {
+      this.rowHeight = sample.offsetHeight;
+      this.render(true);
+    }
+  };
+
+  document.addEventListener("DOMContentLoaded", function () {
+    var configs = document.querySelectorAll('script[type="application/json"][data-vtable-config]');
+    for (var i = 0; i < configs.length; i++) {
+      new VirtualTable(JSON.parse(configs[i].textContent));
+    }
+  });
+})();
+</script>
+"""
+
+
+def script_json(obj: Any) -> str:
+    """Serializes obj for embedding in a script block; '<' is escaped so
+    values can never close the block."""
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+    ).replace("<", "\\u003c")
+
+
+def transaction_columns(
+    available: Sequence[str], currency: str, tx_url_base: str
+) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """
+    Returns the source columns to read and the matching column definitions
+    for a transaction table. Each definition's ``field`` indexes into the
+    row arrays built from the source columns.
+    """
+    currency_upper = currency.upper()
+    value_col_key = f"value_{currency.lower()}"
+    url_prefix, sep, url_suffix = tx_url_base.partition("{txid}")
+    definitions: List[Tuple[str, Dict[str, Any]]] = [
+        ("timestamp", {"title": translate("Date/Time"), "kind": "date"}),
+        (
+            "txid",
+            (
+                {
+                    "title": translate("Transaction ID"),
+                    "kind": "link",
+                    "prefix": url_prefix,
+                    "suffix": url_suffix,
+                }
+                if sep
+                else {"title": translate("Transaction ID"), "kind": "text"}
+            ),
+        ),
+        ("direction", {"title": translate("Direction"), "kind": "label"}),
+        (
+            "amount",
+            {
+                "title": translate("Amount (KAS)"),
+                "kind": "number",
+                "decimals": 8,
+                "empty": "N/A",
+            },
+        ),
+        (
+            value_col_key,
+            {
+                "title": translate(f"Value ({currency_upper})"),
+                "kind": "number",
+                "decimals": 2,
+                "suffix": f" {currency_upper}",
+                "empty": "N/A",
+            },
+        ),
+        ("block_height", {"title": translate("Block Score"), "kind": "text"}),
+        ("type", {"title": translate("Type"), "kind": "label"}),
+    ]
+
+    sources: List[str] = []
+    columns: List[Dict[str, Any]] = [{"title": translate("No."), "kind": "index"}]
+    for key, column in definitions:
+        if key in available:
+            column["field"] = len(sources)
+            sources.append(key)
+            columns.append(column)
+    return sources, columns
+
+
+def dataframe_batches(
+    df: pd.DataFrame, sources: Sequence[str], chunk_rows: Optional[int] = None
+) -> Iterator[List[List[Any]]]:
+    """Yields rows of the given columns as JSON-ready lists, chunk by chunk."""
+    chunk_rows = chunk_rows or CHUNK_ROWS
+    for start in range(0, len(df), chunk_rows):
+        part = df.iloc[start : start + chunk_rows]
+        # Series.tolist() yields native Python values; missing values become None.
+        values = [
+            part[key].astype(object).where(part[key].notna(), None).tolist()
+            for key in sources
+        ]
+        yield [list(row) for row in zip(*values)]
+
+
+class VirtualTableWriter:
+    """Writes one virtually scrolled table to an open text file."""
+
+    def __init__(
+        self,
+        out: TextIO,
+        table_id: str,
+        columns: List[Dict[str, Any]],
+        footer: Optional[List[str]] = None,
+    ) -> None:
+        self.out = out
+        self.table_id = table_id
+        self.columns = columns
+        self.rows = 0
+        # Distinct raw values of label columns, translated once in close().
+        self._label_values: Dict[int, set] = {
+            i: set() for i, col in enumerate(columns) if col["kind"] == "label"
+        }
+        head = "".join(f"<th>{html.escape(col['title'])}</th>" for col in columns)
+        foot = (
+            "<tfoot><tr>"
+            + "".join(f"<td>{html.escape(cell)}</td>" for cell in footer)
+            + "</tr></tfoot>"
+            if footer
+            else ""
+        )
+        out.write(
+            f'<div class="vtable-scroll" id="{html.escape(table_id)}">'
+            f'<table class="kaspa-table"><thead><tr>{head}</tr></thead>'
+            f"<tbody></tbody>{foot}</table></div>"
+            f'<noscript><p>{html.escape(translate("Enable JavaScript to view this table."))}</p></noscript>\n'
+        )
+
+    def write_rows(self, rows: List[Sequence[Any]]) -> None:
+        if not rows:
+            return
+        for index, values in self._label_values.items():
+            field = self.columns[index]["field"]
+            values.update(row[field] for row in rows)
+        self.out.write(
+            f'<script type="application/json" data-vtable="{html.escape(self.table_id)}" '
+            f'data-start="{self.rows}">{script_json(rows)}</script>\n'
+        )
+        self.rows += len(rows)
+
+    def close(self) -> int:
+        """Writes the table's configuration and returns its row count."""
+        labels = {
+            index: {
+                str(v): translate(str(v).capitalize())
+                for v in values
+                if v is not None
+            }
+            for index, values in self._label_values.items()
+        }
+        config = {
+            "id": self.table_id,
+            "rows": self.rows,
+            "columns": self.columns,
+            "labels": labels,
+        }
+        self.out.write(
+            f'<p class="vtable-count">{html.escape(translate("Rows"))}: {self.rows:,}</p>'
+            f'<script type="application/json" data-vtable-config>{script_json(config)}</script>\n'
+        )
+        return self.rows
@@ -0,0 +1,246 @@
+"""
+Background export jobs.
+
+All tabs hand their exports to one ExportJobManager, which runs them on a
+bounded thread pool. Each ExportJob tracks the rows and bytes written and
+can be cancelled; exporters that stream their output report progress and
+check for cancellation between chunks.
+"""
+
+import itertools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.utils.formatting import format_bytes
+from src.utils.i18n import translate
+
+logger = logging.getLogger(__name__)
+
+ExportResult = Tuple[bool, str, str]
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+DEFAULT_MAX_CONCURRENT_EXPORTS = 2
+
+
+class ExportCancelled(Exception):
+    """Raised inside an export when its job has been cancelled."""
+
+
+class ExportJob:
+    """State of one export, shared between its worker and the UI."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, label: str, targets: Dict[str, str]) -> None:
+        self.job_id: int = next(self._ids)
+        self.label = label
+        # Output file per format; used for byte counts and cleanup on cancel.
+        self.targets = dict(targets)
+        self.state = JOB_QUEUED
+        self.results: Dict[str, ExportResult] = {}
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self._rows = 0
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self._connections: List[Any] = []
+
+    @property
+    def rows_written(self) -> int:
+        """Rows exported; a multi-format job writes each row once per format."""
+        with self._lock:
+            return self._rows // max(len(self.targets), 1)
+
+    @property
+    def bytes_written(self) -> int:
+        """Size of the output files so far, including in-progress parts."""
+        total = 0
+        for path in self.targets.values():
+            for candidate in (path, path + ".part"):
+                try:
+                    total += os.path.getsize(candidate)
+                except OSError:
+                    pass
+        return total
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def is_active(self) -> bool:
+        return self.state in (JOB_QUEUED, JOB_RUNNING)
+
+    def add_rows(self, count: int) -> None:
+        with self._lock:
+            self._rows += count
+
+    def raise_if_cancelled(self) -> None:
+        if self._cancel_event.is_set():
+            raise ExportCancelled(translate("Export cancelled."))
+
+    def bind_connection(self, con: Any) -> None:
+        """Registers a private DuckDB connection to interrupt on cancel."""
+        with self._lock:
+            self._connections.append(con)
+
+    def unbind_connection(self, con: Any) -> None:
+        with self._lock:
+            if con in self._connections:
+                self._connections.remove(con)
+
+    def cancel(self) -> None:
+        if not self.is_active:
+            return
+        logger.info(f"Cancelling export job {self.job_id} ({self.label})")
+        self._cancel_event.set()
+        with self._lock:
+            connections = list(self._connections)
+        for con in connections:
+            try:
+                con.interrupt()
+            except Exception as e:
+                logger.debug(f"Could not interrupt export query: {e}")
+
+    def describe(self) -> str:
+        formats = "+".join(fmt.upper() for fmt in self.targets)
+        if self.state == JOB_QUEUED:
+            return f"{formats} {translate('queued')}"
+        return (
+            f"{formats} {self.rows_written:,} {translate('rows')}, "
+            f"{format_bytes(self.bytes_written)}"
+        )
+
+
+def single_export(
+    export_func: Callable[..., ExportResult], export_format: str, export_args: Dict[str, Any]
+) -> Callable[[ExportJob], Dict[str, ExportResult]]:
+    """Wraps one exporter call as a job body."""
+
+    def run(job: ExportJob) -> Dict[str, ExportResult]:
+        return {export_format: export_func(**export_args, job=job)}
+
+    return run
+
+
+class ExportJobManager:
+    """Runs export jobs on a bounded worker pool."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_CONCURRENT_EXPORTS,
+        on_change: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.on_change = on_change
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="ExportJob"
+        )
+        self._jobs: List[ExportJob] = []
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        label: str,
+        targets: Dict[str, str],
+        run: Callable[[ExportJob], Dict[str, ExportResult]],
+        on_finished: Optional[Callable[[ExportJob], None]] = None,
+    ) -> ExportJob:
+        """
+        Queues `run`, which writes every target and returns a result tuple
+        per format. `on_finished` is called from the worker thread.
+        """
+        job = ExportJob(label, targets)
+        with self._lock:
+            # Finished jobs are forgotten once the next one is queued.
+            self._jobs = [j for j in self._jobs if j.is_active] + [job]
+        logger.info(
+            f"Queued export job {job.job_id} ({label}): {', '.join(targets.values())}"
+        )
+        self._executor.submit(self._run_job, job, run, on_finished)
+        self._notify()
+        return job
+
+    def _run_job(
+        self,
+        job: ExportJob,
+        run: Callable[[ExportJob], Dict[str, ExportResult]],
+        on_finished: Optional[Callable[[ExportJob], None]],
+    ) -> None:
+        if job.cancelled:
+            job.state = JOB_CANCELLED
+        else:
+            job.state = JOB_RUNNING
+            self._notify()
+            try:
+                job.results = run(job)
+                if job.cancelled:
+                    job.state = JOB_CANCELLED
+                elif all(ok for ok, _, _ in job.results.values()):
+                    job.state = JOB_DONE
+                else:
+                    job.state = JOB_FAILED
+            except ExportCancelled:
+                job.state = JOB_CANCELLED
+            except Exception as e:
+                logger.error(f"Export job {job.job_id} failed: {e}", exc_info=True)
+                job.error = str(e)
+                job.state = JOB_FAILED
+                if job.cancelled:
+                    job.state = JOB_CANCELLED
+
+        if job.state == JOB_CANCELLED:
+            self._remove_outputs(job)
+        job.finished_at = time.time()
+        logger.info(
+            f"Export job {job.job_id} {job.state}: {job.rows_written} rows, "
+            f"{job.bytes_written} bytes"
+        )
+        if on_finished:
+            try:
+                on_finished(job)
+            except Exception as e:
+                logger.error(f"Export job callback failed: {e}", exc_info=True)
+        self._notify()
+
+    @staticmethod
+    def _remove_outputs(job: ExportJob) -> None:
+        for path in job.targets.values():
+            for candidate in (path, path + ".part"):
+                try:
+                    if os.path.exists(candidate):
+                        os.remove(candidate)
+                except OSError as e:
+                    logger.warning(f"Could not remove partial export {candidate}: {e}")
+
+    def _notify(self) -> None:
+        if self.on_change:
+            try:
+                self.on_change()
+            except Exception as e:
+                logger.debug(f"Export job listener failed: {e}")
+
+    def jobs(self) -> List[ExportJob]:
+        with self._lock:
+            return list(self._jobs)
+
+    def active_jobs(self) -> List[ExportJob]:
+        return [job for job in self.jobs() if job.is_active]
+
+    def cancel_all(self) -> None:
+        for job in self.active_jobs():
+            job.cancel()
+
+    def shutdown(self, wait: bool = False) -> None:
+        self.cancel_all()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,80 @@
+"""
+Replaces addresses with their known names in exported data.
+
+Address columns may hold several addresses joined with ", ". Names are
+resolved per address with a join in DuckDB, or with a vectorized
+split/map over the distinct cell values for DataFrames, so the cost no
+longer grows with a Python call per row.
+"""
+
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from duckdb import DuckDBPyConnection
+
+ADDRESS_SEPARATOR = ", "
+KNOWN_NAMES_RELATION = "export_known_names"
+
+
+def register_known_names(
+    con: "DuckDBPyConnection",
+    known_names_map: Optional[Dict[str, str]],
+    transform: Optional[Callable[[str], str]] = None,
+) -> bool:
+    """
+    Registers the names as a relation on `con` for known_names_sql().
+    `transform` is applied to each name once (e.g. CSV sanitizing).
+    Returns False when there is nothing to substitute.
+    """
+    if not known_names_map:
+        return False
+    names = pd.DataFrame(
+        {
+            "address": list(known_names_map.keys()),
+            "name": [
+                transform(name) if transform else name
+                for name in known_names_map.values()
+            ],
+        }
+    )
+    con.register(KNOWN_NAMES_RELATION, names)
+    return True
+
+
+def known_names_sql(column_sql: str) -> str:
+    """
+    SQL expression that rewrites an address column with registered names.
+    Each address in the cell is looked up with a hash join; unknown
+    addresses are kept and the original order is preserved.
+    """
+    # Only the column expression and fixed names are interpolated.
+    split = f"string_split({column_sql}, '{ADDRESS_SEPARATOR}')"
+    parts = f"SELECT unnest({split}) AS addr, generate_subscripts({split}, 1) AS pos"  # nosec B608
+    agg = f"string_agg(coalesce(kn.name, parts.addr), '{ADDRESS_SEPARATOR}' ORDER BY parts.pos)"
+    lookup = f"LEFT JOIN {KNOWN_NAMES_RELATION} AS kn ON kn.address = parts.addr"
+    return f"(SELECT {agg} FROM ({parts}) AS parts {lookup})"  # nosec B608
+
+
+def resolve_known_names(
+    addresses: pd.Series,
+    known_names_map: Dict[str, str],
+    transform: Optional[Callable[[str], str]] = None,
+) -> pd.Series:
+    """
+    Returns `addresses` with every known address replaced by its name.
+    The work is done once per distinct cell value, and within those with
+    a split/explode/map instead of a Python call per address.
+    """
+    codes, uniques = pd.factorize(addresses.fillna("").astype(str))
+    parts = pd.Series(uniques, dtype=object).str.split(ADDRESS_SEPARATOR).explode()
+    resolved = parts.map(known_names_map).fillna(parts)
+    if transform:
+        # Names and addresses repeat a lot; transform each distinct part once.
+        distinct = resolved.unique()
+        resolved = resolved.map(dict(zip(distinct, map(transform, distinct))))
+    joined = resolved.groupby(level=0).agg(ADDRESS_SEPARATOR.join)
+    return pd.Series(
+        joined.to_numpy(dtype=object)[codes], index=addresses.index, dtype=object
+    )
@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
+import importlib.util
 import io
 import logging
+import multiprocessing
 import os
-import re
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
 
@@ -12,10 +17,13 @@ from src.config.config import (
     APP_NAME,
     APP_VERSION,
     get_active_api_config,
-    get_assets_path,
 )
+from src.export.pdf_utils import register_pdf_fonts
 from src.utils.i18n import translate
 
+if TYPE_CHECKING:
+    from src.export.jobs import ExportJob
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -26,32 +34,38 @@ try:
     from reportlab.lib.pagesizes import landscape, letter
     from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
     from reportlab.lib.units import inch
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
     from reportlab.platypus import (
         BaseDocTemplate,
         Frame,
-        LongTable,
+        PageBreak,
         PageTemplate,
         Paragraph,
         Spacer,
+        Table,
         TableStyle,
     )
 
     REPORTLAB_AVAILABLE = True
-    font_path = get_assets_path(os.path.join("fonts", "DejaVuSans.ttf"))
-    if os.path.exists(font_path):
-        pdfmetrics.registerFont(TTFont("DejaVuSans", font_path))
-    else:
-        logger.warning(
-            f"Font not found at {font_path}, non-Latin PDF export will not render correctly."
-        )
 except ImportError:
     REPORTLAB_AVAILABLE = False
     logger.warning(
         "PDF export functionality is disabled. Please run: pip install reportlab python-bidi arabic_reshaper"
     )
 
+# Partial PDFs can only be joined when pypdf is installed; without it the
+# whole report is rendered in this process.
+PYPDF_AVAILABLE = importlib.util.find_spec("pypdf") is not None
+
+# Body rows are single-line plain strings with a fixed height, so the number
+# of rows per page is known up front and partitions can be numbered before
+# they are rendered.
+ROW_HEIGHT = 11
+HEADER_ROW_HEIGHT = 24
+# Below this many rows, starting worker processes costs more than it saves.
+PARALLEL_MIN_ROWS = 5_000
+MIN_PAGES_PER_PARTITION = 20
+MAX_PDF_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
 
 def create_paragraph(text: str, style: ParagraphStyle, is_rtl: bool) -> Paragraph:
     text_str = str(text)
@@ -65,12 +79,134 @@ def create_paragraph(text: str, style: ParagraphStyle, is_rtl: bool) -> Paragrap
     return Paragraph(text_str, style)
 
 
+def _shape(text: str, is_rtl: bool) -> str:
+    """Reorders RTL text for plain-string cells, which skip create_paragraph."""
+    if not is_rtl:
+        return text
+    try:
+        return get_display(arabic_reshaper.reshape(text))
+    except Exception:
+        return text
+
+
+def _page_margins() -> Dict[str, float]:
+    return {
+        "leftMargin": 0.25 * inch,
+        "rightMargin": 0.25 * inch,
+        "topMargin": 0.5 * inch,
+        "bottomMargin": 0.8 * inch,
+    }
+
+
+@lru_cache(maxsize=2)
+def _styles(is_rtl: bool) -> Any:
+    default_align = TA_RIGHT if is_rtl else TA_LEFT
+    styles = getSampleStyleSheet()
+    styles.add(
+        ParagraphStyle(
+            name="TitleStyle",
+            parent=styles["h1"],
+            alignment=TA_CENTER,
+            fontName="DejaVuSans",
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="HeaderStyle",
+            parent=styles["Normal"],
+            fontSize=8,
+            fontName="DejaVuSans",
+            textColor=colors.whitesmoke,
+            alignment=TA_CENTER,
+            leading=10,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="CellStyle",
+            parent=styles["Normal"],
+            fontSize=7,
+            fontName="DejaVuSans",
+            alignment=default_align,
+            leading=9,
+            wordWrap="break",
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="LinkStyle", parent=styles["CellStyle"], textColor=colors.blue
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="HeaderInfo",
+            parent=styles["Normal"],
+            fontName="DejaVuSans",
+            alignment=TA_CENTER,
+            spaceAfter=6,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="HeaderInfoLink",
+            parent=styles["HeaderInfo"],
+            textColor=colors.blue,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="FooterStyle",
+            parent=styles["Normal"],
+            fontName="DejaVuSans",
+            fontSize=8,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="FooterRight", parent=styles["FooterStyle"], alignment=TA_RIGHT
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="FooterLeft",
+            parent=styles["FooterStyle"],
+            alignment=TA_LEFT if not is_rtl else TA_RIGHT,
+        )
+    )
+    return styles
+
+
+@lru_cache(maxsize=2)
+def _table_style(is_rtl: bool) -> "TableStyle":
+    return TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#007bff")),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("FONTNAME", (0, 1), (-1, -1), "DejaVuSans"),
+            ("FONTSIZE", (0, 1), (-1, -1), 7),
+            ("ALIGN", (0, 1), (-1, -1), "RIGHT" if is_rtl else "LEFT"),
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("GRID", (0, 0), (-1, -1), 1, colors.grey),
+            ("LEFTPADDING", (0, 0), (-1, -1), 3),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 3),
+            ("TOPPADDING", (0, 1), (-1, -1), 1),
+            ("BOTTOMPADDING", (0, 1), (-1, -1), 1),
+        ]
+    )
+
+
 class ReportPDFTemplate(BaseDocTemplate):
     def __init__(self, filename, **kw):
         self.kaspa_address = kw.pop("kaspa_address", "N/A")
         self.report_title = kw.pop(
             "report_title", translate("Kaspa Transaction Report")
         )
+        # Pages rendered in a separate partition continue the numbering.
+        self.page_offset = kw.pop("page_offset", 0)
+        self.is_rtl = kw.pop(
+            "is_rtl", get_active_api_config().get("language", "en") == "ar"
+        )
+        self.footer_texts = kw.pop("footer_texts", None) or _footer_texts()
         super().__init__(filename, **kw)
         frame = Frame(
             self.leftMargin, self.bottomMargin, self.width, self.height, id="normal"
@@ -80,188 +216,196 @@ class ReportPDFTemplate(BaseDocTemplate):
 
     def _footer(self, canvas, doc):
         canvas.saveState()
-        api_config = get_active_api_config()
-        is_rtl = api_config.get("language", "en") == "ar"
-        styles = getSampleStyleSheet()
-        styles.add(
-            ParagraphStyle(
-                name="FooterStyle",
-                parent=styles["Normal"],
-                fontName="DejaVuSans",
-                fontSize=8,
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="FooterRight", parent=styles["FooterStyle"], alignment=TA_RIGHT
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="FooterLeft",
-                parent=styles["FooterStyle"],
-                alignment=TA_LEFT if not is_rtl else TA_RIGHT,
-            )
-        )
+        styles = _styles(self.is_rtl)
+        texts = self.footer_texts
 
-        program_info_text = f"{APP_NAME} {translate('Version')} {APP_VERSION}"
-        p_info = create_paragraph(program_info_text, styles["FooterLeft"], is_rtl)
+        p_info = create_paragraph(texts["program"], styles["FooterLeft"], self.is_rtl)
         p_info.wrapOn(canvas, doc.width / 2, doc.bottomMargin)
         p_info.drawOn(canvas, doc.leftMargin, 0.5 * inch)
 
-        page_num_text = f"{translate('Page')} {doc.page}"
-        p_page = create_paragraph(page_num_text, styles["FooterRight"], is_rtl)
+        page_num_text = f"{texts['page']} {doc.page + self.page_offset}"
+        p_page = create_paragraph(page_num_text, styles["FooterRight"], self.is_rtl)
         p_page.wrapOn(canvas, doc.width, doc.bottomMargin)
         p_page.drawOn(canvas, doc.leftMargin, 0.5 * inch)
 
-        export_time_text = f"{translate('Exported On')}: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        p_time = create_paragraph(export_time_text, styles["FooterLeft"], is_rtl)
+        p_time = create_paragraph(texts["exported"], styles["FooterLeft"], self.is_rtl)
         p_time.wrapOn(canvas, doc.width, doc.bottomMargin)
         p_time.drawOn(canvas, doc.leftMargin, 0.3 * inch)
         canvas.restoreState()
 
 
+def _footer_texts() -> Dict[str, str]:
+    return {
+        "program": f"{APP_NAME} {translate('Version')} {APP_VERSION}",
+        "page": translate("Page"),
+        "exported": f"{translate('Exported On')}: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+    }
+
+
+def _header_flowables(job: Dict[str, Any]) -> List[Any]:
+    is_rtl = job["is_rtl"]
+    styles = _styles(is_rtl)
+    info = job["header"]
+    story = [create_paragraph(info["title"], styles["TitleStyle"], is_rtl)]
+    story.append(
+        create_paragraph(info["address_line"], styles["HeaderInfoLink"], is_rtl)
+    )
+    if info["name_line"]:
+        story.append(create_paragraph(info["name_line"], styles["HeaderInfo"], is_rtl))
+    story.append(Spacer(1, 0.1 * inch))
+    return story
+
+
+def _page_table(rows: Sequence[Tuple[str, ...]], job: Dict[str, Any]) -> "Table":
+    is_rtl = job["is_rtl"]
+    styles = _styles(is_rtl)
+    link_col = job["link_col"]
+    url_prefix, url_suffix = job["url_parts"]
+    data: List[List[Any]] = [
+        [create_paragraph(h, styles["HeaderStyle"], is_rtl) for h in job["headers"]]
+    ]
+    for row in rows:
+        cells: List[Any] = list(row)
+        if link_col is not None:
+            txid = cells[link_col]
+            cells[link_col] = Paragraph(
+                f'<a href="{url_prefix}{txid}{url_suffix}">{txid}</a>',
+                styles["LinkStyle"],
+            )
+        data.append(cells)
+    table = Table(
+        data,
+        colWidths=job["col_widths"],
+        rowHeights=[HEADER_ROW_HEIGHT] + [ROW_HEIGHT] * len(rows),
+    )
+    table.setStyle(_table_style(is_rtl))
+    return table
+
+
+def _render_partition(job: Dict[str, Any]) -> str:
+    """Renders one run of pages to job["path"]. Runs in worker processes."""
+    register_pdf_fonts()
+    story: List[Any] = _header_flowables(job) if job["with_header"] else []
+    for i, page_rows in enumerate(job["pages"]):
+        if i:
+            story.append(PageBreak())
+        story.append(_page_table(page_rows, job))
+    doc = ReportPDFTemplate(
+        job["path"],
+        pagesize=landscape(letter),
+        kaspa_address=job["kaspa_address"],
+        report_title=job["header"]["title"],
+        page_offset=job["page_offset"],
+        is_rtl=job["is_rtl"],
+        footer_texts=job["footer_texts"],
+        **_page_margins(),
+    )
+    doc.build(story)
+    return job["path"]
+
+
+def _rows_per_page(job: Dict[str, Any]) -> Tuple[int, int]:
+    """Returns how many body rows fit on the first page and on the others."""
+    doc = BaseDocTemplate(io.BytesIO(), pagesize=landscape(letter), **_page_margins())
+    # Frame padding (6pt on each side) plus a little slack for grid lines.
+    usable = doc.height - 12 - HEADER_ROW_HEIGHT - 2
+    header_height = 0.0
+    for flowable in _header_flowables(job):
+        _, h = flowable.wrap(doc.width - 12, doc.height)
+        header_height += h + flowable.getSpaceBefore() + flowable.getSpaceAfter()
+    per_page = max(1, int(usable // ROW_HEIGHT))
+    first_page = max(1, int((usable - header_height) // ROW_HEIGHT))
+    return first_page, per_page
+
+
+def _paginate(
+    rows: List[Tuple[str, ...]], first_page: int, per_page: int
+) -> List[List[Tuple[str, ...]]]:
+    pages = [rows[:first_page]]
+    pages.extend(rows[i : i + per_page] for i in range(first_page, len(rows), per_page))
+    return pages
+
+
+def _format_rows(
+    df: pd.DataFrame, currency: str, is_rtl: bool
+) -> Tuple[List[str], List[Tuple[str, ...]], Optional[int]]:
+    """Formats the report columns as plain strings, column by column."""
+    value_col_key = f"value_{currency.lower()}"
+    headers: List[str] = []
+    columns: List[Any] = []
+
+    def label_map(series: pd.Series) -> pd.Series:
+        as_str = series.astype(str)
+        labels = {
+            v: _shape(translate(v.capitalize()), is_rtl) for v in as_str.unique()
+        }
+        return as_str.map(labels)
+
+    if "timestamp" in df.columns:
+        headers.append(translate("Date/Time"))
+        columns.append(
+            pd.to_datetime(df["timestamp"], unit="s").dt.strftime("%Y-%m-%d %H:%M:%S")
+        )
+    if "direction" in df.columns:
+        headers.append(translate("Direction"))
+        columns.append(label_map(df["direction"]))
+    if "amount" in df.columns:
+        headers.append(translate("Amount (KAS)"))
+        columns.append(df["amount"].map("{:,.8f}".format))
+    if value_col_key in df.columns:
+        headers.append(translate(f"Value ({currency.upper()})"))
+        columns.append(
+            df[value_col_key].map(
+                lambda x: f"{x:,.2f} {currency.upper()}" if pd.notnull(x) else "N/A"
+            )
+        )
+    link_col: Optional[int] = None
+    if "txid" in df.columns:
+        link_col = len(headers)
+        headers.append(translate("Transaction ID"))
+        columns.append(df["txid"].astype(str))
+    if "type" in df.columns:
+        headers.append(translate("Type:"))
+        columns.append(label_map(df["type"]))
+
+    rows = list(zip(*(col.tolist() for col in columns)))
+    return headers, rows, link_col
+
+
+def _merge_pdfs(paths: Sequence[str], file_path: str) -> None:
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for path in paths:
+        writer.append(path)
+    with open(file_path, "wb") as f:
+        writer.write(f)
+
+
 def export_to_pdf(
     df: pd.DataFrame,
     file_path: str,
     kaspa_address: str,
     address_name: str,
     currency: str,
+    workers: Optional[int] = None,
     **kwargs,
 ) -> Tuple[bool, str, str]:
     if not REPORTLAB_AVAILABLE:
         return False, "Error", "Missing required PDF libraries. See logs for details."
     if not file_path.lower().endswith(".pdf"):
         file_path += ".pdf"
+    register_pdf_fonts()
 
+    export_job: Optional["ExportJob"] = kwargs.get("job")
+    tmp_dir: Optional[str] = None
     try:
         api_config = get_active_api_config()
         is_rtl = api_config.get("language", "en") == "ar"
-        default_align = TA_RIGHT if is_rtl else TA_LEFT
-        styles = getSampleStyleSheet()
-        styles.add(
-            ParagraphStyle(
-                name="TitleStyle",
-                parent=styles["h1"],
-                alignment=TA_CENTER,
-                fontName="DejaVuSans",
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="HeaderStyle",
-                parent=styles["Normal"],
-                fontSize=8,
-                fontName="DejaVuSans",
-                textColor=colors.whitesmoke,
-                alignment=TA_CENTER,
-                leading=10,
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="CellStyle",
-                parent=styles["Normal"],
-                fontSize=7,
-                fontName="DejaVuSans",
-                alignment=default_align,
-                leading=9,
-                wordWrap="break",
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="LinkStyle", parent=styles["CellStyle"], textColor=colors.blue
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="HeaderInfo",
-                parent=styles["Normal"],
-                fontName="DejaVuSans",
-                alignment=TA_CENTER,
-                spaceAfter=6,
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="HeaderInfoLink",
-                parent=styles["HeaderInfo"],
-                textColor=colors.blue,
-            )
-        )
-
-        report_title_str = translate("Kaspa Transaction Report")
-        story = [create_paragraph(report_title_str, styles["TitleStyle"], is_rtl)]
-        addr_explorer_url = api_config["explorer"]["address"].format(
-            kaspaAddress=kaspa_address
-        )
-        addr_header_text = f"{translate('Kaspa Address')}: <a href='{addr_explorer_url}'>{kaspa_address}</a>"
-        story.append(
-            create_paragraph(addr_header_text, styles["HeaderInfoLink"], is_rtl)
-        )
-
-        if address_name:
-            name_header_text = f"({translate('Address Name')}: {address_name})"
-            story.append(
-                create_paragraph(name_header_text, styles["HeaderInfo"], is_rtl)
-            )
-        story.append(Spacer(1, 0.1 * inch))
-
-        df_source = df.copy()
-        df_final = pd.DataFrame()
-        value_col_key = f"value_{currency.lower()}"
-
-        export_cols_map = {
-            "timestamp": translate("Date/Time"),
-            "direction": translate("Direction"),
-            "amount": translate("Amount (KAS)"),
-            value_col_key: translate(f"Value ({currency.upper()})"),
-            "txid": translate("Transaction ID"),
-            "type": translate("Type:"),
-        }
 
-        if "timestamp" in df_source.columns:
-            df_final[export_cols_map["timestamp"]] = pd.to_datetime(
-                df_source["timestamp"], unit="s"
-            ).dt.strftime("%Y-%m-%d %H:%M:%S")
-        if "direction" in df_source.columns:
-            df_final[export_cols_map["direction"]] = df_source["direction"].apply(
-                lambda x: translate(str(x).capitalize())
-            )
-        if "amount" in df_source.columns:
-            df_final[export_cols_map["amount"]] = df_source["amount"].apply(
-                lambda x: f"{x:,.8f}"
-            )
-        if value_col_key in df_source.columns:
-            df_final[export_cols_map[value_col_key]] = df_source[value_col_key].apply(
-                lambda x: f"{x:,.2f} {currency.upper()}" if pd.notnull(x) else "N/A"
-            )
-        if "txid" in df_source.columns:
-            df_final[export_cols_map["txid"]] = df_source["txid"]
-        if "type" in df_source.columns:
-            df_final[export_cols_map["type"]] = df_source["type"].apply(
-                lambda x: translate(str(x).capitalize())
-            )
-
-        headers = [
-            create_paragraph(h, styles["HeaderStyle"], is_rtl) for h in df_final.columns
-        ]
-        data_as_list = [headers]
-        tx_url_base = api_config["explorer"]["transaction"]
-        txid_col_name = translate("Transaction ID")
-
-        for _, row in df_final.iterrows():
-            row_data = []
-            for col_name, cell in row.items():
-                if col_name == txid_col_name and isinstance(cell, str):
-                    link = f'<a href="{tx_url_base.format(txid=cell)}">{cell}</a>'
-                    row_data.append(create_paragraph(link, styles["LinkStyle"], is_rtl))
-                else:
-                    row_data.append(
-                        create_paragraph(str(cell), styles["CellStyle"], is_rtl)
-                    )
-            data_as_list.append(row_data)
+        headers, rows, link_col = _format_rows(df, currency, is_rtl)
+        if not headers:
+            raise ValueError("No columns or data available to generate the PDF table.")
 
         relative_widths = {
             translate("Date/Time"): 0.12,
@@ -271,46 +415,92 @@ def export_to_pdf(
             translate("Transaction ID"): 0.42,
             translate("Type:"): 0.07,
         }
-
-        margins = {
-            "leftMargin": 0.25 * inch,
-            "rightMargin": 0.25 * inch,
-            "topMargin": 0.5 * inch,
-            "bottomMargin": 0.8 * inch,
+        available_width = BaseDocTemplate(
+            io.BytesIO(), pagesize=landscape(letter), **_page_margins()
+        ).width
+        addr_explorer_url = api_config["explorer"]["address"].format(
+            kaspaAddress=kaspa_address
+        )
+        url_prefix, _, url_suffix = api_config["explorer"]["transaction"].partition(
+            "{txid}"
+        )
+        base_job: Dict[str, Any] = {
+            "is_rtl": is_rtl,
+            "kaspa_address": kaspa_address,
+            "headers": headers,
+            "col_widths": [
+                available_width * relative_widths.get(h, 0.1) for h in headers
+            ],
+            "link_col": link_col,
+            "url_parts": (url_prefix, url_suffix),
+            "footer_texts": _footer_texts(),
+            "header": {
+                "title": translate("Kaspa Transaction Report"),
+                "address_line": f"{translate('Kaspa Address')}: <a href='{addr_explorer_url}'>{kaspa_address}</a>",
+                "name_line": (
+                    f"({translate('Address Name')}: {address_name})"
+                    if address_name
+                    else ""
+                ),
+            },
         }
-        temp_doc = BaseDocTemplate(io.BytesIO(), pagesize=landscape(letter), **margins)
-        available_width = temp_doc.width
-        col_widths = [
-            available_width * relative_widths.get(col, 0.1) for col in df_final.columns
-        ]
 
-        if not col_widths or not data_as_list or len(data_as_list[0]) == 0:
-            raise ValueError("No columns or data available to generate the PDF table.")
+        first_page, per_page = _rows_per_page(base_job)
+        pages = _paginate(rows, first_page, per_page)
 
-        table = LongTable(data_as_list, repeatRows=1, colWidths=col_widths)
-        table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#007bff")),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.grey),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 3),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 3),
-                ]
-            )
+        workers = workers or MAX_PDF_WORKERS
+        parallel = PYPDF_AVAILABLE and workers > 1 and len(rows) >= PARALLEL_MIN_ROWS
+        pages_per_partition = (
+            max(MIN_PAGES_PER_PARTITION, -(-len(pages) // (workers * 2)))
+            if parallel
+            else len(pages)
         )
-        story.append(table)
-
-        logger.info(f"Exporting data to PDF: {file_path}")
-        doc = ReportPDFTemplate(
-            file_path,
-            pagesize=landscape(letter),
-            kaspa_address=kaspa_address,
-            report_title=report_title_str,
-            **margins,
+
+        logger.info(
+            f"Exporting {len(rows)} rows ({len(pages)} pages) to PDF: {file_path}"
         )
-        doc.build(story)
+        if export_job:
+            export_job.raise_if_cancelled()
+        if pages_per_partition >= len(pages):
+            _render_partition(
+                dict(
+                    base_job,
+                    path=file_path,
+                    pages=pages,
+                    page_offset=0,
+                    with_header=True,
+                )
+            )
+            if export_job:
+                export_job.add_rows(len(rows))
+        else:
+            tmp_dir = tempfile.mkdtemp(prefix="kaspa_pdf_")
+            partitions = [
+                dict(
+                    base_job,
+                    path=os.path.join(tmp_dir, f"part_{n:04d}.pdf"),
+                    pages=pages[start : start + pages_per_partition],
+                    page_offset=start,
+                    with_header=start == 0,
+                )
+                for n, start in enumerate(range(0, len(pages), pages_per_partition))
+            ]
+            # spawn: forking a process that runs Tk and DuckDB threads is unsafe.
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(partitions)),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                futures = {pool.submit(_render_partition, p): p for p in partitions}
+                for future in as_completed(futures):
+                    future.result()
+                    if export_job:
+                        if export_job.cancelled:
+                            pool.shutdown(wait=False, cancel_futures=True)
+                        export_job.raise_if_cancelled()
+                        export_job.add_rows(
+                            sum(len(page) for page in futures[future]["pages"])
+                        )
+            _merge_pdfs([p["path"] for p in partitions], file_path)
 
         return True, "Export Successful", os.path.basename(file_path)
     except Exception as e:
@@ -321,3 +511,6 @@ def export_to_pdf(
             except OSError:
                 pass
         return False, "Error", translate("Check logs for details.")
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
@@ -1,10 +1,11 @@
 import logging
 import os
+import threading
 import time
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from src.config.config import APP_NAME, CONFIG
+from src.config.config import APP_NAME, CONFIG, get_assets_path
 from src.utils.i18n import translate
 
 logger = logging.getLogger(__name__)
@@ -50,6 +51,38 @@ except ImportError:
             pass
 
 
+PDF_FONT_FILE = os.path.join("fonts", "DejaVuSans.ttf")
+_fonts_lock = threading.Lock()
+_fonts_registered = False
+
+
+def register_pdf_fonts() -> bool:
+    """
+    Registers the bundled DejaVuSans font (also under "DejaVuSans-Bold")
+    with ReportLab. Runs once, on the first PDF export, instead of when an
+    export module is imported. Returns False if the font file is missing.
+    """
+    global _fonts_registered
+    with _fonts_lock:
+        if _fonts_registered:
+            return True
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+
+        font_path = get_assets_path(PDF_FONT_FILE)
+        if not os.path.exists(font_path):
+            logger.warning(
+                f"Font not found at {font_path}, PDF export may not render correctly."
+            )
+            return False
+        start = time.perf_counter()
+        pdfmetrics.registerFont(TTFont("DejaVuSans", font_path))
+        pdfmetrics.registerFont(TTFont("DejaVuSans-Bold", font_path))
+        _fonts_registered = True
+        logger.info(f"PERF: PDF fonts registered in {time.perf_counter() - start:.4f}s")
+        return True
+
+
 def create_paragraph(text: str, style: "ParagraphStyle", is_rtl: bool) -> "Paragraph":
     """
     Creates a ReportLab Paragraph, handling RTL text reshaping if necessary.
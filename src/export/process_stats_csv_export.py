@@ -0,0 +1,62 @@
+import logging
+import os
+from dataclasses import asdict
+from datetime import datetime
+from typing import TYPE_CHECKING, Sequence, Tuple
+
+import pandas as pd
+
+from src.config.config import APP_NAME, APP_VERSION
+from src.utils.i18n import translate
+
+if TYPE_CHECKING:
+    from src.utils.process_supervisor import ProcessSample
+
+logger = logging.getLogger(__name__)
+
+_COLUMN_MAP = {
+    "timestamp": "Timestamp",
+    "pid": "PID",
+    "cpu_percent": "CPU (%)",
+    "rss_bytes": "RSS (bytes)",
+    "num_fds": "Open Handles",
+    "read_bytes": "Disk Read (bytes)",
+    "write_bytes": "Disk Write (bytes)",
+    "num_connections": "Connections",
+    "net_bytes_sent": "System Net Sent (bytes)",
+    "net_bytes_recv": "System Net Received (bytes)",
+}
+
+
+def export_process_stats_to_csv(
+    samples: Sequence["ProcessSample"], file_path: str, process_name: str
+) -> Tuple[bool, str, str]:
+    if not file_path.lower().endswith(".csv"):
+        file_path += ".csv"
+    try:
+        export_df = pd.DataFrame(
+            [asdict(s) for s in samples], columns=list(_COLUMN_MAP)
+        )
+        export_df["timestamp"] = export_df["timestamp"].apply(
+            lambda t: datetime.fromtimestamp(t).strftime("%Y-%m-%d %H:%M:%S")
+        )
+        # Counters may be missing on some platforms; keep them integral.
+        for col in _COLUMN_MAP:
+            if col not in ("timestamp", "cpu_percent"):
+                export_df[col] = export_df[col].astype("Int64")
+        export_df["cpu_percent"] = export_df["cpu_percent"].astype(float)
+        export_df = export_df.rename(columns=_COLUMN_MAP)
+        timestamp_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        logger.info(
+            f"Exporting {len(export_df)} resource samples of {process_name} to CSV: {file_path}"
+        )
+
+        with open(file_path, "w", encoding="utf-8-sig", newline="") as f:
+            f.write(f'# {APP_NAME} {translate("Version")} {APP_VERSION}\n')
+            f.write(f'# {translate("Resource Usage")}: {process_name}\n')
+            f.write(f'# {translate("Exported On")}: {timestamp_str}\n\n')
+            export_df.to_csv(f, index=False, float_format="%.2f")
+        return True, "Export Successful", os.path.basename(file_path)
+    except (OSError, KeyError, Exception) as e:
+        logger.error(f"Resource Usage CSV Export Error: {e}")
+        return False, "Error", str(e)
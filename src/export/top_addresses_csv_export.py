@@ -13,7 +13,7 @@ logger = logging.getLogger(__name__)
 
 
 def export_top_addresses_to_csv(
-    df: pd.DataFrame, file_path: str, currency: str
+    df: pd.DataFrame, file_path: str, currency: str, **kwargs
 ) -> Tuple[bool, str, str]:
     if not file_path.lower().endswith(".csv"):
         file_path += ".csv"
@@ -31,7 +31,7 @@ STYLE = """
 
 
 def export_top_addresses_to_html(
-    df: pd.DataFrame, file_path: str, currency: str
+    df: pd.DataFrame, file_path: str, currency: str, **kwargs
 ) -> Tuple[bool, str, str]:
     if not file_path.lower().endswith(".html"):
         file_path += ".html"
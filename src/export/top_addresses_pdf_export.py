@@ -9,6 +9,7 @@ from src.export.pdf_utils import (
     REPORTLAB_AVAILABLE,
     ReportPDFTemplate,
     create_paragraph,
+    register_pdf_fonts,
 )
 from src.utils.i18n import translate
 
@@ -24,7 +25,7 @@ if REPORTLAB_AVAILABLE:
 
 
 def export_top_addresses_to_pdf(
-    df: pd.DataFrame, file_path: str, currency: str
+    df: pd.DataFrame, file_path: str, currency: str, **kwargs
 ) -> Tuple[bool, str, str]:
     """
     Exports the top addresses DataFrame to a PDF file.
@@ -33,6 +34,7 @@ def export_top_addresses_to_pdf(
         return False, "Error", "Missing required PDF libraries. See logs for details."
     if not file_path.lower().endswith(".pdf"):
         file_path += ".pdf"
+    register_pdf_fonts()
 
     try:
         is_rtl: bool = CONFIG.get("language", "en") == "ar"
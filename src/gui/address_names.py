@@ -0,0 +1,27 @@
+import logging
+from typing import TYPE_CHECKING, Dict
+
+from src.api.network import fetch_address_names_if_modified
+
+if TYPE_CHECKING:
+    from src.database import AppDataDB
+
+logger = logging.getLogger(__name__)
+
+
+def refresh_address_names(db: "AppDataDB") -> Dict[str, str]:
+    """
+    Brings the stored known names up to date and returns the name map.
+
+    The request carries the validators of the previous fetch, so an
+    unchanged list costs a 304 and no database writes. A changed list is
+    written as a delta by AppDataDB.save_address_names.
+    """
+    validators = db.get_address_names_validators()
+    names, new_validators = fetch_address_names_if_modified(validators)
+    if names:
+        changed = db.save_address_names(names, new_validators)
+        logger.info(f"Fetched {len(names)} address names; {changed} rows changed.")
+    elif new_validators:
+        logger.info("Stored address names are current.")
+    return db.get_address_names_map()
@@ -3,24 +3,34 @@
 # -*- coding: utf-8 -*-
 """
 Export component module.
-Provides a reusable UI widget for exporting data to CSV, HTML, and PDF formats.
+Provides a reusable UI widget for exporting data to CSV, HTML, and PDF formats,
+plus the columnar Parquet and Arrow IPC formats.
 """
 
 from __future__ import annotations
 
-from typing import Any, Callable
+import tkinter as tk
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import DISABLED, LEFT, NORMAL
 =======
-from typing import Callable
+import tkinter as tk
+from typing import Callable, Dict, List, Optional, Sequence
 
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 >>>>>>> dev-latest
 
+from src.export.columnar_export import ARROW_AVAILABLE, COLUMNAR_FORMATS
 from src.utils.i18n import translate
 
+# Menu label keys of the formats offered under "More Formats".
+_FORMAT_LABELS = {
+    "parquet": "Save as Parquet",
+    "arrow": "Save as Arrow IPC",
+}
+
 
 class ExportComponent(ttk.Frame):
     """
@@ -31,17 +41,32 @@ class ExportComponent(ttk.Frame):
     def __init__(
         self,
         parent: Any,
-        export_callback: Callable[[str], None]
+        export_callback: Callable[[str], None],
+        extra_formats: Sequence[str] = COLUMNAR_FORMATS,
+        multi_export_callback: Optional[Callable[[List[str]], None]] = None,
     ) -> None:
         """
         Initialize the ExportComponent.
 
         Args:
             parent: The parent widget.
-            export_callback: Function to call with the format string ('csv', 'html', 'pdf').
+            export_callback: Function to call with the format string
+                ('csv', 'html', 'pdf', 'parquet', 'arrow').
+            extra_formats: Formats listed in the "More Formats" menu.
+            multi_export_callback: If given, the menu also lets the user tick
+                several formats and export them together; called with the
+                selected format strings.
         """
         super().__init__(parent, padding=(5, 5))
         self.export_callback = export_callback
+        self.extra_formats = [
+            fmt for fmt in extra_formats if fmt != "arrow" or ARROW_AVAILABLE
+        ]
+        self.multi_export_callback = multi_export_callback
+        self.multi_format_vars: Dict[str, tk.BooleanVar] = {
+            fmt: tk.BooleanVar(self, value=False)
+            for fmt in ["csv", "html", "pdf", *self.extra_formats]
+        }
 
 <<<<<<< HEAD
         # Configure grid layout
@@ -89,6 +114,16 @@ class ExportComponent(ttk.Frame):
         )
         self.pdf_button.pack(side=LEFT, padx=5)
 
+        # Columnar formats for downstream tools
+        self.more_button = ttk.Menubutton(
+            self, text=translate("More Formats"), bootstyle="info-outline"
+        )
+        self.more_menu = tk.Menu(self.more_button, tearoff=0)
+        self.more_button.configure(menu=self.more_menu)
+        if self.extra_formats or self.multi_export_callback:
+            self.more_button.pack(side=LEFT, padx=5)
+        self._populate_more_menu()
+
         # Initialize in disabled state
         self.set_ui_state(False)
 
@@ -103,6 +138,29 @@ class ExportComponent(ttk.Frame):
         self.csv_button.configure(state=state)
         self.html_button.configure(state=state)
         self.pdf_button.configure(state=state)
+        self.more_button.configure(state=state)
+
+    def _populate_more_menu(self) -> None:
+        self.more_menu.delete(0, "end")
+        for fmt in self.extra_formats:
+            self.more_menu.add_command(
+                label=translate(_FORMAT_LABELS[fmt]),
+                command=lambda f=fmt: self.export_callback(f),
+            )
+        if not self.multi_export_callback:
+            return
+        self.more_menu.add_separator()
+        for fmt, var in self.multi_format_vars.items():
+            self.more_menu.add_checkbutton(label=fmt.upper(), variable=var)
+        self.more_menu.add_command(
+            label=translate("Export Selected Formats..."),
+            command=self._export_selected_formats,
+        )
+
+    def _export_selected_formats(self) -> None:
+        selected = [fmt for fmt, var in self.multi_format_vars.items() if var.get()]
+        if selected and self.multi_export_callback:
+            self.multi_export_callback(selected)
 
     def re_translate(self) -> None:
         """Updates all translatable text in the component."""
@@ -110,3 +168,5 @@ class ExportComponent(ttk.Frame):
         self.csv_button.config(text=translate("Save as CSV"))
         self.html_button.config(text=translate("Save as HTML"))
         self.pdf_button.config(text=translate("Save as PDF"))
+        self.more_button.config(text=translate("More Formats"))
+        self._populate_more_menu()
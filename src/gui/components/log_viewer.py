@@ -49,6 +49,47 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Marker in an application log line and the LogPane level it maps to.
+LOG_LEVEL_MARKERS: Tuple[Tuple[str, str], ...] = (
+    (" - TRACE ", "TRACE"),
+    (" - DEBUG ", "DEBUG"),
+    (" - WARNING ", "WARN"),
+    (" - ERROR ", "ERROR"),
+    (" - CRITICAL ", "FATAL"),
+)
+_TIMESTAMP_RE = re.compile(r'time="([^"]+)"')
+_MESSAGE_RE = re.compile(r'msg="([^"]*)"')
+_KEY_VALUE_RE = re.compile(r'(\w+)=("([^"]*)"|([^\s]+))')
+
+
+def detect_log_level(line: str) -> str:
+    """LogPane level of an application log line; INFO if it has no marker."""
+    for marker, level in LOG_LEVEL_MARKERS:
+        if marker in line:
+            return level
+    return "INFO"
+
+
+def highlight_spans(line: str) -> List[Tuple[str, int, int]]:
+    """
+    (tag, start, end) character ranges to highlight in a line, for the
+    time="..." msg="..." key=value format written by kaspad and ks_bridge.
+    """
+    spans: List[Tuple[str, int, int]] = []
+    ts_match = _TIMESTAMP_RE.search(line)
+    if ts_match:
+        spans.append(("timestamp_tag", ts_match.start(1), ts_match.end(1)))
+    msg_match = _MESSAGE_RE.search(line)
+    if msg_match:
+        spans.append(("message_tag", msg_match.start(1), msg_match.end(1)))
+    for match in _KEY_VALUE_RE.finditer(line):
+        if match.group(1) in ("time", "msg", "level"):
+            continue
+        spans.append(("key_tag", match.start(1), match.end(1)))
+        val_group_idx = 3 if match.group(3) is not None else 4
+        spans.append(("value_tag", match.start(val_group_idx), match.end(val_group_idx)))
+    return spans
+
 
 class LogPane(ttk.Frame):
     """
@@ -494,39 +535,10 @@ class LogPane(ttk.Frame):
                 start_index, end_index
             ).strip()
 
-            ts_match: Optional[re.Match[str]] = re.search(
-                r'time="([^"]+)"', line_content
-            )
-            if ts_match:
-                start = f"{start_index}+{ts_match.start(1)}c"
-                end = f"{start_index}+{ts_match.end(1)}c"
-                self.output_text.text.tag_add("timestamp_tag", start, end)
-
-            msg_match: Optional[re.Match[str]] = re.search(
-                r'msg="([^"]*)"', line_content
-            )
-            if msg_match:
-                start = f"{start_index}+{msg_match.start(1)}c"
-                end = f"{start_index}+{msg_match.end(1)}c"
-                self.output_text.text.tag_add("message_tag", start, end)
-
-            kv_matches = re.finditer(r'(\w+)=("([^"]*)"|([^\s]+))', line_content)
-            for match in kv_matches:
-                key: str = match.group(1)
-                if key in ["time", "msg", "level"]:
-                    continue
-
-                key_start = f"{start_index}+{match.start(1)}c"
-                key_end = f"{start_index}+{match.end(1)}c"
-                self.output_text.text.tag_add("key_tag", key_start, key_end)
-
-                val_group_idx: int = 3 if match.group(3) is not None else 4
-                val_start_idx: int = match.start(val_group_idx)
-                val_end_idx: int = match.end(val_group_idx)
-
-                val_start = f"{start_index}+{val_start_idx}c"
-                val_end = f"{start_index}+{val_end_idx}c"
-                self.output_text.text.tag_add("value_tag", val_start, val_end)
+            for tag, span_start, span_end in highlight_spans(line_content):
+                self.output_text.text.tag_add(
+                    tag, f"{start_index}+{span_start}c", f"{start_index}+{span_end}c"
+                )
 
             num_lines = int(self.output_text.text.index("end-1c").split(".")[0])
             if num_lines > self.max_lines:
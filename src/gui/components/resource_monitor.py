@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Resource usage pane (CPU, memory, handles, disk and network I/O) for a
+process managed by the ProcessSupervisor, drawn as sparkline charts.
+
+The pane only reads the supervisor's ring buffer; it never samples the
+process itself. Redraws are skipped while the pane is not visible.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import tkinter as tk
+from datetime import datetime
+from tkinter import filedialog, messagebox
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import BOTH, EW, LEFT, RIGHT, W, X
+
+from src.config.config import CONFIG
+from src.utils.formatting import format_bytes
+from src.utils.i18n import translate
+from src.utils.process_supervisor import (
+    ProcessSample,
+    counter_rates,
+    get_process_supervisor,
+)
+
+if TYPE_CHECKING:
+    from src.gui.main_window import MainWindow
+
+logger = logging.getLogger(__name__)
+
+REFRESH_INTERVAL_MS: int = 2000
+
+
+def _fmt_rate(value: Optional[float]) -> str:
+    return "N/A" if value is None else f"{format_bytes(value)}/s"
+
+
+def _fmt_count(value: Optional[float]) -> str:
+    return "N/A" if value is None else f"{int(value):,}"
+
+
+# (label key, series builder, value formatter, bootstyle color)
+_METRICS: List[
+    Tuple[
+        str,
+        Callable[[List[ProcessSample]], List[Optional[float]]],
+        Callable[[Optional[float]], str],
+        str,
+    ]
+] = [
+    (
+        "CPU (%)",
+        lambda s: [x.cpu_percent for x in s],
+        lambda v: "N/A" if v is None else f"{v:.1f} %",
+        "primary",
+    ),
+    (
+        "Memory (RSS)",
+        lambda s: [x.rss_bytes for x in s],
+        lambda v: "N/A" if v is None else format_bytes(v),
+        "info",
+    ),
+    ("Open Handles", lambda s: [x.num_fds for x in s], _fmt_count, "secondary"),
+    ("Disk Read", lambda s: counter_rates(s, "read_bytes"), _fmt_rate, "success"),
+    ("Disk Write", lambda s: counter_rates(s, "write_bytes"), _fmt_rate, "warning"),
+    (
+        "Connections",
+        lambda s: [x.num_connections for x in s],
+        _fmt_count,
+        "secondary",
+    ),
+    (
+        "System Net Sent",
+        lambda s: counter_rates(s, "net_bytes_sent"),
+        _fmt_rate,
+        "info",
+    ),
+    (
+        "System Net Received",
+        lambda s: counter_rates(s, "net_bytes_recv"),
+        _fmt_rate,
+        "success",
+    ),
+]
+
+
+class Sparkline(tk.Canvas):
+    """A minimal line chart without axes, scaled to the series maximum."""
+
+    def __init__(
+        self,
+        master: tk.Misc,
+        color: str,
+        width: int = 240,
+        height: int = 28,
+        **kwargs: object,
+    ) -> None:
+        super().__init__(
+            master, width=width, height=height, highlightthickness=0, **kwargs
+        )
+        self.color = color
+
+    def draw(self, values: List[Optional[float]]) -> None:
+        self.delete("all")
+        width = max(int(self.winfo_width()), int(self["width"]))
+        height = max(int(self.winfo_height()), int(self["height"]))
+        # No point drawing more vertices than there are pixel columns.
+        stride = max(1, len(values) // width)
+        values = values[::-stride][::-1]
+        points = [(i, v) for i, v in enumerate(values) if v is not None]
+        if len(points) < 2:
+            return
+        peak = max(v for _, v in points) or 1.0
+        span = max(len(values) - 1, 1)
+        coords: List[float] = []
+        for i, v in points:
+            coords.append(i / span * (width - 2) + 1)
+            coords.append(height - 2 - (v / peak) * (height - 4))
+        self.create_line(*coords, fill=self.color, width=1.5)
+
+
+class ResourceMonitorPane(ttk.Frame):
+    """Shows the recent resource usage history of one managed process."""
+
+    main_window: "MainWindow"
+    process_key: str
+    display_name: str
+    sparklines: Dict[str, Sparkline]
+    value_labels: Dict[str, ttk.Label]
+    metric_labels: Dict[str, ttk.Label]
+
+    def __init__(
+        self,
+        master: tk.Misc,
+        main_window: "MainWindow",
+        process_key: str,
+        display_name: str,
+        **kwargs: object,
+    ) -> None:
+        super().__init__(master, **kwargs)
+        self.main_window = main_window
+        self.process_key = process_key
+        self.display_name = display_name
+        self.sparklines = {}
+        self.value_labels = {}
+        self.metric_labels = {}
+        self._after_id: Optional[str] = None
+
+        self._build_ui()
+        self.bind("<Map>", lambda e: self._refresh(), add="+")
+        self.bind("<Destroy>", self._on_destroy, add="+")
+        self._schedule_refresh()
+
+    def _build_ui(self) -> None:
+        style = ttk.Style.get_instance()
+        toolbar = ttk.Frame(self)
+        toolbar.pack(fill=X, pady=(0, 5))
+        self.status_label = ttk.Label(toolbar, text=translate("No samples yet."))
+        self.status_label.pack(side=LEFT, anchor=W)
+        self.export_button = ttk.Button(
+            toolbar,
+            text=translate("Save as CSV"),
+            bootstyle="info-outline",
+            command=self._export_csv,
+        )
+        self.export_button.pack(side=RIGHT)
+
+        grid = ttk.Frame(self)
+        grid.pack(fill=BOTH, expand=True)
+        grid.grid_columnconfigure(1, weight=1)
+        for row, (label_key, _, _, color) in enumerate(_METRICS):
+            label = ttk.Label(grid, text=translate(label_key))
+            label.grid(row=row, column=0, sticky=W, padx=(0, 10), pady=2)
+            spark = Sparkline(
+                grid,
+                color=getattr(style.colors, color),
+                background=style.colors.bg,
+            )
+            spark.grid(row=row, column=1, sticky=EW, pady=2)
+            value = ttk.Label(grid, text="N/A", width=14, anchor="e")
+            value.grid(row=row, column=2, sticky="e", padx=(10, 0), pady=2)
+            self.metric_labels[label_key] = label
+            self.sparklines[label_key] = spark
+            self.value_labels[label_key] = value
+
+    def _schedule_refresh(self) -> None:
+        self._after_id = self.after(REFRESH_INTERVAL_MS, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._refresh()
+        self._schedule_refresh()
+
+    def _refresh(self) -> None:
+        if not self.winfo_ismapped():
+            return
+        samples = get_process_supervisor().get_history(self.process_key)
+        if not samples:
+            self.status_label.config(text=translate("No samples yet."))
+        else:
+            interval = get_process_supervisor().sample_interval
+            self.status_label.config(
+                text=f"{translate('PID')}: {samples[-1].pid}  |  "
+                f"{len(samples)} {translate('samples')} @ {interval:g}s"
+            )
+        for label_key, build_series, fmt, _ in _METRICS:
+            series = build_series(samples)
+            self.sparklines[label_key].draw(series)
+            self.value_labels[label_key].config(
+                text=fmt(series[-1] if series else None)
+            )
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        if event.widget is self and self._after_id:
+            try:
+                self.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def _export_csv(self) -> None:
+        samples = get_process_supervisor().get_history(self.process_key)
+        if not samples:
+            messagebox.showinfo(
+                translate("Resource Usage"), translate("No samples yet."), parent=self
+            )
+            return
+
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        export_dir = CONFIG.get("paths", {}).get("export", ".")
+        os.makedirs(export_dir, exist_ok=True)
+        file_path = filedialog.asksaveasfilename(
+            initialfile=f"{self.process_key}_resources_{ts}.csv",
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")],
+            title=translate("Save as CSV"),
+            initialdir=export_dir,
+            parent=self,
+        )
+        if not file_path:
+            return
+
+        threading.Thread(
+            target=self._export_worker,
+            args=(samples, file_path),
+            daemon=True,
+            name="ResourceExportWorker",
+        ).start()
+
+    def _export_worker(self, samples: List[ProcessSample], file_path: str) -> None:
+        from src.export import export_process_stats_to_csv
+
+        success, msg_key, details = export_process_stats_to_csv(
+            samples, file_path, self.display_name
+        )
+        final_msg = f"{translate(msg_key)}: {details}" if details else translate(msg_key)
+        if not self.winfo_exists():
+            return
+        if success:
+            self.after(100, self.main_window.prompt_to_open_file, file_path, final_msg)
+        else:
+            self.after(0, lambda: messagebox.showerror(translate("Error"), final_msg))
+
+    def re_translate(self) -> None:
+        self.export_button.config(text=translate("Save as CSV"))
+        for label_key, label in self.metric_labels.items():
+            label.config(text=translate(label_key))
+        self._refresh()
@@ -11,7 +11,7 @@ from __future__ import annotations
 import logging
 import webbrowser
 import tkinter as tk
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import LEFT, RIGHT, X
@@ -71,6 +71,22 @@ class Status(ttk.Frame):
 
         self._build_links()
 
+        # Export jobs (next to the links); only shown while jobs are running.
+        self.on_cancel_exports: Optional[Callable[[], None]] = None
+        self.jobs_frame = ttk.Frame(self)
+        self.jobs_label = ttk.Label(
+            self.jobs_frame, text="", font="-size 9", bootstyle="info"
+        )
+        self.jobs_label.pack(side=LEFT)
+        self.jobs_cancel_button = ttk.Button(
+            self.jobs_frame,
+            text=translate("Cancel Exports"),
+            bootstyle="danger-link",
+            padding=(4, 0),
+            command=self._cancel_exports,
+        )
+        self.jobs_cancel_button.pack(side=LEFT)
+
     def _build_links(self) -> None:
         """Constructs the support links on the right side."""
         self.donations_link = self._create_link("Donations", CONFIG["links"]["donation"])
@@ -130,11 +146,32 @@ class Status(ttk.Frame):
                 exc_info=True,
             )
 
+    def update_export_jobs(self, text: str) -> None:
+        """
+        Shows the export job summary on the right; an empty text hides it.
+
+        Args:
+            text: Already translated summary of the active export jobs.
+        """
+        if not self.winfo_exists():
+            return
+        if text:
+            self.jobs_label.configure(text=text)
+            if not self.jobs_frame.winfo_manager():
+                self.jobs_frame.pack(side=RIGHT, padx=(0, 10))
+        else:
+            self.jobs_frame.pack_forget()
+
+    def _cancel_exports(self) -> None:
+        if self.on_cancel_exports:
+            self.on_cancel_exports()
+
 <<<<<<< HEAD
     def re_translate(self) -> None:
         """Updates translations for the status links."""
         if self.donations_link:
             self.donations_link.config(text=translate("Donations"))
+        self.jobs_cancel_button.config(text=translate("Cancel Exports"))
         
         # Twitter and GitHub usually remain in English, but we ensure they exist
         if self.twitter_link:
@@ -147,6 +184,7 @@ class Status(ttk.Frame):
         # until the next update_status call.
 =======
     def re_translate(self):
+        self.jobs_cancel_button.config(text=translate("Cancel Exports"))
 
         current_text_key = "Ready"
         if "جاهز" in self.label.cget("text"):
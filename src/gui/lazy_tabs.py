@@ -0,0 +1,48 @@
+import logging
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class LazyTabFactory:
+    """
+    Builds notebook tabs the first time they are needed.
+
+    The frame of each tab is created up front so the notebook can show its
+    title; the tab content (and the import of its module) is deferred to
+    build(), which the main window calls when the tab is first selected or
+    when something else needs it (e.g. node autostart).
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, Tuple[Any, Callable[[Any], Any]]] = {}
+        self._built: Dict[str, Any] = {}
+
+    def register(self, key: str, frame: Any, builder: Callable[[Any], Any]) -> None:
+        """builder(frame) creates the tab inside frame and returns it."""
+        self._pending[key] = (frame, builder)
+
+    def is_built(self, key: str) -> bool:
+        return key in self._built
+
+    def build(self, key: str) -> Optional[Any]:
+        """Builds the tab if it has not been built yet and returns it."""
+        if key in self._built:
+            return self._built[key]
+        entry = self._pending.pop(key, None)
+        if entry is None:
+            return None
+        frame, builder = entry
+        start = time.perf_counter()
+        tab = builder(frame)
+        self._built[key] = tab
+        logger.info(f"PERF: Tab '{key}' built in {time.perf_counter() - start:.4f}s")
+        return tab
+
+    def build_for_frame(self, frame: Any) -> Optional[Any]:
+        """Builds the pending tab that lives in frame, if any."""
+        for key, (pending_frame, _) in list(self._pending.items()):
+            if pending_frame is frame or str(pending_frame) == str(frame):
+                return self.build(key)
+        return None
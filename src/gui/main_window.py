@@ -23,13 +23,12 @@ import webbrowser
 from datetime import datetime
 <<<<<<< HEAD
 from tkinter import messagebox
-from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Callable, Dict, Optional, Tuple, TYPE_CHECKING
 =======
 from tkinter import filedialog, messagebox
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, cast
 >>>>>>> dev-latest
 
-import pandas as pd
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import BOTH, DANGER, DISABLED, NORMAL, NSEW, X
 from ttkbootstrap.toast import ToastNotification
@@ -40,14 +39,29 @@ from src.api.network import fetch_address_balance
 # Application-specific imports
 from src.api.network import (
     fetch_address_balance,
-    fetch_address_names,
     fetch_latest_release_info,
 )
 >>>>>>> dev-latest
+from src.api.cache import response_cache
+from src.api.network import api_request_stats
 from src.config.config import CONFIG, get_assets_path
 from src.utils.profiling import log_performance
 from src.utils.formatting import format_large_number
 from src.utils.i18n import switch_language, translate
+from src.utils.lazy_import import (
+    DEFAULT_IMPORT_BUDGET_SECONDS,
+    log_import_budget,
+    record_import_time,
+    timed_import,
+)
+from src.utils.metrics import get_metrics_registry
+from src.utils.process_supervisor import get_process_supervisor
+from src.utils.sampling_profiler import get_sampling_profiler
+from src.utils.startup_trace import (
+    MARK_INTERACTIVE,
+    MARK_WINDOW_SHOWN,
+    startup_tracer,
+)
 from src.utils.validation import validate_kaspa_address
 
 <<<<<<< HEAD
@@ -76,25 +90,28 @@ from src.database import (
 from src.database.db_locker import release_all_locks as release_db_locks
 from src.database.db_manager import DatabaseManager
 
-logger.info(
-    f"PERF: src.database imported in {time.perf_counter() - t_start_imports:.4f}s"
-)
-
-t_start_imports = time.perf_counter()
-logger.debug("PERF: Importing src.export...")
-from src.export import export_df_to_csv, export_df_to_html, export_df_to_pdf
-
-logger.info(
-    f"PERF: src.export imported in {time.perf_counter() - t_start_imports:.4f}s"
+record_import_time(
+    "src.database", time.perf_counter() - t_start_imports, part_of="src.core.app"
 )
 
 t_start_imports = time.perf_counter()
 logger.debug("PERF: Importing GUI components...")
 >>>>>>> dev-latest
+from src.database.db_open import open_databases, open_databases_async
+from src.database.migrations import set_progress_listener
+from src.export.jobs import (
+    DEFAULT_MAX_CONCURRENT_EXPORTS,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    ExportJobManager,
+)
 from src.gui.address_manager import AddressManager
+from src.gui.address_names import refresh_address_names
 from src.gui.config_manager import ConfigManager
+from src.gui.lazy_tabs import LazyTabFactory
 from src.gui.network_updater import NetworkUpdater
 from src.gui.price_updater import PriceUpdater
+from src.gui.stall_detector import StallDetector
 <<<<<<< HEAD
 from src.gui.theme_manager import ThemeManager
 from src.gui.transaction_manager import TransactionManager
@@ -105,12 +122,9 @@ from src.gui.components.status import Status
 =======
 >>>>>>> dev-latest
 from src.gui.tabs.explorer_tab import ExplorerTab
-from src.gui.tabs.kaspa_bridge_tab import KaspaBridgeTab
-from src.gui.tabs.kaspa_node_tab import KaspaNodeTab
 from src.gui.tabs.log_tab import LogTab
 from src.gui.tabs.normal_analysis_tab import NormalAnalysisTab
 from src.gui.tabs.settings_tab import SettingsTab
-from src.gui.tabs.top_addresses_tab import TopAddressesTab
 <<<<<<< HEAD
 =======
 from src.gui.theme_manager import ThemeManager
@@ -119,18 +133,28 @@ from src.utils.formatting import format_large_number
 from src.utils.i18n import switch_language, translate
 from src.utils.validation import _sanitize_for_logging, validate_kaspa_address
 
-logger.info(
-    f"PERF: GUI components imported in {time.perf_counter() - t_start_imports:.4f}s"
+record_import_time(
+    "GUI components", time.perf_counter() - t_start_imports, part_of="src.core.app"
 )
 # --- End Performance-timed Imports ---
 >>>>>>> dev-latest
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from src.gui.components.header import Header
     from src.gui.components.status import Status
+    from src.gui.tabs.kaspa_bridge_tab import KaspaBridgeTab
+    from src.gui.tabs.kaspa_node_tab import KaspaNodeTab
+    from src.gui.tabs.top_addresses_tab import TopAddressesTab
 
 logger = logging.getLogger(__name__)
 
+# How often the status bar refreshes row/byte counts of running exports.
+EXPORT_STATUS_INTERVAL_MS = 500
+# How often startup checks whether a database being opened is ready.
+DB_READY_POLL_MS = 20
+
 
 class MainWindow(ttk.Window):
     """
@@ -168,8 +192,23 @@ class MainWindow(ttk.Window):
         self.kaspa_bridge_tab: Optional[KaspaBridgeTab] = None
         self.status: Optional[Status] = None
         self.progress_bar: Optional[ttk.Progressbar] = None
+        # Top Addresses, Kaspa Node and Kaspa Bridge are built on first use.
+        self.tab_factory = LazyTabFactory()
+
+        # Shared background export queue; its state is shown in the status bar.
+        self.export_jobs = ExportJobManager(
+            max_workers=CONFIG.get("performance", {}).get(
+                "max_concurrent_exports", DEFAULT_MAX_CONCURRENT_EXPORTS
+            ),
+            on_change=self._on_export_jobs_changed,
+        )
+        self._export_status_after_id: Optional[str] = None
+        # Event loop latency watchdog; started once startup is complete.
+        self.stall_detector = StallDetector(self)
 
-        self._build_ui_structure()
+        with startup_tracer.span("_build_ui_structure"):
+            self._build_ui_structure()
+        self.bind("<Map>", self._on_first_map, add="+")
 
         self.after(50, self.deferred_initialization)
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -237,7 +276,26 @@ class MainWindow(ttk.Window):
         """Helper to return the version string currently in CONFIG."""
         return CONFIG.get("version", "1.0.0")
 
+    def _on_first_map(self, event: tk.Event) -> None:
+        """Marks the moment the main window first appears on screen."""
+        if event.widget is self:
+            startup_tracer.mark(MARK_WINDOW_SHOWN)
+
+    def _on_startup_interactive(self) -> None:
+        """
+        Runs on the first idle event loop pass after deferred initialization.
+        Closes the startup trace and, for benchmark runs, quits.
+        """
+        startup_tracer.mark(MARK_INTERACTIVE)
+        startup_tracer.finish()
+        # Started only now, so the (traced) startup work is not reported as stalls.
+        self.stall_detector.apply_settings(CONFIG.get("performance", {}))
+        if startup_tracer.exit_when_interactive:
+            logger.info("Startup complete; exiting as requested (--exit-when-interactive).")
+            self.destroy()
+
     @log_performance
+    @startup_tracer.traced("deferred_initialization")
     def deferred_initialization(self) -> None:
 <<<<<<< HEAD
         """Performs heavy initialization tasks after the UI is shown."""
@@ -250,48 +308,99 @@ class MainWindow(ttk.Window):
         logger.info(
             "Starting deferred initialization of managers and background services."
         )
-        t_start_deferred = time.perf_counter()
+        self._deferred_started_at = time.perf_counter()
 >>>>>>> dev-latest
 
         # 1. Initialize Managers Directly
-        self.config_manager = ConfigManager()
-        self.theme_manager = ThemeManager(self, self.config_manager)
-        self.reinitialize_databases()
+        with startup_tracer.span("config_and_theme"):
+            self.config_manager = ConfigManager()
+            self.theme_manager = ThemeManager(self, self.config_manager)
 
-        # 2. Initialize Logic Layers
-        if self.addr_db:
-            self.address_manager = AddressManager(self.addr_db)
+        # 2. Open the databases in parallel. Each stage below continues on the
+        # Tk thread as soon as the database it needs is ready, so a large
+        # transactions file no longer holds up the header and price cache.
+        self.db_manager = DatabaseManager()
+        set_progress_listener(self._on_migration_progress)
+        self._pending_databases = open_databases_async(self.db_manager.data_dir)
+        self._when_database_ready("app_data", self._on_app_data_db_ready)
 
-        if self.tx_db:
-            self.transaction_manager = TransactionManager(
-                self, self.tx_db, self.cancel_event
+    def _on_migration_progress(self, database: str, description: str, fraction: float) -> None:
+        """Shows schema migrations of large files in the status bar (any thread)."""
+        try:
+            self.after(
+                0,
+                self.status.update_status,
+                "Upgrading {} database: {}%",
+                database,
+                int(fraction * 100),
             )
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def _when_database_ready(self, name: str, callback: Callable[[Any], None]) -> None:
+        """Calls callback(db) on the Tk thread once the named database is open."""
+        future = self._pending_databases[name]
+        if future.done():
+            callback(future.result())
+        else:
+            self.after(DB_READY_POLL_MS, self._when_database_ready, name, callback)
+
+    @startup_tracer.traced("_on_app_data_db_ready")
+    def _on_app_data_db_ready(self, db: AppDataDB) -> None:
+        self.app_data_db = db
+        response_cache.attach_store(db)
 
         # 3. Initialize Background Services
-        price_cache_hours = CONFIG.get("performance", {}).get("price_cache_hours", 0.25)
-        self.price_updater = PriceUpdater(
-            self, self.app_data_db, update_interval_sec=int(price_cache_hours * 3600)
-        )
-        self.network_updater = NetworkUpdater(
-            self, self.app_data_db, update_interval_sec=60
-        )
+        with startup_tracer.span("background_services"):
+            price_cache_hours = CONFIG.get("performance", {}).get(
+                "price_cache_hours", 0.25
+            )
+            self.price_updater = PriceUpdater(
+                self, self.app_data_db, update_interval_sec=int(price_cache_hours * 3600)
+            )
+            self.network_updater = NetworkUpdater(
+                self, self.app_data_db, update_interval_sec=60
+            )
+        with startup_tracer.span("_update_header_stats_from_cache"):
+            self._update_header_stats_from_cache()
+        self._update_clock_loop()
+
+        self._when_database_ready("addresses", self._on_addr_db_ready)
+
+    def _on_addr_db_ready(self, db: AddressDB) -> None:
+        self.addr_db = db
+        self.address_manager = AddressManager(db)
+        self._when_database_ready("transactions", self._on_tx_db_ready)
 
+    def _on_tx_db_ready(self, db: TransactionDB) -> None:
+        set_progress_listener(None)
+        self.tx_db = db
+        self.transaction_manager = TransactionManager(self, db, self.cancel_event)
+        self._finish_deferred_initialization()
+
+    @startup_tracer.traced("_finish_deferred_initialization")
+    def _finish_deferred_initialization(self) -> None:
+        """Wires the UI to the managers once every database is open."""
         # 4. Connect UI
-        self._connect_managers_to_ui()
+        with startup_tracer.span("_connect_managers_to_ui"):
+            self._connect_managers_to_ui()
 
 <<<<<<< HEAD
         # 5. Start Services
 =======
 >>>>>>> dev-latest
-        self._update_header_stats_from_cache()
-        self._update_clock_loop()
-        self.start_background_services()
+        with startup_tracer.span("start_background_services"):
+            self.start_background_services()
 
-        self._load_user_state()
+        with startup_tracer.span("_load_user_state"):
+            self._load_user_state()
 
         # 6. Autostart Logic
         logger.info("Checking autostart configurations...")
-        
+
+        with startup_tracer.span("_build_tabs_needed_for_autostart"):
+            self._build_tabs_needed_for_autostart()
+
         # Node Autostart
         if self.kaspa_node_tab and self.kaspa_node_tab.controller:
             if hasattr(self.kaspa_node_tab.controller, "autostart_if_enabled"):
@@ -310,30 +419,31 @@ class MainWindow(ttk.Window):
 
         t_end_deferred = time.perf_counter()
         logger.info(
-            f"PERF: Deferred initialization complete in {t_end_deferred - t_start_deferred:.4f} seconds."
+            f"PERF: Deferred initialization complete in {t_end_deferred - self._deferred_started_at:.4f} seconds."
         )
 >>>>>>> dev-latest
 
         self.app_initialized = True
         logger.info("Application fully initialized.")
+        self._build_selected_tab()
+        log_import_budget(
+            CONFIG.get("performance", {}).get(
+                "import_budget_seconds", DEFAULT_IMPORT_BUDGET_SECONDS
+            )
+        )
+        self.after_idle(self._on_startup_interactive)
 
+    @startup_tracer.traced("reinitialize_databases")
     def reinitialize_databases(self) -> None:
         """Initializes or re-initializes database connections."""
         logger.info("Initializing databases...")
         self.db_manager = DatabaseManager()
 
-        self.tx_db = TransactionDB(
-            f"{self.db_manager.data_dir}/{CONFIG['db_filenames']['transactions']}",
-            initialize_tx_schema,
-        )
-        self.addr_db = AddressDB(
-            f"{self.db_manager.data_dir}/{CONFIG['db_filenames']['addresses']}",
-            initialize_addr_schema,
-        )
-        self.app_data_db = AppDataDB(
-            f"{self.db_manager.data_dir}/{CONFIG['db_filenames']['app_data']}",
-            initialize_app_data_schema,
-        )
+        databases = open_databases(self.db_manager.data_dir)
+        self.tx_db = databases["transactions"]
+        self.addr_db = databases["addresses"]
+        self.app_data_db = databases["app_data"]
+        response_cache.attach_store(self.app_data_db)
 
         # Update references in managers if they exist
         if self.address_manager:
@@ -416,21 +526,15 @@ class MainWindow(ttk.Window):
         """Initializes all core managers and database connections."""
 
         logger.info("Initializing core managers and database connections...")
-        db_filenames: Dict[str, str] = CONFIG["db_filenames"]
         db_path: str = CONFIG["paths"]["database"]
 
         # Database connections are now opened, assuming locks were
         # acquired successfully by src/main.py
-        self.tx_db = TransactionDB(
-            os.path.join(db_path, db_filenames["transactions"]), initialize_tx_schema
-        )
-        self.addr_db = AddressDB(
-            os.path.join(db_path, db_filenames["addresses"]), initialize_addr_schema
-        )
-        self.app_data_db = AppDataDB(
-            os.path.join(db_path, db_filenames["app_data"]), initialize_app_data_schema
-        )
-        self.addr_db.migrate_schema()
+        databases = open_databases(db_path)
+        self.tx_db = databases["transactions"]
+        self.addr_db = databases["addresses"]
+        self.app_data_db = databases["app_data"]
+        response_cache.attach_store(self.app_data_db)
 
         self.db_manager = DatabaseManager()
         self.config_manager = ConfigManager()
@@ -465,22 +569,18 @@ class MainWindow(ttk.Window):
             logger.error(f"Error while closing DB connections: {e}", exc_info=True)
         logger.info("All database connections closed.")
 
+    @startup_tracer.traced("reinitialize_databases")
     def reinitialize_databases(self) -> None:
         """Re-initializes DB connections and dependent managers after a delete/restore."""
         logger.info("Re-initializing database connections after deletion/restore...")
-        db_filenames: Dict[str, str] = CONFIG["db_filenames"]
         db_path: str = CONFIG["paths"]["database"]
 
-        # Create new instances of the database managers
-        self.tx_db = TransactionDB(
-            os.path.join(db_path, db_filenames["transactions"]), initialize_tx_schema
-        )
-        self.addr_db = AddressDB(
-            os.path.join(db_path, db_filenames["addresses"]), initialize_addr_schema
-        )
-        self.app_data_db = AppDataDB(
-            os.path.join(db_path, db_filenames["app_data"]), initialize_app_data_schema
-        )
+        # Create new instances of the database managers (opened in parallel)
+        databases = open_databases(db_path)
+        self.tx_db = databases["transactions"]
+        self.addr_db = databases["addresses"]
+        self.app_data_db = databases["app_data"]
+        response_cache.attach_store(self.app_data_db)
 
         # Re-link these new instances to the main managers
         self.address_manager.db = self.addr_db
@@ -541,21 +641,14 @@ class MainWindow(ttk.Window):
         node_frame = ttk.Frame(self.tabview)
         bridge_frame = ttk.Frame(self.tabview)
 
-        self.top_addresses_tab = TopAddressesTab(top_addr_frame, self)
         self.log_tab = LogTab(log_frame)
         self.settings_tab = SettingsTab(settings_frame, self)
-        self.kaspa_node_tab = KaspaNodeTab(
-<<<<<<< HEAD
-            node_frame, self, config_manager=self.config_manager
+        self.tab_factory.register(
+            "Top Addresses", top_addr_frame, self._build_top_addresses_tab
         )
-        self.kaspa_bridge_tab = KaspaBridgeTab(
-            bridge_frame, self, config_manager=self.config_manager
-=======
-            kaspa_node_frame, self, config_manager=self.config_manager
-        )
-        self.kaspa_bridge_tab = KaspaBridgeTab(
-            kaspa_bridge_frame, self, config_manager=self.config_manager
->>>>>>> dev-latest
+        self.tab_factory.register("Kaspa Node", node_frame, self._build_kaspa_node_tab)
+        self.tab_factory.register(
+            "Kaspa Bridge", bridge_frame, self._build_kaspa_bridge_tab
         )
 
         self.all_tabs = {
@@ -563,13 +656,8 @@ class MainWindow(ttk.Window):
             "Analysis": self.analysis_tab_notebook,
             "Top Addresses": top_addr_frame,
             "Log": log_frame,
-<<<<<<< HEAD
             "Kaspa Node": node_frame,
             "Kaspa Bridge": bridge_frame,
-=======
-            "Kaspa Node": kaspa_node_frame,
-            "Kaspa Bridge": kaspa_bridge_frame,
->>>>>>> dev-latest
             "Settings": settings_frame,
         }
 
@@ -623,9 +711,16 @@ class MainWindow(ttk.Window):
             )
             return
 
-        if messagebox.askokcancel(
-            translate("Quit"), translate("Are you sure you want to exit?")
-        ):
+        if self.export_jobs.active_jobs():
+            confirmed = messagebox.askyesno(
+                translate("Quit"),
+                translate("Exports are still running. Cancel them and exit?"),
+            )
+        else:
+            confirmed = messagebox.askokcancel(
+                translate("Quit"), translate("Are you sure you want to exit?")
+            )
+        if confirmed:
             try:
 <<<<<<< HEAD
                 self._save_user_state()
@@ -653,6 +748,12 @@ class MainWindow(ttk.Window):
             self.price_updater.stop()
         if self.network_updater:
             self.network_updater.stop()
+        get_process_supervisor().stop()
+        self.stall_detector.stop()
+        self.export_jobs.shutdown()
+        response_cache.shutdown()
+        logger.info(f"API response cache: {response_cache.stats()}")
+        logger.info(f"API request coalescing: {api_request_stats()}")
 
 <<<<<<< HEAD
         if self.transaction_manager:
@@ -704,13 +805,13 @@ class MainWindow(ttk.Window):
             self.price_updater.stop()
         if hasattr(self, "network_updater"):
             self.network_updater.stop()
-        if hasattr(self, "top_addresses_tab"):
+        if getattr(self, "top_addresses_tab", None):
             self.top_addresses_tab.stop()
 
-        if hasattr(self, "kaspa_node_tab"):
+        if getattr(self, "kaspa_node_tab", None):
             self.kaspa_node_tab.on_close()
 
-        if hasattr(self, "kaspa_bridge_tab"):
+        if getattr(self, "kaspa_bridge_tab", None):
             self.kaspa_bridge_tab.on_close()
 
         logger.info("Background services confirmed shut down.")
@@ -805,7 +906,7 @@ class MainWindow(ttk.Window):
                 else "Explorer"
             )
 
-            if previous_tab_text == translate("Top Addresses"):
+            if previous_tab_text == translate("Top Addresses") and self.top_addresses_tab:
                 self.top_addresses_tab.deactivate()
 
             selected_tab_index: int = self.tabview.index(self.tabview.select())
@@ -818,14 +919,15 @@ class MainWindow(ttk.Window):
             )
 
             self.previous_tab_index = selected_tab_index
+            self._build_selected_tab()
 
             if selected_tab_text == translate("Top Addresses"):
                 self.top_addresses_tab.activate()
             elif selected_tab_text == translate("Kaspa Node"):
-                if hasattr(self, "kaspa_node_tab"):
+                if self.kaspa_node_tab:
                     self.kaspa_node_tab.activate_tab()
             elif selected_tab_text == translate("Kaspa Bridge"):
-                if hasattr(self, "kaspa_bridge_tab"):
+                if self.kaspa_bridge_tab:
                     self.kaspa_bridge_tab.activate_tab()
             elif selected_tab_text == translate("Analysis"):
                 try:
@@ -861,6 +963,43 @@ class MainWindow(ttk.Window):
         self.explorer_tab = ExplorerTab(tab, self)
         self.explorer_tab.pack(fill=BOTH, expand=True, padx=5, pady=5)
 
+    def _build_top_addresses_tab(self, frame: ttk.Frame) -> "TopAddressesTab":
+        module = timed_import("src.gui.tabs.top_addresses_tab")
+        self.top_addresses_tab = module.TopAddressesTab(frame, self)
+        return self.top_addresses_tab
+
+    def _build_kaspa_node_tab(self, frame: ttk.Frame) -> "KaspaNodeTab":
+        module = timed_import("src.gui.tabs.kaspa_node_tab")
+        self.kaspa_node_tab = module.KaspaNodeTab(
+            frame, self, config_manager=self.config_manager
+        )
+        return self.kaspa_node_tab
+
+    def _build_kaspa_bridge_tab(self, frame: ttk.Frame) -> "KaspaBridgeTab":
+        module = timed_import("src.gui.tabs.kaspa_bridge_tab")
+        self.kaspa_bridge_tab = module.KaspaBridgeTab(
+            frame, self, config_manager=self.config_manager
+        )
+        return self.kaspa_bridge_tab
+
+    def _build_selected_tab(self) -> None:
+        """Builds the selected notebook tab if it is still a placeholder."""
+        try:
+            if selected := self.tabview.select():
+                self.tab_factory.build_for_frame(self.tabview.nametowidget(selected))
+        except Exception as e:
+            logger.error(f"Failed to build tab: {_sanitize_for_logging(e)}")
+
+    def _build_tabs_needed_for_autostart(self) -> None:
+        """Node and bridge autostart run from their tabs, so build those first."""
+        config: Dict[str, Any] = self.config_manager.get_config()
+        if config.get("kaspa_node", {}).get("autostart_var"):
+            self.tab_factory.build("Kaspa Node")
+        if any(
+            config.get(f"kaspa_bridge_{i}", {}).get("autostart_var") for i in (1, 2)
+        ):
+            self.tab_factory.build("Kaspa Bridge")
+
     def start_ui_update_loop(self, data_queue: "queue.Queue[pd.DataFrame]") -> None:
         """Starts the 'after' loop to process the UI update queue."""
         if hasattr(self, "explorer_tab") and hasattr(
@@ -1036,38 +1175,34 @@ class MainWindow(ttk.Window):
             name="_address_name_worker",
         ).start()
 
-    def _save_and_update_names(self, names: Optional[List[Dict[str, str]]]) -> None:
-        """Saves fetched address names to DB and updates the local map."""
-        try:
-            if names:
-                self.app_data_db.save_address_names(names)
-            self.address_names_map = self.app_data_db.get_address_names_map()
-        except Exception as e:
-            logger.error(
-                f"Failed to save or update address names in main thread: {_sanitize_for_logging(e)}"
-            )
-        finally:
-            self.address_names_loaded.set()
-            logger.info("Address names loaded event set.")
-            self.after(100, self._continue_startup_after_names)
+    def _apply_address_names(self, names_map: Optional[Dict[str, str]]) -> None:
+        """Installs the loaded name map and continues the startup chain."""
+        if names_map is not None:
+            self.address_names_map = names_map
+        self.address_names_loaded.set()
+        logger.info("Address names loaded event set.")
+        self.after(100, self._continue_startup_after_names)
 
     def _address_name_worker_logic(self) -> None:
-        """Background worker to fetch address names."""
+        """Background worker that syncs the stored address names."""
+        names_map: Optional[Dict[str, str]] = None
         try:
-            logger.debug("Fetching address names in background worker.")
-            names: Optional[List[Dict[str, str]]] = fetch_address_names()
-            if self.winfo_exists():
-                self.after(0, self.status.update_status, "Ready")
-            self.after(0, self._save_and_update_names, names)
+            logger.debug("Refreshing address names in background worker.")
+            with startup_tracer.span("refresh_address_names"):
+                names_map = refresh_address_names(self.app_data_db)
         except Exception as e:
-            logger.error(f"Failed to fetch address names: {_sanitize_for_logging(e)}")
-            if self.winfo_exists():
-                self.after(0, self.status.update_status, "Ready")
-            self.after(0, self._save_and_update_names, None)
+            logger.error(f"Failed to refresh address names: {_sanitize_for_logging(e)}")
+        if self.winfo_exists():
+            self.after(0, self.status.update_status, "Ready")
+        self.after(0, self._apply_address_names, names_map)
 
     def on_settings_saved(self) -> None:
         """Callback triggered after settings are saved."""
         logger.info("Settings saved. Triggering full UI and data refresh.")
+        get_process_supervisor().apply_settings(CONFIG.get("performance", {}))
+        get_metrics_registry().apply_settings(CONFIG.get("performance", {}))
+        get_sampling_profiler().apply_settings(CONFIG.get("performance", {}))
+        self.stall_detector.apply_settings(CONFIG.get("performance", {}))
         switch_language(CONFIG["language"])
         self.re_translate_ui()
 
@@ -1076,12 +1211,13 @@ class MainWindow(ttk.Window):
         node_config: Dict[str, Any] = self.config_manager.get_config().get(
             "kaspa_node", {}
         )
+        self._build_tabs_needed_for_autostart()
         if node_config.get("autostart_var", False):
-            if hasattr(self, "kaspa_node_tab"):
+            if self.kaspa_node_tab:
                 logger.info("Auto-starting Kaspa Node...")
                 self.kaspa_node_tab.controller.start_node(is_autostart=True)
 
-        if hasattr(self, "kaspa_bridge_tab"):
+        if self.kaspa_bridge_tab:
             logger.info("Auto-starting Kaspa Bridge(s)...")
             self.kaspa_bridge_tab.autostart_bridges(is_autostart=True)
 
@@ -1149,7 +1285,7 @@ class MainWindow(ttk.Window):
             )
         if self.current_address:
             self.update_address_balance(self.current_address)
-        if hasattr(self, "top_addresses_tab") and self.top_addresses_tab.is_active:
+        if self.top_addresses_tab and self.top_addresses_tab.is_active:
             self.top_addresses_tab.update_currency_display(self.currency_var.get())
 
         if hasattr(self, "normal_analysis_tab"):
@@ -1369,6 +1505,10 @@ class MainWindow(ttk.Window):
             if self.network_updater:
                 self.network_updater.stop()
 
+        get_process_supervisor().apply_settings(CONFIG.get("performance", {}))
+        get_metrics_registry().apply_settings(CONFIG.get("performance", {}))
+        get_sampling_profiler().apply_settings(CONFIG.get("performance", {}))
+        self.stall_detector.apply_settings(CONFIG.get("performance", {}))
         switch_language(CONFIG["language"])
         self.re_translate_ui()
 
@@ -1499,6 +1639,7 @@ class MainWindow(ttk.Window):
             sel_idx = self.tabview.index(self.tabview.select())
             sel_text = self.tabview.tab(sel_idx, "text").strip()
             self.previous_tab_index = sel_idx
+            self._build_selected_tab()
 
             if sel_text == translate("Top Addresses") and self.top_addresses_tab:
                 self.top_addresses_tab.activate()
@@ -1525,6 +1666,7 @@ class MainWindow(ttk.Window):
         f.grid_columnconfigure(0, weight=1)
         self.status = Status(f)
         self.status.grid(row=0, column=0, sticky="ew")
+        self.status.on_cancel_exports = self.export_jobs.cancel_all
 
         self.progress_bar = ttk.Progressbar(
             self, mode="indeterminate", bootstyle="success-striped"
@@ -1593,6 +1735,36 @@ class MainWindow(ttk.Window):
             if self.status:
                 self.status.update_status(translate("Cancelling..."))
 
+    def _on_export_jobs_changed(self) -> None:
+        """Called from export worker threads; the refresh runs on the Tk loop."""
+        try:
+            self.after(0, self._refresh_export_status)
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def _refresh_export_status(self) -> None:
+        """Shows running/queued export jobs and polls while any are active."""
+        if self._export_status_after_id:
+            self.after_cancel(self._export_status_after_id)
+            self._export_status_after_id = None
+
+        active = self.export_jobs.active_jobs()
+        running = [job for job in active if job.state == JOB_RUNNING]
+        queued = sum(1 for job in active if job.state == JOB_QUEUED)
+        text = ""
+        if active:
+            text = f"{translate('Exports')}: " + "; ".join(
+                job.describe() for job in running
+            )
+            if queued:
+                text += f" (+{queued} {translate('queued')})"
+        if self.status:
+            self.status.update_export_jobs(text)
+        if active:
+            self._export_status_after_id = self.after(
+                EXPORT_STATUS_INTERVAL_MS, self._refresh_export_status
+            )
+
     def _update_ui_for_address_validity(self, is_valid: bool) -> None:
         if not self.explorer_tab or not hasattr(self.explorer_tab, "input_component"):
             return
@@ -1747,7 +1919,8 @@ class MainWindow(ttk.Window):
                         self.tabview.select(), "text"
                     ).strip() == translate("Top Addresses"):
                         logger.debug("Auto-refreshing Top Addresses tab.")
-                        self.top_addresses_tab.refresh_data()
+                        if self.top_addresses_tab:
+                            self.top_addresses_tab.refresh_data()
                 except Exception:
                     pass
 
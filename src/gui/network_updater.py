@@ -3,6 +3,7 @@ import threading
 import time
 from typing import TYPE_CHECKING, Callable, Optional, Tuple
 
+from src.api.cache import endpoint_ttl
 from src.api.network import fetch_network_stats
 from src.utils.errors import APIError
 
@@ -54,7 +55,9 @@ class NetworkUpdater:
     def initial_fetch(self):
         logger.info("Performing initial network stats fetch from cache or worker.")
         self.initial_fetch_complete.clear()
-        cached = self.db.get_cached_network_data()
+        cached = self.db.get_cached_network_data(
+            max_age_seconds=endpoint_ttl("network_stats")
+        )
         if cached:
             self.hashrate, self.difficulty = cached
             if self.update_callback:
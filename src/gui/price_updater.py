@@ -4,6 +4,7 @@ import threading
 import time
 from typing import TYPE_CHECKING, Callable, Dict, Optional
 
+from src.api.cache import endpoint_ttl
 from src.api.price import get_kaspa_prices
 from src.utils.errors import APIError
 
@@ -55,7 +56,9 @@ class PriceUpdater:
     def initial_fetch(self) -> None:
         logger.info("Performing initial price fetch from cache or worker.")
         self.initial_fetch_complete.clear()
-        cached_prices = self.db.get_cached_prices()
+        cached_prices = self.db.get_cached_prices(
+            max_age_seconds=endpoint_ttl("prices")
+        )
         if cached_prices:
             self.current_prices = cached_prices
             # self.last_updated_ts = self.db.get_latest_price_timestamp() # This method doesn't exist, get from file mod time or similar if needed
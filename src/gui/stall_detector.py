@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Detects stalls of the Tk event loop and finds the code causing them.
+
+A heartbeat callback is scheduled with after() every HEARTBEAT_MS. How
+late each beat fires is the event-loop latency, recorded in the metrics
+registry ("tk.event_loop_lag"), so it shows up in the Performance panel.
+
+While the main thread is busy no callback can run, so the blocking code
+cannot be seen from the heartbeat itself. A watcher thread therefore
+checks how long ago the last beat ran; once that exceeds the threshold it
+samples the main thread's stack with sys._current_frames() until the
+loop is free again. Each stall is attributed to the innermost frame of
+the application's own code in those samples (e.g. Results.display_data),
+logged once, and aggregated per call site (count, total and worst
+duration, plus a "tk.stall <site>" histogram).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from dataclasses import dataclass, field
+from types import FrameType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from src.utils.metrics import get_metrics_registry
+
+if TYPE_CHECKING:
+    import tkinter as tk
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_MS: int = 100
+DEFAULT_STALL_THRESHOLD_MS: int = 250
+# How often the watcher checks the heartbeat / samples a stalled loop.
+WATCH_INTERVAL_SECONDS: float = 0.05
+# Frames below this directory are the application's; the rest is library code.
+APP_SOURCE_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+UNKNOWN_SITE: str = "<unknown>"
+
+
+@dataclass
+class StallSite:
+    """Aggregated stalls attributed to one call site."""
+
+    site: str
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    example_stack: List[str] = field(default_factory=list)
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _call_site(frame: Optional[FrameType]) -> str:
+    """'function (file:line)' of the innermost application frame."""
+    innermost = frame
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(APP_SOURCE_DIR) and filename != __file__:
+            return _frame_label(frame)
+        frame = frame.f_back
+    return _frame_label(innermost) if innermost is not None else UNKNOWN_SITE
+
+
+class StallDetector:
+    """Heartbeat on the Tk loop plus a watcher thread sampling the main thread."""
+
+    def __init__(
+        self,
+        widget: "tk.Misc",
+        threshold_ms: int = DEFAULT_STALL_THRESHOLD_MS,
+        heartbeat_ms: int = HEARTBEAT_MS,
+    ) -> None:
+        self.widget = widget
+        self.threshold = threshold_ms / 1000
+        self.heartbeat_ms = heartbeat_ms
+        self._main_ident = threading.main_thread().ident
+
+        self._lock = threading.Lock()
+        self._sites: Dict[str, StallSite] = {}
+        self._last_beat = time.monotonic()
+        # Sites seen in the samples of the stall in progress.
+        self._current_samples: Counter[str] = Counter()
+        self._current_stack: List[str] = []
+
+        self._after_id: Optional[str] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Starts the heartbeat and the watcher. Call on the Tk thread."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._last_beat = time.monotonic()
+        self._after_id = self.widget.after(self.heartbeat_ms, self._beat, self._last_beat)
+        self._thread = threading.Thread(
+            target=self._watch_loop, daemon=True, name="StallWatcher"
+        )
+        self._thread.start()
+        logger.info(
+            f"Event loop stall detector started (threshold {self.threshold * 1000:.0f} ms)."
+        )
+
+    def stop(self) -> None:
+        """Stops watching and logs the stall summary."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass  # The window may already be destroyed.
+            self._after_id = None
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=1)
+        self._thread = None
+        for site in self.report()[:5]:
+            logger.info(
+                f"PERF: Tk stalls at {site.site}: {site.count}x, "
+                f"{site.total_seconds:.2f}s total, worst {site.max_seconds * 1000:.0f} ms"
+            )
+
+    def apply_settings(self, perf_config: Dict[str, Any]) -> None:
+        """Applies the 'performance' config keys; call on the Tk thread."""
+        try:
+            self.threshold = (
+                int(perf_config.get("stall_threshold_ms", DEFAULT_STALL_THRESHOLD_MS)) / 1000
+            )
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Invalid stall detector settings: {e}")
+        if perf_config.get("stall_detector_enabled", True):
+            self.start()
+        else:
+            self.stop()
+
+    def _beat(self, scheduled_at: float) -> None:
+        now = time.monotonic()
+        lag = max(0.0, now - scheduled_at - self.heartbeat_ms / 1000)
+        registry = get_metrics_registry()
+        if registry.enabled:
+            registry.histogram("tk.event_loop_lag").record(lag)
+        with self._lock:
+            self._last_beat = now
+            samples, self._current_samples = self._current_samples, Counter()
+            stack, self._current_stack = self._current_stack, []
+        if lag >= self.threshold:
+            self._record_stall(lag, samples, stack)
+        if not self._stop_event.is_set():
+            self._after_id = self.widget.after(self.heartbeat_ms, self._beat, now)
+
+    def _record_stall(self, lag: float, samples: Counter[str], stack: List[str]) -> None:
+        site = samples.most_common(1)[0][0] if samples else UNKNOWN_SITE
+        with self._lock:
+            entry = self._sites.setdefault(site, StallSite(site))
+            entry.count += 1
+            entry.total_seconds += lag
+            if lag >= entry.max_seconds:
+                entry.max_seconds = lag
+                entry.example_stack = stack
+        registry = get_metrics_registry()
+        if registry.enabled:
+            registry.counter("tk.stalls").inc()
+            registry.histogram(f"tk.stall {site}").record(lag)
+        logger.warning(
+            f"Tk event loop stalled for {lag * 1000:.0f} ms in {site}.\n" + "".join(stack)
+        )
+
+    def _watch_loop(self) -> None:
+        while not self._stop_event.wait(WATCH_INTERVAL_SECONDS):
+            with self._lock:
+                overdue = time.monotonic() - self._last_beat - self.heartbeat_ms / 1000
+            if overdue >= self.threshold:
+                self.sample_main_thread()
+
+    def sample_main_thread(self) -> None:
+        """Attributes the main thread's current stack to the stall in progress."""
+        frame = sys._current_frames().get(self._main_ident)
+        if frame is None:
+            return
+        site = _call_site(frame)
+        stack = traceback.format_stack(frame)
+        del frame
+        with self._lock:
+            self._current_samples[site] += 1
+            if not self._current_stack:
+                self._current_stack = stack
+
+    def report(self) -> List[StallSite]:
+        """Call sites ordered by total stalled time."""
+        with self._lock:
+            sites = list(self._sites.values())
+        return sorted(sites, key=lambda s: s.total_seconds, reverse=True)
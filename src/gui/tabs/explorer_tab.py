@@ -34,7 +34,15 @@ from ttkbootstrap.scrolled import ScrolledText
 from ttkbootstrap.toast import ToastNotification
 
 from src.config.config import CONFIG, get_active_api_config
-from src.export import export_df_to_csv, export_df_to_html, export_df_to_pdf
+from src.export import (
+    export_df_to_pdf,
+    export_transactions_to_arrow,
+    export_transactions_to_csv,
+    export_transactions_to_formats,
+    export_transactions_to_html,
+    export_transactions_to_parquet,
+)
+from src.export.jobs import JOB_CANCELLED, JOB_DONE, ExportJob
 from src.gui.components.export import ExportComponent
 from src.gui.components.results import Results
 from src.gui.input import Input
@@ -61,7 +69,15 @@ from ttkbootstrap.constants import *
 from ttkbootstrap.toast import ToastNotification
 
 from src.config.config import CONFIG
-from src.export import export_df_to_csv, export_df_to_html, export_df_to_pdf
+from src.export import (
+    export_df_to_pdf,
+    export_transactions_to_arrow,
+    export_transactions_to_csv,
+    export_transactions_to_formats,
+    export_transactions_to_html,
+    export_transactions_to_parquet,
+)
+from src.export.jobs import JOB_CANCELLED, JOB_DONE, ExportJob
 from src.gui.components import ExportComponent, Results
 from src.gui.input import Input
 from src.utils.i18n import get_all_translations_for_key, translate
@@ -763,6 +779,8 @@ class ExplorerTab(ttk.Frame):
         self.transaction_manager = main_window.transaction_manager
         self.address_manager = main_window.address_manager
         self.tx_db = main_window.tx_db
+        # Filters behind the current view; None means every transaction.
+        self.export_filters: Optional[Dict[str, Any]] = None
 
         # UI Components
         self.input_component: Optional[Input] = None
@@ -803,7 +821,11 @@ class ExplorerTab(ttk.Frame):
         bottom_frame.pack(fill=X, padx=5, pady=5)
         bottom_frame.grid_columnconfigure(1, weight=1)  # Spacer
 
-        self.export_component = ExportComponent(bottom_frame, self.export_data)
+        self.export_component = ExportComponent(
+            bottom_frame,
+            self.export_data,
+            multi_export_callback=self.export_multiple_formats,
+        )
         self.export_component.grid(row=0, column=0, sticky="w")
 
         # Font size controls
@@ -883,6 +905,7 @@ class ExplorerTab(ttk.Frame):
         self.main_window._set_ui_for_processing(True)
         filters = self.explorer_filter_controls.get_filters()
         addr = self.main_window.current_address
+        self.export_filters = filters
 
         def worker() -> None:
             try:
@@ -938,9 +961,6 @@ class ExplorerTab(ttk.Frame):
             return
 
 <<<<<<< HEAD
-        # LOCK UI: Prevent changing language/settings during export
-        self.main_window.set_busy_state(True)
-
         addr_short = (
             self.main_window.current_address.split(":")[-1][:8]
             if self.main_window.current_address
@@ -978,8 +998,6 @@ class ExplorerTab(ttk.Frame):
         )
 
         if not file_path:
-            # Unlock UI if cancelled
-            self.main_window.set_busy_state(False)
             return
 
         self.main_window.status.update_status(
@@ -987,8 +1005,6 @@ class ExplorerTab(ttk.Frame):
         )
 <<<<<<< HEAD
 =======
-        self.main_window._set_ui_for_processing(True)
-        self.main_window.is_exporting = True
         address_name: str = (
             self.main_window.address_names_map.get(self.main_window.current_address, "")
             if self.main_window.current_address
@@ -1005,20 +1021,18 @@ class ExplorerTab(ttk.Frame):
             ),
             "currency": self.main_window.currency_var.get(),
             "known_names_map": self.main_window.address_names_map,
+            # CSV, Parquet and Arrow are written from the database, not the view.
+            "tx_db": self.tx_db,
+            "filters": self.export_filters,
         }
 
-        threading.Thread(
+        self.main_window.export_jobs.submit(
+            translate("Transactions"),
+            {export_format: file_path},
+            lambda job: self._export_worker(export_format, export_args, job),
+        )
 <<<<<<< HEAD
-            target=self._export_worker,
-            args=(export_format, export_args),
-            daemon=True,
-            name="ExplorerExportWorker",
-        ).start()
 =======
-            target=self._export_explorer_tab_worker,
-            args=(export_format, export_args),
-            daemon=True,
-        ).start()
 
     @log_performance
     def _export_explorer_tab_worker(
@@ -1032,23 +1046,32 @@ class ExplorerTab(ttk.Frame):
         )
 >>>>>>> dev-latest
 
-    def _export_worker(self, export_format: str, export_args: Dict[str, Any]) -> None:
-        """Background thread to perform the data export."""
+    def _export_worker(
+        self,
+        export_format: str,
+        export_args: Dict[str, Any],
+        job: Optional[ExportJob] = None,
+    ) -> Dict[str, Tuple[bool, str, str]]:
+        """Export job body: writes the file and reports the outcome."""
         try:
 <<<<<<< HEAD
             from src.export import (
-                export_df_to_csv,
-                export_df_to_html,
                 export_df_to_pdf,
+                export_transactions_to_arrow,
+                export_transactions_to_csv,
+                export_transactions_to_html,
+                export_transactions_to_parquet,
             )
 
             export_map = {
 =======
             export_map: Dict[str, Callable[..., Tuple[bool, str, str]]] = {
 >>>>>>> dev-latest
-                "csv": export_df_to_csv,
-                "html": export_df_to_html,
+                "csv": export_transactions_to_csv,
+                "html": export_transactions_to_html,
                 "pdf": export_df_to_pdf,
+                "parquet": export_transactions_to_parquet,
+                "arrow": export_transactions_to_arrow,
             }
 <<<<<<< HEAD
             export_func = export_map.get(export_format)
@@ -1063,7 +1086,7 @@ class ExplorerTab(ttk.Frame):
                     f"No export function found for format: {export_format}"
                 )
 
-            success, msg_key, details = export_func(**export_args)
+            success, msg_key, details = export_func(**export_args, job=job)
 <<<<<<< HEAD
             final_msg = (
 =======
@@ -1073,7 +1096,7 @@ class ExplorerTab(ttk.Frame):
                 f"{translate(msg_key)}: {details}" if details else translate(msg_key)
             )
 
-            if self.winfo_exists():
+            if self.winfo_exists() and not (job and job.cancelled):
                 if success:
 <<<<<<< HEAD
                     logger.info(
@@ -1097,6 +1120,7 @@ class ExplorerTab(ttk.Frame):
 >>>>>>> dev-latest
                         0, lambda: messagebox.showerror(translate("Error"), final_msg)
                     )
+            return {export_format: (success, msg_key, details)}
 
         except Exception as e:
             logger.error(f"Export worker failed: {e}", exc_info=True)
@@ -1114,21 +1138,74 @@ class ExplorerTab(ttk.Frame):
                         duration=3000,
                     ).show_toast(),
                 )
+            return {export_format: (False, "Error", str(e))}
         finally:
-            # UNLOCK UI regardless of success or failure
             if self.winfo_exists():
 <<<<<<< HEAD
-                self.after(0, self.main_window.set_busy_state, False)
                 self.after(0, self.main_window.status.update_status, "Ready")
 =======
                 self.main_window.after(
                     0, self.main_window.status.update_status, "Ready"
                 )
-                self.main_window.after(
-                    0, self.main_window._set_ui_for_processing, False
-                )
 >>>>>>> dev-latest
 
+    def export_multiple_formats(self, formats: List[str]) -> None:
+        """Exports the filtered transactions to several formats in one job."""
+        if not formats or not self.main_window.current_address:
+            return
+
+        addr_short = self.main_window.current_address.split(":")[-1][:8]
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        export_dir = CONFIG.get("paths", {}).get("export", ".")
+        os.makedirs(export_dir, exist_ok=True)
+        base_path = filedialog.asksaveasfilename(
+            initialfile=f"kaspa_txs_{addr_short}_{ts}",
+            title=translate("Export Selected Formats..."),
+            initialdir=export_dir,
+            parent=self,
+        )
+        if not base_path:
+            return
+        base_path = os.path.splitext(base_path)[0]
+        targets = {fmt: f"{base_path}.{fmt}" for fmt in formats}
+
+        kaspa_address = self.main_window.current_address
+        export_kwargs: Dict[str, Any] = {
+            "tx_db": self.tx_db,
+            "targets": targets,
+            "kaspa_address": kaspa_address,
+            "address_name": self.main_window.address_names_map.get(kaspa_address, ""),
+            "currency": self.main_window.currency_var.get(),
+            "known_names_map": self.main_window.address_names_map,
+            "filters": self.export_filters,
+        }
+        self.main_window.export_jobs.submit(
+            translate("Transactions"),
+            targets,
+            lambda job: export_transactions_to_formats(**export_kwargs, job=job),
+            on_finished=self._on_multi_export_finished,
+        )
+
+    def _on_multi_export_finished(self, job: ExportJob) -> None:
+        """Called on the job's worker thread once every format is written."""
+        if not self.winfo_exists() or job.state == JOB_CANCELLED:
+            return
+        if job.state == JOB_DONE:
+            names = ", ".join(details for _, _, details in job.results.values())
+            self.after(
+                100,
+                self.main_window.prompt_to_open_file,
+                os.path.dirname(next(iter(job.targets.values()))),
+                f"{translate('Export Successful')}: {names}",
+            )
+        else:
+            failed = "\n".join(
+                f"{fmt.upper()}: {details}"
+                for fmt, (ok, _, details) in job.results.items()
+                if not ok
+            ) or job.error or translate("Check logs for details.")
+            self.after(0, lambda: messagebox.showerror(translate("Error"), failed))
+
     def _on_font_size_change(self) -> None:
         new_size = self.font_size_var.get()
         self.results_component.update_font_size(new_size)
@@ -1148,6 +1225,7 @@ class ExplorerTab(ttk.Frame):
 >>>>>>> dev-latest
 
     def set_new_transaction_dataset(self, df: pd.DataFrame) -> None:
+        self.export_filters = None
         self.results_component.display_data(df, self.main_window.currency_var.get())
 
     def append_transaction_data(self, df: pd.DataFrame) -> None:
@@ -30,7 +30,6 @@ from typing import (
     Dict,
     List,
     Optional,
-    Set,
     Tuple,
 <<<<<<< HEAD
 =======
@@ -54,6 +53,7 @@ from src.gui.updater import (
     VersionChecker,
 )
 from src.utils.i18n import translate
+from src.utils.process_supervisor import get_process_supervisor
 from src.utils.validation import (
     _sanitize_for_logging,
     sanitize_cli_arg,
@@ -103,6 +103,7 @@ class BridgeInstanceController:
     config_manager: ConfigManager
     instance_id: str
     config_key: str
+    process_key: str
     main_bridge_tab: Optional[KaspaBridgeTab]
     bridge_process: Optional[subprocess.Popen[bytes]]
     version_checker: Optional[VersionChecker]
@@ -185,6 +186,7 @@ class BridgeInstanceController:
         self.config_manager = config_manager
         self.instance_id = instance_id
         self.config_key = f"kaspa_bridge{instance_id}"
+        self.process_key = f"ks_bridge{instance_id}"
         self.main_bridge_tab = main_bridge_tab
 
         self.bridge_process = None
@@ -1106,7 +1108,8 @@ class BridgeInstanceController:
         
 >>>>>>> dev-latest
         self.bridge_process = None
-        
+        get_process_supervisor().unregister(self.process_key)
+
         try:
             if self.view.winfo_exists():
                 self.view.after(0, self.set_controls_state, True)
@@ -1182,36 +1185,21 @@ class BridgeInstanceController:
 <<<<<<< HEAD
 
     def _check_for_external_process(self) -> None:
-        """Scans for external ks_bridge processes, ignoring other managed instances."""
-        self.external_process_pids.clear()
-        my_pid = self.bridge_process.pid if self.bridge_process else None
-
-        managed_pids: Set[Optional[int]] = {my_pid}
-        if self.main_bridge_tab:
-            self._add_managed_pids(managed_pids, self.main_bridge_tab.bridge1_tab_instance)
-            self._add_managed_pids(managed_pids, self.main_bridge_tab.bridge2_tab_instance)
-
-        try:
-            for proc in psutil.process_iter(["pid", "name"]):
-                if (
-                    proc.name().lower() == "ks_bridge.exe"
-                    and proc.pid not in managed_pids
-                ):
-                    self.external_process_pids.append(proc.pid)
+        """
+        Looks up external ks_bridge processes. Every bridge instance started by
+        this app is registered with the shared process supervisor, so managed
+        instances are never reported and the process-table scan is cached.
+        """
+        supervisor = get_process_supervisor()
+        self.external_process_pids = supervisor.find_external("ks_bridge.exe")
 
-            if self.external_process_pids:
-                logger.warning(
-                    f"Found external ks_bridge.exe (PIDs: {self.external_process_pids}). Managed PIDs: {managed_pids}"
-                )
-        except Exception as e:
-            logger.warning(f"Failed to scan for external processes: {e}")
+        if self.external_process_pids:
+            logger.warning(
+                f"Found external ks_bridge.exe (PIDs: {self.external_process_pids}). Managed PIDs: {supervisor.managed_pids()}"
+            )
 
         self._update_external_process_ui()
 
-    def _add_managed_pids(self, pid_set: Set[Optional[int]], tab_instance: Optional[BridgeInstanceTab]) -> None:
-        if tab_instance and tab_instance.controller.bridge_process:
-            pid_set.add(tab_instance.controller.bridge_process.pid)
-
     def _update_external_process_ui(self) -> None:
         """Shows or hides the external process warning frame."""
         try:
@@ -1227,36 +1215,21 @@ class BridgeInstanceController:
 =======
 
     def _check_for_external_process(self) -> None:
-        """Scans for external ks_bridge processes, ignoring other managed instances."""
-        self.external_process_pids.clear()
-        my_pid = self.bridge_process.pid if self.bridge_process else None
-
-        managed_pids: Set[Optional[int]] = {my_pid}
-        if self.main_bridge_tab:
-            self._add_managed_pids(managed_pids, self.main_bridge_tab.bridge1_tab_instance)
-            self._add_managed_pids(managed_pids, self.main_bridge_tab.bridge2_tab_instance)
-
-        try:
-            for proc in psutil.process_iter(["pid", "name"]):
-                if (
-                    proc.name().lower() == "ks_bridge.exe"
-                    and proc.pid not in managed_pids
-                ):
-                    self.external_process_pids.append(proc.pid)
+        """
+        Looks up external ks_bridge processes. Every bridge instance started by
+        this app is registered with the shared process supervisor, so managed
+        instances are never reported and the process-table scan is cached.
+        """
+        supervisor = get_process_supervisor()
+        self.external_process_pids = supervisor.find_external("ks_bridge.exe")
 
-            if self.external_process_pids:
-                logger.warning(
-                    f"Found external ks_bridge.exe (PIDs: {self.external_process_pids}). Managed PIDs: {managed_pids}"
-                )
-        except Exception as e:
-            logger.warning(f"Failed to scan for external processes: {e}")
+        if self.external_process_pids:
+            logger.warning(
+                f"Found external ks_bridge.exe (PIDs: {self.external_process_pids}). Managed PIDs: {supervisor.managed_pids()}"
+            )
 
         self._update_external_process_ui()
 
-    def _add_managed_pids(self, pid_set: Set[Optional[int]], tab_instance: Optional[BridgeInstanceTab]) -> None:
-        if tab_instance and tab_instance.controller.bridge_process:
-            pid_set.add(tab_instance.controller.bridge_process.pid)
-
     def _update_external_process_ui(self) -> None:
         """Shows or hides the external process warning frame."""
         try:
@@ -1318,6 +1291,7 @@ class BridgeInstanceController:
 <<<<<<< HEAD
             )
 
+        get_process_supervisor().invalidate_external_cache()
         self.view.after(500, self._check_for_external_process)
 
     def _delete_bridge_files(self) -> None:
@@ -1335,6 +1309,7 @@ class BridgeInstanceController:
 =======
             )
 
+        get_process_supervisor().invalidate_external_cache()
         self.view.after(500, self._check_for_external_process)
 
     def _delete_bridge_files(self) -> None:
@@ -2031,6 +2006,7 @@ class BridgeInstanceController:
             creationflags=subprocess.CREATE_NO_WINDOW,
             text=False,
         )
+        get_process_supervisor().register(self.process_key, self.bridge_process)
 
     def _assign_job_object(self) -> None:
         """Assigns the process to a Windows Job Object if applicable."""
@@ -42,6 +42,7 @@ from ttkbootstrap.toast import ToastNotification
 from ttkbootstrap.tooltip import ToolTip
 
 from src.gui.components.log_viewer import LogPane
+from src.gui.components.resource_monitor import ResourceMonitorPane
 from src.gui.tabs.kaspa_bridge_controller import BridgeInstanceController
 from src.utils.i18n import translate
 
@@ -68,6 +69,8 @@ class BridgeInstanceTab(ttk.Frame):
     settings_pane: ttk.Frame
     log_pane: ttk.Labelframe
     log_pane_component: LogPane
+    resources_tab_frame: ttk.Frame
+    resource_monitor: ResourceMonitorPane
     preview_lf: ttk.Labelframe
     command_preview_text: ScrolledText
     copy_command_button: ttk.Button
@@ -150,8 +153,13 @@ class BridgeInstanceTab(ttk.Frame):
         self.log_tab_frame.grid_rowconfigure(0, weight=1)
         self.log_tab_frame.grid_columnconfigure(0, weight=1)
 
+        self.resources_tab_frame = ttk.Frame(self.notebook, padding=10)
+
         self.notebook.add(self.settings_tab_frame, text=f" {translate('Settings')} ")
         self.notebook.add(self.log_tab_frame, text=f" {translate('Log')} ")
+        self.notebook.add(
+            self.resources_tab_frame, text=f" {translate('Resources')} "
+        )
 
         settings_container_frame = ttk.Frame(self.settings_tab_frame)
         settings_container_frame.grid(row=0, column=0, sticky=NSEW)
@@ -163,6 +171,14 @@ class BridgeInstanceTab(ttk.Frame):
         self.log_pane = self.create_log_pane(self.log_tab_frame)
         self.log_pane.pack(fill=BOTH, expand=True, padx=10, pady=(0, 10))
 
+        self.resource_monitor = ResourceMonitorPane(
+            self.resources_tab_frame,
+            self.main_window,
+            self.controller.process_key,
+            f"ks_bridge ({instance_id})",
+        )
+        self.resource_monitor.pack(fill=BOTH, expand=True)
+
         self.controller._add_tracers()
         self.controller.update_command_preview()
 
@@ -873,9 +889,12 @@ class BridgeInstanceTab(ttk.Frame):
         """Update all translatable strings in the UI."""
         self.notebook.tab(0, text=f" {translate('Settings')} ")
         self.notebook.tab(1, text=f" {translate('Log')} ")
+        self.notebook.tab(2, text=f" {translate('Resources')} ")
 
         if hasattr(self, "log_pane_component"):
             self.log_pane_component.re_translate()
+        if hasattr(self, "resource_monitor"):
+            self.resource_monitor.re_translate()
 
         self.controls_frame.config(text=f" {translate('Controls')} ")
 
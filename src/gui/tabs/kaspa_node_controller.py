@@ -48,7 +48,9 @@ from ttkbootstrap.toast import ToastNotification
 
 from src.config.config import CONFIG
 from src.gui.updater import DownloadProgressWindow, GitHubUpdater, VersionChecker
+from src.utils.dir_size import DirectorySizeTracker, format_growth_rate
 from src.utils.i18n import translate
+from src.utils.process_supervisor import get_process_supervisor
 from src.utils.validation import (
     _sanitize_for_logging,
     sanitize_cli_arg,
@@ -101,6 +103,7 @@ class KaspaNodeController:
     first_activation_done: bool
     running_command_str: str
     external_process_pid: Optional[int]
+    dir_size_tracker: DirectorySizeTracker
     bin_dir: str
     node_exe_path: str
     _stop_requested: bool
@@ -182,6 +185,7 @@ class KaspaNodeController:
         self.bin_dir = os.path.join(base_path, "KaspaGateway", "bin")
         os.makedirs(self.bin_dir, exist_ok=True)
         self.node_exe_path = os.path.join(self.bin_dir, "kaspad.exe")
+        self.dir_size_tracker = DirectorySizeTracker()
 
     def _get_default_options(self) -> Dict[str, Dict[str, Any]]:
         return {
@@ -1673,6 +1677,7 @@ class KaspaNodeController:
                 text=False,
             )
             self.running_command_str = command_str
+            get_process_supervisor().register("kaspad", self.node_process)
 
 <<<<<<< HEAD
             if sys.platform == "win32" and CONFIG.get("job_object_handle") and ctypes and self.node_process:
@@ -1790,6 +1795,7 @@ class KaspaNodeController:
             pass
 
         self.node_process = None
+        get_process_supervisor().unregister("kaspad")
 
         try:
             if self.view.winfo_exists():
@@ -1907,18 +1913,12 @@ class KaspaNodeController:
 =======
 
     def _check_for_external_process(self) -> None:
-        """Scans for external kaspad processes."""
-        self.external_process_pid = None
-        my_pid = self.node_process.pid if self.node_process else None
-
-        try:
-            for proc in psutil.process_iter(["pid", "name"]):
-                if proc.name().lower() == "kaspad.exe" and proc.pid != my_pid:
-                    self.external_process_pid = proc.pid
-                    break
-        except Exception as e:
-            logger.warning(f"Failed to scan for external processes: {e}")
-
+        """
+        Looks up external kaspad processes. The shared process supervisor
+        caches the scan and never reports our own managed node.
+        """
+        external_pids = get_process_supervisor().find_external("kaspad.exe")
+        self.external_process_pid = external_pids[0] if external_pids else None
         self._update_external_process_ui()
 
     def _update_external_process_ui(self) -> None:
@@ -1971,6 +1971,7 @@ class KaspaNodeController:
             self.log_message(f"Failed to stop external process: {e}", "ERROR")
             messagebox.showerror(translate("Error"), str(e))
 
+        get_process_supervisor().invalidate_external_cache()
         self.view.after(500, self._check_for_external_process)
 
     def _delete_node_files(self) -> None:
@@ -2199,11 +2200,19 @@ class KaspaNodeController:
         return os.path.join(os.environ.get("HOME", ""), ".kaspad")
 
     def _get_folder_size(self, folder_path: str) -> int:
-        total = 0
-        try:
-            for dp, _, fn in os.walk(folder_path):
-                for f in fn:
-                    fp = os.path.join(dp, f)
+        return self.dir_size_tracker.get_size(folder_path)
+
+    def _format_db_size(self, size_bytes: int, folder_path: str) -> str:
+        if size_bytes < 1024 * 1024:
+            size_str = f"{size_bytes / 1024:.2f} KB"
+        elif size_bytes < 1024 * 1024 * 1024:
+            size_str = f"{size_bytes / (1024 * 1024):.2f} MB"
+        else:
+            size_str = f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+        growth = self.dir_size_tracker.get_growth_rate(folder_path)
+        if growth is not None:
+            size_str += f" ({format_growth_rate(growth)})"
+        return size_str
 =======
         """Gets the default kaspad application directory based on OS."""
         system = platform.system()
@@ -2220,18 +2229,25 @@ class KaspaNodeController:
             return os.path.join(os.environ.get("HOME", ""), ".kaspad")
 
     def _get_folder_size(self, folder_path: str) -> int:
-        """Calculates the total size of a folder, returns -1 on error."""
-        total_size = 0
-        try:
-            for dirpath, _, filenames in os.walk(folder_path):
-                for f in filenames:
-                    fp = os.path.join(dirpath, f)
+        """
+        Calculates the total size of a folder, returns -1 on error.
+        Only directories changed since the last call are rescanned.
+        """
+        return self.dir_size_tracker.get_size(folder_path)
+
+    def _format_db_size(self, size_bytes: int, folder_path: str) -> str:
+        """Formats a DB size, appending the growth rate once it is known."""
+        if size_bytes < 1024**2:
+            size_str = f"{size_bytes / 1024:.2f} KB"
+        elif size_bytes < 1024**3:
+            size_str = f"{size_bytes / 1024**2:.2f} MB"
+        else:
+            size_str = f"{size_bytes / 1024**3:.2f} GB"
+        growth = self.dir_size_tracker.get_growth_rate(folder_path)
+        if growth is not None:
+            size_str += f" ({format_growth_rate(growth)})"
+        return size_str
 >>>>>>> dev-latest
-                    if not os.path.islink(fp):
-                        total += os.path.getsize(fp)
-        except Exception:
-            return -1
-        return total
 
     def update_db_size(self) -> None:
 <<<<<<< HEAD
@@ -2296,12 +2312,7 @@ class KaspaNodeController:
             if os.path.exists(target_path):
                  size_bytes = self._get_folder_size(target_path)
                  if size_bytes >= 0:
-                     if size_bytes < 1024 * 1024:
-                         size_str = f"{size_bytes / 1024:.2f} KB"
-                     elif size_bytes < 1024 * 1024 * 1024:
-                         size_str = f"{size_bytes / (1024 * 1024):.2f} MB"
-                     else:
-                         size_str = f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+                     size_str = self._format_db_size(size_bytes, target_path)
                  else:
                      size_str = "Error"
             else:
@@ -2330,15 +2341,8 @@ class KaspaNodeController:
         self._save_settings()
     
     def _check_for_external_process(self) -> None:
-        self.external_process_pid = None
-        my_pid = self.node_process.pid if self.node_process else None
-        try:
-            for proc in psutil.process_iter(["pid", "name"]):
-                if proc.name().lower() == "kaspad.exe" and proc.pid != my_pid:
-                    self.external_process_pid = proc.pid
-                    break
-        except Exception:
-            pass
+        external_pids = get_process_supervisor().find_external("kaspad.exe")
+        self.external_process_pid = external_pids[0] if external_pids else None
         self._update_external_process_ui()
 
     def _update_external_process_ui(self) -> None:
@@ -2359,6 +2363,7 @@ class KaspaNodeController:
                 self.log_message(f"Terminated external process {self.external_process_pid}.", "INFO")
             except Exception:
                 pass
+            get_process_supervisor().invalidate_external_cache()
             self.view.after(500, self._check_for_external_process)
 
     def _delete_node_files(self) -> None:
@@ -2461,12 +2466,8 @@ class KaspaNodeController:
                 size_bytes = self._get_folder_size(db_path)
                 if size_bytes < 0:
                     size_str = translate("Error")
-                elif size_bytes < 1024**2:
-                    size_str = f"{size_bytes / 1024:.2f} KB"
-                elif size_bytes < 1024**3:
-                    size_str = f"{size_bytes / 1024**2:.2f} MB"
                 else:
-                    size_str = f"{size_bytes / 1024**3:.2f} GB"
+                    size_str = self._format_db_size(size_bytes, db_path)
 
         except Exception as e:
             logger.error(f"Error getting DB size: {_sanitize_for_logging(e)}")
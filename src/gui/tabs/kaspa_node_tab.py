@@ -53,6 +53,7 @@ from ttkbootstrap.scrolled import ScrolledText
 from ttkbootstrap.tooltip import ToolTip
 
 from src.gui.components.log_viewer import LogPane
+from src.gui.components.resource_monitor import ResourceMonitorPane
 from src.utils.i18n import translate
 <<<<<<< HEAD
 from src.utils.validation import sanitize_cli_arg
@@ -82,6 +83,8 @@ class KaspaNodeTab(ttk.Frame):
     settings_pane: ttk.Frame
     log_pane: ttk.Labelframe
     log_pane_component: LogPane
+    resources_tab_frame: ttk.Frame
+    resource_monitor: ResourceMonitorPane
     preview_lf: ttk.Labelframe
     command_preview_text: ScrolledText
     copy_command_button: ttk.Button
@@ -172,9 +175,13 @@ class KaspaNodeTab(ttk.Frame):
         self.log_tab_frame = ttk.Frame(self.notebook, padding=0)
         self.log_tab_frame.grid_rowconfigure(0, weight=1)
         self.log_tab_frame.grid_columnconfigure(0, weight=1)
+        self.resources_tab_frame = ttk.Frame(self.notebook, padding=10)
 
         self.notebook.add(self.settings_tab_frame, text=f" {translate('Settings')} ")
         self.notebook.add(self.log_tab_frame, text=f" {translate('Log')} ")
+        self.notebook.add(
+            self.resources_tab_frame, text=f" {translate('Resources')} "
+        )
 
         self.settings_pane = self.create_settings_pane(self.settings_tab_frame)
         self.settings_pane.pack(fill=BOTH, expand=True)
@@ -182,6 +189,11 @@ class KaspaNodeTab(ttk.Frame):
         self.log_pane = self.create_log_pane(self.log_tab_frame)
         self.log_pane.grid(row=0, column=0, sticky="nsew", padx=10, pady=(0, 10))
 
+        self.resource_monitor = ResourceMonitorPane(
+            self.resources_tab_frame, self.controller.main_window, "kaspad", "kaspad"
+        )
+        self.resource_monitor.pack(fill=BOTH, expand=True)
+
     def _initialize_controller_hooks(self) -> None:
         """Sets up tracers and initial updates after UI build."""
         self.controller._add_tracers()
@@ -957,9 +969,12 @@ class KaspaNodeTab(ttk.Frame):
         """Update all translatable strings in the UI."""
         self.notebook.tab(0, text=translate("Settings"))
         self.notebook.tab(1, text=translate("Log"))
+        self.notebook.tab(2, text=translate("Resources"))
 
         if hasattr(self, "log_pane_component"):
             self.log_pane_component.re_translate()
+        if hasattr(self, "resource_monitor"):
+            self.resource_monitor.re_translate()
 
         self.controls_frame.config(text=f" {translate('Controls')} ")
         self.start_button.config(text=translate("Start Kaspa Node"))
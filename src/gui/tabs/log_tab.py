@@ -18,7 +18,7 @@ from typing import IO, TYPE_CHECKING, Any, List, Optional
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 
-from src.gui.components.log_viewer import LogPane
+from src.gui.components.log_viewer import LogPane, detect_log_level
 from src.utils.i18n import translate
 
 if TYPE_CHECKING:
@@ -78,20 +78,8 @@ class TextFile(threading.Thread):
                     if not self.log_pane.winfo_exists():
                         break
 
-                    log_level = "INFO"
-                    if " - TRACE " in line:
-                        log_level = "TRACE"
-                    elif " - DEBUG " in line:
-                        log_level = "DEBUG"
-                    elif " - WARNING " in line:
-                        log_level = "WARN"
-                    elif " - ERROR " in line:
-                        log_level = "ERROR"
-                    elif " - CRITICAL " in line:
-                        log_level = "FATAL"
-
                     self.log_pane.main_window.after(
-                        0, self.update_text, line, log_level
+                        0, self.update_text, line, detect_log_level(line)
                     )
                 except (tk.TclError, RuntimeError):
                     break
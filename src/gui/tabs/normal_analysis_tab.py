@@ -17,7 +17,6 @@ import time
 >>>>>>> dev-latest
 import tkinter as tk
 import webbrowser
-from collections import defaultdict
 from datetime import date, datetime, timedelta
 from tkinter import filedialog, messagebox
 from typing import (
@@ -56,10 +55,13 @@ from ttkbootstrap.toast import ToastNotification
 
 from src.config.config import get_active_api_config
 from src.export import (
+    export_analysis_to_arrow,
     export_analysis_to_csv,
     export_analysis_to_html,
+    export_analysis_to_parquet,
     export_analysis_to_pdf,
 )
+from src.export.jobs import ExportJob
 from src.gui.components.export import ExportComponent
 <<<<<<< HEAD
 from src.utils.i18n import translate
@@ -76,6 +78,58 @@ logger = logging.getLogger(__name__)
 KASPA_MINDATE = date(2021, 11, 7)
 TODAY = date.today()
 
+ANALYSIS_SUMMARY_QUERY = """
+SELECT
+    COUNT(*) AS total_transactions,
+    SUM(CASE WHEN direction = 'incoming' THEN amount ELSE 0 END) AS total_inflow,
+    SUM(CASE WHEN direction = 'outgoing' THEN amount ELSE 0 END) AS total_outflow,
+    MAX(CASE WHEN direction = 'incoming' THEN amount ELSE 0 END) AS max_inflow,
+    MAX(CASE WHEN direction = 'outgoing' THEN amount ELSE 0 END) AS max_outflow,
+    AVG(CASE WHEN direction = 'incoming' THEN amount ELSE NULL END) AS avg_inflow,
+    AVG(CASE WHEN direction = 'outgoing' THEN amount ELSE NULL END) AS avg_outflow,
+    MIN(datetime) AS first_tx_date,
+    MAX(datetime) AS last_tx_date
+FROM filtered_df
+"""
+
+
+def summarize_flows(df: pd.DataFrame) -> pd.Series:
+    """Totals, extremes and date range of an analysis DataFrame."""
+    con = duckdb.connect()
+    try:
+        con.register("filtered_df", df)
+        return con.execute(ANALYSIS_SUMMARY_QUERY).fetchdf().iloc[0]
+    finally:
+        con.close()
+
+
+def group_by_counterparty(
+    df: pd.DataFrame, main_address: Optional[str]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Maps each counterparty address to the transactions it took part in.
+    The address lists are split and exploded column-wise instead of
+    walking the rows in Python.
+    """
+    peers = df["from_address"].where(df["direction"] == "incoming", df["to_address"])
+    exploded = peers.fillna("").astype(str).str.split(", ").explode()
+    is_coinbase = df["type"] == "coinbase"
+    exploded = exploded[~is_coinbase.reindex(exploded.index)]
+    exploded = exploded[
+        (exploded != "")
+        & (exploded != main_address)
+        & (exploded != "N/A (Coinbase)")
+    ]
+    coinbase = pd.Series("Coinbase / Mining", index=df.index[is_coinbase])
+    keys = pd.concat([coinbase, exploded]).sort_index(kind="stable")
+
+    records = df.to_dict("records")
+    row_positions = df.index.get_indexer(keys.index)
+    return {
+        address: [records[i] for i in row_positions[positions]]
+        for address, positions in keys.groupby(keys, sort=False).indices.items()
+    }
+
 
 class ManualCalendarPopup(ttk.Toplevel):
     """
@@ -1048,11 +1102,8 @@ class NormalAnalysisTab(ttk.Frame):
 
             df["datetime"] = pd.to_datetime(df["timestamp"], unit="s")
             df = df.sort_values("datetime", ascending=True).reset_index(drop=True)
-            df["flow"] = df.apply(
-                lambda row: (
-                    row["amount"] if row["direction"] == "incoming" else -row["amount"]
-                ),
-                axis=1,
+            df["flow"] = df["amount"].where(
+                df["direction"] == "incoming", -df["amount"]
             )
             df["balance"] = df["flow"].cumsum()
             df_for_sql = df.set_index("datetime")
@@ -1060,52 +1111,12 @@ class NormalAnalysisTab(ttk.Frame):
             if self.normal_cancel_event.is_set():
                 raise InterruptedError("Analysis cancelled.")
 
-            con = duckdb.connect()
-            con.register("filtered_df", df)
-            summary_query = """
-            SELECT
-                COUNT(*) AS total_transactions,
-                SUM(CASE WHEN direction = 'incoming' THEN amount ELSE 0 END) AS total_inflow,
-                SUM(CASE WHEN direction = 'outgoing' THEN amount ELSE 0 END) AS total_outflow,
-                MAX(CASE WHEN direction = 'incoming' THEN amount ELSE 0 END) AS max_inflow,
-                MAX(CASE WHEN direction = 'outgoing' THEN amount ELSE 0 END) AS max_outflow,
-                AVG(CASE WHEN direction = 'incoming' THEN amount ELSE NULL END) AS avg_inflow,
-                AVG(CASE WHEN direction = 'outgoing' THEN amount ELSE NULL END) AS avg_outflow,
-                MIN(datetime) AS first_tx_date,
-                MAX(datetime) AS last_tx_date
-            FROM filtered_df
-            """
-            summary_df = con.execute(summary_query).fetchdf()
-            summary = summary_df.iloc[0]
+            summary = summarize_flows(df)
 
             if self.normal_cancel_event.is_set():
                 raise InterruptedError("Analysis cancelled.")
 
-            counterparties: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-            for row_dict in df.to_dict("records"):
-                if row_dict.get("type") == "coinbase":
-                    counterparties["Coinbase / Mining"].append(row_dict)
-                else:
-<<<<<<< HEAD
-                    is_incoming = row_dict["direction"] == "incoming"
-                    addr_str = row_dict.get(
-                        "from_address" if is_incoming else "to_address", ""
-                    )
-                    addresses = str(addr_str).split(", ")
-=======
-                    is_incoming: bool = row_dict["direction"] == "incoming"
-                    addr_str: str = row_dict.get(
-                        "from_address" if is_incoming else "to_address", ""
-                    )
-                    addresses: List[str] = str(addr_str).split(", ")
->>>>>>> dev-latest
-                    for addr in addresses:
-                        if (
-                            addr
-                            and addr != self.main_address
-                            and addr != "N/A (Coinbase)"
-                        ):
-                            counterparties[addr].append(row_dict)
+            counterparties = group_by_counterparty(df, self.main_address)
 
             if self.normal_cancel_event.is_set():
                 raise InterruptedError("Analysis cancelled.")
@@ -1637,9 +1648,6 @@ class NormalAnalysisTab(ttk.Frame):
             return
 
 <<<<<<< HEAD
-        # Lock UI controls during export
-        self.main_window.set_busy_state(True)
-
         addr_short = (
             self.main_address.split(":")[-1][:8] if self.main_address else "analysis"
         )
@@ -1673,8 +1681,6 @@ class NormalAnalysisTab(ttk.Frame):
         )
 
         if not file_path:
-            # Release lock if cancelled
-            self.main_window.set_busy_state(False)
             return
 
         self.main_window.status.update_status(
@@ -1695,27 +1701,32 @@ class NormalAnalysisTab(ttk.Frame):
             "counterparties": self.analysis_results.get("counterparties", {}),
             "known_names_map": self.main_window.address_names_map,
             "analysis_data": {"summary": self.analysis_results.get("summary")},
+            "tx_db": self.main_window.tx_db,
         }
 
-        threading.Thread(
-            target=self._export_normal_worker,
-            args=(export_format, export_args),
-            daemon=True,
-            name="NormalExportWorker",
-        ).start()
+        self.main_window.export_jobs.submit(
+            translate("Analysis"),
+            {export_format: file_path},
+            lambda job: self._export_normal_worker(export_format, export_args, job),
+        )
 
     @log_performance
     def _export_normal_worker(
-        self, export_format: str, export_args: Dict[str, Any]
-    ) -> None:
+        self,
+        export_format: str,
+        export_args: Dict[str, Any],
+        job: Optional[ExportJob] = None,
+    ) -> Dict[str, Tuple[bool, str, str]]:
         """
-        Background thread to perform the data export.
+        Export job body: writes the file and reports the outcome.
         """
         try:
             export_func_map: Dict[str, Callable[..., Tuple[bool, str, str]]] = {
                 "csv": export_analysis_to_csv,
                 "html": export_analysis_to_html,
                 "pdf": export_analysis_to_pdf,
+                "parquet": export_analysis_to_parquet,
+                "arrow": export_analysis_to_arrow,
             }
             export_func = export_func_map.get(export_format)
 
@@ -1725,7 +1736,7 @@ class NormalAnalysisTab(ttk.Frame):
             if export_format == "csv":
                 export_args.pop("analysis_data", None)
 
-            success, msg_key, details = export_func(**export_args)
+            success, msg_key, details = export_func(**export_args, job=job)
 <<<<<<< HEAD
             final_msg = (
 =======
@@ -1733,7 +1744,7 @@ class NormalAnalysisTab(ttk.Frame):
 >>>>>>> dev-latest
                 f"{translate(msg_key)}: {details}" if details else translate(msg_key)
             )
-            if self.winfo_exists():
+            if self.winfo_exists() and not (job and job.cancelled):
                 if success:
                     self.after(
                         100,
@@ -1745,6 +1756,7 @@ class NormalAnalysisTab(ttk.Frame):
                     self.after(
                         0, lambda: messagebox.showerror(translate("Error"), final_msg)
                     )
+            return {export_format: (success, msg_key, details)}
         except Exception as e:
             logger.error(f"Analysis export to {export_format} failed", exc_info=True)
             if self.winfo_exists():
@@ -1757,7 +1769,7 @@ class NormalAnalysisTab(ttk.Frame):
                         duration=3000,
                     ).show_toast(),
                 )
+            return {export_format: (False, "Error", str(e))}
         finally:
             if self.winfo_exists():
-                self.after(0, self.main_window.set_busy_state, False)
                 self.after(0, self.main_window.status.update_status, "Ready")
\ No newline at end of file
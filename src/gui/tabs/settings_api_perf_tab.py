@@ -38,6 +38,12 @@ from ttkbootstrap.constants import *
 from ttkbootstrap.toast import ToastNotification
 from ttkbootstrap.tooltip import ToolTip
 
+from src.api.rate_limit import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    host_guard_stats,
+)
 from src.config.config import (
     CONFIG,
     CURRENCY_TRANSLATION_KEYS,
@@ -47,6 +53,8 @@ from src.config.config import (
 )
 from src.utils.i18n import get_available_languages, translate
 from src.utils.logging_config import setup_logging, shutdown_file_handler
+from src.utils.metrics import get_metrics_registry
+from src.utils.sampling_profiler import get_sampling_profiler
 from src.utils.validation import sanitize_cli_arg
 
 if TYPE_CHECKING:
@@ -56,6 +64,33 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+API_HEALTH_REFRESH_MS: int = 2000
+# (stats key, heading translation key, width) of the API health table.
+API_HEALTH_COLUMNS: Tuple[Tuple[str, str, int], ...] = (
+    ("profile", "Profile", 100),
+    ("host", "Host", 180),
+    ("state", "Circuit", 80),
+    ("rate", "Rate (req/s)", 90),
+    ("requests", "Requests", 80),
+    ("throttled", "Throttled (429)", 100),
+    ("failures", "Failures", 70),
+    ("rejected", "Rejected", 70),
+)
+# (snapshot key, heading translation key, width) of the metrics table.
+METRICS_COLUMNS: Tuple[Tuple[str, str, int], ...] = (
+    ("name", "Metric", 240),
+    ("count", "Calls", 70),
+    ("p50", "p50 (ms)", 80),
+    ("p95", "p95 (ms)", 80),
+    ("p99", "p99 (ms)", 80),
+    ("max", "Max (ms)", 80),
+)
+CIRCUIT_STATE_KEYS: Dict[str, str] = {
+    CIRCUIT_CLOSED: "Closed",
+    CIRCUIT_OPEN: "Open",
+    CIRCUIT_HALF_OPEN: "Half-open",
+}
+
 
 def _get_nested_value(
     d: Dict[str, Any], keys: Tuple[str, ...], default: Any = None
@@ -210,6 +245,9 @@ class SettingsApiPerfTab(ttk.Frame):
         self._build_general_settings(self.general_tab)
         self._build_api_management_tab(self.api_tab_frame)
         self._build_performance_settings(self.perf_tab)
+        self._build_api_health_panel(self.perf_tab)
+        self._build_metrics_panel(self.perf_tab)
+        self._build_profiler_panel(self.perf_tab)
 
     def _build_general_settings(self, parent: ttk.Frame) -> None:
         """Builds the 'General' sub-tab UI."""
@@ -461,6 +499,15 @@ class SettingsApiPerfTab(ttk.Frame):
             entry_width=8,
         )
 >>>>>>> dev-latest
+        self._create_setting_row(
+            trans_lf,
+            1,
+            0,
+            "Concurrent Exports",
+            ("performance", "max_concurrent_exports"),
+            "Tooltip_max_concurrent_exports",
+            entry_width=8,
+        )
         self.labelframes["Transaction Fetching"] = trans_lf
 
         cache_lf = ttk.Labelframe(parent, text=translate("Caching"), padding=10)
@@ -484,12 +531,46 @@ class SettingsApiPerfTab(ttk.Frame):
             "Tooltip_network_cache_hours",
             entry_width=8,
         )
+        self._create_setting_row(
+            cache_lf,
+            1,
+            0,
+            "Rich List Cache (minutes)",
+            ("performance", "rich_list_cache_minutes"),
+            "Tooltip_rich_list_cache_minutes",
+            entry_width=8,
+        )
         self.labelframes["Caching"] = cache_lf
 
+        monitor_lf = ttk.Labelframe(
+            parent, text=translate("Process Monitoring"), padding=10
+        )
+        monitor_lf.grid(row=3, column=0, sticky="nsew", padx=10, pady=5)
+        monitor_lf.grid_columnconfigure(4, weight=1)
+        self._create_setting_row(
+            monitor_lf,
+            0,
+            0,
+            "Sample Interval (sec)",
+            ("performance", "process_sample_interval_seconds"),
+            "Tooltip_process_sample_interval",
+            entry_width=8,
+        )
+        self._create_setting_row(
+            monitor_lf,
+            0,
+            2,
+            "History Samples",
+            ("performance", "process_history_size"),
+            "Tooltip_process_history_size",
+            entry_width=8,
+        )
+        self.labelframes["Process Monitoring"] = monitor_lf
+
         auto_lf = ttk.Labelframe(
             parent, text=translate("Automatic Refresh"), padding=10
         )
-        auto_lf.grid(row=3, column=0, sticky="nsew", padx=10, pady=10)
+        auto_lf.grid(row=4, column=0, sticky="nsew", padx=10, pady=10)
         auto_lf.grid_columnconfigure(3, weight=1)
         self.labelframes["Automatic Refresh"] = auto_lf
 
@@ -521,6 +602,220 @@ class SettingsApiPerfTab(ttk.Frame):
         )
 >>>>>>> dev-latest
 
+    def _build_api_health_panel(self, parent: ttk.Frame) -> None:
+        """Live rate limiter and circuit breaker state of each API host."""
+        health_lf = ttk.Labelframe(parent, text=translate("API Health"), padding=10)
+        health_lf.grid(row=5, column=0, sticky="nsew", padx=10, pady=(0, 10))
+        health_lf.grid_columnconfigure(0, weight=1)
+        self.labelframes["API Health"] = health_lf
+
+        self.api_health_tree = ttk.Treeview(
+            health_lf,
+            columns=[key for key, _, _ in API_HEALTH_COLUMNS],
+            show="headings",
+            height=4,
+            selectmode="none",
+        )
+        for key, _, width in API_HEALTH_COLUMNS:
+            anchor = "w" if key in ("profile", "host", "state") else "e"
+            self.api_health_tree.column(key, width=width, anchor=anchor, stretch=key == "host")
+        self._translate_api_health_headings()
+        self.api_health_tree.grid(row=0, column=0, sticky="nsew")
+        self.after(API_HEALTH_REFRESH_MS, self._refresh_api_health)
+
+    def _translate_api_health_headings(self) -> None:
+        for key, heading_key, _ in API_HEALTH_COLUMNS:
+            self.api_health_tree.heading(key, text=translate(heading_key))
+
+    def _refresh_api_health(self) -> None:
+        if not self.winfo_exists():
+            return
+        if self.api_health_tree.winfo_ismapped():
+            self.api_health_tree.delete(*self.api_health_tree.get_children())
+            for stats in host_guard_stats():
+                state = translate(CIRCUIT_STATE_KEYS.get(stats["state"], stats["state"]))
+                if stats["paused_for"] > 0:
+                    state = f"{state} ({translate('Paused')} {stats['paused_for']:.0f}s)"
+                self.api_health_tree.insert(
+                    "",
+                    "end",
+                    values=(
+                        stats["profile"] or "-",
+                        stats["host"],
+                        state,
+                        f"{stats['rate']:.2f} / {stats['max_rate']:.2f}",
+                        int(stats["requests"]),
+                        int(stats["throttled"]),
+                        int(stats["failures"]),
+                        int(stats["rejected"]),
+                    ),
+                )
+        self.after(API_HEALTH_REFRESH_MS, self._refresh_api_health)
+
+    def _build_metrics_panel(self, parent: ttk.Frame) -> None:
+        """Latency percentiles of the functions and stages in the metrics registry."""
+        metrics_lf = ttk.Labelframe(parent, text=translate("Performance Metrics"), padding=10)
+        metrics_lf.grid(row=6, column=0, sticky="nsew", padx=10, pady=(0, 10))
+        metrics_lf.grid_columnconfigure(0, weight=1)
+        self.labelframes["Performance Metrics"] = metrics_lf
+
+        options = ttk.Frame(metrics_lf)
+        options.grid(row=0, column=0, sticky="ew", pady=(0, 5))
+        options.grid_columnconfigure(2, weight=1)
+        self.metrics_enabled_var = ttk.BooleanVar(value=True)
+        self.metrics_enabled_cb = ttk.Checkbutton(
+            options,
+            text=translate("Collect Metrics"),
+            variable=self.metrics_enabled_var,
+        )
+        self.metrics_enabled_cb.grid(row=0, column=0, sticky="w", pady=5, padx=(5, 20))
+        self.entries[("performance", "metrics_enabled")] = self.metrics_enabled_var
+        self._create_setting_row(
+            options,
+            0,
+            1,
+            "Resource Sample Every (calls)",
+            ("performance", "metrics_resource_sample_every"),
+            "Tooltip_metrics_resource_sample_every",
+            entry_width=8,
+        )
+        self.metrics_reset_btn = ttk.Button(
+            options,
+            text=translate("Reset"),
+            command=self._reset_metrics,
+            bootstyle="secondary-outline",
+        )
+        self.metrics_reset_btn.grid(row=0, column=3, sticky="e", padx=5)
+        self.metrics_export_btn = ttk.Button(
+            options,
+            text=translate("Export JSON"),
+            command=self._export_metrics,
+            bootstyle="secondary-outline",
+        )
+        self.metrics_export_btn.grid(row=0, column=4, sticky="e", padx=5)
+        self.stall_detector_var = ttk.BooleanVar(value=True)
+        self.stall_detector_cb = ttk.Checkbutton(
+            options,
+            text=translate("Detect UI Stalls"),
+            variable=self.stall_detector_var,
+        )
+        self.stall_detector_cb.grid(row=1, column=0, sticky="w", pady=5, padx=(5, 20))
+        self.entries[("performance", "stall_detector_enabled")] = self.stall_detector_var
+        self._create_setting_row(
+            options,
+            1,
+            1,
+            "Stall Threshold (ms)",
+            ("performance", "stall_threshold_ms"),
+            "Tooltip_stall_threshold_ms",
+            entry_width=8,
+        )
+
+        self.metrics_tree = ttk.Treeview(
+            metrics_lf,
+            columns=[key for key, _, _ in METRICS_COLUMNS],
+            show="headings",
+            height=8,
+            selectmode="none",
+        )
+        for key, _, width in METRICS_COLUMNS:
+            self.metrics_tree.column(
+                key, width=width, anchor="w" if key == "name" else "e", stretch=key == "name"
+            )
+        self._translate_metrics_headings()
+        self.metrics_tree.grid(row=1, column=0, sticky="nsew")
+        self.after(API_HEALTH_REFRESH_MS, self._refresh_metrics)
+
+    def _translate_metrics_headings(self) -> None:
+        for key, heading_key, _ in METRICS_COLUMNS:
+            self.metrics_tree.heading(key, text=translate(heading_key))
+
+    def _refresh_metrics(self) -> None:
+        if not self.winfo_exists():
+            return
+        if self.metrics_tree.winfo_ismapped():
+            histograms = get_metrics_registry().snapshot()["histograms"]
+            self.metrics_tree.delete(*self.metrics_tree.get_children())
+            # Slowest (by total time spent) first.
+            for name, stats in sorted(histograms.items(), key=lambda item: -item[1]["sum"]):
+                self.metrics_tree.insert(
+                    "",
+                    "end",
+                    values=(
+                        name,
+                        stats["count"],
+                        *(f"{stats[key] * 1000:.2f}" for key in ("p50", "p95", "p99", "max")),
+                    ),
+                )
+        self.after(API_HEALTH_REFRESH_MS, self._refresh_metrics)
+
+    def _reset_metrics(self) -> None:
+        get_metrics_registry().reset()
+        self.metrics_tree.delete(*self.metrics_tree.get_children())
+
+    def _export_metrics(self) -> None:
+        export_dir: str = CONFIG.get("paths", {}).get("export", ".")
+        os.makedirs(export_dir, exist_ok=True)
+        file_path = filedialog.asksaveasfilename(
+            initialfile="kaspa_metrics.json",
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json")],
+            title=translate("Export JSON"),
+            initialdir=export_dir,
+            parent=self,
+        )
+        if not file_path:
+            return
+        try:
+            get_metrics_registry().dump_json(file_path)
+        except OSError as e:
+            logger.error(f"Failed to export metrics: {e}")
+            messagebox.showerror(translate("Error"), str(e), parent=self)
+
+    def _build_profiler_panel(self, parent: ttk.Frame) -> None:
+        """Toggle and live status of the background stack sampler."""
+        profiler_lf = ttk.Labelframe(parent, text=translate("Sampling Profiler"), padding=10)
+        profiler_lf.grid(row=7, column=0, sticky="nsew", padx=10, pady=(0, 10))
+        profiler_lf.grid_columnconfigure(2, weight=1)
+        self.labelframes["Sampling Profiler"] = profiler_lf
+
+        self.profiler_enabled_var = ttk.BooleanVar(value=False)
+        self.profiler_enabled_cb = ttk.Checkbutton(
+            profiler_lf,
+            text=translate("Enable Profiler"),
+            variable=self.profiler_enabled_var,
+        )
+        self.profiler_enabled_cb.grid(row=0, column=0, sticky="w", pady=5, padx=(5, 20))
+        self.entries[("performance", "profiler_enabled")] = self.profiler_enabled_var
+        self._create_setting_row(
+            profiler_lf,
+            0,
+            1,
+            "Sample Interval (ms)",
+            ("performance", "profiler_interval_ms"),
+            "Tooltip_profiler",
+            entry_width=8,
+        )
+        self.profiler_status_label = ttk.Label(profiler_lf, bootstyle="secondary")
+        self.profiler_status_label.grid(row=1, column=0, columnspan=3, sticky="w", padx=5)
+        self._refresh_profiler_status()
+
+    def _refresh_profiler_status(self) -> None:
+        if not self.winfo_exists():
+            return
+        stats = get_sampling_profiler().stats()
+        if stats["path"]:
+            self.profiler_status_label.config(
+                text=(
+                    f"{translate('Running') if stats['running'] else translate('Stopped')}: "
+                    f"{stats['samples']} {translate('samples')}, "
+                    f"{translate('overhead')} {stats['overhead']:.2%} - {stats['path']}"
+                )
+            )
+        else:
+            self.profiler_status_label.config(text=translate("Stopped"))
+        self.after(API_HEALTH_REFRESH_MS, self._refresh_profiler_status)
+
     def _build_api_management_tab(self, parent: ttk.Frame) -> None:
         parent.grid_columnconfigure(0, weight=1, uniform="group1")
         parent.grid_columnconfigure(1, weight=3, uniform="group1")
@@ -1551,6 +1846,15 @@ class SettingsApiPerfTab(ttk.Frame):
         self.reset_selected_api_btn.config(text=translate("Reset Selected"))
         if hasattr(self, "profile_combo"): self._populate_profile_dropdown()
         if hasattr(self, "api_tree"): self._populate_api_tree()
+        if hasattr(self, "api_health_tree"): self._translate_api_health_headings()
+        if hasattr(self, "metrics_tree"):
+            self._translate_metrics_headings()
+            self.metrics_enabled_cb.config(text=translate("Collect Metrics"))
+            self.metrics_reset_btn.config(text=translate("Reset"))
+            self.metrics_export_btn.config(text=translate("Export JSON"))
+            self.stall_detector_cb.config(text=translate("Detect UI Stalls"))
+        if hasattr(self, "profiler_enabled_cb"):
+            self.profiler_enabled_cb.config(text=translate("Enable Profiler"))
 =======
         for key, label_widget in self.path_labels.items():
             label_widget.config(text=translate(key))
@@ -1601,4 +1905,14 @@ class SettingsApiPerfTab(ttk.Frame):
             self._populate_profile_dropdown()
         if hasattr(self, "api_tree"):
             self._populate_api_tree()
+        if hasattr(self, "api_health_tree"):
+            self._translate_api_health_headings()
+        if hasattr(self, "metrics_tree"):
+            self._translate_metrics_headings()
+            self.metrics_enabled_cb.config(text=translate("Collect Metrics"))
+            self.metrics_reset_btn.config(text=translate("Reset"))
+            self.metrics_export_btn.config(text=translate("Export JSON"))
+            self.stall_detector_cb.config(text=translate("Detect UI Stalls"))
+        if hasattr(self, "profiler_enabled_cb"):
+            self.profiler_enabled_cb.config(text=translate("Enable Profiler"))
 >>>>>>> dev-latest
@@ -237,7 +237,14 @@ class SettingsDbTab(ttk.Frame):
             time.sleep(0.5)
             release_lock(db_name)
             time.sleep(0.2)
-            success, msg = self.db_manager.compact_database(db_name)
+            success, msg = self.db_manager.compact_database(
+                db_name,
+                lambda fraction: self.after(
+                    0,
+                    self.main_window.status.update_status,
+                    f"{translate('Compacting database...')} {fraction:.0%}",
+                ),
+            )
             
             def ui_update():
                 self.main_window.reinitialize_databases()
@@ -29,7 +29,7 @@ from ttkbootstrap.constants import (
 from ttkbootstrap.toast import ToastNotification
 from ttkbootstrap.tooltip import ToolTip
 
-from src.api.network import fetch_top_addresses, fetch_address_names
+from src.api.network import fetch_top_addresses
 =======
 from ttkbootstrap.constants import *
 from ttkbootstrap.toast import ToastNotification
@@ -39,10 +39,15 @@ from src.api.network import fetch_top_addresses
 >>>>>>> dev-latest
 from src.config.config import CONFIG, get_active_api_config
 from src.export import (
+    COLUMNAR_FORMATS,
+    export_top_addresses_to_arrow,
     export_top_addresses_to_csv,
     export_top_addresses_to_html,
+    export_top_addresses_to_parquet,
     export_top_addresses_to_pdf,
 )
+from src.export.jobs import ExportJob
+from src.gui.address_names import refresh_address_names
 from src.gui.components.export import ExportComponent
 from src.utils.i18n import translate
 
@@ -51,6 +56,21 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Rows inserted into the tree at a time; more are loaded while scrolling.
+TREE_WINDOW_SIZE = 200
+
+# Maps the tab's sort keys to the columns understood by query_rich_list.
+_SORT_KEYS: Dict[str, str] = {
+    "Rank": "rank",
+    "Known Name": "name",
+    "Address": "address",
+    "Balance": "balance",
+    "Value": "balance",
+    "Rank Change": "rank_change",
+    "Balance Change": "balance_change",
+}
+_NUMERIC_SORTS = ["Balance", "Value", "Rank", "Rank Change", "Balance Change"]
+
 
 class TopAddressesTab(ttk.Frame):
     """
@@ -67,7 +87,11 @@ class TopAddressesTab(ttk.Frame):
 >>>>>>> dev-latest
     _thread: Optional[threading.Thread]
     _stop_event: threading.Event
-    full_df: pd.DataFrame
+    snapshot_id: Optional[int]
+    previous_snapshot_id: Optional[int]
+    snapshot_taken_at: Optional[int]
+    total_rows: int
+    loaded_rows: int
     sort_info: Dict[str, Any]
     placeholder_active: bool
     is_active: bool
@@ -80,6 +104,7 @@ class TopAddressesTab(ttk.Frame):
     search_button: ttk.Button
     reset_button: ttk.Button
     tree: ttk.Treeview
+    tree_scrollbar: ttk.Scrollbar
     context_menu: tk.Menu
 
 <<<<<<< HEAD
@@ -97,7 +122,12 @@ class TopAddressesTab(ttk.Frame):
 
         self._thread = None
         self._stop_event = threading.Event()
-        self.full_df = pd.DataFrame()
+        self.snapshot_id = None
+        self.previous_snapshot_id = None
+        self.snapshot_taken_at = None
+        self.total_rows = 0
+        self.loaded_rows = 0
+        self._window_pending = False
 <<<<<<< HEAD
         self.sort_info = {"column": "Rank", "reverse": False}
         self.placeholder_active = False
@@ -115,7 +145,7 @@ class TopAddressesTab(ttk.Frame):
         if not self.is_active:
             logger.info("Top Addresses tab activated.")
             self.is_active = True
-            if self.full_df.empty:
+            if self.snapshot_id is None:
                 self.refresh_data()
 
     def deactivate(self) -> None:
@@ -145,7 +175,9 @@ class TopAddressesTab(ttk.Frame):
         button_frame.pack(side=RIGHT)
 
         self.refresh_button = ttk.Button(
-            button_frame, text=translate("Refresh List"), command=self.refresh_data
+            button_frame,
+            text=translate("Refresh List"),
+            command=lambda: self.refresh_data(force=True),
         )
         self.refresh_button.pack(side=LEFT)
 
@@ -177,17 +209,35 @@ class TopAddressesTab(ttk.Frame):
         tree_frame.grid_rowconfigure(0, weight=1)
 
 <<<<<<< HEAD
-        columns = ("rank", "name", "address", "balance", "value")
+        columns = (
+            "rank",
+            "name",
+            "address",
+            "balance",
+            "value",
+            "rank_change",
+            "balance_change",
+        )
 =======
-        columns: Tuple[str, ...] = ("rank", "name", "address", "balance", "value")
+        columns: Tuple[str, ...] = (
+            "rank",
+            "name",
+            "address",
+            "balance",
+            "value",
+            "rank_change",
+            "balance_change",
+        )
 >>>>>>> dev-latest
         self.tree = ttk.Treeview(
             tree_frame, columns=columns, show="headings", bootstyle="primary"
         )
-        vsb = ttk.Scrollbar(tree_frame, orient=VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=vsb.set)
+        self.tree_scrollbar = ttk.Scrollbar(
+            tree_frame, orient=VERTICAL, command=self.tree.yview
+        )
+        self.tree.configure(yscrollcommand=self._on_tree_scroll)
         self.tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
+        self.tree_scrollbar.grid(row=0, column=1, sticky="ns")
 
         self.context_menu = tk.Menu(self, tearoff=0)
         self.tree.bind("<Double-1>", self._on_double_click)
@@ -297,34 +347,50 @@ class TopAddressesTab(ttk.Frame):
         """Signals the fetching thread to stop."""
         self._stop_event.set()
 
-    def refresh_data(self) -> None:
-        """Initiates a background thread to fetch top addresses."""
+    def refresh_data(self, force: bool = False) -> None:
+        """
+        Initiates a background thread to load the rich list. The newest
+        stored snapshot is reused unless it is stale or force is True.
+        """
         if self._thread and self._thread.is_alive():
             logger.warning("Refresh already in progress.")
             return
 
-        self.show_placeholder(translate("Loading..."))
+        if self.snapshot_id is None:
+            self.show_placeholder(translate("Loading..."))
         self._stop_event.clear()
         self._thread = threading.Thread(
-            target=self._fetch_worker, daemon=True, name="TopAddressesThread"
+            target=self._fetch_worker,
+            args=(force,),
+            daemon=True,
+            name="TopAddressesThread",
         )
         self._thread.start()
 
-    def _fetch_worker(self) -> None:
-        """Background worker to fetch names AND top addresses in parallel."""
+    def _fetch_worker(self, force: bool = False) -> None:
+        """Background worker that stores a new rich-list snapshot if needed."""
+        db = self.main_window.app_data_db
+        snapshots: List[Tuple[int, int]] = []
         try:
+            if db is None:
+                raise RuntimeError("App data database is not available.")
+
             # 1. Fetch Names First (Critical Fix)
             if not self.main_window.address_names_map:
-                 logger.info("Fetching address names map...")
-                 names_list = fetch_address_names()
-                 if names_list:
-                     self.main_window.address_names_map = {
-                         entry["address"]: entry["name"] for entry in names_list
-                     }
-            
+                logger.info("Loading address names map...")
+                self.main_window.address_names_map = refresh_address_names(db)
+
             if self._stop_event.is_set():
                 return
 
+            snapshots = db.get_rich_list_snapshots()
+            max_age = (
+                CONFIG.get("performance", {}).get("rich_list_cache_minutes", 10) * 60
+            )
+            if not force and snapshots and time.time() - snapshots[0][1] < max_age:
+                logger.info("Using stored rich-list snapshot.")
+                return
+
             # 2. Fetch Top Addresses
             raw_data = fetch_top_addresses()
             if self._stop_event.is_set():
@@ -340,121 +406,171 @@ class TopAddressesTab(ttk.Frame):
             elif isinstance(raw_data, list):
                 address_list = raw_data
 
-            if isinstance(address_list, list):
-<<<<<<< HEAD
-                df_data: List[Dict[str, Any]] = []
-                
-                # Optimized loop with direct dictionary lookup
-                for i, item in enumerate(address_list):
-                    addr = item.get("address", "N/A")
-                    # Direct lookup from the pre-loaded map
-                    known_name = self.main_window.address_names_map.get(addr, "")
-                    
-                    df_data.append({
-                        "Rank": item.get("rank", i) + 1,
-                        "Known Name": known_name,
-                        "Address": addr,
-                        "Balance": float(item.get("amount", 0)),
-                    })
-                
-=======
-                df_data: List[Dict[str, Any]] = [
+            if isinstance(address_list, list) and address_list:
+                entries = pd.DataFrame(
                     {
-                        "Rank": item.get("rank", i) + 1,
-                        "Known Name": self.main_window.address_names_map.get(
-                            item.get("address"), ""
-                        ),
-                        "Address": item.get("address", "N/A"),
-                        "Balance": float(item.get("amount", 0)),
+                        "rank": [
+                            item.get("rank", i) + 1
+                            for i, item in enumerate(address_list)
+                        ],
+                        "address": [
+                            item.get("address", "N/A") for item in address_list
+                        ],
+                        "balance": [
+                            float(item.get("amount", 0)) for item in address_list
+                        ],
                     }
-                    for i, item in enumerate(address_list)
-                ]
->>>>>>> dev-latest
-                self.full_df = pd.DataFrame(df_data)
-            else:
-                self.full_df = pd.DataFrame()
+                )
+                if db.save_rich_list_snapshot(entries) is not None:
+                    snapshots = db.get_rich_list_snapshots()
 
         except Exception as e:
             logger.error(f"Failed to fetch or process top addresses: {e}")
-            self.full_df = pd.DataFrame()
         finally:
             if self.winfo_exists():
-                self.after(0, self._apply_filters_and_sort)
+                self.after(0, self._on_snapshots_loaded, snapshots)
+
+    def _on_snapshots_loaded(self, snapshots: List[Tuple[int, int]]) -> None:
+        """Switches the view to the newest snapshot (runs on the UI thread)."""
+        if snapshots:
+            self.snapshot_id, self.snapshot_taken_at = snapshots[0]
+            self.previous_snapshot_id = (
+                snapshots[1][0] if len(snapshots) > 1 else None
+            )
+        self._apply_filters_and_sort()
 
     def _apply_filters_and_sort(self) -> None:
-        """Applies current filters and sorting to the full_df and updates the tree."""
+        """Re-runs the filtered, sorted query and shows its first window."""
         self._clear_tree()
-        df = self.full_df.copy()
-
-        search_term = self.search_entry.get().strip().lower()
-        if search_term and not self.placeholder_active and not df.empty:
-            df = df[
-                df.apply(
-                    lambda row: search_term in str(row["Address"]).lower()
-                    or search_term in str(row["Known Name"]).lower()
-                    or search_term == str(row["Rank"]),
-                    axis=1,
-                )
-            ]
-
-        if not df.empty:
-<<<<<<< HEAD
-            currency_code = self.main_window.currency_var.get().upper()
-            current_prices = {}
-            if self.main_window.price_updater:
-                current_prices = self.main_window.price_updater.get_current_prices()
-            
-            price = current_prices.get(currency_code.lower(), 0.0)
-
-            df["Value"] = df["Balance"] * price
-            df["Balance_float"] = df["Balance"]
+        self.total_rows = 0
+        self.loaded_rows = 0
 
-            sort_key = self.sort_info["column"]
-            if sort_key in ["Balance", "Value", "Rank"]:
-                sort_col = "Balance_float" if sort_key == "Balance" else sort_key
-=======
-            currency_code: str = self.main_window.currency_var.get().upper()
-            price: float = self.main_window.price_updater.get_current_prices().get(
-                currency_code.lower(), 0.0
-            )
-            df["Value"] = df["Balance"] * price
-            df["Balance_float"] = df["Balance"]
-
-            sort_key: str = self.sort_info["column"]
-            if sort_key in ["Balance", "Value", "Rank"]:
-                sort_col: str = "Balance_float" if sort_key == "Balance" else sort_key
->>>>>>> dev-latest
-                df = df.sort_values(
-                    by=sort_col, ascending=not self.sort_info["reverse"]
-                )
-            else:
-                df = df.sort_values(
-                    by=sort_key,
-                    ascending=not self.sort_info["reverse"],
-                    key=lambda col: col.astype(str).str.lower(),
-                )
+        if self.snapshot_id is not None and self.main_window.app_data_db:
+            self._load_next_window()
 
-            # Optimized insert
-            for _, row in df.iterrows():
-                self.tree.insert(
-                    "",
-                    "end",
-                    iid=row["Rank"],
-                    values=(
-                        row["Rank"],
-                        row["Known Name"],
-                        row["Address"],
-                        f"{row['Balance']:,.2f}",
-                        f"{row['Value']:,.2f} {currency_code}",
-                    ),
-                )
+        if self.loaded_rows:
+            taken_at = datetime.fromtimestamp(self.snapshot_taken_at or time.time())
             self.last_updated_label.config(
-                text=f"{translate('Last Updated')}: {time.strftime('%Y-%m-%d %H:%M:%S')}"
+                text=f"{translate('Last Updated')}: {taken_at.strftime('%Y-%m-%d %H:%M:%S')}"
             )
         else:
             self.show_placeholder(translate("No data to display."))
 
-        self.export_component.set_ui_state(not df.empty)
+        self.export_component.set_ui_state(self.loaded_rows > 0)
+
+    def _current_search(self) -> Optional[str]:
+        if self.placeholder_active:
+            return None
+        return self.search_entry.get().strip() or None
+
+    def _load_next_window(self) -> None:
+        """Appends the next TREE_WINDOW_SIZE rows of the current query."""
+        self._window_pending = False
+        rows, total = self.main_window.app_data_db.query_rich_list(
+            self.snapshot_id,
+            compare_snapshot_id=self.previous_snapshot_id,
+            search=self._current_search(),
+            sort_by=_SORT_KEYS.get(self.sort_info["column"], "rank"),
+            descending=self.sort_info["reverse"],
+            offset=self.loaded_rows,
+            limit=TREE_WINDOW_SIZE,
+        )
+        if self.loaded_rows == 0:
+            self.total_rows = total
+
+        currency_code = self.main_window.currency_var.get().upper()
+        current_prices = {}
+        if self.main_window.price_updater:
+            current_prices = self.main_window.price_updater.get_current_prices()
+        price = current_prices.get(currency_code.lower(), 0.0)
+
+        for row in rows:
+            self.tree.insert(
+                "",
+                "end",
+                iid=row["rank"],
+                values=(
+                    row["rank"],
+                    row["name"],
+                    row["address"],
+                    f"{row['balance']:,.2f}",
+                    f"{row['balance'] * price:,.2f} {currency_code}",
+                    self._format_rank_change(row),
+                    self._format_balance_change(row["balance_change"]),
+                ),
+            )
+        self.loaded_rows += len(rows)
+
+    @staticmethod
+    def _format_rank_change(row: Dict[str, Any]) -> str:
+        """Formats the rank movement since the previous snapshot."""
+        if row["is_new"]:
+            return translate("New")
+        change = row["rank_change"]
+        if change is None:
+            return ""
+        if change == 0:
+            return "="
+        return f"▲ {change}" if change > 0 else f"▼ {-change}"
+
+    @staticmethod
+    def _format_balance_change(change: Optional[float]) -> str:
+        """Formats the balance delta since the previous snapshot."""
+        if change is None or abs(change) < 0.005:
+            return ""
+        return f"{change:+,.2f}"
+
+    def _on_tree_scroll(self, first: str, last: str) -> None:
+        """Updates the scrollbar and loads more rows near the bottom."""
+        self.tree_scrollbar.set(first, last)
+        if (
+            float(last) >= 0.98
+            and 0 < self.loaded_rows < self.total_rows
+            and not self._window_pending
+        ):
+            self._window_pending = True
+            self.after_idle(self._load_next_window)
+
+    def _export_query(self) -> Dict[str, Any]:
+        """The table's current selection and order; read on the Tk thread."""
+        return {
+            "snapshot_id": self.snapshot_id,
+            "compare_snapshot_id": self.previous_snapshot_id,
+            "search": self._current_search(),
+            "sort_by": _SORT_KEYS.get(self.sort_info["column"], "rank"),
+            "descending": self.sort_info["reverse"],
+        }
+
+    def query_export_df(
+        self,
+        snapshot_id: Optional[int],
+        price: float,
+        compare_snapshot_id: Optional[int] = None,
+        search: Optional[str] = None,
+        sort_by: str = "rank",
+        descending: bool = False,
+    ) -> pd.DataFrame:
+        """
+        All rows of a snapshot matching search, in table order, with their
+        value at price. Queries the database, so it runs in the export job.
+        """
+        columns = ["Rank", "Known Name", "Address", "Balance", "Value"]
+        if snapshot_id is None or not self.main_window.app_data_db:
+            return pd.DataFrame(columns=columns)
+        rows, _ = self.main_window.app_data_db.query_rich_list(
+            snapshot_id,
+            compare_snapshot_id=compare_snapshot_id,
+            search=search,
+            sort_by=sort_by,
+            descending=descending,
+        )
+        return pd.DataFrame(
+            [
+                (r["rank"], r["name"], r["address"], r["balance"], r["balance"] * price)
+                for r in rows
+            ],
+            columns=columns,
+        )
 
     def _reset_filters(self) -> None:
         """Clears the search entry and re-applies filters."""
@@ -470,6 +586,8 @@ class TopAddressesTab(ttk.Frame):
             "address": "Address",
             "balance": "Balance",
             "value": "Value",
+            "rank_change": "Rank Change",
+            "balance_change": "Balance Change",
         }
         sort_key = sort_map.get(col_id)
 
@@ -480,14 +598,14 @@ class TopAddressesTab(ttk.Frame):
             self.sort_info["reverse"] = not self.sort_info["reverse"]
         else:
             self.sort_info["column"] = sort_key
-            self.sort_info["reverse"] = sort_key in ["Balance", "Value", "Rank"]
+            self.sort_info["reverse"] = sort_key in _NUMERIC_SORTS
 
         self._apply_filters_and_sort()
 
     def update_currency_display(self, new_currency: str) -> None:
         """Updates the 'Value' column when the global currency changes."""
         self._configure_tree_headings()
-        if self.full_df.empty:
+        if self.snapshot_id is None:
             return
 
 <<<<<<< HEAD
@@ -534,6 +652,8 @@ class TopAddressesTab(ttk.Frame):
             "address": "Address",
             "balance": "Balance (KAS)",
             "value": f"Value ({currency_code})",
+            "rank_change": "Rank Change",
+            "balance_change": "Balance Change (KAS)",
         }
         for col_id, text_key in headings.items():
 <<<<<<< HEAD
@@ -552,6 +672,8 @@ class TopAddressesTab(ttk.Frame):
         self.tree.column("address", width=500, stretch=YES)
         self.tree.column("balance", width=180, anchor="e", stretch=NO)
         self.tree.column("value", width=150, anchor="e", stretch=NO)
+        self.tree.column("rank_change", width=110, anchor="center", stretch=NO)
+        self.tree.column("balance_change", width=160, anchor="e", stretch=NO)
 
     def re_translate(self) -> None:
         """Reloads all translatable text in the tab."""
@@ -591,7 +713,7 @@ class TopAddressesTab(ttk.Frame):
         self.search_entry.config(state=current_state)
         self.export_component.re_translate()
 
-        if self.full_df.empty:
+        if self.snapshot_id is None:
             self.show_placeholder(
                 translate("Press 'Refresh List' to load top addresses.")
             )
@@ -644,7 +766,7 @@ class TopAddressesTab(ttk.Frame):
 
     def export_data(self, export_format: str) -> None:
         """Initiates the data export process."""
-        if self.full_df.empty:
+        if self.snapshot_id is None:
             ToastNotification(
                 title=translate("Export Results:"),
                 message=translate("No data to export."),
@@ -654,9 +776,6 @@ class TopAddressesTab(ttk.Frame):
             return
 
 <<<<<<< HEAD
-        # Lock UI during export
-        self.main_window.set_busy_state(True)
-
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         initial_filename = f"kaspa_top_addresses_{ts}.{export_format}"
         export_dir = CONFIG.get("paths", {}).get("export", ".")
@@ -680,60 +799,59 @@ class TopAddressesTab(ttk.Frame):
         )
 
         if not file_path:
-            # Unlock UI if cancelled
-            self.main_window.set_busy_state(False)
             return
 
         self.main_window.status.update_status(
             f"Exporting to {export_format.upper()}..."
         )
-<<<<<<< HEAD
-=======
-        df_to_export = self.full_df.copy()
-        price: float = self.main_window.price_updater.get_current_prices().get(
-            self.main_window.currency_var.get().lower(), 0.0
-        )
-        df_to_export["Value"] = df_to_export["Balance"] * price
->>>>>>> dev-latest
 
-        df_to_export = self.full_df.copy()
-        
         current_prices = {}
         if self.main_window.price_updater:
             current_prices = self.main_window.price_updater.get_current_prices()
-            
-        price = current_prices.get(
-            self.main_window.currency_var.get().lower(), 0.0
-        )
-        df_to_export["Value"] = df_to_export["Balance"] * price
-
-        export_args = {
-            "df": df_to_export,
-            "file_path": file_path,
-            "currency": self.main_window.currency_var.get(),
-        }
+        currency = self.main_window.currency_var.get()
+        price = current_prices.get(currency.lower(), 0.0)
+
+        # Only the query arguments are captured here; the rows are read in
+        # the export job, off the Tk thread.
+        if export_format in COLUMNAR_FORMATS:
+            # Written straight from the stored snapshot.
+            export_args = {
+                "app_data_db": self.main_window.app_data_db,
+                "file_path": file_path,
+                "currency": currency,
+                "price": price,
+                **self._export_query(),
+            }
+        else:
+            export_args = {
+                "file_path": file_path,
+                "currency": currency,
+                "query": {"price": price, **self._export_query()},
+            }
 
-        threading.Thread(
-<<<<<<< HEAD
-            target=self._export_worker,
-            args=(export_format, export_args),
-            daemon=True,
-            name="ExplorerExportWorker",
-=======
-            target=self._export_worker, args=(export_format, export_args), daemon=True
->>>>>>> dev-latest
-        ).start()
+        self.main_window.export_jobs.submit(
+            translate("Top Addresses"),
+            {export_format: file_path},
+            lambda job: self._export_worker(export_format, export_args, job),
+        )
 
-    def _export_worker(self, export_format: str, export_args: Dict[str, Any]) -> None:
-        """Background thread to handle the file I/O for exporting."""
+    def _export_worker(
+        self,
+        export_format: str,
+        export_args: Dict[str, Any],
+        job: Optional[ExportJob] = None,
+    ) -> Dict[str, Tuple[bool, str, str]]:
+        """Export job body: writes the file and reports the outcome."""
         logger.info(
             f"Exporting top addresses to {export_format.upper()} at {export_args['file_path']}"
         )
         try:
 <<<<<<< HEAD
             from src.export import (
+                export_top_addresses_to_arrow,
                 export_top_addresses_to_csv,
                 export_top_addresses_to_html,
+                export_top_addresses_to_parquet,
                 export_top_addresses_to_pdf,
             )
 
@@ -744,6 +862,8 @@ class TopAddressesTab(ttk.Frame):
                 "csv": export_top_addresses_to_csv,
                 "html": export_top_addresses_to_html,
                 "pdf": export_top_addresses_to_pdf,
+                "parquet": export_top_addresses_to_parquet,
+                "arrow": export_top_addresses_to_arrow,
             }
 <<<<<<< HEAD
             export_func = export_map.get(export_format)
@@ -758,7 +878,10 @@ class TopAddressesTab(ttk.Frame):
                     f"No export function found for format: {export_format}"
                 )
 
-            success, msg_key, details = export_func(**export_args)
+            call_args = dict(export_args)
+            if "query" in call_args:
+                call_args["df"] = self.query_export_df(**call_args.pop("query"))
+            success, msg_key, details = export_func(**call_args, job=job)
 <<<<<<< HEAD
             final_msg = (
 =======
@@ -767,7 +890,7 @@ class TopAddressesTab(ttk.Frame):
                 f"{translate(msg_key)}: {details}" if details else translate(msg_key)
             )
 
-            if self.winfo_exists():
+            if self.winfo_exists() and not (job and job.cancelled):
                 if success:
                     logger.info(
                         f"Export successful. File saved to {export_args['file_path']}"
@@ -790,6 +913,7 @@ class TopAddressesTab(ttk.Frame):
 >>>>>>> dev-latest
                         0, lambda: messagebox.showerror(translate("Error"), final_msg)
                     )
+            return {export_format: (success, msg_key, details)}
 
         except Exception as e:
             logger.error(f"Export worker failed for top addresses: {e}", exc_info=True)
@@ -807,11 +931,10 @@ class TopAddressesTab(ttk.Frame):
                         duration=3000,
                     ).show_toast(),
                 )
+            return {export_format: (False, "Error", str(e))}
         finally:
-            # UNLOCK UI regardless of success or failure
             if self.winfo_exists():
 <<<<<<< HEAD
-                self.after(0, self.main_window.set_busy_state, False)
                 self.after(0, self.main_window.status.update_status, "Ready")
 =======
                 self.main_window.after(
@@ -31,7 +31,7 @@ from typing import TYPE_CHECKING
 =======
 from src.database.db_locker import release_lock
 from src.utils.errors import APIError
-from src.utils.i18n import get_all_translations_for_key, translate
+from src.utils.i18n import is_translation_of, translate
 from src.utils.profiling import log_performance
 >>>>>>> dev-latest
 
@@ -353,21 +353,15 @@ class TransactionManager:
         end_ts: float = int(end_dt.timestamp()) if end_dt else float("inf")
 
         type_filter: str = filters.get("type_filter", "ALL")
-        all_type_keys: Set[str] = get_all_translations_for_key("ALL")
-        if type_filter not in all_type_keys:
+        if not is_translation_of(type_filter, "ALL"):
             type_filter = (
-                "coinbase"
-                if type_filter in get_all_translations_for_key("coinbase")
-                else "transfer"
+                "coinbase" if is_translation_of(type_filter, "coinbase") else "transfer"
             )
 
         direction_filter: str = filters.get("direction_filter", "ALL")
-        all_direction_keys: Set[str] = get_all_translations_for_key("ALL")
-        if direction_filter not in all_direction_keys:
+        if not is_translation_of(direction_filter, "ALL"):
             direction_filter = (
-                "incoming"
-                if direction_filter in get_all_translations_for_key("incoming")
-                else "outgoing"
+                "incoming" if is_translation_of(direction_filter, "incoming") else "outgoing"
             )
 >>>>>>> dev-latest
 
@@ -781,7 +775,7 @@ class TransactionManager:
             self.main_window.price_updater.stop()
         if hasattr(self.main_window, "network_updater"):
             self.main_window.network_updater.stop()
-        if hasattr(self.main_window, "top_addresses_tab"):
+        if getattr(self.main_window, "top_addresses_tab", None):
             self.main_window.top_addresses_tab.stop()
 
         status: Callable[..., None] = lambda key, *args: self.main_window.after(
@@ -5,6 +5,7 @@
 Handles application updates from GitHub, including download progress,
 hash verification, and version checking.
 Refactored to reduce cyclomatic complexity.
+Release archives are fetched with the parallel, resumable RangeDownloader.
 """
 
 import hashlib
@@ -12,7 +13,9 @@ import json
 import logging
 import os
 import re
+import shutil
 import threading
+import time
 import zipfile
 from datetime import datetime, timezone
 from tkinter import StringVar, messagebox
@@ -22,10 +25,16 @@ import requests
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import DISABLED, LEFT, X
 
+from src.utils.errors import DownloadCancelled, DownloadError
 from src.utils.i18n import translate
+from src.utils.range_download import STATE_SUFFIX, RangeDownloader
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_CONNECTIONS = 4
+EXTRACT_BUFFER_SIZE = 1024 * 1024
+PROGRESS_UPDATE_INTERVAL_SECONDS = 0.25
+
 
 class DownloadProgressWindow(ttk.Toplevel):
     """
@@ -54,6 +63,9 @@ class DownloadProgressWindow(ttk.Toplevel):
         self.progress.pack(pady=5, padx=10, fill=X, expand=False)
         self.progress.start(10)
 
+        self.detail_var = ttk.StringVar(value="")
+        ttk.Label(self, textvariable=self.detail_var).pack(padx=10, anchor="e")
+
         self.cancel_button = ttk.Button(
             self,
             text=translate("Cancel"),
@@ -93,6 +105,19 @@ class DownloadProgressWindow(ttk.Toplevel):
             self.after(0, self.status_var.set, message)
             self.update_idletasks()
 
+    def set_progress(self, downloaded: int, total: Optional[int]) -> None:
+        if not self.winfo_exists():
+            return
+        mb_done = downloaded / 1024**2
+        if not total:
+            self.detail_var.set(f"{mb_done:.1f} MB")
+            return
+        if str(self.progress.cget("mode")) != "determinate":
+            self.progress.stop()
+            self.progress.config(mode="determinate", maximum=100)
+        self.progress.config(value=downloaded * 100 / total)
+        self.detail_var.set(f"{mb_done:.1f} / {total / 1024**2:.1f} MB")
+
     def show_success(self, message: str) -> None:
         if not self.winfo_exists():
             return
@@ -137,6 +162,7 @@ class ProgressTracker:
         self.log_callback = log_callback
         self.lines: List[str] = []
         self.lock = threading.Lock()
+        self._last_progress_update = 0.0
 
     def _update_gui(self, final_text: str) -> None:
         if self.progress_window and self.progress_window.winfo_exists():
@@ -167,6 +193,18 @@ class ProgressTracker:
     def add_log(self, message: str) -> None:
         self.log_callback(message)
 
+    def set_progress(self, downloaded: int, total: Optional[int]) -> None:
+        """Forwards download progress to the window, at most a few times a second."""
+        now = time.monotonic()
+        if total and downloaded < total:
+            if now - self._last_progress_update < PROGRESS_UPDATE_INTERVAL_SECONDS:
+                return
+        self._last_progress_update = now
+        if self.progress_window and self.progress_window.winfo_exists():
+            self.progress_window.after(
+                0, self.progress_window.set_progress, downloaded, total
+            )
+
     def complete_all(self, final_message: str) -> None:
         self.log_callback(final_message)
         final_text = self._build_text(success=True)
@@ -214,6 +252,9 @@ class GitHubUpdater:
         self.progress_window = progress_window
         self.tracker = ProgressTracker(self.progress_window, log_callback)
         self.asset_name = ""
+        # Set when a download is interrupted, so the partial file is kept
+        # and the next update attempt resumes it.
+        self.keep_partial_download = False
 
         self.multi_target_files = multi_target_files
         self.version_file_base_path = local_path
@@ -378,26 +419,39 @@ class GitHubUpdater:
                 f"{translate('Update failed: Could not download hash file. {0}.').format(e)}"
             )
 
-    def _download_asset(self, url: str, expected_hash: Optional[str]) -> str:
-        download_path = "kaspa_update.tmp_download"
+    def _download_path(self) -> str:
         if self.version_file_base_path:
-            download_path = f"{self.version_file_base_path}.tmp_download"
-
-        os.makedirs(os.path.dirname(download_path), exist_ok=True)
-        sha256 = hashlib.sha256()
+            return f"{self.version_file_base_path}.tmp_download"
+        return "kaspa_update.tmp_download"
 
-        with requests.get(url, stream=True, timeout=600) as r:
-            r.raise_for_status()
-            with open(download_path, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    if self.cancel_event.is_set():
-                        raise Exception(translate("Download cancelled by user."))
-                    f.write(chunk)
-                    sha256.update(chunk)
+    def _download_asset(self, url: str, expected_hash: Optional[str]) -> str:
+        download_path = self._download_path()
+        os.makedirs(os.path.dirname(os.path.abspath(download_path)), exist_ok=True)
+
+        downloader = RangeDownloader(
+            url,
+            download_path,
+            connections=DOWNLOAD_CONNECTIONS,
+            cancel_event=self.cancel_event,
+            progress_callback=self.tracker.set_progress,
+        )
+        try:
+            calculated = downloader.download()
+        except DownloadCancelled:
+            self.keep_partial_download = True
+            raise Exception(translate("Download cancelled by user."))
+        except DownloadError:
+            self.keep_partial_download = True
+            raise
+
+        if downloader.resumed_bytes:
+            self.tracker.add_log(
+                f"Resumed download at {downloader.resumed_bytes / 1024**2:.1f} MB."
+            )
 
         if expected_hash:
-            calculated = sha256.hexdigest()
             if calculated.lower() != expected_hash.lower():
+                downloader.discard_partial()
                 raise Exception(
                     f"{translate('Hash mismatch!')} Expected {expected_hash}, Got {calculated}"
                 )
@@ -437,7 +491,7 @@ class GitHubUpdater:
 
                 os.makedirs(os.path.dirname(local_path), exist_ok=True)
                 with zip_ref.open(info) as source, open(local_path, "wb") as dest:
-                    dest.write(source.read())
+                    shutil.copyfileobj(source, dest, EXTRACT_BUFFER_SIZE)
 
                 if remote_time:
                     try:
@@ -460,14 +514,16 @@ class GitHubUpdater:
                 )
 
     def _cleanup_temp_files(self) -> None:
-        tmp_path = "kaspa_update.tmp_download"
-        if self.version_file_base_path:
-            tmp_path = f"{self.version_file_base_path}.tmp_download"
-        if os.path.exists(tmp_path):
-            try:
-                os.remove(tmp_path)
-            except:
-                pass
+        tmp_path = self._download_path()
+        if self.keep_partial_download:
+            logger.info(f"Keeping partial download for resume: {tmp_path}")
+            return
+        for path in (tmp_path, tmp_path + STATE_SUFFIX):
+            if os.path.exists(path):
+                try:
+                    os.remove(path)
+                except:
+                    pass
 
 
 class VersionChecker:
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+import multiprocessing
 import os
 import signal
 import sys
@@ -35,61 +36,63 @@ if not getattr(sys, "frozen", False):
         sys.path.insert(0, project_root)
 # --- End Path Setup ---
 
-# --- Argument Parsing & Config Initialization ---
-parser = argparse.ArgumentParser(description="KaspaGateway")
-parser.add_argument(
-    "--user-data-path",
-    type=str,
-    default=None,
-    help="Specifies the directory for user data (config, logs, db).",
-)
-
-args, _ = parser.parse_known_args()
-
-try:
-    from src.config.config import CONFIG, initialize_config
-
-    initialize_config(args.user_data_path)
-except Exception as e:
-    print(f"FATAL: Failed to initialize configuration: {e}")
-    traceback.print_exc()
-    sys.exit(1)
-# --- End Config Initialization ---
-
-# --- Logging Setup ---
-try:
-    from src.utils.logging_config import setup_logging
-
-    setup_logging(
-        level=CONFIG.get("log_level", "INFO"), log_path=CONFIG["paths"]["log"]
-    )
-except Exception as e:
-    print(f"FATAL: Failed to set up logging: {e}")
-    traceback.print_exc()
-    sys.exit(1)
+# Imported first so the trace clock starts as close to process start as possible.
+from src.utils.startup_trace import startup_tracer  # noqa: E402
 
+# Everything below runs inside main() only: spawned worker processes (e.g.
+# parallel PDF rendering) re-import this module as __mp_main__ and must not
+# parse arguments, load the config, open the log file or import the GUI.
 logger = logging.getLogger(__name__)
-# --- End Logging Setup ---
-
-# --- Main Application Imports ---
-try:
-    from src.core.app import KaspaApp
-    from src.database.db_locker import acquire_all_locks, release_all_locks
-    from src.utils.errors import KaspaError
-except ImportError as e:
-    logger.critical(f"Failed to import core application modules: {e}", exc_info=True)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="KaspaGateway")
+    parser.add_argument(
+        "--user-data-path",
+        type=str,
+        default=None,
+        help="Specifies the directory for user data (config, logs, db).",
+    )
+    parser.add_argument(
+        "--startup-trace",
+        type=str,
+        default=None,
+        help="Writes a Chrome-trace JSON of the startup critical path to this file.",
+    )
+    parser.add_argument(
+        "--exit-when-interactive",
+        action="store_true",
+        help="Quits as soon as startup is complete (used by the startup benchmark).",
+    )
+    args, _ = parser.parse_known_args()
+    return args
+
+
+def _initialize(args: argparse.Namespace) -> None:
+    """Loads the configuration and sets up logging; exits if either fails."""
+    startup_tracer.configure(args.startup_trace, args.exit_when_interactive)
+
     try:
-        root = tk.Tk()
-        root.withdraw()
-        messagebox.showerror(
-            "Import Error",
-            f"Failed to load application components: {e}\nPlease check logs.",
-        )
-        root.destroy()
-    except Exception:
-        pass
-    sys.exit(1)
-# --- End Main Application Imports ---
+        with startup_tracer.span("initialize_config"):
+            from src.config.config import CONFIG, initialize_config
+
+            initialize_config(args.user_data_path)
+    except Exception as e:
+        print(f"FATAL: Failed to initialize configuration: {e}")
+        traceback.print_exc()
+        sys.exit(1)
+
+    try:
+        from src.utils.logging_config import setup_logging
+
+        with startup_tracer.span("setup_logging"):
+            setup_logging(
+                level=CONFIG.get("log_level", "INFO"), log_path=CONFIG["paths"]["log"]
+            )
+    except Exception as e:
+        print(f"FATAL: Failed to set up logging: {e}")
+        traceback.print_exc()
+        sys.exit(1)
 
 
 def main() -> None:
@@ -97,6 +100,34 @@ def main() -> None:
     Main application entry point.
     Initializes, sets up signal handlers, and runs the application.
     """
+    _initialize(_parse_args())
+
+    # --- Main Application Imports ---
+    try:
+        t_start_imports = time.perf_counter()
+        with startup_tracer.span("import src.core.app"):
+            from src.config.config import CONFIG
+            from src.core.app import KaspaApp
+            from src.database.db_locker import acquire_all_locks, release_all_locks
+            from src.utils.errors import KaspaError
+            from src.utils.lazy_import import record_import_time
+            from src.utils.sampling_profiler import get_sampling_profiler
+
+        record_import_time("src.core.app", time.perf_counter() - t_start_imports)
+    except ImportError as e:
+        logger.critical(f"Failed to import core application modules: {e}", exc_info=True)
+        try:
+            root = tk.Tk()
+            root.withdraw()
+            messagebox.showerror(
+                "Import Error",
+                f"Failed to load application components: {e}\nPlease check logs.",
+            )
+            root.destroy()
+        except Exception:
+            pass
+        sys.exit(1)
+    # --- End Main Application Imports ---
 
     # --- Job Object Management (for Windows) ---
     # This ensures that if the main app is force-killed (e.g., Task Manager),
@@ -226,7 +257,9 @@ def main() -> None:
             logger.error(f"Failed to create Job Object: {e}", exc_info=True)
     # --- End Job Object Management ---
 
-    if not acquire_all_locks(CONFIG):
+    with startup_tracer.span("acquire_all_locks"):
+        locks_acquired = acquire_all_locks(CONFIG)
+    if not locks_acquired:
         logger.critical(
             "Failed to acquire database locks. Another instance may be running."
         )
@@ -274,8 +307,12 @@ def main() -> None:
     try:
         logger.info(f"--- KaspaGateway v{CONFIG.get('version')} Starting ---")
 
+        # Started before the window so a profiled session includes startup.
+        get_sampling_profiler().apply_settings(CONFIG.get("performance", {}))
+
         start_init: float = time.perf_counter()
-        app = KaspaApp()
+        with startup_tracer.span("KaspaApp()"):
+            app = KaspaApp()
         end_init: float = time.perf_counter()
         logger.info(
             f"PERF: KaspaApp() initialization took {end_init - start_init:.4f} seconds."
@@ -317,10 +354,13 @@ def main() -> None:
         # this process terminates, which will trigger the child process kills.
 
         release_all_locks()
+        get_sampling_profiler().stop()
 
         logger.info("--- Application Shutdown ---")
         logging.shutdown()
 
 
 if __name__ == "__main__":
+    # Worker processes started by the frozen executable return here.
+    multiprocessing.freeze_support()
     main()
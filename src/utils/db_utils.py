@@ -62,10 +62,15 @@ def retry_on_schema_error(
                     logger.warning(
                         f"Schema error in {func.__name__} for {db_path}: {e}. Retrying after re-initializing schema..."
                     )
+                    # Imported here: src.database imports this module.
+                    from src.database.db_schema import repair_schema
+
                     try:
-                        # Fix the schema by getting a connection and calling the init function
+                        # Fix the schema by getting a connection and calling the init function.
+                        # The schema version says the file is current, so missing tables
+                        # are re-created explicitly.
                         with self.connect() as con:
-                            schema_init_func(con)
+                            repair_schema(con, schema_init_func)
 
                         # Retry the original function one more time
                         return func(self, *args, **kwargs)
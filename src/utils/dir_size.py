@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Provides an incremental, cached directory-size tracker.
+
+Walking a multi-hundred-GB kaspad datadir with os.walk + os.path.getsize
+costs one stat call per file on every refresh. The tracker below keeps a
+per-directory cache keyed by the directory's mtime:
+
+1. Directories are enumerated with os.scandir, whose DirEntry objects
+   cache stat results (free on Windows, one lstat per entry elsewhere).
+2. A directory whose mtime is unchanged since the last scan has the same
+   set of entries, so its cached file total is reused without listing it.
+3. Files that were modified recently ("hot" files, e.g. RocksDB WAL and
+   MANIFEST files that grow in place) are re-stat'ed individually, since
+   appending to a file does not change the parent directory's mtime.
+   Immutable SST files quickly become "cold" and are never re-stat'ed.
+
+Every measurement is also recorded as a (timestamp, bytes) sample so that
+a growth rate (GB/day) can be reported alongside the size.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# A file modified within this many seconds of a scan is considered "hot"
+# and is re-stat'ed on every refresh until it cools down.
+HOT_FILE_WINDOW_SECONDS: float = 3600.0
+
+# Maximum number of (timestamp, size) samples kept per tracked root.
+MAX_GROWTH_SAMPLES: int = 512
+
+# Minimum time span between the oldest and newest sample before a
+# growth rate is reported, to avoid wildly extrapolated numbers.
+MIN_GROWTH_SPAN_SECONDS: float = 60.0
+
+
+@dataclass
+class _DirEntryCache:
+    """Cached state of a single directory (non-recursive)."""
+
+    mtime_ns: int
+    cold_files_total: int
+    hot_files: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    subdirs: List[str] = field(default_factory=list)
+
+
+class DirectorySizeTracker:
+    """
+    Computes directory sizes incrementally, rescanning only directories
+    whose mtime changed since the previous call. Thread-safe.
+    """
+
+    def __init__(self, hot_window_seconds: float = HOT_FILE_WINDOW_SECONDS) -> None:
+        self.hot_window_seconds = hot_window_seconds
+        self._cache: Dict[str, _DirEntryCache] = {}
+        self._samples: Dict[str, Deque[Tuple[float, int]]] = {}
+        self._lock = threading.Lock()
+        self.last_scan_stats: Dict[str, int] = {}
+
+    def get_size(self, folder_path: str, force_rescan: bool = False) -> int:
+        """
+        Returns the total size in bytes of all regular files under folder_path
+        (symlinks are not followed), or -1 on error.
+        """
+        root = os.path.abspath(folder_path)
+        stats = {"dirs_rescanned": 0, "dirs_cached": 0, "hot_files_restat": 0}
+        with self._lock:
+            if force_rescan:
+                self._drop_subtree(root)
+            try:
+                total = self._size_of(root, time.time(), stats, set())
+            except OSError as e:
+                logger.warning(f"Failed to compute size of {root}: {e}")
+                self._drop_subtree(root)
+                return -1
+
+            self.last_scan_stats = stats
+            samples = self._samples.setdefault(
+                root, deque(maxlen=MAX_GROWTH_SAMPLES)
+            )
+            samples.append((time.time(), total))
+
+        logger.debug(
+            f"Directory size for {root}: {total} bytes "
+            f"(rescanned={stats['dirs_rescanned']}, cached={stats['dirs_cached']}, "
+            f"hot_restat={stats['hot_files_restat']})"
+        )
+        return total
+
+    def get_growth_rate(self, folder_path: str) -> Optional[float]:
+        """
+        Returns the growth rate of folder_path in bytes per day, based on the
+        samples recorded by get_size(), or None if not enough data exists yet.
+        """
+        root = os.path.abspath(folder_path)
+        with self._lock:
+            samples = self._samples.get(root)
+            if not samples or len(samples) < 2:
+                return None
+            (t0, s0), (t1, s1) = samples[0], samples[-1]
+        span = t1 - t0
+        if span < MIN_GROWTH_SPAN_SECONDS:
+            return None
+        return (s1 - s0) / span * 86400.0
+
+    def get_growth_rate_gb_per_day(self, folder_path: str) -> Optional[float]:
+        """Convenience wrapper around get_growth_rate() returning GB/day."""
+        rate = self.get_growth_rate(folder_path)
+        return None if rate is None else rate / 1024**3
+
+    def clear(self) -> None:
+        """Forgets all cached directory state and growth samples."""
+        with self._lock:
+            self._cache.clear()
+            self._samples.clear()
+
+    def _drop_subtree(self, root: str) -> None:
+        prefix = root.rstrip(os.sep) + os.sep
+        for path in [p for p in self._cache if p == root or p.startswith(prefix)]:
+            del self._cache[path]
+
+    def _size_of(
+        self, path: str, now: float, stats: Dict[str, int], seen: set
+    ) -> int:
+        """Returns the recursive size of path, using and refreshing the cache."""
+        if path in seen:
+            return 0
+        seen.add(path)
+
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            self._drop_subtree(path)
+            if len(seen) == 1:
+                # The root itself is missing; let get_size() report the error.
+                raise
+            return 0
+
+        cached = self._cache.get(path)
+        if cached is None or cached.mtime_ns != mtime_ns:
+            cached = self._scan_dir(path, mtime_ns, now)
+            self._cache[path] = cached
+            stats["dirs_rescanned"] += 1
+        else:
+            stats["dirs_cached"] += 1
+            self._refresh_hot_files(path, cached, now, stats)
+
+        total = cached.cold_files_total + sum(
+            size for size, _ in cached.hot_files.values()
+        )
+        for subdir in cached.subdirs:
+            total += self._size_of(subdir, now, stats, seen)
+        return total
+
+    def _scan_dir(self, path: str, mtime_ns: int, now: float) -> _DirEntryCache:
+        """Lists a directory once with os.scandir and classifies its files."""
+        entry_cache = _DirEntryCache(mtime_ns=mtime_ns, cold_files_total=0)
+        hot_cutoff = now - self.hot_window_seconds
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        entry_cache.subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        if st.st_mtime >= hot_cutoff:
+                            entry_cache.hot_files[entry.name] = (
+                                st.st_size,
+                                st.st_mtime_ns,
+                            )
+                        else:
+                            entry_cache.cold_files_total += st.st_size
+                except OSError:
+                    # File vanished between listing and stat (e.g. compaction).
+                    continue
+        return entry_cache
+
+    def _refresh_hot_files(
+        self,
+        path: str,
+        cached: _DirEntryCache,
+        now: float,
+        stats: Dict[str, int],
+    ) -> None:
+        """Re-stats recently modified files and demotes those that cooled down."""
+        hot_cutoff = now - self.hot_window_seconds
+        for name in list(cached.hot_files):
+            try:
+                st = os.stat(os.path.join(path, name))
+            except OSError:
+                del cached.hot_files[name]
+                continue
+            stats["hot_files_restat"] += 1
+            if st.st_mtime < hot_cutoff:
+                del cached.hot_files[name]
+                cached.cold_files_total += st.st_size
+            else:
+                cached.hot_files[name] = (st.st_size, st.st_mtime_ns)
+
+
+def format_growth_rate(bytes_per_day: Optional[float]) -> str:
+    """Formats a growth rate in bytes/day as a short 'GB/day' string."""
+    if bytes_per_day is None:
+        return "N/A"
+    gb_per_day = bytes_per_day / 1024**3
+    return f"{gb_per_day:+.2f} GB/day"
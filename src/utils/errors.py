@@ -12,3 +12,11 @@ class DatabaseError(KaspaError):
 
 class InputError(KaspaError):
     pass
+
+
+class DownloadError(KaspaError):
+    pass
+
+
+class DownloadCancelled(DownloadError):
+    pass
@@ -28,6 +28,16 @@ def format_hashrate(ths: float, precision: int = 2) -> str:
     return f"{ths:,.{precision}f} TH/s"
 
 
+def format_bytes(num_bytes: float, precision: int = 2) -> str:
+    if not isinstance(num_bytes, (int, float)) or num_bytes < 0:
+        return "N/A"
+    for unit in ("B", "KB", "MB", "GB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:,.{precision if unit != 'B' else 0}f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:,.{precision}f} TB"
+
+
 def mask_address(address: str, prefix=8, suffix=5) -> str:
     if not address or not isinstance(address, str):
         return "N/A"
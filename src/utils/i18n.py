@@ -1,8 +1,11 @@
+import hashlib
 import json
 import logging
+import marshal
 import os
 import sys
-from typing import Any, Callable, Dict, List, Optional, Set
+import threading
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from src.config.config import CONFIG, get_project_root
 
@@ -11,7 +14,13 @@ logger = logging.getLogger(__name__)
 _current_lang_code: str = "en"
 _translations: Dict[str, str] = {}
 LANG_MAP: Dict[str, str] = {}
-_translation_key_cache: Dict[str, Set[str]] = {}
+
+# Compiled form of all translation files, cached in the user's cache
+# directory (the install directory may be read-only, and bundlers reset
+# file times). Bump the format when the layout of the compiled data changes.
+CATALOG_FILENAME: str = "catalog.marshal"
+CATALOG_FORMAT: int = 1
+_EMPTY: FrozenSet[str] = frozenset()
 
 
 def get_translations_dir() -> str:
@@ -44,33 +53,179 @@ def _load_lang_map() -> None:
         LANG_MAP = {"en": "English"}  # Fallback
 
 
-def _load_translations() -> None:
-    """Loads the translation strings for the current language."""
-    global _translations
+class TranslationCatalog:
+    """
+    Every language's messages (each already overlaid on English) plus two
+    indexes over all languages: key -> its translations, and translated
+    text -> the keys it translates.
+    """
+
+    def __init__(
+        self,
+        messages: Dict[str, Dict[str, str]],
+        translations_by_key: Dict[str, FrozenSet[str]],
+        keys_by_translation: Dict[str, FrozenSet[str]],
+    ) -> None:
+        self.messages = messages
+        self.translations_by_key = translations_by_key
+        self.keys_by_translation = keys_by_translation
+
+    @classmethod
+    def compile(cls, languages: Dict[str, Dict[str, Any]]) -> "TranslationCatalog":
+        english = {k: str(v) for k, v in languages.get("en", {}).items()}
+        messages: Dict[str, Dict[str, str]] = {}
+        by_key: Dict[str, Set[str]] = {}
+        by_text: Dict[str, Set[str]] = {}
+        for code, strings in languages.items():
+            merged = dict(english)
+            merged.update((k, str(v)) for k, v in strings.items())
+            messages[code] = merged
+            for key, text in strings.items():
+                by_key.setdefault(key, {key}).add(str(text))
+        for key, texts in by_key.items():
+            for text in texts:
+                by_text.setdefault(text, set()).add(key)
+        return cls(
+            messages,
+            {key: frozenset(texts) for key, texts in by_key.items()},
+            {text: frozenset(keys) for text, keys in by_text.items()},
+        )
+
+    def to_bytes(self, signature: Tuple[Any, ...]) -> bytes:
+        return marshal.dumps(
+            (
+                CATALOG_FORMAT,
+                signature,
+                self.messages,
+                self.translations_by_key,
+                self.keys_by_translation,
+            )
+        )
 
-    def load_json(lang_code: str) -> Dict[str, Any]:
-        """Helper to load a single JSON translation file."""
-        file_path: str = os.path.join(TRANSLATIONS_DIR, f"{lang_code}.json")
-        if not os.path.exists(file_path):
-            logger.warning(f"Translation file not found: {file_path}")
-            return {}
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, signature: Tuple[Any, ...]
+    ) -> Optional["TranslationCatalog"]:
+        """Returns None unless data is a catalog compiled from signature."""
         try:
-            with open(file_path, "r", encoding="utf-8-sig") as f:
-                return json.load(f)
+            # Written by this module into the user's own cache dir.
+            loaded = marshal.loads(data)  # nosec B302
+        except (EOFError, ValueError, TypeError):
+            return None
+        if (
+            not isinstance(loaded, tuple)
+            or len(loaded) != 5
+            or loaded[0] != CATALOG_FORMAT
+            or loaded[1] != signature
+            or not all(isinstance(part, dict) for part in loaded[2:])
+        ):
+            return None
+        return cls(loaded[2], loaded[3], loaded[4])
+
+
+_catalog: Optional[TranslationCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def _translation_files() -> List[str]:
+    try:
+        names = os.listdir(TRANSLATIONS_DIR)
+    except OSError as e:
+        logger.error(f"Cannot list translations in {TRANSLATIONS_DIR}: {e}")
+        return []
+    return sorted(n for n in names if n.endswith(".json") and n != "lang_map.json")
+
+
+def _source_signature(file_names: List[str]) -> Tuple[Any, ...]:
+    """(name, SHA-256 of the contents) of every translation file."""
+    signature = []
+    for name in file_names:
+        try:
+            with open(os.path.join(TRANSLATIONS_DIR, name), "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            continue
+        signature.append((name, digest))
+    return tuple(signature)
+
+
+def _catalog_path() -> Optional[str]:
+    """Where the compiled catalog is cached; None before the config is loaded."""
+    cache_dir = CONFIG.get("paths", {}).get("cache")
+    return os.path.join(cache_dir, CATALOG_FILENAME) if cache_dir else None
+
+
+def _read_languages(file_names: List[str]) -> Dict[str, Dict[str, Any]]:
+    languages: Dict[str, Dict[str, Any]] = {}
+    for name in file_names:
+        try:
+            with open(os.path.join(TRANSLATIONS_DIR, name), "r", encoding="utf-8-sig") as f:
+                languages[name[: -len(".json")]] = json.load(f)
         except Exception as e:
-            logger.error(f"Failed to load translation {lang_code}: {e}")
-            return {}
+            logger.error(f"Failed to load translation {name}: {e}")
+    return languages
 
-    # Always load English as the fallback
-    base_translations: Dict[str, Any] = load_json("en")
-    merged_translations: Dict[str, Any] = base_translations.copy()
 
-    # Overlay the target language on top of English
-    if _current_lang_code != "en":
-        target_translations: Dict[str, Any] = load_json(_current_lang_code)
-        merged_translations.update(target_translations)
+def compile_catalog(write: bool = True) -> TranslationCatalog:
+    """
+    Loads the compiled catalog if it matches the JSON files on disk,
+    otherwise compiles it from them and (if write) stores it for next time.
+    Writing is best effort.
+    """
+    file_names = _translation_files()
+    signature = _source_signature(file_names)
+    catalog_path = _catalog_path()
+    if catalog_path is not None:
+        try:
+            with open(catalog_path, "rb") as f:
+                catalog = TranslationCatalog.from_bytes(f.read(), signature)
+            if catalog is not None:
+                return catalog
+        except OSError:
+            pass
+
+    catalog = TranslationCatalog.compile(_read_languages(file_names))
+    if write and catalog_path is not None:
+        tmp_path = f"{catalog_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(catalog_path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(catalog.to_bytes(signature))
+            os.replace(tmp_path, catalog_path)
+        except OSError as e:
+            logger.debug(f"Translation catalog not cached ({e}).")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    return catalog
+
+
+def get_catalog() -> TranslationCatalog:
+    """The process-wide catalog, compiled or loaded on first use."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = compile_catalog()
+    return _catalog
+
+
+def reload_catalog() -> None:
+    """Drops the in-memory catalog so edited JSON files are picked up."""
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
+    _load_translations()
+
 
-    _translations = merged_translations
+def _load_translations() -> None:
+    """Points translate() at the current language's messages."""
+    global _translations
+    messages = get_catalog().messages
+    if _current_lang_code not in messages:
+        logger.warning(f"No translation file for language '{_current_lang_code}'")
+    _translations = messages.get(_current_lang_code) or messages.get("en", {})
     logger.info(
         f"Translations loaded for language: '{_current_lang_code}' from {TRANSLATIONS_DIR}"
     )
@@ -86,7 +241,7 @@ def switch_language(lang_code: str) -> bool:
             )
             _current_lang_code = lang_code
             CONFIG["language"] = lang_code
-        _load_translations()  # Reload translations
+        _load_translations()
         return True
     logger.warning(f"Attempted to switch to unsupported language: {lang_code}")
     return False
@@ -97,34 +252,22 @@ def translate(key: str) -> str:
     return _translations.get(key, key)
 
 
-def get_all_translations_for_key(key: str) -> Set[str]:
+def get_all_translations_for_key(key: str) -> FrozenSet[str]:
     """
-    Gets all translated values for a specific key from all .json files.
-    Used for validating combobox/placeholder inputs.
+    Gets all translated values for a specific key across all languages,
+    including the key itself. Used for validating combobox/placeholder inputs.
     """
-    global _translation_key_cache
-    if key in _translation_key_cache:
-        return _translation_key_cache[key]
+    return get_catalog().translations_by_key.get(key) or frozenset((key,))
+
+
+def is_translation_of(text: str, key: str) -> bool:
+    """True if text is key itself or its translation in any language."""
+    return text == key or key in get_catalog().keys_by_translation.get(text, _EMPTY)
 
-    placeholders: Set[str] = set()
-    try:
-        placeholders.add(key)  # Add the key itself as a valid value
-
-        for file_name in os.listdir(TRANSLATIONS_DIR):
-            if file_name.endswith(".json") and file_name != "lang_map.json":
-                file_path: str = os.path.join(TRANSLATIONS_DIR, file_name)
-                try:
-                    with open(file_path, "r", encoding="utf-8-sig") as f:
-                        data: Dict[str, Any] = json.load(f)
-                        if key in data:
-                            placeholders.add(data[key])
-                except Exception as e:
-                    logger.error(f"Failed to parse {file_name} for key '{key}': {e}")
-    except Exception as e:
-        logger.error(f"Failed to build placeholder list for key '{key}': {e}")
 
-    _translation_key_cache[key] = placeholders
-    return placeholders
+def keys_for_translation(text: str) -> FrozenSet[str]:
+    """All keys that text is a translation of, in any language."""
+    return get_catalog().keys_by_translation.get(text, _EMPTY)
 
 
 def get_available_languages() -> List[Dict[str, str]]:
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Deferred imports and the startup import-time budget.
+
+Heavy modules (the export backends and, through them, ReportLab) are only
+needed once the user exports something. lazy_callable() hands out a
+stand-in for a function that imports its module on the first call, and
+timed_import() logs and records how long each import took.
+
+Import times recorded at startup (the "PERF: ... imported in" blocks of
+main_window) and by lazy loads end up in one table; log_import_budget()
+reports it against the configured budget once the window is up.
+"""
+
+import functools
+import importlib
+import logging
+import sys
+import threading
+import time
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IMPORT_BUDGET_SECONDS: float = 2.0
+# Number of slowest imports named in the budget report.
+IMPORT_REPORT_TOP: int = 5
+
+# name -> (seconds, enclosing import or None)
+_import_times: Dict[str, Tuple[float, Optional[str]]] = {}
+_import_lock = threading.Lock()
+
+
+def record_import_time(
+    name: str, seconds: float, part_of: Optional[str] = None
+) -> None:
+    """
+    Adds one timed import to the budget table and logs it. Imports timed
+    inside another recorded import name it in part_of, so they show up in
+    the report without being counted twice in the total.
+    """
+    with _import_lock:
+        previous = _import_times.get(name, (0.0, part_of))[0]
+        _import_times[name] = (previous + seconds, part_of)
+    logger.info(f"PERF: {name} imported in {seconds:.4f}s")
+
+
+def timed_import(name: str) -> ModuleType:
+    """importlib.import_module() that records first-time import cost."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    # Python's import lock serializes concurrent first imports; holding our
+    # own lock here as well could deadlock against it.
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    record_import_time(name, time.perf_counter() - start)
+    return module
+
+
+class _LazyCallable:
+    """Stands in for module.attr and imports the module on the first call."""
+
+    def __init__(self, module: str, attr: str) -> None:
+        self._module = module
+        self._attr = attr
+        self._target: Optional[Callable[..., Any]] = None
+        self.__name__ = attr
+        self.__qualname__ = attr
+
+    def resolve(self) -> Callable[..., Any]:
+        if self._target is None:
+            target = getattr(timed_import(self._module), self._attr)
+            functools.update_wrapper(self, target)
+            self._target = target
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<lazy {self._module}.{self._attr} ({state})>"
+
+
+def lazy_callable(module: str, attr: str) -> Callable[..., Any]:
+    return _LazyCallable(module, attr)
+
+
+def import_times() -> List[Tuple[str, float]]:
+    """Recorded imports, slowest first."""
+    with _import_lock:
+        times = [(name, seconds) for name, (seconds, _) in _import_times.items()]
+    return sorted(times, key=lambda item: item[1], reverse=True)
+
+
+def log_import_budget(budget_seconds: float = DEFAULT_IMPORT_BUDGET_SECONDS) -> float:
+    """
+    Logs the total recorded import time against the budget, naming the
+    slowest imports. Returns the total.
+    """
+    times = import_times()
+    with _import_lock:
+        total = sum(
+            seconds for seconds, part_of in _import_times.values() if part_of is None
+        )
+    slowest = ", ".join(f"{name} {seconds:.3f}s" for name, seconds in times[:IMPORT_REPORT_TOP])
+    message = (
+        f"PERF: Import budget: {total:.3f}s of {budget_seconds:.3f}s "
+        f"across {len(times)} imports. Slowest: {slowest or 'none'}"
+    )
+    if total > budget_seconds:
+        logger.warning(message)
+    else:
+        logger.info(message)
+    return total
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Provides an in-process metrics registry: counters, gauges and latency
+histograms keyed by function or stage name.
+
+Histograms use HDR-style log-linear buckets: every power-of-two range of
+microseconds is split into 2**SUB_BUCKET_BITS equal buckets, so a recorded
+latency costs one dict increment, memory is bounded no matter how many
+values are recorded, and percentiles are accurate to about 3%.
+
+Recording is switched off with MetricsRegistry.enabled; the timed()
+decorator then costs a single attribute check per call. The registry is
+configured from the 'performance' config keys (apply_settings) and its
+snapshot is shown in the Performance panel of the settings tab and can be
+dumped to JSON.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, ParamSpec, TypeVar
+
+from src.config.config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# 2**5 sub-buckets per power of two: at most 1/32 relative bucket width.
+SUB_BUCKET_BITS: int = 5
+SUB_BUCKET_COUNT: int = 1 << SUB_BUCKET_BITS
+PERCENTILES: tuple = (50.0, 95.0, 99.0)
+DEFAULT_RESOURCE_SAMPLE_EVERY: int = 50
+
+
+def _bucket_index(value: int) -> int:
+    """Log-linear bucket of a non-negative integer value."""
+    if value < SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - 1 - SUB_BUCKET_BITS
+    return (shift + 1) * SUB_BUCKET_COUNT + (value >> shift) - SUB_BUCKET_COUNT
+
+
+def _bucket_bounds(index: int) -> tuple:
+    """Lowest and highest value that fall into a bucket."""
+    if index < SUB_BUCKET_COUNT:
+        return index, index
+    shift = index // SUB_BUCKET_COUNT - 1
+    mantissa = index - shift * SUB_BUCKET_COUNT
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+class Counter:
+    """A monotonically increasing count."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def reset(self) -> None:
+        with self._lock:
+            self.value = 0
+
+
+class Gauge:
+    """The last value set, e.g. the current RSS of the process."""
+
+    def __init__(self) -> None:
+        self.value: float = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def reset(self) -> None:
+        self.value = 0.0
+
+
+class Histogram:
+    """A latency distribution with log-linear microsecond buckets."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    def record(self, seconds: float) -> None:
+        self.record_us(int(seconds * 1_000_000))
+
+    def record_us(self, value: int) -> None:
+        value = max(0, value)
+        index = _bucket_index(value)
+        with self._lock:
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+            if self.count == 0 or value < self.min_us:
+                self.min_us = value
+            if value > self.max_us:
+                self.max_us = value
+            self.count += 1
+            self.total_us += value
+
+    def percentile(self, percent: float) -> float:
+        """Value (in seconds) below which percent% of the recordings fall."""
+        with self._lock:
+            if self.count == 0:
+                return 0.0
+            rank = max(1, int(self.count * percent / 100.0 + 0.999999))
+            seen = 0
+            for index in sorted(self._buckets):
+                seen += self._buckets[index]
+                if seen >= rank:
+                    _, high = _bucket_bounds(index)
+                    return min(max(high, self.min_us), self.max_us) / 1_000_000
+            return self.max_us / 1_000_000
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Count, sum, mean, min, max and percentiles, in seconds."""
+        with self._lock:
+            count, total, low, high = self.count, self.total_us, self.min_us, self.max_us
+        stats: Dict[str, Any] = {
+            "count": count,
+            "sum": total / 1_000_000,
+            "mean": total / count / 1_000_000 if count else 0.0,
+            "min": low / 1_000_000,
+            "max": high / 1_000_000,
+        }
+        for percent in PERCENTILES:
+            stats[f"p{percent:g}"] = self.percentile(percent)
+        return stats
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+            self.count = self.total_us = self.min_us = self.max_us = 0
+
+
+class MetricsRegistry:
+    """
+    Named counters, gauges and histograms. Metrics are created on first use
+    and kept for the lifetime of the registry (reset() zeroes them in place),
+    so callers may hold on to the objects they get.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.resource_sample_every = DEFAULT_RESOURCE_SAMPLE_EVERY
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Counter] = {}
+        self._gauges: Dict[str, Gauge] = {}
+        self._histograms: Dict[str, Histogram] = {}
+
+    def _get(self, store: Dict[str, Any], name: str, factory: Callable[[], Any]) -> Any:
+        metric = store.get(name)
+        if metric is None:
+            with self._lock:
+                metric = store.setdefault(name, factory())
+        return metric
+
+    def counter(self, name: str) -> Counter:
+        return self._get(self._counters, name, Counter)
+
+    def gauge(self, name: str) -> Gauge:
+        return self._get(self._gauges, name, Gauge)
+
+    def histogram(self, name: str) -> Histogram:
+        return self._get(self._histograms, name, Histogram)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Records the duration of the with-block into histogram name."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.histogram(name).record(time.perf_counter() - start)
+
+    def apply_settings(self, perf_config: Dict[str, Any]) -> None:
+        """Applies the 'performance' config keys for metrics collection."""
+        try:
+            self.enabled = bool(perf_config.get("metrics_enabled", True))
+            self.resource_sample_every = max(
+                0,
+                int(
+                    perf_config.get(
+                        "metrics_resource_sample_every", DEFAULT_RESOURCE_SAMPLE_EVERY
+                    )
+                ),
+            )
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Invalid metrics settings: {e}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All metrics as plain data; histogram values are in seconds."""
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            histograms = dict(self._histograms)
+        return {
+            "timestamp": time.time(),
+            "enabled": self.enabled,
+            "counters": {name: c.value for name, c in sorted(counters.items())},
+            "gauges": {name: g.value for name, g in sorted(gauges.items())},
+            "histograms": {
+                name: h.snapshot() for name, h in sorted(histograms.items()) if h.count
+            },
+        }
+
+    def dump_json(self, path: str) -> None:
+        """Writes snapshot() to path."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2, default=str)
+        logger.info(f"Metrics written to {path}")
+
+    def reset(self) -> None:
+        """Zeroes every metric; the metric objects stay valid."""
+        with self._lock:
+            metrics: List[Any] = [
+                *self._counters.values(),
+                *self._gauges.values(),
+                *self._histograms.values(),
+            ]
+        for metric in metrics:
+            metric.reset()
+
+
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Returns the application-wide MetricsRegistry instance."""
+    global _registry
+    if _registry is not None:
+        return _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = MetricsRegistry()
+            _registry.apply_settings(CONFIG.get("performance", {}))
+        return _registry
+
+
+def timed(
+    name: Optional[str] = None, registry: Optional[MetricsRegistry] = None
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Decorator recording each call's wall time into a histogram named name
+    (default: the function's qualified name). Exceptions are counted in
+    '<name>.errors' and re-raised.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        metric_name = name or func.__qualname__
+        metrics: List[Any] = []
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            reg = registry or get_metrics_registry()
+            if not reg.enabled:
+                return func(*args, **kwargs)
+            if not metrics:
+                metrics.extend((reg.histogram(metric_name), reg.counter(f"{metric_name}.errors")))
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                metrics[1].inc()
+                raise
+            finally:
+                metrics[0].record(time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Provides a shared supervisor for the external processes managed by the
+application (kaspad and the ks_bridge instances).
+
+The node and bridge controllers used to scan the full process table with
+psutil.process_iter every time they needed to know whether an external
+kaspad.exe / ks_bridge.exe was running. This module centralizes that work:
+
+1. Managed children are registered by their Popen handle (PID), so they
+   are never reported as "external" and need no table scan to be found.
+2. External-process detection is cached with a TTL. A single table scan
+   serves every watched executable name at once; within the TTL, cached
+   PIDs are re-validated with a targeted per-PID lookup instead.
+3. One daemon sampling thread collects CPU%, RSS, open handles, disk I/O
+   and network counters for all managed processes. Samples are kept in a
+   fixed-size ring buffer per process key, so the tabs can chart recent
+   history and export it without re-sampling anything themselves.
+
+psutil has no per-process network byte counters, so each sample records
+the process' open inet connections plus the system-wide byte counters
+(read once per sampling tick and shared by all processes).
+"""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
+
+try:
+    import psutil
+except ImportError:
+    psutil = None  # type: ignore
+
+from src.config.config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_INTERVAL_SECONDS: float = 2.0
+DEFAULT_EXTERNAL_SCAN_TTL_SECONDS: float = 5.0
+# 1800 samples at the default 2s period cover the last hour.
+DEFAULT_HISTORY_SIZE: int = 1800
+MIN_SAMPLE_INTERVAL_SECONDS: float = 0.1
+
+
+@dataclass
+class ProcessSample:
+    """A single resource usage sample of a managed process."""
+
+    key: str
+    pid: int
+    timestamp: float
+    cpu_percent: float
+    rss_bytes: int
+    read_bytes: Optional[int] = None
+    write_bytes: Optional[int] = None
+    num_fds: Optional[int] = None
+    num_connections: Optional[int] = None
+    net_bytes_sent: Optional[int] = None
+    net_bytes_recv: Optional[int] = None
+
+
+class _ManagedProcess:
+    """Book-keeping for one registered child process."""
+
+    def __init__(self, key: str, pid: int, handle: Optional[subprocess.Popen]) -> None:
+        self.key = key
+        self.pid = pid
+        self.handle = handle
+        self.proc: Optional[Any] = None
+        self.latest: Optional[ProcessSample] = None
+        if psutil:
+            try:
+                self.proc = psutil.Process(pid)
+                # Prime cpu_percent(); the first call always returns 0.0.
+                self.proc.cpu_percent(None)
+            except psutil.Error:
+                self.proc = None
+
+    def is_alive(self) -> bool:
+        if self.handle is not None:
+            return self.handle.poll() is None
+        return bool(self.proc and self.proc.is_running())
+
+
+class ProcessSupervisor:
+    """
+    Tracks managed child processes, detects external instances of watched
+    executables, and samples resource usage from a single background thread.
+    """
+
+    def __init__(
+        self,
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL_SECONDS,
+        external_scan_ttl: float = DEFAULT_EXTERNAL_SCAN_TTL_SECONDS,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+    ) -> None:
+        self.sample_interval = max(MIN_SAMPLE_INTERVAL_SECONDS, sample_interval)
+        self.external_scan_ttl = external_scan_ttl
+        self.history_size = max(1, history_size)
+
+        self._lock = threading.RLock()
+        self._managed: Dict[str, _ManagedProcess] = {}
+        self._watched_names: Set[str] = set()
+        self._external: Dict[str, List[int]] = {}
+        self._external_scan_time: float = 0.0
+        # History outlives registration so a stopped process can still be
+        # inspected and exported; it is reset when the key is re-registered.
+        self._history: Dict[str, Deque[ProcessSample]] = {}
+
+        self._stop_event = threading.Event()
+        self._sampler_thread: Optional[threading.Thread] = None
+
+        self.full_scans: int = 0
+        self.cached_lookups: int = 0
+
+    # --- Managed processes ---
+
+    def register(
+        self, key: str, process: Union[subprocess.Popen, int]
+    ) -> None:
+        """Registers a managed child process under a stable key (e.g. 'kaspad')."""
+        if isinstance(process, int):
+            pid, handle = process, None
+        else:
+            pid, handle = process.pid, process
+
+        with self._lock:
+            self._managed[key] = _ManagedProcess(key, pid, handle)
+            self._history[key] = deque(maxlen=self.history_size)
+            # A newly managed PID may have been cached as "external".
+            for pids in self._external.values():
+                if pid in pids:
+                    pids.remove(pid)
+        logger.debug(f"Process supervisor: registered '{key}' (PID: {pid}).")
+        self._ensure_sampler_running()
+
+    def unregister(self, key: str) -> None:
+        """Forgets a managed process (e.g. after it exited)."""
+        with self._lock:
+            managed = self._managed.pop(key, None)
+        if managed:
+            logger.debug(
+                f"Process supervisor: unregistered '{key}' (PID: {managed.pid})."
+            )
+
+    def managed_pids(self) -> Set[int]:
+        """Returns the PIDs of all registered processes."""
+        with self._lock:
+            return {m.pid for m in self._managed.values()}
+
+    def get_latest_sample(self, key: str) -> Optional[ProcessSample]:
+        """Returns the most recent resource sample for a managed process."""
+        with self._lock:
+            managed = self._managed.get(key)
+            return managed.latest if managed else None
+
+    def get_history(self, key: str) -> List[ProcessSample]:
+        """Returns the buffered samples for a process key, oldest first."""
+        with self._lock:
+            return list(self._history.get(key, ()))
+
+    def clear_history(self, key: str) -> None:
+        """Discards the buffered samples for a process key."""
+        with self._lock:
+            self._history.pop(key, None)
+
+    def apply_settings(self, perf_config: Dict[str, Any]) -> None:
+        """Applies the 'performance' config keys for sampling and history."""
+        try:
+            self.set_sample_interval(
+                float(
+                    perf_config.get(
+                        "process_sample_interval_seconds",
+                        DEFAULT_SAMPLE_INTERVAL_SECONDS,
+                    )
+                )
+            )
+            self.set_history_size(
+                int(perf_config.get("process_history_size", DEFAULT_HISTORY_SIZE))
+            )
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Invalid process sampling settings: {e}")
+
+    def set_sample_interval(self, seconds: float) -> None:
+        """Changes the sampling period; takes effect on the next tick."""
+        self.sample_interval = max(MIN_SAMPLE_INTERVAL_SECONDS, float(seconds))
+
+    def set_history_size(self, size: int) -> None:
+        """Resizes every ring buffer, keeping the most recent samples."""
+        size = max(1, int(size))
+        with self._lock:
+            self.history_size = size
+            for key, history in self._history.items():
+                if history.maxlen != size:
+                    self._history[key] = deque(history, maxlen=size)
+
+    # --- External process detection ---
+
+    def find_external(self, exe_name: str, force_refresh: bool = False) -> List[int]:
+        """
+        Returns the PIDs of running processes named exe_name (case-insensitive)
+        that are not managed by this supervisor.
+        """
+        name = exe_name.lower()
+        with self._lock:
+            is_new_name = name not in self._watched_names
+            self._watched_names.add(name)
+            expired = (
+                time.monotonic() - self._external_scan_time >= self.external_scan_ttl
+            )
+            if force_refresh or is_new_name or expired:
+                self._scan_external_locked()
+            else:
+                self._revalidate_cached_locked(name)
+                self.cached_lookups += 1
+
+            managed = {m.pid for m in self._managed.values()}
+            return [pid for pid in self._external.get(name, []) if pid not in managed]
+
+    def invalidate_external_cache(self) -> None:
+        """Forces the next find_external() call to rescan the process table."""
+        with self._lock:
+            self._external_scan_time = 0.0
+
+    def _scan_external_locked(self) -> None:
+        """One process-table pass that serves every watched executable name."""
+        found: Dict[str, List[int]] = {name: [] for name in self._watched_names}
+        if psutil:
+            try:
+                for proc in psutil.process_iter(["name"]):
+                    proc_name = (proc.info.get("name") or "").lower()
+                    if proc_name in found:
+                        found[proc_name].append(proc.pid)
+            except Exception as e:
+                logger.warning(f"Failed to scan for external processes: {e}")
+        self._external = found
+        self._external_scan_time = time.monotonic()
+        self.full_scans += 1
+
+    def _revalidate_cached_locked(self, name: str) -> None:
+        """Drops cached PIDs that exited or were reused by another program."""
+        if not psutil:
+            return
+        still_running: List[int] = []
+        for pid in self._external.get(name, []):
+            try:
+                if psutil.Process(pid).name().lower() == name:
+                    still_running.append(pid)
+            except psutil.Error:
+                continue
+        self._external[name] = still_running
+
+    # --- Sampling ---
+
+    def _ensure_sampler_running(self) -> None:
+        if not psutil:
+            return
+        with self._lock:
+            if self._sampler_thread and self._sampler_thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._sampler_thread = threading.Thread(
+                target=self._sampler_loop, daemon=True, name="ProcessSampler"
+            )
+            self._sampler_thread.start()
+
+    def _sampler_loop(self) -> None:
+        logger.info("Process sampler thread started.")
+        while not self._stop_event.wait(self.sample_interval):
+            with self._lock:
+                managed_list = list(self._managed.values())
+            if not managed_list:
+                continue
+            net_counters = self._read_net_counters()
+            for managed in managed_list:
+                sample = self._sample_process(managed, net_counters)
+                if sample is not None:
+                    with self._lock:
+                        managed.latest = sample
+                        # Skip keys that were unregistered and cleared meanwhile.
+                        history = self._history.get(managed.key)
+                        if history is not None and self._managed.get(managed.key) is managed:
+                            history.append(sample)
+        logger.info("Process sampler thread stopped.")
+
+    @staticmethod
+    def _read_net_counters() -> Tuple[Optional[int], Optional[int]]:
+        try:
+            net = psutil.net_io_counters()
+            return net.bytes_sent, net.bytes_recv
+        except Exception:
+            return None, None
+
+    def _sample_process(
+        self,
+        managed: _ManagedProcess,
+        net_counters: Tuple[Optional[int], Optional[int]] = (None, None),
+    ) -> Optional[ProcessSample]:
+        if managed.proc is None or not managed.is_alive():
+            return None
+        proc = managed.proc
+        try:
+            with proc.oneshot():
+                cpu = proc.cpu_percent(None)
+                rss = proc.memory_info().rss
+                read_bytes = write_bytes = None
+                try:
+                    io = proc.io_counters()
+                    read_bytes, write_bytes = io.read_bytes, io.write_bytes
+                except (AttributeError, psutil.AccessDenied):
+                    # io_counters() is unavailable on macOS.
+                    pass
+                num_fds = None
+                try:
+                    # Windows has handles instead of file descriptors.
+                    if hasattr(proc, "num_handles"):
+                        num_fds = proc.num_handles()
+                    else:
+                        num_fds = proc.num_fds()
+                except psutil.AccessDenied:
+                    pass
+                num_connections = None
+                try:
+                    get_connections = getattr(proc, "net_connections", None) or proc.connections
+                    num_connections = len(get_connections(kind="inet"))
+                except psutil.AccessDenied:
+                    pass
+        except psutil.Error:
+            return None
+        return ProcessSample(
+            key=managed.key,
+            pid=managed.pid,
+            timestamp=time.time(),
+            cpu_percent=cpu,
+            rss_bytes=rss,
+            read_bytes=read_bytes,
+            write_bytes=write_bytes,
+            num_fds=num_fds,
+            num_connections=num_connections,
+            net_bytes_sent=net_counters[0],
+            net_bytes_recv=net_counters[1],
+        )
+
+    def stop(self) -> None:
+        """Stops the sampling thread."""
+        self._stop_event.set()
+        thread = self._sampler_thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=2)
+
+
+def counter_rates(
+    samples: List[ProcessSample], attr: str
+) -> List[Optional[float]]:
+    """
+    Converts a cumulative counter (e.g. 'read_bytes') into per-second rates
+    between consecutive samples. The first sample, missing values and
+    counter resets yield None.
+    """
+    rates: List[Optional[float]] = [None] * len(samples)
+    for i in range(1, len(samples)):
+        prev, cur = samples[i - 1], samples[i]
+        v0, v1 = getattr(prev, attr), getattr(cur, attr)
+        dt = cur.timestamp - prev.timestamp
+        if v0 is None or v1 is None or dt <= 0 or v1 < v0 or prev.pid != cur.pid:
+            continue
+        rates[i] = (v1 - v0) / dt
+    return rates
+
+
+_supervisor: Optional[ProcessSupervisor] = None
+_supervisor_lock = threading.Lock()
+
+
+def get_process_supervisor() -> ProcessSupervisor:
+    """Returns the application-wide ProcessSupervisor instance."""
+    global _supervisor
+    with _supervisor_lock:
+        if _supervisor is None:
+            _supervisor = ProcessSupervisor()
+            _supervisor.apply_settings(CONFIG.get("performance", {}))
+        return _supervisor
@@ -7,13 +7,16 @@ Requires the 'psutil' package.
 """
 
 import functools
+import itertools
 import logging
 import os
 import time
-from typing import Any, Callable, ParamSpec, TypeVar
+from typing import Any, Callable, List, Optional, ParamSpec, Tuple, TypeVar
 
 import psutil
 
+from src.utils.metrics import MetricsRegistry, get_metrics_registry
+
 logger = logging.getLogger(__name__)
 
 # Type variables for precise decorator typing
@@ -46,65 +49,88 @@ def _format_bytes(b: int) -> str:
         return "N/A"
 
 
+def _resource_usage() -> Tuple[int, Optional[Any]]:
+    """RSS and CPU times of this process, or (0, None) if unavailable."""
+    if PSUTIL_AVAILABLE and _process:
+        try:
+            return _process.memory_info().rss, _process.cpu_times()
+        except psutil.Error as e:
+            logger.warning(f"psutil error: {e}")
+    return 0, None
+
+
 def log_performance(func: Callable[P, R]) -> Callable[P, R]:
     """
-    Decorator to log wall time, CPU time, and memory usage of a function.
-    Logs at DEBUG level.
+    Decorator recording the wall time of every call into the metrics
+    registry under the function's qualified name.
+
+    CPU time and memory are read with psutil only on every Nth call
+    (performance.metrics_resource_sample_every, 0 = never), because those
+    reads cost more than most of the decorated functions. Sampled calls
+    are logged at DEBUG level. With metrics disabled the function is
+    called directly.
     """
+    name = func.__qualname__
+    calls = itertools.count(1)
+    metrics: List[Any] = []
 
     @functools.wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        # 1. Get "before" stats
-        mem_before = 0
-        cpu_before = None
-        if PSUTIL_AVAILABLE and _process:
-            try:
-                mem_before = _process.memory_info().rss
-                cpu_before = _process.cpu_times()
-            except psutil.Error as e:
-                logger.warning(f"psutil error before {func.__name__}: {e}")
+        registry = get_metrics_registry()
+        if not registry.enabled:
+            return func(*args, **kwargs)
+        if not metrics:
+            metrics.extend((registry.histogram(name), registry.counter(f"{name}.errors")))
+
+        every = registry.resource_sample_every
+        sampled = every > 0 and (next(calls) - 1) % every == 0
+        if sampled:
+            mem_before, cpu_before = _resource_usage()
 
         start_time = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            metrics[1].inc()
+            raise
+        finally:
+            wall_elapsed = time.perf_counter() - start_time
+            metrics[0].record(wall_elapsed)
+            if sampled:
+                _record_resource_sample(
+                    registry, name, wall_elapsed, mem_before, cpu_before
+                )
 
-        # 2. Run the function
-        result = func(*args, **kwargs)
-
-        # 3. Get "after" stats
-        end_time = time.perf_counter()
-        mem_after = 0
-        cpu_after = None
-        if PSUTIL_AVAILABLE and _process:
-            try:
-                mem_after = _process.memory_info().rss
-                cpu_after = _process.cpu_times()
-            except psutil.Error as e:
-                logger.warning(f"psutil error after {func.__name__}: {e}")
-
-        # 4. Calculate deltas
-        wall_elapsed = end_time - start_time
-
-        cpu_elapsed_str = "N/A"
-        mem_after_str = "N/A"
-        mem_delta_str = "N/A"
-
-        if PSUTIL_AVAILABLE and cpu_before is not None and cpu_after is not None:
-            cpu_elapsed = (cpu_after.user - cpu_before.user) + (
-                cpu_after.system - cpu_before.system
-            )
-            cpu_elapsed_str = f"{cpu_elapsed:.4f}s (CPU)"
-
-        if PSUTIL_AVAILABLE and mem_after > 0:
-            mem_delta = mem_after - mem_before
-            mem_after_str = _format_bytes(mem_after)
-            mem_delta_str = _format_bytes(mem_delta)
-
-        # 5. Log the result
-        logger.debug(
-            f"PERF: {func.__name__} | "
-            f"Time: {wall_elapsed:.4f}s (Wall), {cpu_elapsed_str} | "
-            f"Mem: {mem_after_str} (RSS), Delta: {mem_delta_str}"
-        )
+    return wrapper
 
-        return result
 
-    return wrapper
+def _record_resource_sample(
+    registry: MetricsRegistry,
+    name: str,
+    wall_elapsed: float,
+    mem_before: int,
+    cpu_before: Optional[Any],
+) -> None:
+    mem_after, cpu_after = _resource_usage()
+
+    cpu_elapsed_str = "N/A"
+    mem_after_str = "N/A"
+    mem_delta_str = "N/A"
+
+    if cpu_before is not None and cpu_after is not None:
+        cpu_elapsed = (cpu_after.user - cpu_before.user) + (
+            cpu_after.system - cpu_before.system
+        )
+        registry.histogram(f"{name}.cpu").record(cpu_elapsed)
+        cpu_elapsed_str = f"{cpu_elapsed:.4f}s (CPU)"
+
+    if mem_after > 0:
+        registry.gauge("process.rss_bytes").set(mem_after)
+        mem_after_str = _format_bytes(mem_after)
+        mem_delta_str = _format_bytes(mem_after - mem_before)
+
+    logger.debug(
+        f"PERF: {name} | "
+        f"Time: {wall_elapsed:.4f}s (Wall), {cpu_elapsed_str} | "
+        f"Mem: {mem_after_str} (RSS), Delta: {mem_delta_str}"
+    )
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Provides a parallel, resumable HTTP file downloader.
+
+1. The server is probed with a one-byte range request. If it answers with
+   206 Partial Content, the file is split into segments that are fetched
+   concurrently with HTTP Range requests into a preallocated file.
+   Otherwise the probe response itself is streamed sequentially.
+2. Progress is persisted to a small JSON sidecar ("<path>.state"), so a
+   cancelled or interrupted download resumes where it left off, provided
+   the remote file still has the same size and ETag/Last-Modified.
+3. The SHA-256 digest is computed incrementally while downloading: the
+   contiguous completed prefix of the file is hashed as it grows (read back
+   while still in the OS page cache), so no separate pass is needed at the
+   end. After a resume, the already downloaded prefix is re-hashed first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.errors import DownloadCancelled, DownloadError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONNECTIONS: int = 4
+DEFAULT_CHUNK_SIZE: int = 1024 * 1024
+# Files are not split into segments smaller than this.
+MIN_SEGMENT_SIZE: int = 4 * 1024 * 1024
+SEGMENT_RETRIES: int = 3
+STATE_SAVE_INTERVAL_SECONDS: float = 2.0
+STATE_SUFFIX: str = ".state"
+
+_CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+
+
+@dataclass
+class _Segment:
+    start: int
+    end: int  # Inclusive, as in HTTP Range headers.
+    done: int = 0
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+    @property
+    def complete(self) -> bool:
+        return self.done >= self.length
+
+
+class RangeDownloader:
+    """
+    Downloads url to dest_path, optionally over several connections.
+
+    download() returns the hex SHA-256 digest of the file. It raises
+    DownloadCancelled if cancel_event is set (the partial file and its
+    state are kept for resuming) and DownloadError on other failures.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        dest_path: str,
+        connections: int = DEFAULT_CONNECTIONS,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        cancel_event: Optional[threading.Event] = None,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+        timeout: float = 60.0,
+        min_segment_size: int = MIN_SEGMENT_SIZE,
+    ) -> None:
+        self.url = url
+        self.dest_path = dest_path
+        self.state_path = dest_path + STATE_SUFFIX
+        self.connections = max(1, connections)
+        self.chunk_size = chunk_size
+        self.cancel_event = cancel_event or threading.Event()
+        self.progress_callback = progress_callback
+        self.timeout = timeout
+        self.min_segment_size = max(1, min_segment_size)
+
+        self.total_size: Optional[int] = None
+        self.resumed_bytes: int = 0
+        self.segments: List[_Segment] = []
+
+        self._lock = threading.Lock()
+        # Set when one segment fails for good, to stop the other workers.
+        self._abort_event = threading.Event()
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=self.connections)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._sha256 = hashlib.sha256()
+        self._hashed_offset = 0
+        self._last_state_save = 0.0
+
+    # --- Public API ---
+
+    def download(self) -> str:
+        try:
+            return self._download()
+        finally:
+            self._session.close()
+
+    def discard_partial(self) -> None:
+        """Removes the partial file and its resume state."""
+        for path in (self.dest_path, self.state_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    # --- Implementation ---
+
+    def _download(self) -> str:
+        self._check_cancelled()
+        try:
+            probe = self._session.get(
+                self.url,
+                headers={"Range": "bytes=0-0"},
+                stream=True,
+                timeout=self.timeout,
+            )
+            probe.raise_for_status()
+        except requests.RequestException as e:
+            raise DownloadError(f"Could not reach {self.url}: {e}") from e
+
+        with probe:
+            match = _CONTENT_RANGE_RE.match(probe.headers.get("Content-Range", ""))
+            if probe.status_code != 206 or not match or match.group(3) == "*":
+                logger.info(
+                    "Server does not support range requests; downloading sequentially."
+                )
+                self.discard_partial()
+                length = probe.headers.get("Content-Length")
+                self.total_size = int(length) if length and length.isdigit() else None
+                return self._download_sequential(probe)
+
+            self.total_size = int(match.group(3))
+            validator = probe.headers.get("ETag") or probe.headers.get(
+                "Last-Modified", ""
+            )
+            # Segments go to the final URL, skipping redirects on every request.
+            segment_url = probe.url
+
+        self._prepare_segments(validator)
+        self._download_segments(segment_url, validator)
+        return self._sha256.hexdigest()
+
+    def _download_sequential(self, response: requests.Response) -> str:
+        downloaded = 0
+        with open(self.dest_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                self._check_cancelled()
+                f.write(chunk)
+                self._sha256.update(chunk)
+                downloaded += len(chunk)
+                self._report_progress(downloaded)
+        if self.total_size is not None and downloaded != self.total_size:
+            raise DownloadError(
+                f"Incomplete download: got {downloaded} of {self.total_size} bytes."
+            )
+        return self._sha256.hexdigest()
+
+    def _prepare_segments(self, validator: str) -> None:
+        """Loads a matching resume state, or plans fresh segments."""
+        state = self._load_state()
+        if (
+            state
+            and state.get("url") == self.url
+            and state.get("size") == self.total_size
+            and state.get("validator") == validator
+            and os.path.exists(self.dest_path)
+            and os.path.getsize(self.dest_path) == self.total_size
+        ):
+            self.segments = [_Segment(**s) for s in state["segments"]]
+            self.resumed_bytes = sum(s.done for s in self.segments)
+            logger.info(
+                f"Resuming download of {self.url} at {self.resumed_bytes}/{self.total_size} bytes."
+            )
+            return
+
+        self.discard_partial()
+        total = self.total_size or 0
+        count = max(1, min(self.connections, total // self.min_segment_size))
+        seg_size = -(-total // count) if total else 0
+        self.segments = [
+            _Segment(start, min(start + seg_size, total) - 1)
+            for start in range(0, total, seg_size or 1)
+        ]
+        # Preallocate so every worker can write at its own offset.
+        with open(self.dest_path, "wb") as f:
+            f.truncate(total)
+        self._save_state(validator)
+
+    def _download_segments(self, url: str, validator: str) -> None:
+        pending = [s for s in self.segments if not s.complete]
+        self._report_progress(self.resumed_bytes)
+        failure: Optional[BaseException] = None
+        with ThreadPoolExecutor(
+            max_workers=max(1, len(pending)), thread_name_prefix="RangeDownload"
+        ) as pool:
+            futures: List[Future] = [
+                pool.submit(self._fetch_segment, url, seg) for seg in pending
+            ]
+            not_done = set(futures)
+            while not_done:
+                done, not_done = wait(
+                    not_done, timeout=0.25, return_when=FIRST_EXCEPTION
+                )
+                for future in done:
+                    if future.exception() is not None and failure is None:
+                        failure = future.exception()
+                        self._abort_event.set()
+                self._advance_hash()
+                self._report_progress(self._downloaded_bytes())
+                if time.monotonic() - self._last_state_save >= STATE_SAVE_INTERVAL_SECONDS:
+                    self._save_state(validator)
+
+        self._save_state(validator)
+        if failure is not None:
+            # The partial file is kept; a retry resumes from the saved state.
+            if isinstance(failure, DownloadError):
+                raise failure
+            raise DownloadError(str(failure)) from failure
+
+        self._advance_hash()
+        if self._hashed_offset != self.total_size:
+            raise DownloadError("Download finished with missing segments.")
+        try:
+            os.remove(self.state_path)
+        except OSError:
+            pass
+
+    def _fetch_segment(self, url: str, seg: _Segment) -> None:
+        attempt = 0
+        while not seg.complete:
+            self._check_cancelled()
+            headers = {"Range": f"bytes={seg.start + seg.done}-{seg.end}"}
+            try:
+                with self._session.get(
+                    url, headers=headers, stream=True, timeout=self.timeout
+                ) as r:
+                    r.raise_for_status()
+                    if r.status_code != 206:
+                        raise DownloadError(
+                            f"Server ignored range request (HTTP {r.status_code})."
+                        )
+                    # Unbuffered, so completed bytes are visible to the hasher.
+                    with open(self.dest_path, "r+b", buffering=0) as f:
+                        f.seek(seg.start + seg.done)
+                        for chunk in r.iter_content(chunk_size=self.chunk_size):
+                            self._check_cancelled()
+                            chunk = chunk[: seg.length - seg.done]
+                            f.write(chunk)
+                            with self._lock:
+                                seg.done += len(chunk)
+                            if seg.complete:
+                                break
+                if not seg.complete:
+                    raise DownloadError("Connection closed before segment was complete.")
+            except (requests.RequestException, DownloadError) as e:
+                if isinstance(e, DownloadCancelled):
+                    raise
+                attempt += 1
+                if attempt > SEGMENT_RETRIES:
+                    raise DownloadError(f"Segment {seg.start}-{seg.end} failed: {e}") from e
+                logger.warning(
+                    f"Segment {seg.start}-{seg.end} interrupted ({e}); retry {attempt}/{SEGMENT_RETRIES}."
+                )
+                time.sleep(min(2**attempt * 0.25, 4.0))
+
+    def _advance_hash(self) -> None:
+        """Hashes the contiguous completed prefix of the file."""
+        with self._lock:
+            prefix_end = 0
+            for seg in self.segments:
+                prefix_end = seg.start + seg.done
+                if not seg.complete:
+                    break
+        if prefix_end <= self._hashed_offset:
+            return
+        with open(self.dest_path, "rb") as f:
+            f.seek(self._hashed_offset)
+            remaining = prefix_end - self._hashed_offset
+            while remaining > 0:
+                block = f.read(min(self.chunk_size, remaining))
+                if not block:
+                    break
+                self._sha256.update(block)
+                remaining -= len(block)
+        self._hashed_offset = prefix_end - remaining
+
+    def _downloaded_bytes(self) -> int:
+        with self._lock:
+            return sum(s.done for s in self.segments)
+
+    def _check_cancelled(self) -> None:
+        if self.cancel_event.is_set():
+            raise DownloadCancelled("Download cancelled by user.")
+        if self._abort_event.is_set():
+            raise DownloadCancelled("Download aborted after a segment failed.")
+
+    def _report_progress(self, downloaded: int) -> None:
+        if self.progress_callback:
+            try:
+                self.progress_callback(downloaded, self.total_size)
+            except Exception as e:
+                logger.debug(f"Download progress callback failed: {e}")
+
+    def _load_state(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_state(self, validator: str) -> None:
+        with self._lock:
+            state = {
+                "url": self.url,
+                "size": self.total_size,
+                "validator": validator,
+                "segments": [asdict(s) for s in self.segments],
+            }
+        tmp_path = self.state_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"Could not save download state: {e}")
+        self._last_state_save = time.monotonic()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Provides a low-rate sampling profiler that can stay on in production.
+
+A daemon thread periodically snapshots the stack of every Python thread
+(the Tk main thread, FetchWorker, DBWriter, LogTailingThread,
+NodeWatchdog, ...) with sys._current_frames() and counts each distinct
+stack. Nothing is installed in the profiled threads, so their code runs
+unchanged between samples.
+
+The sampler holds the GIL while it walks the stacks, so it measures its
+own cost and stretches the interval whenever a sample would take more
+than MAX_OVERHEAD of wall time. Counts are written in the collapsed-stack
+format ("thread;outer;...;inner count" per line) that flamegraph.pl,
+speedscope and inferno read directly. The file in the logs directory is
+rewritten every FLUSH_INTERVAL_SECONDS, so a session that ends in a freeze
+or a kill still leaves a profile behind.
+
+Switched on and off with performance.profiler_enabled (API & Performance
+settings tab); see apply_settings().
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Any, Dict, List, Optional
+
+from src.config.config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SECONDS: float = 0.02
+MIN_INTERVAL_SECONDS: float = 0.005
+# Share of wall time the sampler may spend walking stacks.
+MAX_OVERHEAD: float = 0.01
+FLUSH_INTERVAL_SECONDS: float = 30.0
+MAX_STACK_DEPTH: int = 128
+# Distinct stacks kept; further new stacks are counted as TRUNCATED_STACK.
+MAX_STACKS: int = 50_000
+TRUNCATED_STACK: str = "[truncated]"
+PROFILE_FILENAME_TEMPLATE: str = "profile_{time_str}.collapsed"
+
+
+class SamplingProfiler:
+    """Samples all thread stacks on a background thread and aggregates them."""
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        max_overhead: float = MAX_OVERHEAD,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        self.interval = max(MIN_INTERVAL_SECONDS, interval)
+        self.max_overhead = max_overhead
+        self.flush_interval = flush_interval
+        self.output_path: Optional[str] = None
+
+        self._lock = threading.Lock()
+        self._stacks: Counter[str] = Counter()
+        self._labels: Dict[CodeType, str] = {}
+        self.samples = 0
+        self._busy_seconds = 0.0
+        self._started_at = 0.0
+        self._stopped_at: Optional[float] = None
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, output_dir: str) -> str:
+        """
+        Starts sampling into a new file in output_dir and returns its path.
+        Does nothing (and returns the current path) if already running.
+        """
+        if self.is_running and self.output_path:
+            return self.output_path
+        os.makedirs(output_dir, exist_ok=True)
+        time_str = time.strftime("%Y-%m-%d_%H%M%S")
+        self.output_path = os.path.join(
+            output_dir, PROFILE_FILENAME_TEMPLATE.format(time_str=time_str)
+        )
+        with self._lock:
+            self._stacks.clear()
+            self.samples = 0
+            self._busy_seconds = 0.0
+        self._started_at = time.perf_counter()
+        self._stopped_at = None
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._sampler_loop, daemon=True, name="StackSampler"
+        )
+        self._thread.start()
+        logger.info(f"Sampling profiler started, writing to {self.output_path}")
+        return self.output_path
+
+    def stop(self) -> Optional[str]:
+        """Stops sampling, writes the profile and returns its path."""
+        thread = self._thread
+        if thread is None:
+            return self.output_path
+        self._stop_event.set()
+        if thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=2)
+        self._thread = None
+        self._stopped_at = time.perf_counter()
+        self.flush()
+        logger.info(f"Sampling profiler stopped. {self.stats()}")
+        return self.output_path
+
+    def _sampler_loop(self) -> None:
+        own_ident = threading.get_ident()
+        next_flush = time.monotonic() + self.flush_interval
+        wait = self.interval
+        while not self._stop_event.wait(wait):
+            start = time.perf_counter()
+            self.sample_once(exclude=own_ident)
+            cost = time.perf_counter() - start
+            self._busy_seconds += cost
+            # Keep cost / (cost + wait) at or below max_overhead.
+            wait = max(self.interval, cost * (1.0 / self.max_overhead - 1.0))
+            if time.monotonic() >= next_flush:
+                self.flush()
+                next_flush = time.monotonic() + self.flush_interval
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = os.path.basename(code.co_filename)
+            # ';' separates frames and ' ' the count in the collapsed format.
+            label = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+            label = label.replace(";", ":").replace(" ", "_")
+            self._labels[code] = label
+        return label
+
+    def _collapse(self, thread_name: str, frame: Optional[FrameType]) -> str:
+        frames: List[str] = []
+        while frame is not None and len(frames) < MAX_STACK_DEPTH:
+            frames.append(self._label(frame.f_code))
+            frame = frame.f_back
+        frames.append(thread_name.replace(";", ":").replace(" ", "_"))
+        return ";".join(reversed(frames))
+
+    def sample_once(self, exclude: Optional[int] = None) -> None:
+        """Records one stack per live thread (except the exclude ident)."""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        frames = sys._current_frames()
+        stacks = [
+            self._collapse(names.get(ident, f"Thread-{ident}"), frame)
+            for ident, frame in frames.items()
+            if ident != exclude
+        ]
+        del frames
+        with self._lock:
+            for stack in stacks:
+                if stack in self._stacks or len(self._stacks) < MAX_STACKS:
+                    self._stacks[stack] += 1
+                else:
+                    self._stacks[TRUNCATED_STACK] += 1
+            self.samples += 1
+
+    def collapsed(self) -> Dict[str, int]:
+        """The aggregated stacks and their sample counts."""
+        with self._lock:
+            return dict(self._stacks)
+
+    def write(self, path: str) -> None:
+        """Writes the collapsed stacks to path (replacing it atomically)."""
+        lines = [f"{stack} {count}\n" for stack, count in sorted(self.collapsed().items())]
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+        os.replace(tmp_path, path)
+
+    def flush(self) -> None:
+        """Writes the profile to output_path; errors are logged, not raised."""
+        if not self.output_path:
+            return
+        try:
+            self.write(self.output_path)
+        except OSError as e:
+            logger.error(f"Could not write profile to {self.output_path}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Sample count, distinct stacks and the measured overhead (0..1)."""
+        end = self._stopped_at if self._stopped_at is not None else time.perf_counter()
+        elapsed = end - self._started_at if self._started_at else 0.0
+        with self._lock:
+            return {
+                "running": self.is_running,
+                "samples": self.samples,
+                "stacks": len(self._stacks),
+                "overhead": self._busy_seconds / elapsed if elapsed > 0 else 0.0,
+                "path": self.output_path,
+            }
+
+    def apply_settings(self, perf_config: Dict[str, Any]) -> None:
+        """Starts or stops sampling according to the 'performance' config keys."""
+        try:
+            interval_ms = float(
+                perf_config.get("profiler_interval_ms", DEFAULT_INTERVAL_SECONDS * 1000)
+            )
+            self.interval = max(MIN_INTERVAL_SECONDS, interval_ms / 1000)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Invalid profiler settings: {e}")
+        if perf_config.get("profiler_enabled", False):
+            self.start(CONFIG["paths"]["log"])
+        elif self.is_running:
+            self.stop()
+
+
+_profiler: Optional[SamplingProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_sampling_profiler() -> SamplingProfiler:
+    """Returns the application-wide SamplingProfiler instance."""
+    global _profiler
+    with _profiler_lock:
+        if _profiler is None:
+            _profiler = SamplingProfiler()
+        return _profiler
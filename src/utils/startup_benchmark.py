@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Cold-start benchmark for KaspaGateway.
+
+Starts the application repeatedly with --startup-trace and
+--exit-when-interactive, then reports time-to-window and
+time-to-interactive measured from process spawn:
+
+    python -m src.utils.startup_benchmark --runs 10 --output results.json
+
+Every run gets a fresh user data directory unless --user-data-path is given,
+in which case the runs share it (warm start: existing databases, config and
+cached names). On Linux without a display the app is wrapped in xvfb-run.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.utils.startup_trace import MARK_INTERACTIVE, MARK_WINDOW_SHOWN
+
+DEFAULT_RUNS = 5
+RUN_TIMEOUT_SECONDS = 180
+METRICS = ("time_to_window", "time_to_interactive")
+
+
+def _app_command(user_data_path: str, trace_path: str) -> List[str]:
+    command = [
+        sys.executable,
+        "-m",
+        "src.main",
+        "--user-data-path",
+        user_data_path,
+        "--startup-trace",
+        trace_path,
+        "--exit-when-interactive",
+    ]
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        xvfb_run = shutil.which("xvfb-run")
+        if xvfb_run is None:
+            raise RuntimeError("No DISPLAY is set and xvfb-run is not installed.")
+        command = [xvfb_run, "-a"] + command
+    return command
+
+
+def run_once(user_data_path: Optional[str] = None) -> Dict[str, Any]:
+    """Starts the app once and returns its startup milestones in seconds."""
+    with tempfile.TemporaryDirectory(prefix="kg-startup-") as tmp:
+        data_path = user_data_path or os.path.join(tmp, "data")
+        trace_path = os.path.join(tmp, "trace.json")
+        spawned_at = time.time()
+        result = subprocess.run(
+            _app_command(data_path, trace_path),
+            capture_output=True,
+            text=True,
+            timeout=RUN_TIMEOUT_SECONDS,
+        )
+        wall = time.time() - spawned_at
+        if not os.path.exists(trace_path):
+            raise RuntimeError(
+                f"The app exited with code {result.returncode} without writing "
+                f"a startup trace:\n{result.stderr[-2000:]}"
+            )
+        with open(trace_path, "r", encoding="utf-8") as f:
+            trace = json.load(f)
+    return measure(trace, spawned_at, wall)
+
+
+def measure(trace: Dict[str, Any], spawned_at: float, wall: float) -> Dict[str, Any]:
+    """Converts a trace's marks into seconds since the process was spawned."""
+    other = trace.get("otherData", {})
+    offset = other.get("origin_epoch", spawned_at) - spawned_at
+    marks = other.get("marks", {})
+    run: Dict[str, Any] = {"process_wall": wall}
+    for metric, mark in zip(METRICS, (MARK_WINDOW_SHOWN, MARK_INTERACTIVE)):
+        run[metric] = offset + marks[mark] if mark in marks else None
+    return run
+
+
+def summarize(runs: Sequence[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """min / median / p95 / max for each metric across runs."""
+    summary: Dict[str, Dict[str, float]] = {}
+    for metric in METRICS:
+        values = sorted(run[metric] for run in runs if run.get(metric) is not None)
+        if not values:
+            continue
+        p95_index = min(len(values) - 1, round(0.95 * (len(values) - 1)))
+        summary[metric] = {
+            "min": values[0],
+            "median": statistics.median(values),
+            "p95": values[p95_index],
+            "max": values[-1],
+        }
+    return summary
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="KaspaGateway cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument(
+        "--user-data-path",
+        default=None,
+        help="Reuse this data directory for every run (warm start).",
+    )
+    parser.add_argument("--output", default=None, help="Write the results as JSON.")
+    options = parser.parse_args(argv)
+
+    runs = []
+    for index in range(options.runs):
+        run = run_once(options.user_data_path)
+        runs.append(run)
+        print(
+            f"run {index + 1}/{options.runs}: "
+            + ", ".join(
+                f"{metric} {run[metric]:.3f}s" if run[metric] is not None else f"{metric} n/a"
+                for metric in METRICS
+            )
+        )
+
+    summary = summarize(runs)
+    for metric, stats in summary.items():
+        print(
+            f"{metric}: "
+            + ", ".join(f"{name} {value:.3f}s" for name, value in stats.items())
+        )
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as f:
+            json.dump({"runs": runs, "summary": summary}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Startup critical-path tracing.
+
+startup_tracer records nested spans from main() through KaspaApp and
+MainWindow.deferred_initialization, on whichever thread they run, plus
+instant marks for the two milestones we benchmark:
+
+- "window_shown": the main window has been mapped on screen.
+- "interactive": deferred initialization is done and the event loop is idle.
+
+Recording stops at "interactive", so the tracer costs nothing afterwards.
+write() saves the events in the Chrome trace format, which chrome://tracing
+and https://ui.perfetto.dev open directly.
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+MARK_WINDOW_SHOWN = "window_shown"
+MARK_INTERACTIVE = "interactive"
+
+# Safety cap: startup records a few hundred events at most.
+MAX_TRACE_EVENTS = 20000
+# Number of slowest spans named in the startup summary.
+SUMMARY_TOP_SPANS = 5
+
+
+class StartupTracer:
+    """Collects startup spans and marks in Chrome trace event form."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._origin = clock()
+        self._origin_epoch = time.time()
+        self._events: List[Dict[str, Any]] = []
+        self._marks: Dict[str, float] = {}
+        self._threads: Dict[int, str] = {}
+        self._recording = True
+        self.output_path: Optional[str] = None
+        self.exit_when_interactive = False
+
+    def configure(
+        self, output_path: Optional[str] = None, exit_when_interactive: bool = False
+    ) -> None:
+        """Sets where finish() writes the trace and whether the app should quit."""
+        self.output_path = output_path
+        self.exit_when_interactive = exit_when_interactive
+
+    @property
+    def recording(self) -> bool:
+        return self._recording
+
+    def _elapsed_us(self) -> float:
+        return (self._clock() - self._origin) * 1_000_000
+
+    def _append(self, event: Dict[str, Any]) -> None:
+        thread = threading.current_thread()
+        event["pid"] = os.getpid()
+        event["tid"] = thread.ident or 0
+        with self._lock:
+            if not self._recording or len(self._events) >= MAX_TRACE_EVENTS:
+                return
+            self._threads.setdefault(event["tid"], thread.name)
+            self._events.append(event)
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[None]:
+        """Times the enclosed block as one span on the current thread."""
+        if not self._recording:
+            yield
+            return
+        start = self._elapsed_us()
+        try:
+            yield
+        finally:
+            event: Dict[str, Any] = {
+                "name": name,
+                "cat": "startup",
+                "ph": "X",
+                "ts": round(start, 1),
+                "dur": round(self._elapsed_us() - start, 1),
+            }
+            if args:
+                event["args"] = {key: str(value) for key, value in args.items()}
+            self._append(event)
+
+    def traced(self, name: Optional[str] = None) -> Callable[[F], F]:
+        """Decorator form of span(); defaults to the function's qualified name."""
+
+        def decorator(func: F) -> F:
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    def mark(self, name: str) -> Optional[float]:
+        """
+        Records a milestone once and returns its time in seconds since the
+        tracer was created, or None if it was already marked or recording
+        has stopped.
+        """
+        with self._lock:
+            if not self._recording or name in self._marks:
+                return None
+        elapsed_us = self._elapsed_us()
+        self._append(
+            {"name": name, "cat": "startup", "ph": "i", "s": "g", "ts": round(elapsed_us, 1)}
+        )
+        with self._lock:
+            self._marks[name] = elapsed_us / 1_000_000
+        logger.info(f"PERF: Startup milestone '{name}' at {elapsed_us / 1_000_000:.4f}s")
+        return elapsed_us / 1_000_000
+
+    def marks(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._marks)
+
+    def spans(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(event) for event in self._events if event["ph"] == "X"]
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        with self._lock:
+            events = [dict(event) for event in self._events]
+            threads = dict(self._threads)
+            marks = dict(self._marks)
+        pid = os.getpid()
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "KaspaGateway"}}
+        ]
+        metadata.extend(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_name}}
+            for tid, thread_name in threads.items()
+        )
+        return {
+            "traceEvents": metadata + events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "origin_epoch": self._origin_epoch,
+                "marks": marks,
+            },
+        }
+
+    def write(self, path: str) -> None:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+        os.replace(tmp_path, path)
+
+    def summary(self) -> str:
+        marks = self.marks()
+        slowest = sorted(self.spans(), key=lambda event: event["dur"], reverse=True)
+        parts = [f"{name} {seconds:.3f}s" for name, seconds in marks.items()]
+        top = ", ".join(
+            f"{event['name']} {event['dur'] / 1_000_000:.3f}s"
+            for event in slowest[:SUMMARY_TOP_SPANS]
+        )
+        return f"PERF: Startup: {', '.join(parts) or 'no milestones'}. Slowest spans: {top or 'none'}"
+
+    def finish(self) -> Optional[str]:
+        """
+        Stops recording, logs the summary and writes the trace if an output
+        path is configured. Returns the path written, if any.
+        """
+        with self._lock:
+            if not self._recording:
+                return None
+            self._recording = False
+        logger.info(self.summary())
+        if not self.output_path:
+            return None
+        try:
+            self.write(self.output_path)
+        except OSError as e:
+            logger.error(f"Could not write startup trace to {self.output_path}: {e}")
+            return None
+        logger.info(f"Startup trace written to {self.output_path}")
+        return self.output_path
+
+
+startup_tracer = StartupTracer()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Seeded generators of realistic synthetic data for benchmarks and tests.
+
+- generate_raw_transactions(): full-transaction JSON as returned by the
+  /addresses/{address}/full-transactions endpoint (with resolved previous
+  outpoints): coinbase payouts, multi-input incoming payments, outgoing
+  payments with change, self-sends and a few unaccepted transactions.
+- transaction_rows_sql() / generate_transaction_rows() /
+  build_transaction_db(): rows of the transactions table. They are
+  generated inside DuckDB from range() and hash(), so even a 10M row file
+  is built without a Python loop.
+- generate_log_lines(): application and kaspad / ks_bridge style log lines.
+
+The same seed always yields the same data.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import duckdb
+import pandas as pd
+
+from src.config.config import SUPPORTED_CURRENCIES
+from src.database.db_schema import initialize_tx_schema
+
+BECH32_CHARSET: str = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+SOMPI_PER_KAS: int = 100_000_000
+# 2024-01-01 00:00:00 UTC, in milliseconds.
+DEFAULT_START_TIME_MS: int = 1_704_067_200_000
+COINBASE_SUBNETWORK_ID: str = "0100000000000000000000000000000000000000"
+NATIVE_SUBNETWORK_ID: str = "0000000000000000000000000000000000000000"
+# Rows inserted per statement when building a transactions file.
+DB_BUILD_BATCH_ROWS: int = 1_000_000
+
+# Share of each transaction kind in generate_raw_transactions().
+TRANSACTION_MIX: Dict[str, float] = {
+    "coinbase": 0.15,
+    "incoming": 0.45,
+    "outgoing": 0.30,
+    "self_send": 0.08,
+    "unaccepted": 0.02,
+}
+
+
+def random_address(rng: random.Random) -> str:
+    """A kaspa: address with a random (not checksummed) bech32 payload."""
+    return "kaspa:q" + "".join(rng.choice(BECH32_CHARSET) for _ in range(60))
+
+
+def _hex(rng: random.Random, length: int = 64) -> str:
+    return "%0*x" % (length, rng.getrandbits(length * 4))
+
+
+def _input(
+    rng: random.Random, txid: str, index: int, address: str, amount: int
+) -> Dict[str, Any]:
+    return {
+        "transaction_id": txid,
+        "index": index,
+        "previous_outpoint_hash": _hex(rng),
+        "previous_outpoint_index": str(rng.randrange(4)),
+        "previous_outpoint_resolved": None,
+        "previous_outpoint_address": address,
+        "previous_outpoint_amount": amount,
+        "signature_script": _hex(rng, 132),
+        "sig_op_count": "1",
+    }
+
+
+def _output(txid: str, index: int, address: str, amount: int) -> Dict[str, Any]:
+    return {
+        "transaction_id": txid,
+        "index": index,
+        "amount": amount,
+        "script_public_key": "20" + address[-60:].encode().hex()[:64] + "ac",
+        "script_public_key_address": address,
+        "script_public_key_type": "pubkey",
+        "accepting_block_hash": None,
+    }
+
+
+def _pick_kind(rng: random.Random) -> str:
+    roll = rng.random()
+    for kind, share in TRANSACTION_MIX.items():
+        if roll < share:
+            return kind
+        roll -= share
+    return "incoming"
+
+
+def generate_raw_transactions(
+    address: str,
+    count: int,
+    seed: int = 0,
+    counterparties: int = 200,
+    start_time_ms: int = DEFAULT_START_TIME_MS,
+) -> List[Dict[str, Any]]:
+    """
+    count full transactions touching address, newest first like the API.
+    Amounts are in sompi (integers); block times in milliseconds.
+    """
+    rng = random.Random(seed)
+    peers = [random_address(rng) for _ in range(max(1, counterparties))]
+    transactions: List[Dict[str, Any]] = []
+    block_time = start_time_ms
+    blue_score = 80_000_000
+    for _ in range(count):
+        block_time += rng.randint(1_000, 600_000)
+        blue_score += rng.randint(10, 6_000)
+        txid = _hex(rng)
+        kind = _pick_kind(rng)
+        inputs: List[Dict[str, Any]] = []
+        outputs: List[Dict[str, Any]] = []
+        amount = rng.randint(1, 5_000) * SOMPI_PER_KAS // rng.choice((1, 10, 100))
+        fee = rng.randint(2_000, 20_000)
+
+        if kind == "coinbase":
+            outputs.append(_output(txid, 0, address, amount))
+            for index in range(1, rng.randint(1, 4)):
+                outputs.append(_output(txid, index, rng.choice(peers), amount))
+        elif kind in ("incoming", "unaccepted"):
+            # Multi-input payment from one or more peers, with change.
+            parts = rng.randint(1, 4)
+            for index in range(parts):
+                inputs.append(
+                    _input(rng, txid, index, rng.choice(peers), amount // parts + fee)
+                )
+            outputs.append(_output(txid, 0, address, amount))
+            outputs.append(_output(txid, 1, inputs[0]["previous_outpoint_address"], fee))
+        elif kind == "outgoing":
+            for index in range(rng.randint(1, 3)):
+                inputs.append(_input(rng, txid, index, address, amount + fee))
+            outputs.append(_output(txid, 0, rng.choice(peers), amount))
+            if rng.random() < 0.5:
+                # Change back to the sender; the rest spend their inputs exactly.
+                outputs.append(_output(txid, 1, address, amount * (len(inputs) - 1) + fee))
+        else:  # self_send: consolidating own UTXOs.
+            for index in range(rng.randint(2, 6)):
+                inputs.append(_input(rng, txid, index, address, amount))
+            outputs.append(_output(txid, 0, address, amount * len(inputs) - fee))
+
+        transactions.append(
+            {
+                "subnetwork_id": (
+                    COINBASE_SUBNETWORK_ID if kind == "coinbase" else NATIVE_SUBNETWORK_ID
+                ),
+                "transaction_id": txid,
+                "hash": _hex(rng),
+                "mass": str(rng.randint(1_000, 10_000)),
+                "payload": _hex(rng, 40) if kind == "coinbase" else None,
+                "block_hash": [_hex(rng) for _ in range(rng.randint(1, 2))],
+                "block_time": block_time,
+                "is_accepted": kind != "unaccepted",
+                "accepting_block_hash": None if kind == "unaccepted" else _hex(rng),
+                "accepting_block_blue_score": None if kind == "unaccepted" else blue_score,
+                "accepting_block_time": None if kind == "unaccepted" else block_time + 1_000,
+                "inputs": inputs,
+                "outputs": outputs,
+            }
+        )
+    transactions.reverse()
+    return transactions
+
+
+def transaction_rows_sql(
+    rows: int,
+    addresses: Sequence[str],
+    seed: int = 0,
+    offset: int = 0,
+    counterparties: int = 5_000,
+) -> str:
+    """
+    SELECT producing rows of the transactions table (txids offset ..
+    offset + rows - 1), spread round-robin over addresses.
+    """
+    address_list = ", ".join("'" + a.replace("'", "''") + "'" for a in addresses)
+    seed = int(seed)
+    value_cols = ", ".join(
+        f'amount * {1.0 + i / 10:.1f} AS "value_{c}"'
+        for i, c in enumerate(SUPPORTED_CURRENCIES)
+    )
+    peer = (
+        "'kaspa:qpeer' || lpad((hash(i, {seed}, {salt}) % {n})::VARCHAR, 55, '0')"
+    )
+    from_peer = peer.format(seed=seed, salt=3, n=int(counterparties))
+    to_peer = peer.format(seed=seed, salt=4, n=int(counterparties))
+    return f"""
+        WITH base AS (
+            SELECT
+                i,
+                ([{address_list}])[1 + i % {len(addresses)}] AS address,
+                hash(i, {seed}, 1) % 100 AS kind_roll,
+                (hash(i, {seed}, 2) % 1000000000000) / {SOMPI_PER_KAS}::DOUBLE AS amount
+            FROM range({int(offset)}, {int(offset) + int(rows)}) t(i)
+        )
+        SELECT
+            md5(i::VARCHAR || '-{seed}') || md5('{seed}-' || i::VARCHAR) AS txid,
+            address,
+            CASE WHEN kind_roll < 60 THEN 'incoming' ELSE 'outgoing' END AS direction,
+            CASE WHEN kind_roll < 10 THEN 'N/A'
+                 WHEN kind_roll < 60 THEN {from_peer}
+                 ELSE address END AS from_address,
+            CASE WHEN kind_roll < 60 THEN address
+                 ELSE {to_peer} || ', ' || address END AS to_address,
+            amount,
+            {value_cols},
+            (80000000 + i * 10)::UBIGINT AS block_height,
+            {DEFAULT_START_TIME_MS // 1000} + i * 30 AS timestamp,
+            CASE WHEN kind_roll < 10 THEN 'coinbase' ELSE 'transfer' END AS "type"
+        FROM base
+    """  # nosec B608
+
+
+def generate_transaction_rows(
+    rows: int, addresses: Sequence[str], seed: int = 0, offset: int = 0
+) -> pd.DataFrame:
+    """rows of the transactions table as a DataFrame (see transaction_rows_sql)."""
+    with duckdb.connect() as con:
+        return con.execute(transaction_rows_sql(rows, addresses, seed, offset)).fetchdf()
+
+
+def build_transaction_db(
+    path: str, rows: int, addresses: Sequence[str], seed: int = 0
+) -> str:
+    """Creates (or extends) a transactions DuckDB file with rows synthetic rows."""
+    with duckdb.connect(path) as con:
+        initialize_tx_schema(con)
+        for offset in range(0, rows, DB_BUILD_BATCH_ROWS):
+            batch = min(DB_BUILD_BATCH_ROWS, rows - offset)
+            con.execute(
+                "INSERT INTO transactions BY NAME "  # nosec B608
+                + transaction_rows_sql(batch, addresses, seed, offset)
+            )
+    return path
+
+
+LOG_MESSAGES: Sequence[str] = (
+    "Fetching page {n} of transactions",
+    "PERF: upsert_transactions_df | Time: 0.{n:04d}s (Wall)",
+    "Price update complete",
+    "API request failed, retrying in {n}s",
+    "--- KaspaGateway Starting ---",
+)
+LOG_LEVELS: Sequence[str] = ("DEBUG", "INFO", "INFO", "INFO", "WARNING", "ERROR")
+
+
+def generate_log_lines(count: int, seed: int = 0, start: Optional[float] = None) -> List[str]:
+    """
+    Newline-terminated log lines, half in the application's format and
+    half in the key=value format written by kaspad and ks_bridge.
+    """
+    rng = random.Random(seed)
+    now = start if start is not None else DEFAULT_START_TIME_MS / 1000
+    lines: List[str] = []
+    for n in range(count):
+        now += rng.random()
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(now))
+        level = rng.choice(LOG_LEVELS)
+        message = rng.choice(LOG_MESSAGES).format(n=n % 10_000)
+        if n % 2:
+            lines.append(
+                f"{stamp} - {level} - [MainThread] - src.gui.main_window - {message}\n"
+            )
+        else:
+            lines.append(
+                f'time="{stamp}" level={level.lower()} msg="{message}" '
+                f"blocks={rng.randint(1, 500)} hashrate={rng.random() * 100:.2f}GH/s "
+                f'worker="rig-{rng.randint(1, 9)}"\n'
+            )
+    return lines
@@ -0,0 +1,115 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.api.network import fetch_address_names_if_modified
+from src.database import AppDataDB, initialize_app_data_schema
+from src.gui.address_names import refresh_address_names
+
+API_CONFIG = {
+    "base_url": "https://api.test",
+    "endpoints": {"address_names": "/addresses/names"},
+}
+
+
+def _names(count, suffix=""):
+    return [{"address": f"kaspa:q{i:04d}", "name": f"Name {i}{suffix}"} for i in range(count)]
+
+
+def _response(status, payload=None, headers=None):
+    response = MagicMock(status_code=status, headers=headers or {})
+    response.json.return_value = payload
+    response.raise_for_status.return_value = None
+    return response
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = AppDataDB(str(tmp_path / "app_data.duckdb"), initialize_app_data_schema)
+    yield database
+    database.close()
+
+
+class TestKnownNamesStore:
+
+    def test_only_changes_are_written(self, db):
+        assert db.save_address_names(_names(500), {"etag": '"v1"'}) == 500
+        assert db.save_address_names(_names(500)) == 0
+
+        updated = _names(499)
+        updated[3]["name"] = "Renamed"
+        updated.append({"address": "kaspa:qnew", "name": "New"})
+        # One rename, one new address, kaspa:q0499 removed.
+        assert db.save_address_names(updated) == 3
+
+        names_map = db.get_address_names_map()
+        assert len(names_map) == 500
+        assert names_map["kaspa:q0003"] == "Renamed"
+        assert "kaspa:q0499" not in names_map
+        assert db.get_address_names_count() == 500
+
+    def test_map_is_cached_until_names_change(self, db):
+        db.save_address_names(_names(10))
+        with patch.object(db, "fetch_all", wraps=db.fetch_all) as fetch_all:
+            first = db.get_address_names_map()
+            first["kaspa:q0000"] = "Mutated by caller"
+            assert db.get_address_names_map()["kaspa:q0000"] == "Name 0"
+            assert fetch_all.call_count == 1
+
+            db.save_address_names(_names(10))
+            db.get_address_names_map()
+            assert fetch_all.call_count == 1
+
+            db.save_address_names(_names(10, " v2"))
+            assert db.get_address_names_map()["kaspa:q0000"] == "Name 0 v2"
+            assert fetch_all.call_count == 2
+
+    def test_validators_require_stored_names(self, db):
+        assert db.get_address_names_validators() == {}
+        db.save_address_names(_names(2), {"etag": '"abc"', "last_modified": "Mon"})
+        assert db.get_address_names_validators() == {
+            "etag": '"abc"',
+            "last_modified": "Mon",
+        }
+        db.execute_query("DELETE FROM known_names")
+        assert db.get_address_names_validators() == {}
+
+
+@patch.dict(
+    "src.api.network.CONFIG",
+    {"performance": {"retry_attempts": 1, "timeout": 5, "backoff_factor": 0}},
+)
+@patch("src.api.network.get_active_api_config", return_value=API_CONFIG)
+class TestConditionalFetch:
+
+    def test_sends_validators_and_handles_not_modified(self, _config):
+        with patch("src.api.network._session.get", return_value=_response(304)) as get:
+            names, validators = fetch_address_names_if_modified(
+                {"etag": '"v1"', "last_modified": "Tue, 01 Oct 2024 00:00:00 GMT"}
+            )
+        assert names is None
+        assert validators["etag"] == '"v1"'
+        headers = get.call_args.kwargs["headers"]
+        assert headers == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Tue, 01 Oct 2024 00:00:00 GMT",
+        }
+
+    def test_refresh_skips_writes_when_unchanged(self, _config, db):
+        responses = [
+            _response(200, _names(50), {"ETag": '"v1"'}),
+            _response(304),
+            _response(200, _names(50, " v2"), {"ETag": '"v2"'}),
+        ]
+        with patch("src.api.network._session.get", side_effect=responses) as get:
+            assert len(refresh_address_names(db)) == 50
+            assert "headers" in get.call_args.kwargs
+            assert not get.call_args.kwargs["headers"]
+
+            with patch.object(db, "save_address_names") as save:
+                assert refresh_address_names(db)["kaspa:q0001"] == "Name 1"
+                save.assert_not_called()
+            assert get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+            assert refresh_address_names(db)["kaspa:q0001"] == "Name 1 v2"
+        assert db.get_address_names_validators() == {"etag": '"v2"'}
@@ -0,0 +1,247 @@
+import json
+import os
+import random
+import statistics
+import time
+from unittest.mock import patch
+
+import duckdb
+import pandas as pd
+import pytest
+
+from src.database import TransactionDB, initialize_tx_schema
+from src.export.csv_export import export_transactions_to_csv
+from src.export.known_names import resolve_known_names
+from src.gui.components.log_viewer import detect_log_level, highlight_spans
+from src.gui.tabs.normal_analysis_tab import group_by_counterparty, summarize_flows
+from src.gui.transaction_manager import _process_raw_transactions
+from src.utils.synthetic_data import (
+    build_transaction_db,
+    generate_log_lines,
+    generate_raw_transactions,
+    generate_transaction_rows,
+)
+from src.utils.validation import sanitize_csv_cell
+
+# Timings are stored as multiples of a fixed calibration workload measured
+# in the same run, so one baseline file holds on faster and slower
+# machines. A plain test run only records and prints them, since shared
+# runners are too noisy to gate on. KASPA_RUN_BENCHMARKS=1 turns on the
+# baseline check (a benchmark fails when it is TOLERANCE times slower than
+# its baseline) and adds the large (1M-10M row) sizes.
+# KASPA_UPDATE_BENCHMARKS=1 rewrites the baselines instead.
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "benchmark_baselines.json")
+RUN_BENCHMARKS = bool(os.environ.get("KASPA_RUN_BENCHMARKS"))
+UPDATE_BASELINES = bool(os.environ.get("KASPA_UPDATE_BENCHMARKS"))
+TOLERANCE = float(os.environ.get("KASPA_BENCHMARK_TOLERANCE", "2.5"))
+LARGE = pytest.mark.skipif(
+    not RUN_BENCHMARKS, reason="set KASPA_RUN_BENCHMARKS=1 to run"
+)
+
+ADDRESS = "kaspa:qbenchmarkmain"
+ADDRESSES = [ADDRESS, "kaspa:qbenchmarkb", "kaspa:qbenchmarkc", "kaspa:qbenchmarkd"]
+PRICES = {"usd": 0.12, "eur": 0.11}
+API_CONFIG = {"explorer": {"transaction": "https://explorer.test/txs/{txid}"}}
+KNOWN_NAMES = {
+    f"kaspa:qpeer{i:055d}": f"Known {i}" for i in range(0, 5_000, 3)
+}
+
+
+def _median_seconds(func, rounds):
+    func()  # warm-up: imports, caches, DuckDB catalog
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _calibration_workload():
+    rng = random.Random(0)
+    values = [rng.random() for _ in range(100_000)]
+    sorted(values)
+    df = pd.DataFrame({"key": [i % 100 for i in range(100_000)], "value": values})
+    df.groupby("key")["value"].sum()
+    with duckdb.connect() as con:
+        con.execute("SELECT sum(i * 2) FROM range(2000000) t(i)").fetchone()
+
+
+@pytest.fixture(scope="session")
+def calibration():
+    return _median_seconds(_calibration_workload, rounds=5)
+
+
+@pytest.fixture(scope="session")
+def baselines():
+    stored = {}
+    if os.path.exists(BASELINES_PATH):
+        with open(BASELINES_PATH, encoding="utf-8") as f:
+            stored = json.load(f)
+    measured = {}
+    yield stored, measured
+    if UPDATE_BASELINES and measured:
+        with open(BASELINES_PATH, "w", encoding="utf-8", newline="\n") as f:
+            json.dump({**stored, **measured}, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+
+@pytest.fixture
+def bench(request, calibration, baselines):
+    stored, measured = baselines
+
+    def run(func, rounds=5):
+        name = request.node.name
+        seconds = _median_seconds(func, rounds)
+        ratio = seconds / calibration
+        measured[name] = round(ratio, 3)
+        print(f"{name}: {seconds * 1000:.1f} ms ({ratio:.2f}x calibration)")
+        baseline = stored.get(name)
+        if baseline is not None and RUN_BENCHMARKS and not UPDATE_BASELINES:
+            assert ratio <= baseline * TOLERANCE, (
+                f"{name} regressed: {ratio:.2f}x calibration, "
+                f"baseline {baseline:.2f}x (tolerance {TOLERANCE}x)"
+            )
+        return seconds
+
+    return run
+
+
+@pytest.fixture(scope="session")
+def transaction_files(tmp_path_factory):
+    """Synthetic transaction databases, built once per size."""
+    paths = {}
+
+    def get(rows):
+        if rows not in paths:
+            path = str(tmp_path_factory.mktemp("bench_db") / f"tx_{rows}.duckdb")
+            paths[rows] = build_transaction_db(path, rows, ADDRESSES, seed=rows)
+        return paths[rows]
+
+    return get
+
+
+@pytest.fixture
+def tx_db(transaction_files, request):
+    db = TransactionDB(transaction_files(request.param), initialize_tx_schema)
+    yield db
+    db.close()
+
+
+def _analysis_frame(rows):
+    df = generate_transaction_rows(rows, [ADDRESS], seed=rows)
+    df["datetime"] = pd.to_datetime(df["timestamp"], unit="s")
+    return df
+
+
+class TestSyntheticData:
+
+    def test_generators_are_deterministic(self):
+        assert generate_raw_transactions(ADDRESS, 50, seed=3) == generate_raw_transactions(
+            ADDRESS, 50, seed=3
+        )
+        assert generate_transaction_rows(100, ADDRESSES, seed=3).equals(
+            generate_transaction_rows(100, ADDRESSES, seed=3)
+        )
+        assert generate_log_lines(20, seed=3) == generate_log_lines(20, seed=3)
+
+    def test_raw_transactions_cover_every_kind(self):
+        raw = generate_raw_transactions(ADDRESS, 500, seed=1)
+        df = _process_raw_transactions(raw, ADDRESS, PRICES)
+        assert len(df) == sum(tx["is_accepted"] for tx in raw) < len(raw)
+        assert set(df["type"]) == {"coinbase", "transfer"}
+        assert set(df["direction"]) == {"incoming", "outgoing"}
+        self_sends = [
+            tx for tx in raw
+            if len(tx["inputs"]) > 1
+            and {i["previous_outpoint_address"] for i in tx["inputs"]} == {ADDRESS}
+            and {o["script_public_key_address"] for o in tx["outputs"]} == {ADDRESS}
+        ]
+        assert self_sends
+
+    def test_database_file_matches_schema(self, transaction_files):
+        with duckdb.connect(transaction_files(1_000), read_only=True) as con:
+            assert con.execute("SELECT count(*) FROM transactions").fetchone()[0] == 1_000
+            per_address = con.execute(
+                "SELECT count(DISTINCT address), count(DISTINCT txid) FROM transactions"
+            ).fetchone()
+        assert per_address == (len(ADDRESSES), 1_000)
+
+
+class TestBenchmarks:
+
+    @pytest.mark.parametrize("count", [1_000, 10_000, pytest.param(100_000, marks=LARGE)])
+    def test_normalize_raw_transactions(self, bench, count):
+        raw = generate_raw_transactions(ADDRESS, count, seed=count)
+        bench(lambda: _process_raw_transactions(raw, ADDRESS, PRICES))
+
+    @pytest.mark.parametrize("rows", [10_000, 100_000, pytest.param(1_000_000, marks=LARGE)])
+    def test_upsert_transactions(self, bench, tmp_path, rows):
+        df = generate_transaction_rows(rows, ADDRESSES, seed=rows)
+        db = TransactionDB(str(tmp_path / "upsert.duckdb"), initialize_tx_schema)
+        try:
+            bench(lambda: db.upsert_transactions_df(df), rounds=3)
+            assert db.get_total_transaction_count() == rows
+        finally:
+            db.close()
+
+    @pytest.mark.parametrize(
+        "tx_db",
+        [100_000, pytest.param(1_000_000, marks=LARGE), pytest.param(10_000_000, marks=LARGE)],
+        indirect=True,
+    )
+    def test_filter_query(self, bench, tx_db):
+        def query():
+            return tx_db.filter_transactions(
+                ADDRESS, direction_filter="incoming", search_query="qpeer00000000"
+            )
+
+        bench(query)
+        assert query()
+
+    @pytest.mark.parametrize(
+        "rows",
+        [10_000, pytest.param(100_000, marks=LARGE), pytest.param(1_000_000, marks=LARGE)],
+    )
+    def test_analysis_aggregation(self, bench, rows):
+        df = _analysis_frame(rows)
+
+        def analyse():
+            summarize_flows(df)
+            return group_by_counterparty(df, ADDRESS)
+
+        bench(analyse, rounds=3)
+        assert "Coinbase / Mining" in analyse()
+
+    @pytest.mark.parametrize(
+        "tx_db", [100_000, pytest.param(1_000_000, marks=LARGE)], indirect=True
+    )
+    def test_csv_export_with_known_names(self, bench, tx_db, tmp_path):
+        path = str(tmp_path / "export.csv")
+
+        def export():
+            return export_transactions_to_csv(
+                tx_db, path, ADDRESS, "", "usd", known_names_map=KNOWN_NAMES
+            )
+
+        with patch("src.export.csv_export.get_active_api_config", return_value=API_CONFIG):
+            bench(export, rounds=3)
+            assert export()[0]
+        with open(path, encoding="utf-8-sig") as f:
+            assert "Known " in f.read(100_000)
+
+    @pytest.mark.parametrize("lines", [10_000, pytest.param(1_000_000, marks=LARGE)])
+    def test_log_ingestion(self, bench, lines):
+        log_lines = generate_log_lines(lines, seed=lines)
+
+        def ingest():
+            return [(detect_log_level(line), highlight_spans(line)) for line in log_lines]
+
+        bench(ingest)
+        levels = {level for level, _ in ingest()}
+        assert {"INFO", "WARN", "ERROR"} <= levels
+
+    @pytest.mark.parametrize("rows", [100_000, pytest.param(1_000_000, marks=LARGE)])
+    def test_known_name_mapping(self, bench, rows):
+        df = generate_transaction_rows(rows, [ADDRESS], seed=rows)
+        bench(lambda: resolve_known_names(df["from_address"], KNOWN_NAMES, sanitize_csv_cell))
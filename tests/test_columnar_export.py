@@ -0,0 +1,189 @@
+import duckdb
+import pandas as pd
+import pytest
+
+from src.config.config import SUPPORTED_CURRENCIES
+from src.database import (
+    AppDataDB,
+    TransactionDB,
+    initialize_app_data_schema,
+    initialize_tx_schema,
+)
+from src.export.columnar_export import (
+    export_analysis_to_parquet,
+    export_top_addresses_to_parquet,
+    export_transactions_to_arrow,
+    export_transactions_to_parquet,
+)
+
+ADDRESS = "kaspa:qcolumnar"
+
+
+def _transactions(count):
+    df = pd.DataFrame(
+        {
+            "txid": [f"tx{i:05d}" for i in range(count)],
+            "address": ADDRESS,
+            "direction": ["incoming" if i % 2 else "outgoing" for i in range(count)],
+            "from_address": "kaspa:qpeer",
+            "to_address": ADDRESS,
+            "amount": [float(i) for i in range(count)],
+            "block_height": list(range(count)),
+            "timestamp": [1_700_000_000 + i for i in range(count)],
+            "type": "transfer",
+        }
+    )
+    for cur in SUPPORTED_CURRENCIES:
+        df[f"value_{cur}"] = df["amount"] * 2
+    return df
+
+
+@pytest.fixture
+def tx_db(tmp_path):
+    db = TransactionDB(str(tmp_path / "tx.duckdb"), initialize_tx_schema)
+    db.upsert_transactions_df(_transactions(500))
+    yield db
+    db.close()
+
+
+class TestParquetExport:
+
+    def test_transactions_are_typed_and_zstd(self, tx_db, tmp_path):
+        path = str(tmp_path / "txs.parquet")
+        ok, _, _ = export_transactions_to_parquet(tx_db, path, ADDRESS, "Wallet", "usd")
+        assert ok
+
+        con = duckdb.connect()
+        types = {r[0]: r[1] for r in con.execute(f"DESCRIBE SELECT * FROM '{path}'").fetchall()}
+        assert types["amount"] == "DOUBLE"
+        assert types["timestamp"] == "TIMESTAMP"
+        assert con.execute(f"SELECT COUNT(*), SUM(value) FROM '{path}'").fetchone() == (
+            500,
+            pytest.approx(2 * sum(range(500))),
+        )
+        codecs = {r[0] for r in con.execute(f"SELECT compression FROM parquet_metadata('{path}')").fetchall()}
+        assert codecs == {"ZSTD"}
+        kv = dict(
+            con.execute(
+                f"SELECT key::VARCHAR, value::VARCHAR FROM parquet_kv_metadata('{path}')"
+            ).fetchall()
+        )
+        assert kv["kaspa_address"] == ADDRESS and kv["currency"] == "USD"
+
+    def test_transaction_filters_are_applied(self, tx_db, tmp_path):
+        path = str(tmp_path / "incoming.parquet")
+        ok, _, _ = export_transactions_to_parquet(
+            tx_db, path, ADDRESS, "", "usd", filters={"direction_filter": "incoming"}
+        )
+        assert ok
+        directions = duckdb.connect().execute(f"SELECT DISTINCT direction FROM '{path}'").fetchall()
+        assert directions == [("incoming",)]
+
+    def test_analysis_joins_counterparties(self, tx_db, tmp_path):
+        path = str(tmp_path / "analysis.parquet")
+        counterparties = {
+            "kaspa:qpeer": [{"txid": "tx00001"}, {"txid": "tx00003"}],
+            "Coinbase / Mining": [{"txid": "tx00002"}],
+        }
+        ok, _, _ = export_analysis_to_parquet(
+            tx_db,
+            path,
+            ADDRESS,
+            "",
+            "usd",
+            counterparties,
+            {"kaspa:qpeer": "Peer"},
+            analysis_data={"summary": {"Total Transactions": "3"}},
+        )
+        assert ok
+        con = duckdb.connect()
+        rows = con.execute(
+            f"SELECT counterparty, counterparty_name, txid, amount FROM '{path}'"
+        ).fetchall()
+        assert rows == [
+            ("Coinbase / Mining", None, "tx00002", 2.0),
+            ("kaspa:qpeer", "Peer", "tx00001", 1.0),
+            ("kaspa:qpeer", "Peer", "tx00003", 3.0),
+        ]
+        kv = dict(
+            con.execute(
+                f"SELECT key::VARCHAR, value::VARCHAR FROM parquet_kv_metadata('{path}')"
+            ).fetchall()
+        )
+        assert kv["summary.Total Transactions"] == "3"
+
+    def test_top_addresses_snapshot(self, tmp_path):
+        db = AppDataDB(str(tmp_path / "app.duckdb"), initialize_app_data_schema)
+        try:
+            db.save_address_names([{"address": "kaspa:qwhale", "name": "Whale"}])
+            snapshot_id = db.save_rich_list_snapshot(
+                pd.DataFrame(
+                    [(1, "kaspa:qwhale", 10.0), (2, "kaspa:qother", 5.0)],
+                    columns=["rank", "address", "balance"],
+                )
+            )
+            path = str(tmp_path / "rich.parquet")
+            ok, _, _ = export_top_addresses_to_parquet(db, snapshot_id, path)
+        finally:
+            db.close()
+        assert ok
+        rows = duckdb.connect().execute(f"SELECT rank, name, balance FROM '{path}'").fetchall()
+        assert rows == [(1, "Whale", 10.0), (2, None, 5.0)]
+
+    def test_top_addresses_follow_search_sort_and_price(self, tmp_path):
+        db = AppDataDB(str(tmp_path / "app.duckdb"), initialize_app_data_schema)
+        try:
+            db.save_address_names([{"address": "kaspa:qwhale", "name": "Whale"}])
+            snapshot_id = db.save_rich_list_snapshot(
+                pd.DataFrame(
+                    [(1, "kaspa:qwhale", 10.0), (2, "kaspa:qother", 5.0), (3, "kaspa:qsmall", 1.0)],
+                    columns=["rank", "address", "balance"],
+                )
+            )
+            path = str(tmp_path / "rich.parquet")
+            ok, _, _ = export_top_addresses_to_parquet(
+                db, snapshot_id, path, currency="EUR", price=0.5,
+                search="kaspa:q", sort_by="balance", descending=False,
+            )
+            rows, _ = db.query_rich_list(
+                snapshot_id, search="kaspa:q", sort_by="balance", descending=False
+            )
+            filtered = str(tmp_path / "whale.parquet")
+            export_top_addresses_to_parquet(db, snapshot_id, filtered, search="whale")
+        finally:
+            db.close()
+        assert ok
+        con = duckdb.connect()
+        exported = con.execute(f"SELECT address, value FROM '{path}'").fetchall()
+        assert [address for address, _ in exported] == [row["address"] for row in rows]
+        assert exported == [("kaspa:qsmall", 0.5), ("kaspa:qother", 2.5), ("kaspa:qwhale", 5.0)]
+        assert con.execute(f"SELECT address FROM '{filtered}'").fetchall() == [("kaspa:qwhale",)]
+        kv = dict(
+            con.execute(
+                f"SELECT key::VARCHAR, value::VARCHAR FROM parquet_kv_metadata('{path}')"
+            ).fetchall()
+        )
+        assert kv["currency"] == "EUR"
+
+
+class TestArrowExport:
+
+    def test_transactions_to_arrow(self, tx_db, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.ipc
+
+        path = str(tmp_path / "txs.arrow")
+        ok, _, _ = export_transactions_to_arrow(tx_db, path, ADDRESS, "", "usd")
+        assert ok
+        with pa.memory_map(path) as source:
+            table = pyarrow.ipc.open_file(source).read_all()
+        assert table.num_rows == 500
+        assert table.schema.metadata[b"kaspa_address"] == ADDRESS.encode()
+
+    def test_arrow_without_pyarrow_reports_error(self, tx_db, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.export.columnar_export.ARROW_AVAILABLE", False)
+        ok, msg_key, details = export_transactions_to_arrow(
+            tx_db, str(tmp_path / "txs.arrow"), ADDRESS, "", "usd"
+        )
+        assert (ok, msg_key) == (False, "Error")
+        assert "pyarrow" in details
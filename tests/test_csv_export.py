@@ -0,0 +1,108 @@
+import csv
+from datetime import datetime
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.config.config import SUPPORTED_CURRENCIES
+from src.database import TransactionDB, initialize_tx_schema
+from src.export.csv_export import export_to_csv, export_transactions_to_csv
+
+ADDRESS = "kaspa:qtestaddress"
+API_CONFIG = {"explorer": {"transaction": "https://explorer.test/txs/{txid}"}}
+
+
+def _transactions():
+    df = pd.DataFrame(
+        [
+            {
+                "txid": "aa01",
+                "address": ADDRESS,
+                "direction": "incoming",
+                "from_address": "kaspa:qsender",
+                "to_address": ADDRESS,
+                "amount": 1500.5,
+                "value_usd": 1234.5,
+                "block_height": 10,
+                "timestamp": 1678888888,
+                "type": "transfer",
+            },
+            {
+                "txid": "aa02",
+                "address": ADDRESS,
+                "direction": "outgoing",
+                "from_address": ADDRESS,
+                "to_address": "kaspa:qreceiver, kaspa:qchange",
+                "amount": 2.0,
+                "value_usd": None,
+                "block_height": 20,
+                "timestamp": 1678900000,
+                "type": "coinbase",
+            },
+        ]
+    )
+    for cur in SUPPORTED_CURRENCIES:
+        if f"value_{cur}" not in df.columns:
+            df[f"value_{cur}"] = None
+    return df
+
+
+def _read_csv(path):
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        lines = f.read().splitlines()
+    header = [line for line in lines if line.startswith("#")]
+    body = [line for line in lines if line and not line.startswith("#")]
+    return header, list(csv.DictReader(body))
+
+
+@patch("src.export.csv_export.get_active_api_config", return_value=API_CONFIG)
+class TestStreamingCsvExport:
+
+    @pytest.fixture
+    def tx_db(self, tmp_path):
+        db = TransactionDB(str(tmp_path / "tx.duckdb"), initialize_tx_schema)
+        db.upsert_transactions_df(_transactions())
+        yield db
+        db.close()
+
+    def test_formats_rows_in_sql(self, _config, tx_db, tmp_path):
+        path = str(tmp_path / "all.csv")
+        ok, _, _ = export_transactions_to_csv(tx_db, path, ADDRESS, "Wallet", "usd")
+        assert ok
+
+        header, rows = _read_csv(path)
+        assert any("Wallet" in line for line in header)
+        assert any("USD" in line for line in header)
+        assert [r["Transaction ID"] for r in rows] == ["aa02", "aa01"]
+        newest, oldest = rows
+        assert oldest["Direction"] == "Incoming"
+        assert oldest["Type:"] == "Transfer"
+        assert oldest["Value (USD)"] == "1,234.50 USD"
+        assert newest["Value (USD)"] == "N/A"
+        assert newest["To Address(es)"] == "kaspa:qreceiver, kaspa:qchange"
+        assert oldest["Date/Time"] == "2023-03-15 14:01:28"
+        assert oldest["Transaction URL"] == "https://explorer.test/txs/aa01"
+
+    def test_applies_explorer_filters(self, _config, tx_db, tmp_path):
+        path = str(tmp_path / "filtered.csv")
+        filters = {
+            "start_date": datetime.fromtimestamp(1678890000),
+            "direction_filter": "ALL",
+            "type_filter": "ALL",
+        }
+        ok, _, _ = export_transactions_to_csv(
+            tx_db, path, ADDRESS, "", "usd", filters=filters
+        )
+        assert ok
+        _, rows = _read_csv(path)
+        assert [r["Transaction ID"] for r in rows] == ["aa02"]
+
+    def test_dataframe_export_matches_database_export(self, _config, tx_db, tmp_path):
+        db_path = str(tmp_path / "db.csv")
+        df_path = str(tmp_path / "df.csv")
+        export_transactions_to_csv(tx_db, db_path, ADDRESS, "", "usd")
+        df = pd.DataFrame(tx_db.filter_transactions(ADDRESS))
+        ok, _, _ = export_to_csv(df, df_path, ADDRESS, "", "usd")
+        assert ok
+        assert _read_csv(df_path)[1] == _read_csv(db_path)[1]
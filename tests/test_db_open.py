@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.database import AddressDB, AppDataDB, TransactionDB, open_databases, open_databases_async
+from src.utils.errors import DatabaseError
+
+FILENAMES = {
+    "transactions": "Transactions.duckdb",
+    "addresses": "Addresses.duckdb",
+    "app_data": "AppData.duckdb",
+}
+
+
+@pytest.fixture(autouse=True)
+def db_filenames():
+    with patch.dict("src.database.db_open.CONFIG", {"db_filenames": FILENAMES}):
+        yield
+
+
+class TestOpenDatabases:
+
+    def test_opens_all_in_parallel(self, tmp_path):
+        futures = open_databases_async(str(tmp_path))
+        assert set(futures) == set(FILENAMES)
+        databases = {name: future.result(timeout=30) for name, future in futures.items()}
+        assert isinstance(databases["transactions"], TransactionDB)
+        assert isinstance(databases["addresses"], AddressDB)
+        assert isinstance(databases["app_data"], AppDataDB)
+        for db in databases.values():
+            db.close()
+
+        reopened = open_databases(str(tmp_path), ["app_data"])
+        assert list(reopened) == ["app_data"]
+        reopened["app_data"].close()
+
+    def test_failed_open_closes_the_others(self, tmp_path):
+        (tmp_path / FILENAMES["addresses"]).write_bytes(b"not a database")
+        with patch("src.database.db_base.ConnectionPool.close_all") as close_all:
+            with pytest.raises(DatabaseError):
+                open_databases(str(tmp_path))
+        assert close_all.call_count == 2
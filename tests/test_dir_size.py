@@ -0,0 +1,85 @@
+import os
+import time
+import pytest
+from src.utils.dir_size import DirectorySizeTracker, format_growth_rate
+
+
+def _write(path, size):
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+
+
+def _age(path, seconds):
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+class TestDirectorySizeTracker:
+
+    @pytest.fixture
+    def datadir(self, tmp_path):
+        """Build a small tree that mimics a kaspad datadir."""
+        (tmp_path / "consensus" / "sst").mkdir(parents=True)
+        for i in range(5):
+            sst = tmp_path / "consensus" / "sst" / f"{i:06d}.sst"
+            _write(sst, 1000)
+            _age(sst, 7200)  # Cold: written long ago
+        _write(tmp_path / "consensus" / "LOG", 10)
+        _age(tmp_path / "consensus" / "sst", 7200)
+        return tmp_path
+
+    def test_matches_os_walk(self, datadir):
+        tracker = DirectorySizeTracker()
+        expected = sum(
+            os.path.getsize(os.path.join(dp, f))
+            for dp, _, fn in os.walk(datadir)
+            for f in fn
+        )
+        assert tracker.get_size(str(datadir)) == expected == 5010
+
+    def test_unchanged_directories_are_not_rescanned(self, datadir):
+        tracker = DirectorySizeTracker()
+        tracker.get_size(str(datadir))
+        assert tracker.last_scan_stats["dirs_rescanned"] == 3
+
+        tracker.get_size(str(datadir))
+        assert tracker.last_scan_stats["dirs_rescanned"] == 0
+        assert tracker.last_scan_stats["dirs_cached"] == 3
+
+    def test_hot_file_growth_is_detected(self, datadir):
+        # Appending to a file does not touch the directory mtime.
+        tracker = DirectorySizeTracker()
+        assert tracker.get_size(str(datadir)) == 5010
+        with open(datadir / "consensus" / "LOG", "ab") as f:
+            f.write(b"y" * 90)
+        assert tracker.get_size(str(datadir)) == 5100
+        assert tracker.last_scan_stats["dirs_rescanned"] == 0
+
+    def test_new_and_deleted_files(self, datadir):
+        tracker = DirectorySizeTracker()
+        tracker.get_size(str(datadir))
+        sst_dir = datadir / "consensus" / "sst"
+        os.remove(sst_dir / "000000.sst")
+        _write(sst_dir / "000005.sst", 4000)
+        # Force an mtime change even on coarse-grained filesystems.
+        os.utime(sst_dir, (time.time() + 5, time.time() + 5))
+        assert tracker.get_size(str(datadir)) == 8010
+        assert tracker.last_scan_stats["dirs_rescanned"] == 1
+
+    def test_missing_folder_returns_error(self, tmp_path):
+        tracker = DirectorySizeTracker()
+        assert tracker.get_size(str(tmp_path / "missing")) == -1
+
+    def test_growth_rate(self, datadir, monkeypatch):
+        tracker = DirectorySizeTracker()
+        now = time.time()
+        monkeypatch.setattr("src.utils.dir_size.time.time", lambda: now)
+        tracker.get_size(str(datadir))
+        assert tracker.get_growth_rate(str(datadir)) is None
+
+        _write(datadir / "consensus" / "LOG", 10 + 1024**2)
+        monkeypatch.setattr("src.utils.dir_size.time.time", lambda: now + 86400)
+        tracker.get_size(str(datadir))
+        assert tracker.get_growth_rate(str(datadir)) == pytest.approx(1024**2)
+        assert format_growth_rate(1024**3 * 1.5) == "+1.50 GB/day"
+        assert format_growth_rate(None) == "N/A"
@@ -0,0 +1,273 @@
+import os
+import re
+import threading
+import time
+from unittest.mock import patch
+
+import duckdb
+import pandas as pd
+import pytest
+
+from src.config.config import SUPPORTED_CURRENCIES
+from src.database import TransactionDB, initialize_tx_schema
+from src.export.batch_export import (
+    MaterializedTransactions,
+    export_transactions_to_formats,
+)
+from src.export.csv_export import export_transactions_to_csv
+from src.export.html_export import export_transactions_to_html
+from src.export.jobs import (
+    JOB_CANCELLED,
+    JOB_DONE,
+    JOB_FAILED,
+    ExportJob,
+    ExportJobManager,
+)
+
+ADDRESS = "kaspa:qexportjobs"
+API_CONFIG = {
+    "language": "en",
+    "explorer": {
+        "address": "https://explorer.test/addresses/{kaspaAddress}",
+        "transaction": "https://explorer.test/txs/{txid}",
+    },
+}
+
+
+def _transactions(count):
+    df = pd.DataFrame(
+        {
+            "txid": [f"tx{i:05d}" for i in range(count)],
+            "address": ADDRESS,
+            "direction": ["incoming" if i % 2 else "outgoing" for i in range(count)],
+            "from_address": "kaspa:qpeer",
+            "to_address": ADDRESS,
+            "amount": [float(i) for i in range(count)],
+            "block_height": list(range(count)),
+            "timestamp": [1_700_000_000 + i for i in range(count)],
+            "type": "transfer",
+        }
+    )
+    for cur in SUPPORTED_CURRENCIES:
+        df[f"value_{cur}"] = [None if i % 3 == 0 else i * 2.0 for i in range(count)]
+    return df
+
+
+@pytest.fixture
+def tx_db(tmp_path):
+    db = TransactionDB(str(tmp_path / "tx.duckdb"), initialize_tx_schema)
+    db.upsert_transactions_df(_transactions(300))
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def api_config():
+    with patch(
+        "src.export.csv_export.get_active_api_config", return_value=API_CONFIG
+    ), patch(
+        "src.export.html_export.get_active_api_config", return_value=API_CONFIG
+    ), patch(
+        "src.export.pdf_export.get_active_api_config", return_value=API_CONFIG
+    ):
+        yield
+
+
+def _wait(job, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while job.is_active and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not job.is_active
+
+
+class TestExportJobManager:
+
+    def test_concurrency_is_bounded(self):
+        manager = ExportJobManager(max_workers=2)
+        release = threading.Event()
+        lock = threading.Lock()
+        running = {"now": 0, "peak": 0}
+
+        def run(job):
+            with lock:
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+            release.wait(5)
+            with lock:
+                running["now"] -= 1
+            return {"csv": (True, "Export Successful", "x.csv")}
+
+        try:
+            jobs = [manager.submit("Test", {"csv": f"{i}.csv"}, run) for i in range(5)]
+            time.sleep(0.2)
+            assert len(manager.active_jobs()) == 5
+            release.set()
+            for job in jobs:
+                _wait(job)
+        finally:
+            manager.shutdown()
+        assert running["peak"] == 2
+        assert {job.state for job in jobs} == {JOB_DONE}
+
+    def test_failed_result_and_exception_mark_job_failed(self):
+        manager = ExportJobManager(max_workers=1)
+        try:
+            failed = manager.submit(
+                "Test", {"csv": "a.csv"}, lambda job: {"csv": (False, "Error", "x")}
+            )
+            raised = manager.submit("Test", {"csv": "b.csv"}, lambda job: 1 / 0)
+            _wait(failed)
+            _wait(raised)
+        finally:
+            manager.shutdown()
+        assert failed.state == raised.state == JOB_FAILED
+        assert "division" in raised.error
+
+    def test_cancel_removes_partial_output(self, tmp_path):
+        manager = ExportJobManager(max_workers=1)
+        path = str(tmp_path / "out.csv")
+        started = threading.Event()
+
+        def run(job):
+            with open(path + ".part", "w") as f:
+                f.write("partial")
+            started.set()
+            while True:
+                job.raise_if_cancelled()
+                time.sleep(0.01)
+
+        finished = []
+        try:
+            job = manager.submit("Test", {"csv": path}, run, on_finished=finished.append)
+            queued = manager.submit("Test", {"csv": path}, run)
+            assert started.wait(5)
+            assert job.bytes_written == len("partial")
+            manager.cancel_all()
+            _wait(job)
+            _wait(queued)
+        finally:
+            manager.shutdown()
+        assert job.state == queued.state == JOB_CANCELLED
+        assert finished == [job]
+        assert not os.path.exists(path + ".part")
+
+    def test_cancel_interrupts_bound_connection(self):
+        job = ExportJob("Test", {})
+        con = duckdb.connect()
+        job.bind_connection(con)
+        timer = threading.Timer(0.2, job.cancel)
+        timer.start()
+        with pytest.raises(duckdb.InterruptException):
+            con.execute(
+                "SELECT COUNT(*) FROM range(1000000000000) a, range(1000) b"
+            ).fetchone()
+        timer.join()
+        assert job.cancelled
+
+
+@pytest.mark.usefixtures("api_config")
+class TestExportProgress:
+
+    def test_csv_and_html_report_rows(self, tx_db, tmp_path):
+        csv_job = ExportJob("Test", {})
+        ok, _, _ = export_transactions_to_csv(
+            tx_db, str(tmp_path / "t.csv"), ADDRESS, "", "usd", job=csv_job
+        )
+        assert ok and csv_job.rows_written == 300
+
+        html_job = ExportJob("Test", {})
+        with patch("src.export.html_utils.CHUNK_ROWS", 50):
+            ok, _, _ = export_transactions_to_html(
+                tx_db, str(tmp_path / "t.html"), ADDRESS, "", "usd", job=html_job
+            )
+        assert ok and html_job.rows_written == 300
+
+    def test_cancelled_job_stops_export(self, tx_db, tmp_path):
+        job = ExportJob("Test", {})
+        job.cancel()  # Not active yet, so nothing happens.
+        job.state = "running"
+        job.cancel()
+        ok, _, message = export_transactions_to_csv(
+            tx_db, str(tmp_path / "t.csv"), ADDRESS, "", "usd", job=job
+        )
+        assert not ok
+        assert "Export cancelled." in message
+
+
+@pytest.mark.usefixtures("api_config")
+class TestMultiFormatExport:
+
+    def test_formats_come_from_one_filtered_read(self, tx_db, tmp_path):
+        targets = {
+            "csv": str(tmp_path / "t.csv"),
+            "parquet": str(tmp_path / "t.parquet"),
+            "pdf": str(tmp_path / "t.pdf"),
+        }
+        job = ExportJob("Test", targets)
+        with patch.object(
+            tx_db, "connect", wraps=tx_db.connect
+        ) as connect:
+            results = export_transactions_to_formats(
+                tx_db,
+                targets,
+                ADDRESS,
+                "",
+                "usd",
+                filters={"direction_filter": "incoming"},
+                job=job,
+            )
+        assert connect.call_count == 1
+        assert all(ok for ok, _, _ in results.values())
+        assert all(os.path.getsize(path) > 0 for path in targets.values())
+
+        csv_text = open(targets["csv"], encoding="utf-8-sig").read()
+        assert len(set(re.findall(r"tx\d{5}", csv_text))) == 150
+        con = duckdb.connect()
+        count, nulls = con.execute(
+            "SELECT COUNT(*), COUNT(*) - COUNT(value) FROM read_parquet(?)",
+            [targets["parquet"]],
+        ).fetchone()
+        assert count == 150
+        assert nulls == 50
+        assert job.rows_written == 150
+
+    def test_copy_is_a_temporary_file_removed_on_close(self, tx_db, tmp_path):
+        cache_dir = tmp_path / "cache"
+        paths = {"paths": {"cache": str(cache_dir)}}
+        with patch.dict("src.export.batch_export.CONFIG", paths):
+            source = MaterializedTransactions(
+                tx_db, ADDRESS, {"direction_filter": "incoming"}
+            )
+        try:
+            assert source.row_count == 150
+            (copy_dir,) = cache_dir.iterdir()
+            assert (copy_dir / "transactions.duckdb").exists()
+            df = source.to_dataframe(("timestamp", "txid", "missing"))
+            assert list(df.columns) == ["timestamp", "txid"]
+            assert df["timestamp"].is_monotonic_decreasing
+        finally:
+            source.close()
+        assert list(cache_dir.iterdir()) == []
+
+    def test_copy_keeps_nan_and_null_apart(self, tx_db):
+        with tx_db.connect() as con:
+            con.execute("UPDATE transactions SET amount = 'nan' WHERE txid = 'tx00001'")
+        source = MaterializedTransactions(tx_db, ADDRESS)
+        try:
+            with source.connect() as con:
+                nan, nulls = con.execute(
+                    "SELECT bool_or(isnan(amount)), "
+                    "COUNT(*) - COUNT(value_usd) FROM transactions"
+                ).fetchone()
+        finally:
+            source.close()
+        assert nan
+        assert nulls == 100
+        with tx_db.connect() as con:
+            assert len(con.execute("SHOW DATABASES").fetchall()) == 1
+
+    def test_unknown_format_is_rejected(self, tx_db, tmp_path):
+        with pytest.raises(ValueError):
+            export_transactions_to_formats(
+                tx_db, {"xlsx": str(tmp_path / "t.xlsx")}, ADDRESS, "", "usd"
+            )
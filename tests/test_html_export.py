@@ -0,0 +1,151 @@
+import json
+import re
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.config.config import SUPPORTED_CURRENCIES
+from src.database import TransactionDB, initialize_tx_schema
+from src.export.analysis_html_export import export_analysis_to_html
+from src.export.html_export import export_to_html, export_transactions_to_html
+from src.export.html_utils import VirtualTableWriter, script_json
+
+ADDRESS = "kaspa:qhtmlexport"
+API_CONFIG = {
+    "language": "en",
+    "explorer": {
+        "address": "https://explorer.test/addresses/{kaspaAddress}",
+        "transaction": "https://explorer.test/txs/{txid}",
+    },
+}
+
+
+def _transactions(count):
+    df = pd.DataFrame(
+        {
+            "txid": [f"tx{i:06d}" for i in range(count)],
+            "address": ADDRESS,
+            "direction": ["incoming" if i % 2 else "outgoing" for i in range(count)],
+            "from_address": "kaspa:qpeer",
+            "to_address": ADDRESS,
+            "amount": [i / 4 for i in range(count)],
+            "block_height": list(range(count)),
+            "timestamp": [1_700_000_000 + i for i in range(count)],
+            "type": "transfer",
+        }
+    )
+    for cur in SUPPORTED_CURRENCIES:
+        df[f"value_{cur}"] = [None if i % 5 == 0 else i * 0.1 for i in range(count)]
+    return df
+
+
+def _tables(path):
+    """Returns {table_id: (config, rows)} parsed from the embedded JSON."""
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    configs = [
+        json.loads(m)
+        for m in re.findall(
+            r'<script type="application/json" data-vtable-config>(.*?)</script>', content
+        )
+    ]
+    tables = {}
+    for config in configs:
+        chunks = re.findall(
+            rf'<script type="application/json" data-vtable="{config["id"]}" '
+            r'data-start="(\d+)">(.*?)</script>',
+            content,
+        )
+        rows = []
+        for start, chunk in chunks:
+            assert int(start) == len(rows)
+            rows.extend(json.loads(chunk))
+        tables[config["id"]] = (config, rows)
+    return content, tables
+
+
+@patch("src.export.html_export.get_active_api_config", return_value=API_CONFIG)
+class TestStreamingHtmlExport:
+
+    def test_rows_are_chunked_json(self, _config, tmp_path):
+        path = str(tmp_path / "report.html")
+        with patch("src.export.html_utils.CHUNK_ROWS", 100):
+            ok, _, _ = export_to_html(_transactions(250), path, ADDRESS, "Wallet", "usd")
+        assert ok
+
+        content, tables = _tables(path)
+        config, rows = tables["transactions"]
+        assert config["rows"] == len(rows) == 250
+        assert content.count('data-vtable="transactions"') == 3
+        assert "<tr><td>" not in content
+
+        fields = {c["title"]: c.get("field") for c in config["columns"]}
+        assert rows[5][fields["Transaction ID"]] == "tx000005"
+        assert rows[5][fields["Value (USD)"]] is None
+        link = next(c for c in config["columns"] if c["kind"] == "link")
+        assert (link["prefix"], link["suffix"]) == ("https://explorer.test/txs/", "")
+        direction = next(
+            i for i, c in enumerate(config["columns"]) if c["title"] == "Direction"
+        )
+        assert config["labels"][str(direction)] == {
+            "incoming": "Incoming",
+            "outgoing": "Outgoing",
+        }
+
+    def test_database_export_applies_filters(self, _config, tmp_path):
+        db = TransactionDB(str(tmp_path / "tx.duckdb"), initialize_tx_schema)
+        try:
+            db.upsert_transactions_df(_transactions(40))
+            path = str(tmp_path / "incoming.html")
+            ok, _, _ = export_transactions_to_html(
+                db, path, ADDRESS, "", "usd", filters={"direction_filter": "incoming"}
+            )
+        finally:
+            db.close()
+        assert ok
+
+        _, tables = _tables(path)
+        config, rows = tables["transactions"]
+        fields = {c["title"]: c.get("field") for c in config["columns"]}
+        assert config["rows"] == 20
+        assert [r[fields["Transaction ID"]] for r in rows[:2]] == ["tx000039", "tx000037"]
+        assert {r[fields["Direction"]] for r in rows} == {"incoming"}
+
+
+class TestVirtualTableWriter:
+
+    def test_values_cannot_close_the_script_block(self, tmp_path):
+        path = tmp_path / "t.html"
+        with open(path, "w", encoding="utf-8") as f:
+            table = VirtualTableWriter(f, "t", [{"title": "<b>x</b>", "kind": "text", "field": 0}])
+            table.write_rows([["</script><script>alert(1)</script>"]])
+            assert table.close() == 1
+        content = path.read_text(encoding="utf-8")
+        assert "</script><script>alert" not in content
+        assert "&lt;b&gt;x&lt;/b&gt;" in content
+        assert json.loads(script_json(["</script>"])) == ["</script>"]
+
+    def test_nan_is_rejected(self):
+        with pytest.raises(ValueError):
+            script_json([float("nan")])
+
+
+@patch("src.export.analysis_html_export.get_active_api_config", return_value=API_CONFIG)
+def test_analysis_tables_have_totals(_config, tmp_path):
+    txs = _transactions(6).to_dict("records")
+    path = str(tmp_path / "analysis.html")
+    ok, _, _ = export_analysis_to_html(
+        path,
+        ADDRESS,
+        "",
+        "usd",
+        {"kaspa:qpeer": txs[:4], "kaspa:qother": txs[4:]},
+        {"kaspa:qpeer": "Peer"},
+        analysis_data={"summary": {"Total Transactions": "6"}},
+    )
+    assert ok
+    content, tables = _tables(path)
+    assert [cfg["rows"] for cfg, _ in tables.values()] == [4, 2]
+    assert "<td>1.50000000</td>" in content
+    assert "(Peer)" in content
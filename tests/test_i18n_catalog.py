@@ -0,0 +1,84 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import i18n
+from src.utils.i18n import CATALOG_FILENAME, TranslationCatalog
+
+
+@pytest.fixture
+def translations_dir(tmp_path, monkeypatch):
+    (tmp_path / "en.json").write_text(
+        json.dumps({"ALL": "ALL", "incoming": "Incoming", "Ready": "Ready"}), encoding="utf-8"
+    )
+    (tmp_path / "de.json").write_text(
+        json.dumps({"ALL": "ALLE", "incoming": "Eingehend"}), encoding="utf-8"
+    )
+    (tmp_path / "lang_map.json").write_text(json.dumps({"en": "English"}), encoding="utf-8")
+    monkeypatch.setattr(i18n, "TRANSLATIONS_DIR", str(tmp_path))
+    monkeypatch.setitem(i18n.CONFIG, "paths", {"cache": str(tmp_path / "cache")})
+    monkeypatch.setattr(i18n, "_catalog", None)
+    # Restored afterwards, so other tests keep the real translations.
+    monkeypatch.setattr(i18n, "_translations", i18n._translations)
+    monkeypatch.setattr(i18n, "_current_lang_code", i18n._current_lang_code)
+    return tmp_path
+
+
+class TestTranslationCatalog:
+
+    def test_messages_and_indexes(self, translations_dir):
+        catalog = i18n.compile_catalog()
+        assert catalog.messages["de"] == {"ALL": "ALLE", "incoming": "Eingehend", "Ready": "Ready"}
+        assert catalog.translations_by_key["incoming"] == {"incoming", "Incoming", "Eingehend"}
+        assert catalog.keys_by_translation["Eingehend"] == {"incoming"}
+
+    def test_cached_catalog_is_reused_until_a_file_changes(self, translations_dir):
+        i18n.compile_catalog()
+        assert (translations_dir / "cache" / CATALOG_FILENAME).exists()
+        with patch.object(i18n, "_read_languages") as read:
+            i18n.compile_catalog()
+        read.assert_not_called()
+
+        (translations_dir / "de.json").write_text(
+            json.dumps({"ALL": "ALLE", "incoming": "Eingang"}), encoding="utf-8"
+        )
+        assert i18n.compile_catalog().keys_by_translation["Eingang"] == {"incoming"}
+
+    def test_cache_survives_reset_file_times(self, translations_dir):
+        i18n.compile_catalog()
+        for path in translations_dir.glob("*.json"):
+            os.utime(path, (0, 0))
+        with patch.object(i18n, "_read_languages") as read:
+            i18n.compile_catalog()
+        read.assert_not_called()
+
+    def test_corrupt_cache_is_recompiled(self, translations_dir):
+        (translations_dir / "cache").mkdir()
+        (translations_dir / "cache" / CATALOG_FILENAME).write_bytes(b"\x00garbage")
+        assert i18n.compile_catalog().messages["en"]["Ready"] == "Ready"
+        signature = i18n._source_signature(i18n._translation_files())
+        data = (translations_dir / "cache" / CATALOG_FILENAME).read_bytes()
+        assert TranslationCatalog.from_bytes(data, signature) is not None
+
+    def test_nothing_is_written_into_the_translations_dir(self, translations_dir):
+        before = {p.name for p in translations_dir.iterdir()}
+        i18n.compile_catalog()
+        assert {p.name for p in translations_dir.iterdir()} - before == {"cache"}
+
+    def test_reverse_lookup_and_language_switch(self, translations_dir):
+        assert i18n.is_translation_of("ALLE", "ALL")
+        assert i18n.is_translation_of("incoming", "incoming")
+        assert not i18n.is_translation_of("Eingehend", "ALL")
+        assert i18n.keys_for_translation("unknown") == frozenset()
+        assert i18n.get_all_translations_for_key("missing key") == {"missing key"}
+
+        with patch.object(i18n, "LANG_MAP", {"en": "English", "de": "Deutsch"}), patch.dict(
+            i18n.CONFIG, {"language": "en"}
+        ), patch.object(i18n, "_read_languages", wraps=i18n._read_languages) as read:
+            assert i18n.switch_language("de")
+            assert i18n.translate("incoming") == "Eingehend"
+            assert i18n.switch_language("en")
+            assert i18n.translate("incoming") == "Incoming"
+        assert read.call_count == 0
@@ -0,0 +1,180 @@
+import csv
+import html
+import os
+import time
+from unittest.mock import patch
+
+import duckdb
+import pandas as pd
+import pytest
+
+from src.config.config import SUPPORTED_CURRENCIES
+from src.database import TransactionDB, initialize_tx_schema
+from src.export.batch_export import export_transactions_to_formats
+from src.export.csv_export import export_to_csv, export_transactions_to_csv
+from src.export.known_names import (
+    known_names_sql,
+    register_known_names,
+    resolve_known_names,
+)
+from src.utils.validation import sanitize_csv_cell
+
+ADDRESS = "kaspa:qknownnames"
+API_CONFIG = {"explorer": {"transaction": "https://explorer.test/txs/{txid}"}}
+NAMES = {
+    "kaspa:qexchange": "Exchange",
+    "kaspa:qpool": "=Pool",
+    "kaspa:qtag": "<b>Tag</b>",
+}
+
+
+def _legacy(value, names, transform):
+    return ", ".join(transform(names.get(a, a)) for a in str(value).split(", "))
+
+
+def _transactions(count):
+    peers = ["kaspa:qexchange", "kaspa:qunknown", "kaspa:qpool, kaspa:qother, kaspa:qtag"]
+    df = pd.DataFrame(
+        {
+            "txid": [f"tx{i:07d}" for i in range(count)],
+            "address": ADDRESS,
+            "direction": ["incoming" if i % 2 else "outgoing" for i in range(count)],
+            "from_address": [peers[i % 3] for i in range(count)],
+            "to_address": [f"{ADDRESS}, kaspa:qexchange" if i % 4 else ADDRESS for i in range(count)],
+            "amount": [i / 8 for i in range(count)],
+            "block_height": list(range(count)),
+            "timestamp": [1_700_000_000 + i for i in range(count)],
+            "type": "transfer",
+        }
+    )
+    for cur in SUPPORTED_CURRENCIES:
+        df[f"value_{cur}"] = df["amount"] * 2
+    return df
+
+
+def _csv_rows(path):
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        body = [line for line in f.read().splitlines() if line and not line.startswith("#")]
+    return list(csv.DictReader(body))
+
+
+class TestResolveKnownNames:
+
+    @pytest.mark.parametrize("transform", [sanitize_csv_cell, html.escape])
+    def test_matches_per_cell_lookup(self, transform):
+        values = pd.Series(
+            [
+                "kaspa:qexchange",
+                "kaspa:qpool, kaspa:qunknown, kaspa:qtag",
+                None,
+                "",
+                "-kaspa:qodd",
+                "kaspa:qexchange",
+            ],
+            index=[10, 11, 12, 13, 14, 15],
+        )
+        resolved = resolve_known_names(values, NAMES, transform)
+        expected = [
+            _legacy("" if v is None else v, NAMES, transform) for v in values
+        ]
+        assert resolved.tolist() == expected
+        assert list(resolved.index) == [10, 11, 12, 13, 14, 15]
+
+    def test_sql_join_preserves_order_and_nulls(self):
+        con = duckdb.connect()
+        assert not register_known_names(con, {})
+        assert register_known_names(con, NAMES)
+        rows = con.execute(
+            f"SELECT {known_names_sql('v')} FROM (VALUES "
+            "('kaspa:qtag, kaspa:qx, kaspa:qexchange'), (NULL), ('kaspa:qx')) t(v)"
+        ).fetchall()
+        assert rows == [("<b>Tag</b>, kaspa:qx, Exchange",), (None,), ("kaspa:qx",)]
+
+
+@patch("src.export.csv_export.get_active_api_config", return_value=API_CONFIG)
+class TestCsvKnownNames:
+
+    def test_database_and_dataframe_exports_substitute_names(self, _config, tmp_path):
+        df = _transactions(12)
+        db = TransactionDB(str(tmp_path / "tx.duckdb"), initialize_tx_schema)
+        try:
+            db.upsert_transactions_df(df)
+            db_path = str(tmp_path / "db.csv")
+            ok, _, _ = export_transactions_to_csv(
+                db, db_path, ADDRESS, "", "usd", known_names_map=NAMES
+            )
+            assert ok
+            multi = export_transactions_to_formats(
+                db,
+                {"csv": str(tmp_path / "multi.csv")},
+                ADDRESS,
+                "",
+                "usd",
+                known_names_map=NAMES,
+            )
+            assert multi["csv"][0]
+            stored = pd.DataFrame(db.filter_transactions(ADDRESS))
+        finally:
+            db.close()
+        df_path = str(tmp_path / "df.csv")
+        ok, _, _ = export_to_csv(
+            stored, df_path, ADDRESS, "", "usd", known_names_map=NAMES
+        )
+        assert ok
+
+        rows = _csv_rows(db_path)
+        assert rows == _csv_rows(df_path) == _csv_rows(str(tmp_path / "multi.csv"))
+        by_txid = {r["Transaction ID"]: r for r in rows}
+        assert by_txid["tx0000000"]["From Address(es)"] == "Exchange"
+        assert (
+            by_txid["tx0000002"]["From Address(es)"]
+            == "'=Pool, kaspa:qother, <b>Tag</b>"
+        )
+        assert by_txid["tx0000001"]["To Address(es)"] == f"{ADDRESS}, Exchange"
+
+    def test_without_names_addresses_are_kept(self, _config, tmp_path):
+        path = str(tmp_path / "plain.csv")
+        ok, _, _ = export_to_csv(_transactions(3), path, ADDRESS, "", "usd")
+        assert ok
+        assert _csv_rows(path)[0]["From Address(es)"] == "kaspa:qexchange"
+
+
+@patch("src.export.csv_export.get_active_api_config", return_value=API_CONFIG)
+class TestKnownNamesPerformance:
+
+    @pytest.mark.parametrize(
+        "rows, budget",
+        [
+            (100_000, 15.0),
+            pytest.param(
+                1_000_000,
+                60.0,
+                marks=pytest.mark.skipif(
+                    not os.environ.get("KASPA_RUN_BENCHMARKS"),
+                    reason="set KASPA_RUN_BENCHMARKS=1 to run",
+                ),
+            ),
+        ],
+    )
+    def test_export_benchmark(self, _config, tmp_path, rows, budget):
+        df = _transactions(rows)
+        names = {f"kaspa:qname{i}": f"Name {i}" for i in range(5_000)}
+        names.update(NAMES)
+        path = str(tmp_path / f"bench_{rows}.csv")
+
+        start_time = time.perf_counter()
+        ok, _, _ = export_to_csv(df, path, ADDRESS, "", "usd", known_names_map=names)
+        sql_duration = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        resolve_known_names(df["from_address"], names, sanitize_csv_cell)
+        resolve_known_names(df["to_address"], names, sanitize_csv_cell)
+        pandas_duration = time.perf_counter() - start_time
+
+        print(
+            f"Resolved names for {rows} rows: CSV export {sql_duration:.2f}s, "
+            f"DataFrame {pandas_duration:.2f}s"
+        )
+        assert ok
+        assert sql_duration < budget
+        assert pandas_duration < budget
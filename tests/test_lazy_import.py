@@ -0,0 +1,110 @@
+import logging
+import subprocess
+import sys
+import textwrap
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.gui.lazy_tabs import LazyTabFactory
+from src.utils import lazy_import
+from src.utils.lazy_import import lazy_callable, log_import_budget, record_import_time
+
+
+def _run(code):
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def import_table(monkeypatch):
+    monkeypatch.setattr(lazy_import, "_import_times", {})
+    return lazy_import._import_times
+
+
+class TestLazyExports:
+
+    def test_backends_load_on_first_call(self):
+        out = _run(
+            """
+            import sys
+            from src.export import export_df_to_pdf, export_transactions_to_csv
+            print("reportlab" in sys.modules, "src.export.pdf_export" in sys.modules)
+            print(export_transactions_to_csv.__name__)
+            try:
+                export_df_to_pdf()
+            except TypeError:
+                pass
+            print("src.export.pdf_export" in sys.modules, "src.export.csv_export" in sys.modules)
+            """
+        )
+        assert out.splitlines() == [
+            "False False",
+            "export_transactions_to_csv",
+            "True False",
+        ]
+
+    def test_fonts_register_on_first_pdf_export(self):
+        out = _run(
+            """
+            from reportlab.pdfbase import pdfmetrics
+            from src.export import pdf_utils
+            print("DejaVuSans" in pdfmetrics.getRegisteredFontNames())
+            pdf_utils.register_pdf_fonts()
+            pdf_utils.register_pdf_fonts()
+            print("DejaVuSans-Bold" in pdfmetrics.getRegisteredFontNames())
+            """
+        )
+        assert out.splitlines() == ["False", "True"]
+
+    def test_unknown_names_still_raise(self):
+        import src.export
+
+        with pytest.raises(AttributeError):
+            src.export.export_to_nowhere
+
+
+class TestImportBudget:
+
+    def test_lazy_callable_records_import(self, import_table):
+        dumps = lazy_callable("json", "dumps")
+        assert "not loaded" in repr(dumps)
+        assert dumps({"a": 1}) == '{"a": 1}'
+        assert dumps.__name__ == "dumps"
+        # json is already imported, so nothing new is timed.
+        assert import_table == {}
+
+    def test_nested_imports_are_not_counted_twice(self, import_table, caplog):
+        record_import_time("src.core.app", 1.5)
+        record_import_time("src.database", 1.0, part_of="src.core.app")
+        record_import_time("src.export.pdf_export", 0.25)
+        with caplog.at_level(logging.INFO, logger="src.utils.lazy_import"):
+            assert log_import_budget(2.0) == 1.75
+        assert "Slowest: src.core.app 1.500s, src.database 1.000s" in caplog.text
+
+        caplog.clear()
+        with caplog.at_level(logging.WARNING, logger="src.utils.lazy_import"):
+            log_import_budget(1.0)
+        assert caplog.records[-1].levelno == logging.WARNING
+
+
+class TestLazyTabFactory:
+
+    def test_tabs_are_built_once_on_demand(self):
+        factory = LazyTabFactory()
+        frame = object()
+        builder = MagicMock(return_value="tab")
+        factory.register("Kaspa Node", frame, builder)
+        assert not factory.is_built("Kaspa Node")
+
+        assert factory.build_for_frame(object()) is None
+        assert factory.build_for_frame(frame) == "tab"
+        assert factory.build("Kaspa Node") == "tab"
+        builder.assert_called_once_with(frame)
+        assert factory.build("Unknown") is None
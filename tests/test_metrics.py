@@ -0,0 +1,102 @@
+import json
+import random
+
+import pytest
+
+from src.utils import metrics as metrics_module
+from src.utils.metrics import MetricsRegistry, timed, _bucket_bounds, _bucket_index
+from src.utils.profiling import log_performance
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    reg = MetricsRegistry()
+    monkeypatch.setattr(metrics_module, "_registry", reg)
+    return reg
+
+
+class TestHistogram:
+
+    def test_buckets_are_contiguous_and_bounded(self):
+        previous = -1
+        for value in list(range(2000)) + [10**6, 10**9, 2**40 + 12345]:
+            index = _bucket_index(value)
+            low, high = _bucket_bounds(index)
+            assert low <= value <= high
+            assert high - low <= max(1, value // 16)
+            if value < 2000:
+                assert index in (previous, previous + 1)
+                previous = index
+
+    def test_percentiles_within_bucket_error(self, registry):
+        rng = random.Random(7)
+        values = sorted(rng.randint(100, 500_000) for _ in range(10_000))
+        histogram = registry.histogram("work")
+        for value in values:
+            histogram.record_us(value)
+        for percent in (50, 95, 99):
+            exact = values[int(len(values) * percent / 100) - 1] / 1_000_000
+            assert histogram.percentile(percent) == pytest.approx(exact, rel=0.04)
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 10_000
+        assert snapshot["max"] == values[-1] / 1_000_000
+        assert snapshot["min"] == values[0] / 1_000_000
+
+
+class TestMetricsRegistry:
+
+    def test_timed_records_calls_and_errors(self, registry):
+        @timed("stage")
+        def work(fail=False):
+            if fail:
+                raise ValueError("boom")
+            return 1
+
+        assert work() == 1
+        with pytest.raises(ValueError):
+            work(fail=True)
+        snapshot = registry.snapshot()
+        assert snapshot["histograms"]["stage"]["count"] == 2
+        assert snapshot["counters"]["stage.errors"] == 1
+
+    def test_disabled_registry_records_nothing(self, registry):
+        registry.apply_settings({"metrics_enabled": False})
+
+        @log_performance
+        def work():
+            return "ok"
+
+        assert work() == "ok"
+        with registry.timer("block"):
+            pass
+        assert registry.snapshot()["histograms"] == {}
+
+    def test_log_performance_samples_resources(self, registry):
+        registry.apply_settings({"metrics_resource_sample_every": 3})
+
+        @log_performance
+        def work():
+            return None
+
+        for _ in range(7):
+            work()
+        histograms = registry.snapshot()["histograms"]
+        name = work.__qualname__
+        assert histograms[name]["count"] == 7
+        assert histograms[f"{name}.cpu"]["count"] == 3
+        assert registry.gauge("process.rss_bytes").value > 0
+
+    def test_dump_json_and_reset(self, registry, tmp_path):
+        histogram = registry.histogram("stage")
+        histogram.record(0.25)
+        registry.counter("hits").inc(3)
+        path = tmp_path / "metrics.json"
+        registry.dump_json(str(path))
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["counters"] == {"hits": 3}
+        assert data["histograms"]["stage"]["p99"] == pytest.approx(0.25, rel=0.04)
+
+        registry.reset()
+        assert registry.snapshot()["histograms"] == {}
+        histogram.record(0.5)
+        assert registry.snapshot()["histograms"]["stage"]["count"] == 1
@@ -0,0 +1,173 @@
+from unittest.mock import MagicMock, patch
+
+import duckdb
+import pytest
+
+from src.database import TransactionDB, initialize_addr_schema, initialize_tx_schema
+from src.database import db_schema
+from src.database.db_manager import DatabaseManager
+from src.database.db_schema import (
+    ADDR_MIGRATIONS,
+    TX_MIGRATIONS,
+    TX_SCHEMA,
+    cluster_transactions,
+)
+from src.database.migrations import (
+    Migration,
+    check_migrations,
+    current_version,
+    migrate,
+    set_progress_listener,
+)
+from src.utils.db_utils import retry_on_schema_error
+from src.utils.errors import DatabaseError
+
+
+@pytest.fixture
+def con():
+    connection = duckdb.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def progress():
+    listener = MagicMock()
+    set_progress_listener(listener)
+    yield listener
+    set_progress_listener(None)
+
+
+def _noop(con, progress):
+    pass
+
+
+class TestMigrationEngine:
+
+    def test_up_to_date_file_costs_one_query(self, con):
+        initialize_tx_schema(con)
+        assert current_version(con) == TX_MIGRATIONS[-1].version
+        spy = MagicMock(wraps=con)
+        initialize_tx_schema(spy)
+        assert spy.execute.call_count == 1
+
+    def test_failed_step_is_rolled_back(self, con):
+        def broken(con, progress):
+            con.execute("CREATE TABLE half_done(id INTEGER)")
+            con.execute("SELECT * FROM missing_table")
+
+        steps = [Migration(1, "ok", _noop), Migration(2, "broken", broken)]
+        with pytest.raises(DatabaseError):
+            migrate(con, steps)
+        assert current_version(con) == 1
+        assert ("half_done",) not in con.execute("SHOW TABLES").fetchall()
+
+    def test_python_error_in_step_is_rolled_back(self, con):
+        def broken(con, progress):
+            con.execute("CREATE TABLE half_done(id INTEGER)")
+            raise KeyError("bug")
+
+        with pytest.raises(DatabaseError):
+            migrate(con, [Migration(1, "ok", _noop), Migration(2, "broken", broken)])
+        assert current_version(con) == 1
+        assert ("half_done",) not in con.execute("SHOW TABLES").fetchall()
+        con.execute("BEGIN TRANSACTION")  # No transaction was left open.
+        con.execute("ROLLBACK")
+
+    def test_newer_file_is_left_alone(self, con):
+        migrate(con, [Migration(1, "a", _noop), Migration(2, "b", _noop)])
+        apply = MagicMock()
+        assert migrate(con, [Migration(1, "a", apply)]) == 2
+        apply.assert_not_called()
+
+    def test_versions_must_be_consecutive(self):
+        with pytest.raises(ValueError):
+            check_migrations([Migration(1, "a", _noop), Migration(3, "c", _noop)])
+
+    def test_progress_reaches_listener(self, con, progress):
+        def step(con, report):
+            report(0.5)
+
+        migrate(con, [Migration(1, "a", _noop), Migration(2, "b", step)], "Test")
+        fractions = [call.args[2] for call in progress.call_args_list]
+        assert fractions == [0.0, 0.5, 0.5, 0.75, 1.0]
+        assert progress.call_args.args[:2] == ("Test", "b")
+
+
+class TestDatabaseMigrations:
+
+    def test_legacy_transactions_are_normalized(self, con, progress):
+        con.execute(TX_SCHEMA["transactions"])
+        rows = [("t1", "kaspa:qB", 3), ("t2", " kaspa:qa", 2), ("t3", "kaspa:qb", 1)]
+        con.executemany(
+            "INSERT INTO transactions (txid, address, timestamp) VALUES (?, ?, ?)", rows
+        )
+        with patch.object(db_schema, "MIGRATION_BATCH_ROWS", 1):
+            initialize_tx_schema(con)
+
+        assert con.execute("SELECT txid, address FROM transactions ORDER BY txid").fetchall() == [
+            ("t1", "kaspa:qb"),
+            ("t2", "kaspa:qa"),
+            ("t3", "kaspa:qb"),
+        ]
+        assert progress.call_count > 2 * len(TX_MIGRATIONS)
+
+    def test_legacy_addresses_gain_created_at_and_merge(self, con):
+        con.execute("CREATE TABLE addresses(address VARCHAR PRIMARY KEY, name VARCHAR)")
+        con.execute("INSERT INTO addresses VALUES ('KASPA:QA ', 'old'), ('kaspa:qb', 'b')")
+        initialize_addr_schema(con)
+        assert con.execute("SELECT address, name FROM addresses ORDER BY 1").fetchall() == [
+            ("kaspa:qa", "old"),
+            ("kaspa:qb", "b"),
+        ]
+        assert current_version(con) == ADDR_MIGRATIONS[-1].version
+
+    def test_dropped_table_is_repaired_on_retry(self, tmp_path):
+        @retry_on_schema_error(initialize_tx_schema)
+        def count(db):
+            con = db.connection_pool.get_connection()
+            return con.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+
+        db = TransactionDB(str(tmp_path / "tx.duckdb"), initialize_tx_schema)
+        with db.connect() as con:
+            con.execute("DROP TABLE transactions")
+        assert count(db) == 0
+        db.close()
+
+
+class TestClusterTransactions:
+
+    def test_rewrites_in_address_and_time_order(self, con):
+        initialize_tx_schema(con)
+        rows = [("t1", "kaspa:qb", 3), ("t2", "kaspa:qa", 2), ("t3", "kaspa:qb", 1)]
+        con.executemany(
+            "INSERT INTO transactions (txid, address, timestamp) VALUES (?, ?, ?)", rows
+        )
+        fractions = []
+        with patch.object(db_schema, "MIGRATION_BATCH_ROWS", 1):
+            cluster_transactions(con, fractions.append)
+
+        assert con.execute("SELECT txid FROM transactions").fetchall() == [
+            ("t2",),
+            ("t3",),
+            ("t1",),
+        ]
+        assert fractions[-1] == 1.0
+        assert ("transactions_sorted",) not in con.execute("SHOW TABLES").fetchall()
+        with pytest.raises(duckdb.ConstraintException):
+            con.execute("INSERT INTO transactions (txid, address) VALUES ('t1', 'x')")
+
+    def test_compact_database_clusters_transactions(self, tmp_path):
+        path = tmp_path / "tx.duckdb"
+        with duckdb.connect(str(path)) as con:
+            initialize_tx_schema(con)
+            con.execute(
+                "INSERT INTO transactions (txid, address, timestamp) "
+                "VALUES ('t1', 'kaspa:qb', 1), ('t2', 'kaspa:qa', 2)"
+            )
+        manager = MagicMock(data_dir=str(tmp_path))
+        ok, _ = DatabaseManager.compact_database(manager, "tx.duckdb")
+        assert ok
+        with duckdb.connect(str(path)) as con:
+            assert con.execute("SELECT txid FROM transactions").fetchall() == [("t2",), ("t1",)]
+            assert current_version(con) == TX_MIGRATIONS[-1].version
@@ -0,0 +1,172 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.api.cache import response_cache
+from src.api.mock_server import HISTORY_CHUNK, MockKaspaAPI
+from src.api.network import (
+    _make_api_request,
+    fetch_address_balance,
+    fetch_address_names_if_modified,
+    fetch_kaspa_info,
+    fetch_network_stats,
+    fetch_top_addresses,
+)
+from src.api.rate_limit import host_guard_stats, reset_host_guards
+from src.config.config import CONFIG
+from src.gui.transaction_manager import _process_raw_transactions
+
+ADDRESS = "kaspa:qmockaddressmain"
+PERFORMANCE = {"retry_attempts": 3, "timeout": 5, "backoff_factor": 0}
+
+
+@pytest.fixture(autouse=True)
+def fresh_client_state():
+    reset_host_guards()
+    response_cache.clear()
+    yield
+    reset_host_guards()
+    response_cache.clear()
+
+
+@pytest.fixture
+def serve():
+    """Starts a MockKaspaAPI and makes it the active API profile."""
+    servers = []
+    patcher = patch.dict(CONFIG, {"performance": PERFORMANCE})
+
+    def start(**kwargs):
+        api = MockKaspaAPI(**kwargs)
+        api.start()
+        servers.append(api)
+        CONFIG["api"] = {
+            "active_profile": "Mock",
+            "profiles": {"Mock": api.api_profile(
+                rate_limit={"requests_per_second": 100, "burst": 100}
+            )},
+        }
+        return api
+
+    patcher.start()
+    yield start
+    patcher.stop()
+    for api in servers:
+        api.stop()
+
+
+def _page_url(api, offset, limit=500, address=ADDRESS):
+    endpoint = api.api_profile()["endpoints"]["full_transactions"]
+    return api.base_url + endpoint.format(kaspaAddress=address, limit=limit, offset=offset)
+
+
+def _fetch_all(api, limit=500):
+    transactions, offset = [], 0
+    while True:
+        page = _make_api_request(_page_url(api, offset, limit))
+        if not page:
+            return transactions
+        transactions.extend(page)
+        offset += len(page)
+
+
+class TestHistories:
+
+    def test_pages_cover_the_history_newest_first(self, serve):
+        api = serve(histories={ADDRESS: 1_234})
+        transactions = _fetch_all(api)
+        assert len(transactions) == 1_234
+        assert len({tx["transaction_id"] for tx in transactions}) == 1_234
+        times = [tx["block_time"] for tx in transactions]
+        assert times == sorted(times, reverse=True)
+        assert api.stats()["requests"]["full_transactions"] == 4
+
+    def test_pages_do_not_depend_on_page_size(self, serve):
+        api = serve(histories={ADDRESS: HISTORY_CHUNK + 77})
+        assert _fetch_all(api, limit=500) == _fetch_all(api, limit=37)
+
+    def test_same_seed_serves_the_same_history(self, serve):
+        first = _fetch_all(serve(histories={ADDRESS: 600}, seed=5))
+        second = _fetch_all(serve(histories={ADDRESS: 600}, seed=5))
+        assert first == second
+        assert first != _fetch_all(serve(histories={ADDRESS: 600}, seed=6))
+
+    def test_deep_pages_of_huge_histories_are_cheap(self, serve):
+        api = serve(default_history=10_000_000)
+        start = time.perf_counter()
+        page = _make_api_request(_page_url(api, 5_000_000))
+        assert time.perf_counter() - start < 2
+        assert len(page) == 500
+        assert _make_api_request(_page_url(api, 10_000_000)) == []
+
+    def test_history_feeds_the_normalizer(self, serve):
+        api = serve(histories={ADDRESS: 300})
+        df = _process_raw_transactions(_fetch_all(api), ADDRESS, {"usd": 0.1})
+        assert 0 < len(df) <= 300
+        assert set(df["direction"]) == {"incoming", "outgoing"}
+
+    def test_invalid_paging_is_rejected(self, serve):
+        api = serve(histories={ADDRESS: 10})
+        assert api.handle(f"/addresses/{ADDRESS}/full-transactions?limit=501", {})[0] == 422
+        assert api.handle(f"/addresses/{ADDRESS}/full-transactions?offset=x", {})[0] == 422
+        assert api.handle("/addresses/nope/full-transactions", {})[0] == 400
+        assert api.handle("/unknown", {})[0] == 404
+
+
+class TestEndpoints:
+
+    def test_info_endpoints(self, serve):
+        serve()
+        info = fetch_kaspa_info()
+        assert set(info) == {
+            "network", "kaspad", "blockdag", "coinsupply",
+            "halving", "hashrate", "blockreward", "maxhashrate",
+        }
+        stats = fetch_network_stats()
+        assert stats["hashrate"] == 425.0
+        assert stats["difficulty"] > 0
+
+    def test_balance_and_top_addresses(self, serve):
+        serve()
+        balance = fetch_address_balance(ADDRESS)
+        assert balance is not None and balance >= 0
+        assert fetch_address_balance(ADDRESS) == balance
+        ranking = fetch_top_addresses()[0]["ranking"]
+        assert [entry["rank"] for entry in ranking[:3]] == [0, 1, 2]
+
+    def test_address_names_are_revalidated(self, serve):
+        api = serve()
+        names, validators = fetch_address_names_if_modified()
+        assert len(names) == len(api.names)
+        assert validators["etag"] == api.names_etag
+        assert fetch_address_names_if_modified(validators) == (None, validators)
+        assert api.stats()["responses"][304] == 1
+
+
+class TestFaults:
+
+    def test_latency_is_added(self, serve):
+        api = serve(latency=0.05)
+        start = time.perf_counter()
+        assert _make_api_request(api.base_url + "/info/hashrate")
+        assert time.perf_counter() - start >= 0.05
+
+    def test_server_errors_are_retried_then_given_up(self, serve):
+        api = serve(error_rate=1.0)
+        assert _make_api_request(api.base_url + "/info/hashrate") is None
+        assert api.stats()["responses"] == {503: PERFORMANCE["retry_attempts"]}
+
+    def test_throttled_requests_wait_for_retry_after(self, serve):
+        api = serve(throttle_rate=0.3, retry_after=0, seed=1)
+        for _ in range(10):
+            assert _make_api_request(api.base_url + "/info/blockreward")
+        responses = api.stats()["responses"]
+        assert responses[200] == 10
+        assert responses[429] > 0
+        assert host_guard_stats()[0]["throttled"] == responses[429]
+
+    def test_server_side_rate_limit(self):
+        api = MockKaspaAPI(requests_per_second=1, burst=2)
+        statuses = [api.handle("/info/hashrate", {}) for _ in range(3)]
+        assert [status for status, _, _ in statuses] == [200, 200, 429]
+        assert statuses[2][2] == {"Retry-After": "1"}
@@ -0,0 +1,186 @@
+import os
+import subprocess
+import sys
+import textwrap
+import time
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.export import pdf_export
+from src.export.pdf_export import export_to_pdf
+
+pypdf = pytest.importorskip("pypdf")
+
+ADDRESS = "kaspa:qpdfexport"
+MAIN_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src", "main.py")
+API_CONFIG = {
+    "language": "en",
+    "explorer": {
+        "address": "https://explorer.test/addresses/{kaspaAddress}",
+        "transaction": "https://explorer.test/txs/{txid}",
+    },
+}
+
+
+def _transactions(count):
+    return pd.DataFrame(
+        {
+            "txid": [f"{i:064x}" for i in range(count)],
+            "direction": ["incoming" if i % 2 else "outgoing" for i in range(count)],
+            "amount": [i / 3 for i in range(count)],
+            "value_usd": [None if i % 7 == 0 else i * 0.05 for i in range(count)],
+            "timestamp": [1_700_000_000 + i for i in range(count)],
+            "type": "transfer",
+        }
+    )
+
+
+def _page_numbers(reader):
+    return [
+        int(page.extract_text().split("Page ")[1].split()[0]) for page in reader.pages
+    ]
+
+
+def _links(reader):
+    return [
+        annot.get_object()["/A"]["/URI"]
+        for page in reader.pages
+        for annot in page.get("/Annots", [])
+    ]
+
+
+@patch("src.export.pdf_export.get_active_api_config", return_value=API_CONFIG)
+class TestPdfExport:
+
+    def test_single_process_report(self, _config, tmp_path):
+        path = str(tmp_path / "small.pdf")
+        ok, _, name = export_to_pdf(_transactions(300), path, ADDRESS, "Wallet", "usd")
+        assert ok and name == "small.pdf"
+
+        reader = pypdf.PdfReader(path)
+        assert _page_numbers(reader) == list(range(1, len(reader.pages) + 1))
+        links = _links(reader)
+        assert links[0] == f"https://explorer.test/addresses/{ADDRESS}"
+        assert links[1:] == [f"https://explorer.test/txs/{i:064x}" for i in range(300)]
+
+    def test_partitions_merge_with_continuous_pages(self, _config, tmp_path):
+        path = str(tmp_path / "parallel.pdf")
+        with patch.object(pdf_export, "PARALLEL_MIN_ROWS", 100), patch.object(
+            pdf_export, "MIN_PAGES_PER_PARTITION", 2
+        ):
+            ok, _, _ = export_to_pdf(
+                _transactions(1_000), path, ADDRESS, "", "usd", workers=2
+            )
+        assert ok
+
+        reader = pypdf.PdfReader(path)
+        assert len(reader.pages) > 4
+        assert _page_numbers(reader) == list(range(1, len(reader.pages) + 1))
+        assert "Kaspa Transaction Report" in reader.pages[0].extract_text()
+        assert "Kaspa Transaction Report" not in reader.pages[1].extract_text()
+        links = _links(reader)
+        assert links[1:] == [
+            f"https://explorer.test/txs/{i:064x}" for i in range(1_000)
+        ]
+
+    def test_single_process_without_pypdf(self, _config, tmp_path):
+        path = str(tmp_path / "fallback.pdf")
+        with patch.object(pdf_export, "PYPDF_AVAILABLE", False), patch.object(
+            pdf_export, "PARALLEL_MIN_ROWS", 100
+        ), patch.object(pdf_export, "ProcessPoolExecutor") as pool:
+            ok, _, _ = export_to_pdf(_transactions(1_000), path, ADDRESS, "", "usd")
+        assert ok
+        pool.assert_not_called()
+        assert len(pypdf.PdfReader(path).pages) > 4
+
+
+def _run(code, env=None):
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        timeout=300,
+        env=env,
+    )
+    assert result.returncode == 0, result.stderr
+    return result
+
+
+class TestSpawnedWorkers:
+    """Spawned workers re-import the app's __main__ (src/main.py) as __mp_main__."""
+
+    def test_importing_main_has_no_side_effects(self):
+        _run(
+            f"""
+            import logging, runpy, sys
+            runpy.run_path({MAIN_PATH!r}, run_name="__mp_main__")
+            assert "src.config.config" not in sys.modules
+            assert "src.core.app" not in sys.modules
+            assert not logging.getLogger().handlers
+            """
+        )
+
+    def test_parallel_export_leaves_config_and_logs_alone(self, tmp_path):
+        user_data = tmp_path / "appdata"
+        env = dict(os.environ, LOCALAPPDATA=str(user_data), APPDATA=str(user_data))
+        _run(
+            f"""
+            import sys
+            from unittest.mock import patch
+            # Make the workers start from src/main.py, as they do in the app.
+            sys.modules["__main__"].__file__ = {MAIN_PATH!r}
+            sys.modules["__main__"].__spec__ = None
+            sys.path.insert(0, {os.path.dirname(os.path.dirname(MAIN_PATH))!r})
+            from tests.test_pdf_export import ADDRESS, API_CONFIG, _transactions
+            from src.export import pdf_export
+
+            if __name__ == "__main__":
+                pool_class = pdf_export.ProcessPoolExecutor
+                with patch.object(
+                    pdf_export, "get_active_api_config", return_value=API_CONFIG
+                ), patch.object(pdf_export, "ProcessPoolExecutor", wraps=pool_class) as pool:
+                    ok, _, _ = pdf_export.export_to_pdf(
+                        _transactions(pdf_export.PARALLEL_MIN_ROWS),
+                        {str(tmp_path / "spawned.pdf")!r}, ADDRESS, "", "usd", workers=2,
+                    )
+                assert ok and pool.called
+            """,
+            env=env,
+        )
+        assert not user_data.exists()
+
+
+@patch("src.export.pdf_export.get_active_api_config", return_value=API_CONFIG)
+class TestPdfExportPerformance:
+
+    # 100k rows takes a while even in parallel; opt in with KASPA_RUN_BENCHMARKS=1.
+    @pytest.mark.parametrize(
+        "rows, budget",
+        [
+            (1_000, 10.0),
+            (10_000, 60.0),
+            pytest.param(
+                100_000,
+                600.0,
+                marks=pytest.mark.skipif(
+                    not os.environ.get("KASPA_RUN_BENCHMARKS"),
+                    reason="set KASPA_RUN_BENCHMARKS=1 to run",
+                ),
+            ),
+        ],
+    )
+    def test_export_benchmark(self, _config, tmp_path, rows, budget):
+        df = _transactions(rows)
+        path = str(tmp_path / f"bench_{rows}.pdf")
+
+        start_time = time.perf_counter()
+        ok, _, _ = export_to_pdf(df, path, ADDRESS, "", "usd")
+        duration = time.perf_counter() - start_time
+
+        print(f"Exported {rows} rows to PDF in {duration:.2f} seconds")
+        assert ok
+        assert duration < budget
+        reader = pypdf.PdfReader(path)
+        assert _page_numbers(reader)[-1] == len(reader.pages)
@@ -0,0 +1,157 @@
+import os
+import subprocess
+import sys
+import time
+import psutil
+import pytest
+from src.export.process_stats_csv_export import export_process_stats_to_csv
+from src.utils.process_supervisor import ProcessSample, ProcessSupervisor, counter_rates
+
+
+def _spawn_sleeper():
+    return subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+
+
+class TestProcessSupervisor:
+
+    @pytest.fixture
+    def sleepers(self):
+        procs = [_spawn_sleeper(), _spawn_sleeper()]
+        yield procs
+        for p in procs:
+            p.kill()
+            p.wait()
+
+    @pytest.fixture
+    def supervisor(self):
+        sup = ProcessSupervisor(sample_interval=0.1, external_scan_ttl=60)
+        yield sup
+        sup.stop()
+
+    def test_managed_processes_are_not_external(self, supervisor, sleepers):
+        exe_name = psutil.Process(sleepers[0].pid).name()
+        supervisor.register("managed", sleepers[0])
+
+        external = supervisor.find_external(exe_name)
+        assert sleepers[0].pid not in external
+        assert sleepers[1].pid in external
+
+    def test_scan_is_cached_within_ttl(self, supervisor, sleepers):
+        exe_name = psutil.Process(sleepers[0].pid).name()
+        supervisor.find_external(exe_name)
+        supervisor.find_external(exe_name)
+        supervisor.find_external(exe_name.upper())
+        assert supervisor.full_scans == 1
+        assert supervisor.cached_lookups == 2
+
+        # Exited processes are dropped by the targeted re-validation.
+        sleepers[1].kill()
+        sleepers[1].wait()
+        assert sleepers[1].pid not in supervisor.find_external(exe_name)
+        assert supervisor.full_scans == 1
+
+        supervisor.invalidate_external_cache()
+        supervisor.find_external(exe_name)
+        assert supervisor.full_scans == 2
+
+    def test_one_scan_serves_all_watched_names(self, supervisor, sleepers):
+        exe_name = psutil.Process(sleepers[0].pid).name()
+        supervisor.find_external("kaspad.exe")
+        supervisor.find_external(exe_name)
+        scans = supervisor.full_scans
+        assert supervisor.find_external("kaspad.exe") == []
+        assert sleepers[0].pid in supervisor.find_external(exe_name)
+        assert supervisor.full_scans == scans
+
+    def test_sampler_collects_resource_usage(self, supervisor, sleepers):
+        supervisor.register("node", sleepers[0])
+        deadline = time.time() + 5
+        sample = None
+        while sample is None and time.time() < deadline:
+            time.sleep(0.05)
+            sample = supervisor.get_latest_sample("node")
+
+        assert sample is not None
+        assert sample.pid == sleepers[0].pid
+        assert sample.rss_bytes > 0
+        assert sample.cpu_percent >= 0.0
+
+        supervisor.unregister("node")
+        assert supervisor.get_latest_sample("node") is None
+        assert supervisor.managed_pids() == set()
+
+    def test_history_is_a_ring_buffer(self, sleepers):
+        supervisor = ProcessSupervisor(sample_interval=0.05, history_size=3)
+        try:
+            supervisor.register("node", sleepers[0])
+            deadline = time.time() + 5
+            while len(supervisor.get_history("node")) < 3 and time.time() < deadline:
+                time.sleep(0.05)
+            time.sleep(0.2)
+
+            history = supervisor.get_history("node")
+            assert len(history) == 3
+            assert [s.timestamp for s in history] == sorted(s.timestamp for s in history)
+            assert history[-1].num_fds is None or history[-1].num_fds > 0
+
+            # History survives the process exit and can be resized.
+            supervisor.unregister("node")
+            assert len(supervisor.get_history("node")) == 3
+            supervisor.set_history_size(2)
+            assert supervisor.get_history("node") == history[-2:]
+        finally:
+            supervisor.stop()
+
+    def test_apply_settings(self, supervisor):
+        supervisor.apply_settings(
+            {"process_sample_interval_seconds": "5", "process_history_size": 10}
+        )
+        assert supervisor.sample_interval == 5.0
+        assert supervisor.history_size == 10
+
+        supervisor.apply_settings({"process_sample_interval_seconds": "abc"})
+        assert supervisor.sample_interval == 5.0
+
+
+def _sample(ts, read_bytes, pid=1):
+    return ProcessSample(
+        key="node",
+        pid=pid,
+        timestamp=ts,
+        cpu_percent=12.5,
+        rss_bytes=1024,
+        read_bytes=read_bytes,
+        write_bytes=0,
+    )
+
+
+class TestResourceHistory:
+
+    def test_counter_rates(self):
+        samples = [
+            _sample(100.0, 0),
+            _sample(102.0, 2048),
+            _sample(103.0, None),
+            _sample(104.0, 4096),
+            _sample(105.0, 0),  # counter reset
+            _sample(106.0, 100, pid=2),  # process restarted
+        ]
+        assert counter_rates(samples, "read_bytes") == [
+            None, 1024.0, None, None, None, None,
+        ]
+
+    def test_csv_export(self, tmp_path):
+        samples = [_sample(1_700_000_000.0, 10), _sample(1_700_000_002.0, None)]
+        success, msg, name = export_process_stats_to_csv(
+            samples, str(tmp_path / "stats"), "kaspad"
+        )
+        assert success, name
+        assert name == "stats.csv"
+
+        lines = (tmp_path / "stats.csv").read_text(encoding="utf-8-sig").splitlines()
+        assert lines[0].startswith("# ")
+        assert lines[1].endswith(": kaspad")
+        header_idx = lines.index("") + 1
+        assert lines[header_idx].startswith("Timestamp,PID,CPU (%),RSS (bytes)")
+        assert lines[header_idx + 1].split(",")[1:5] == ["1", "12.50", "1024", ""]
+        assert lines[header_idx + 2].split(",")[5] == ""
@@ -0,0 +1,196 @@
+import hashlib
+import io
+import os
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.utils.errors import DownloadCancelled
+from src.utils.range_download import RangeDownloader
+
+
+class _FileServer:
+    """Serves one in-memory payload, optionally honouring Range headers."""
+
+    def __init__(self, payload, support_ranges=True):
+        self.payload = payload
+        self.support_ranges = support_ranges
+        self.etag = '"v1"'
+        self.range_requests = []
+        self.on_chunk = None
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                data, status = server.payload, 200
+                start, end = 0, len(data) - 1
+                header = self.headers.get("Range")
+                if header and server.support_ranges:
+                    start_s, end_s = header.split("=")[1].split("-")
+                    start, end = int(start_s), min(int(end_s), len(data) - 1)
+                    server.range_requests.append((start, end))
+                    status = 206
+                self.send_response(status)
+                self.send_header("Content-Length", str(end - start + 1))
+                self.send_header("ETag", server.etag)
+                if status == 206:
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+                self.end_headers()
+                for offset in range(start, end + 1, 64 * 1024):
+                    if server.on_chunk:
+                        server.on_chunk()
+                    try:
+                        self.wfile.write(data[offset : min(offset + 64 * 1024, end + 1)])
+                    except (BrokenPipeError, ConnectionResetError):
+                        return
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/asset.zip"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def payload():
+    return os.urandom(3 * 1024 * 1024 + 12345)
+
+
+@pytest.fixture
+def server(payload):
+    srv = _FileServer(payload)
+    yield srv
+    srv.close()
+
+
+class TestRangeDownloader:
+
+    def test_parallel_download(self, server, payload, tmp_path):
+        dest = str(tmp_path / "asset.zip")
+        progress = []
+        downloader = RangeDownloader(
+            server.url,
+            dest,
+            connections=4,
+            chunk_size=64 * 1024,
+            min_segment_size=512 * 1024,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+        digest = downloader.download()
+
+        assert digest == hashlib.sha256(payload).hexdigest()
+        assert open(dest, "rb").read() == payload
+        assert len(downloader.segments) == 4
+        # Probe plus one request per segment.
+        assert len(server.range_requests) == 5
+        assert progress[-1] == (len(payload), len(payload))
+        assert not os.path.exists(dest + ".state")
+
+    def test_sequential_fallback(self, payload, tmp_path):
+        srv = _FileServer(payload, support_ranges=False)
+        try:
+            dest = str(tmp_path / "asset.zip")
+            digest = RangeDownloader(srv.url, dest, chunk_size=64 * 1024).download()
+        finally:
+            srv.close()
+        assert digest == hashlib.sha256(payload).hexdigest()
+        assert open(dest, "rb").read() == payload
+
+    def test_resume_after_cancel(self, server, payload, tmp_path):
+        dest = str(tmp_path / "asset.zip")
+        cancel = threading.Event()
+        release = threading.Event()
+        served = []
+
+        def stall_midway():
+            # Hold the transfer until the client has seen some progress.
+            served.append(1)
+            if len(served) > 16:
+                release.wait(5)
+
+        def cancel_on_progress(done, total):
+            if done >= 256 * 1024:
+                cancel.set()
+                release.set()
+
+        server.on_chunk = stall_midway
+        first = RangeDownloader(
+            server.url,
+            dest,
+            connections=2,
+            chunk_size=64 * 1024,
+            min_segment_size=512 * 1024,
+            cancel_event=cancel,
+            progress_callback=cancel_on_progress,
+        )
+        with pytest.raises(DownloadCancelled):
+            first.download()
+        assert os.path.exists(dest + ".state")
+        partial = sum(s.done for s in first.segments)
+        assert 0 < partial < len(payload)
+
+        server.on_chunk = None
+        second = RangeDownloader(
+            server.url,
+            dest,
+            connections=2,
+            chunk_size=64 * 1024,
+            min_segment_size=512 * 1024,
+        )
+        digest = second.download()
+        assert second.resumed_bytes == partial
+        assert digest == hashlib.sha256(payload).hexdigest()
+        assert open(dest, "rb").read() == payload
+
+    def test_changed_remote_file_restarts(self, server, payload, tmp_path):
+        dest = str(tmp_path / "asset.zip")
+        cancel = threading.Event()
+        cancel.set()
+        with pytest.raises(DownloadCancelled):
+            RangeDownloader(server.url, dest, cancel_event=cancel).download()
+
+        server.etag = '"v2"'
+        downloader = RangeDownloader(server.url, dest, min_segment_size=512 * 1024)
+        assert downloader.download() == hashlib.sha256(payload).hexdigest()
+        assert downloader.resumed_bytes == 0
+
+
+class TestUpdaterInstall:
+
+    def test_download_and_extract(self, tmp_path):
+        from src.gui.updater import GitHubUpdater
+
+        binary = os.urandom(2 * 1024 * 1024)
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("bin/kaspad.exe", binary)
+        srv = _FileServer(buf.getvalue())
+        local_path = str(tmp_path / "kaspad.exe")
+        logs = []
+        try:
+            updater = GitHubUpdater(
+                repo_url=srv.url,
+                asset_name_pattern=r"asset\.zip",
+                log_callback=logs.append,
+                is_running_check=lambda: False,
+                target_file_in_zip="bin/kaspad.exe",
+                local_path=local_path,
+            )
+            expected = hashlib.sha256(buf.getvalue()).hexdigest()
+            zip_path = updater._download_asset(srv.url, expected)
+            updater._extract_and_install(zip_path, None, "v1")
+            updater._cleanup_temp_files()
+        finally:
+            srv.close()
+
+        assert open(local_path, "rb").read() == binary
+        assert open(local_path + ".version").read() == "v1"
+        assert not os.path.exists(zip_path)
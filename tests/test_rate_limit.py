@@ -0,0 +1,175 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from src.api.network import _get_with_retries
+from src.api.rate_limit import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+    HostGuard,
+    TokenBucket,
+    get_host_guard,
+    host_guard_stats,
+    parse_retry_after,
+    reset_host_guards,
+)
+
+SETTINGS = {
+    "requests_per_second": 2,
+    "burst": 2,
+    "max_wait_seconds": 10,
+    "failure_threshold": 3,
+    "open_seconds": 30,
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _response(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response._content = b"{}"
+    response.url = "https://api.test/info"
+    return response
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(autouse=True)
+def fresh_guards():
+    reset_host_guards()
+    yield
+    reset_host_guards()
+
+
+class TestTokenBucket:
+
+    def test_burst_then_paced(self, clock):
+        bucket = TokenBucket(2, 2, clock, clock.sleep)
+        assert bucket.acquire(10) == 0
+        assert bucket.acquire(10) == 0
+        assert bucket.acquire(10) == pytest.approx(0.5)
+        assert bucket.acquire(0.1) is None
+
+    def test_pause_blocks_until_retry_after(self, clock):
+        bucket = TokenBucket(2, 2, clock, clock.sleep)
+        bucket.pause(5)
+        assert bucket.acquire(1) is None
+        assert bucket.acquire(10) == pytest.approx(5.5)
+
+
+class TestCircuitBreaker:
+
+    def test_opens_half_opens_and_closes(self, clock):
+        breaker = CircuitBreaker(2, 30, clock)
+        assert not breaker.record_failure()
+        assert breaker.record_failure()
+        assert breaker.state == CIRCUIT_OPEN
+        assert not breaker.allow()
+
+        clock.now += 30
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+        assert breaker.record_failure()
+        assert breaker.retry_in() == 30
+
+        clock.now += 30
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CIRCUIT_CLOSED
+
+
+class TestHostGuard:
+
+    def test_429_halves_rate_and_waits_for_retry_after(self, clock):
+        guard = HostGuard("https://api.test", SETTINGS, "Default", clock, clock.sleep)
+        guard.record_response(429, {"Retry-After": "4"})
+        assert guard.bucket.rate == 1
+        assert guard.before_request() is None
+        assert sum(clock.slept) == pytest.approx(5)
+        stats = guard.stats()
+        assert (stats["throttled"], stats["state"]) == (1, CIRCUIT_CLOSED)
+
+    def test_learns_from_rate_limit_headers(self, clock):
+        guard = HostGuard("https://api.test", SETTINGS, None, clock, clock.sleep)
+        guard.record_response(200, {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "10"})
+        assert guard.bucket.rate == 0.5
+        guard.record_response(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "20"})
+        assert guard.bucket.paused_for() == 20
+        guard.record_response(200, {})
+        assert guard.bucket.rate == pytest.approx(0.7)
+
+    def test_open_circuit_fails_fast(self, clock):
+        guard = HostGuard("https://api.test", SETTINGS, None, clock, clock.sleep)
+        for _ in range(3):
+            guard.record_failure()
+        assert "circuit open" in guard.before_request()
+        assert guard.stats()["rejected"] == 1
+
+    def test_retry_after_http_date(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480) == 10
+        assert parse_retry_after("soon") is None
+
+
+@patch.dict(
+    "src.api.network.CONFIG",
+    {
+        "performance": {"retry_attempts": 3, "timeout": 5, "backoff_factor": 0},
+        "api": {
+            "profiles": {
+                "Test": {
+                    "base_url": "https://api.test",
+                    "rate_limit": {"burst": 50, "failure_threshold": 3},
+                }
+            }
+        },
+    },
+)
+class TestRetries:
+
+    def test_settings_follow_the_matching_profile(self):
+        guard = get_host_guard("https://api.test/info/hashrate")
+        assert guard.profile == "Test"
+        assert guard.bucket.capacity == 50
+        assert get_host_guard("https://other.test/x").profile is None
+
+    def test_429_is_retried_after_the_pause(self):
+        responses = [_response(429, {"Retry-After": "0"}), _response(200)]
+        with patch("src.api.network._session.get", side_effect=responses) as get:
+            response = _get_with_retries("https://api.test/info")
+        assert response.status_code == 200
+        assert get.call_count == 2
+        assert host_guard_stats()[0]["throttled"] == 1
+
+    def test_client_errors_are_not_retried(self):
+        with patch("src.api.network._session.get", return_value=_response(404)) as get:
+            assert _get_with_retries("https://api.test/missing") is None
+        assert get.call_count == 1
+
+    def test_down_host_opens_circuit_and_fails_fast(self):
+        get = MagicMock(side_effect=requests.exceptions.ConnectionError("down"))
+        with patch("src.api.network._session.get", get):
+            _get_with_retries("https://api.test/a")
+            assert get.call_count == 3
+            assert get_host_guard("https://api.test").breaker.state == CIRCUIT_OPEN
+            assert _get_with_retries("https://api.test/b") is None
+        assert get.call_count == 3
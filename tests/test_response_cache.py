@@ -0,0 +1,163 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.api import network
+from src.api.cache import ResponseCache, endpoint_max_stale, endpoint_ttl, response_cache
+from src.config.config import DEFAULT_API_PROFILE
+from src.database import AppDataDB, initialize_app_data_schema
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = AppDataDB(str(tmp_path / "app_data.duckdb"), initialize_app_data_schema)
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def cache():
+    response_cache = ResponseCache(max_entries=3)
+    yield response_cache
+    response_cache.shutdown()
+
+
+class TestResponseCache:
+
+    def test_fresh_hit_skips_fetch(self, cache):
+        fetch = MagicMock(return_value={"balance": 1})
+        assert cache.get("url", 60, fetch) == {"balance": 1}
+        assert cache.get("url", 60, fetch) == {"balance": 1}
+        assert fetch.call_count == 1
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_ratio"] == 0.5
+
+    def test_stale_value_is_served_while_revalidating(self, cache):
+        cache.get("url", 60, lambda: "old")
+        with cache._lock:
+            cache._entries["url"] = ("old", time.time() - 120)
+
+        refreshed = threading.Event()
+
+        def fetch():
+            refreshed.set()
+            return "new"
+
+        assert cache.get("url", 60, fetch) == "old"
+        assert refreshed.wait(5)
+        for _ in range(500):
+            if not cache._revalidating:
+                break
+            time.sleep(0.01)
+        assert cache.get("url", 60, MagicMock()) == "new"
+        stats = cache.stats()
+        assert (stats["stale_hits"], stats["revalidations"]) == (1, 1)
+
+    def test_entries_past_stale_limit_are_refetched(self):
+        cache = ResponseCache(max_stale_seconds=60)
+        cache.get("url", 10, lambda: "old")
+        with cache._lock:
+            cache._entries["url"] = ("old", time.time() - 600)
+        assert cache.get("url", 10, lambda: "new") == "new"
+        assert cache.stats()["revalidations"] == 0
+
+    def test_endpoint_stale_limit_overrides_default(self, cache):
+        cache.get("url", 10, lambda: "old")
+        with cache._lock:
+            cache._entries["url"] = ("old", time.time() - 600)
+        assert cache.get("url", 10, lambda: "new", max_stale=0) == "new"
+        assert cache.stats()["stale_hits"] == 0
+
+    def test_lru_evicts_least_recently_used(self, cache):
+        for key in ("a", "b", "c"):
+            cache.get(key, 60, lambda k=key: k)
+        cache.get("a", 60, MagicMock())
+        cache.get("d", 60, lambda: "d")
+        assert list(cache._entries) == ["c", "a", "d"]
+
+    def test_failed_fetch_is_not_cached(self, cache):
+        fetch = MagicMock(side_effect=[None, "ok"])
+        assert cache.get("url", 60, fetch) is None
+        assert cache.get("url", 60, fetch) == "ok"
+        assert cache.stats()["errors"] == 1
+
+    def test_store_survives_restart(self, db):
+        first = ResponseCache(store=db)
+        first.get("https://api.test/info", 60, lambda: {"height": 42})
+
+        second = ResponseCache(store=db)
+        fetch = MagicMock()
+        assert second.get("https://api.test/info", 60, fetch) == {"height": 42}
+        fetch.assert_not_called()
+        assert second.stats()["store_hits"] == 1
+
+    def test_attaching_store_prunes_entries_past_stale_limit(self, db):
+        writer = ResponseCache(store=db)
+        writer.get("old", 60, lambda: "old")
+        writer.get("new", 60, lambda: "new")
+        db.save_cached_prices('{"usd": 0.1}')
+        db.execute_query(
+            "UPDATE cache SET last_updated = NOW() - INTERVAL '2 hours' "
+            "WHERE key IN ('api:old', 'prices')"
+        )
+
+        ResponseCache(max_stale_seconds=3600).attach_store(db)
+        keys = [row[0] for row in db.fetch_all("SELECT key FROM cache ORDER BY key")]
+        assert keys == ["api:new", "prices"]
+
+    def test_failed_prune_does_not_block_attach(self, cache):
+        store = MagicMock()
+        store.prune_cached_responses.side_effect = RuntimeError("locked")
+        cache.attach_store(store)
+        store.load_cached_response.return_value = ("stored", time.time())
+        assert cache.get("url", 60, MagicMock()) == "stored"
+
+
+class TestCacheTtls:
+
+    def test_profile_overrides_and_defaults(self):
+        profile = {"cache_ttl": {"balance": 5}}
+        with patch("src.api.cache.get_active_api_config", return_value=profile):
+            assert endpoint_ttl("balance") == 5
+            assert endpoint_ttl("halving") == 3600
+            assert endpoint_ttl("unknown") == 0
+
+    def test_stale_limits_default_to_cache_wide_limit(self):
+        profile = {"max_stale": {"hashrate": "60"}}
+        with patch("src.api.cache.get_active_api_config", return_value=profile):
+            assert endpoint_max_stale("hashrate") == 60
+            assert endpoint_max_stale("balance") == 0
+            assert endpoint_max_stale("halving") is None
+
+    def test_expired_persisted_balance_is_refetched(self, db):
+        address = "kaspa:qbalance"
+        url = DEFAULT_API_PROFILE["base_url"] + DEFAULT_API_PROFILE["endpoints"][
+            "balance"
+        ].format(kaspaAddress=address)
+        db.save_cached_response(url, {"balance": 1e8}, time.time() - 3600)
+        fetch = MagicMock(return_value={"balance": 2e8})
+        response_cache.clear()
+        try:
+            response_cache.attach_store(db)
+            with patch(
+                "src.api.network.get_active_api_config", return_value=DEFAULT_API_PROFILE
+            ), patch(
+                "src.api.cache.get_active_api_config", return_value=DEFAULT_API_PROFILE
+            ), patch.object(network, "_make_api_request", fetch):
+                assert network.fetch_address_balance(address) == 2.0
+        finally:
+            response_cache.attach_store(None)
+            response_cache.clear()
+        fetch.assert_called_once_with(url)
+
+    def test_cached_prices_respect_max_age(self, db):
+        db.save_cached_prices('{"usd": 0.1}')
+        db.execute_query(
+            "UPDATE cache SET last_updated = NOW() - INTERVAL '10 minutes' WHERE key = 'prices'"
+        )
+        assert db.get_cached_prices(max_age_seconds=3600) == {"usd": 0.1}
+        assert db.get_cached_prices(max_age_seconds=300) is None
+        assert db.get_cached_prices(expired=True, max_age_seconds=300) == {"usd": 0.1}
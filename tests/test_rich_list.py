@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from src.database import AppDataDB, initialize_app_data_schema
+from src.gui.tabs.top_addresses_tab import TopAddressesTab
+
+
+def _snapshot(rows):
+    return pd.DataFrame(rows, columns=["rank", "address", "balance"])
+
+
+class TestRichListSnapshots:
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        database = AppDataDB(str(tmp_path / "app_data.duckdb"), initialize_app_data_schema)
+        database.save_address_names(
+            [{"address": "kaspa:qexchange", "name": "Big Exchange"}]
+        )
+        yield database
+        database.close()
+
+    @pytest.fixture
+    def snapshots(self, db):
+        old_id = db.save_rich_list_snapshot(
+            _snapshot(
+                [
+                    (1, "kaspa:qwhale", 1000.0),
+                    (2, "kaspa:qexchange", 800.0),
+                    (3, "kaspa:qminer", 500.0),
+                ]
+            )
+        )
+        new_id = db.save_rich_list_snapshot(
+            _snapshot(
+                [
+                    (1, "kaspa:qexchange", 1200.0),
+                    (2, "kaspa:qwhale", 900.0),
+                    (3, "kaspa:qnewcomer", 600.0),
+                    (4, "kaspa:qminer", 450.0),
+                ]
+            )
+        )
+        return old_id, new_id
+
+    def test_snapshots_are_listed_newest_first(self, db, snapshots):
+        old_id, new_id = snapshots
+        assert [s[0] for s in db.get_rich_list_snapshots()] == [new_id, old_id]
+
+    def test_window_and_sort(self, db, snapshots):
+        _, new_id = snapshots
+        rows, total = db.query_rich_list(
+            new_id, sort_by="balance", descending=True, offset=1, limit=2
+        )
+        assert total == 4
+        assert [r["address"] for r in rows] == ["kaspa:qwhale", "kaspa:qnewcomer"]
+
+    def test_search_matches_name_address_and_rank(self, db, snapshots):
+        _, new_id = snapshots
+        rows, total = db.query_rich_list(new_id, search="exchange")
+        assert total == 1 and rows[0]["name"] == "Big Exchange"
+        rows, _ = db.query_rich_list(new_id, search="4")
+        assert [r["address"] for r in rows] == ["kaspa:qminer"]
+        rows, _ = db.query_rich_list(new_id, search="%")
+        assert rows == []
+
+    def test_diff_against_previous_snapshot(self, db, snapshots):
+        old_id, new_id = snapshots
+        rows, _ = db.query_rich_list(
+            new_id, compare_snapshot_id=old_id, sort_by="rank_change", descending=True
+        )
+        by_addr = {r["address"]: r for r in rows}
+        assert by_addr["kaspa:qexchange"]["rank_change"] == 1
+        assert by_addr["kaspa:qexchange"]["balance_change"] == pytest.approx(400.0)
+        assert by_addr["kaspa:qminer"]["rank_change"] == -1
+        assert by_addr["kaspa:qnewcomer"]["is_new"] is True
+        assert by_addr["kaspa:qnewcomer"]["rank_change"] is None
+        # New entries (no previous rank) sort last.
+        assert rows[0]["address"] == "kaspa:qexchange"
+        assert rows[-1]["address"] == "kaspa:qnewcomer"
+
+    def test_export_frame_follows_table_query(self, db, snapshots):
+        _, new_id = snapshots
+        tab = SimpleNamespace(main_window=SimpleNamespace(app_data_db=db))
+        df = TopAddressesTab.query_export_df(
+            tab, new_id, price=0.5, search="kaspa:q", sort_by="balance"
+        )
+        assert list(df["Address"]) == [
+            "kaspa:qminer", "kaspa:qnewcomer", "kaspa:qwhale", "kaspa:qexchange",
+        ]
+        assert list(df["Value"]) == [225.0, 300.0, 450.0, 600.0]
+        assert TopAddressesTab.query_export_df(tab, None, price=1.0).empty
+
+    def test_old_snapshots_are_pruned(self, db):
+        ids = [
+            db.save_rich_list_snapshot(_snapshot([(1, "kaspa:qwhale", float(i))]), keep=2)
+            for i in range(4)
+        ]
+        assert [s[0] for s in db.get_rich_list_snapshots(limit=10)] == ids[:-3:-1]
+        assert db.query_rich_list(ids[0])[1] == 0
@@ -0,0 +1,61 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.sampling_profiler import SamplingProfiler
+
+
+def _spin(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def busy_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=_spin, args=(stop,), name="FetchWorker", daemon=True)
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+class TestSamplingProfiler:
+
+    def test_collapsed_stacks_name_thread_and_frames(self, busy_thread, tmp_path):
+        profiler = SamplingProfiler()
+        for _ in range(5):
+            profiler.sample_once()
+        stacks = [s for s in profiler.collapsed() if s.startswith("FetchWorker;")]
+        assert stacks
+        assert all(";_spin_(test_sampling_profiler.py:" in s for s in stacks)
+
+        path = tmp_path / "out.collapsed"
+        profiler.write(str(path))
+        for line in path.read_text(encoding="utf-8").splitlines():
+            stack, count = line.rsplit(" ", 1)
+            assert " " not in stack and int(count) > 0
+
+    def test_background_sampling_stays_within_overhead(self, busy_thread, tmp_path):
+        profiler = SamplingProfiler(interval=0.005, flush_interval=0.1)
+        path = profiler.start(str(tmp_path))
+        time.sleep(0.5)
+        assert profiler.stop() == path
+        stats = profiler.stats()
+        assert not stats["running"]
+        assert stats["samples"] > 5
+        assert stats["overhead"] < 0.02
+        assert "FetchWorker;" in open(path, encoding="utf-8").read()
+        assert "StackSampler" not in open(path, encoding="utf-8").read()
+
+    def test_apply_settings_toggles_sampling(self, tmp_path):
+        profiler = SamplingProfiler()
+        with patch.dict("src.utils.sampling_profiler.CONFIG", {"paths": {"log": str(tmp_path)}}):
+            profiler.apply_settings({"profiler_enabled": True, "profiler_interval_ms": 50})
+            assert profiler.is_running
+            assert profiler.interval == pytest.approx(0.05)
+            profiler.apply_settings({"profiler_enabled": False})
+        assert not profiler.is_running
+        assert list(tmp_path.glob("profile_*.collapsed"))
@@ -0,0 +1,94 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.api.network import _get_with_retries, _make_api_request
+from src.api.single_flight import SingleFlight
+
+THREADS = 8
+
+
+def _run_concurrently(fn, count=THREADS):
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        return [f.result() for f in [pool.submit(fn) for _ in range(count)]]
+
+
+class TestSingleFlight:
+
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=THREADS) as pool:
+            leader = pool.submit(flight.do, "key", slow)
+            assert started.wait(5)
+            followers = [pool.submit(flight.do, "key", slow) for _ in range(THREADS - 1)]
+            while flight.stats()["coalesced"] < THREADS - 1:
+                pass
+            release.set()
+            results = [leader.result()] + [f.result() for f in followers]
+
+        assert results == ["result"] * THREADS
+        assert len(calls) == 1
+        assert flight.stats() == {
+            "calls": THREADS,
+            "executed": 1,
+            "coalesced": THREADS - 1,
+            "in_flight": 0,
+        }
+
+    def test_errors_reach_every_waiter_and_are_not_kept(self):
+        flight = SingleFlight()
+        with pytest.raises(ValueError):
+            flight.do("key", MagicMock(side_effect=ValueError("boom")))
+        assert flight.do("key", lambda: 1) == 1
+        assert flight.stats()["executed"] == 2
+
+    def test_different_keys_run_independently(self):
+        flight = SingleFlight()
+        assert flight.do("a", lambda: "a") == "a"
+        assert flight.do("b", lambda: "b") == "b"
+        assert flight.stats()["coalesced"] == 0
+
+
+@patch.dict(
+    "src.api.network.CONFIG",
+    {"performance": {"retry_attempts": 1, "timeout": 5, "backoff_factor": 0}},
+)
+class TestCoalescedRequests:
+
+    def test_identical_gets_share_one_http_request(self):
+        response = MagicMock(status_code=200)
+        response.json.side_effect = lambda: {"hashrate": 1.5}
+
+        def get(*_args, **_kwargs):
+            time.sleep(0.2)
+            return response
+
+        with patch("src.api.network._session.get", side_effect=get) as session_get:
+            results = _run_concurrently(
+                lambda: _make_api_request("https://api.test/info/hashrate")
+            )
+
+        assert results == [{"hashrate": 1.5}] * THREADS
+        assert session_get.call_count < THREADS
+        # Every caller decodes its own copy of the body.
+        assert len({id(r) for r in results}) == THREADS
+
+    def test_headers_are_part_of_the_key(self):
+        response = MagicMock(status_code=200)
+        with patch("src.api.network._session.get", return_value=response) as get:
+            _get_with_retries("https://api.test/names", {"If-None-Match": '"a"'})
+            _get_with_retries("https://api.test/names")
+        assert get.call_count == 2
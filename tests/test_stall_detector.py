@@ -0,0 +1,83 @@
+import time
+
+import pytest
+
+from src.gui.stall_detector import StallDetector
+from src.utils import metrics as metrics_module
+from src.utils.metrics import MetricsRegistry
+
+
+class FakeTk:
+    """Collects after() callbacks so the test drives the event loop."""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, func, *args):
+        self.pending.append((func, args))
+        return f"after#{len(self.pending)}"
+
+    def after_cancel(self, after_id):
+        pass
+
+    def run_pending(self):
+        pending, self.pending = self.pending, []
+        for func, args in pending:
+            func(*args)
+
+
+def slow_render(seconds):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        sum(range(1000))
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    reg = MetricsRegistry()
+    monkeypatch.setattr(metrics_module, "_registry", reg)
+    return reg
+
+
+@pytest.fixture
+def detector():
+    tk = FakeTk()
+    stall_detector = StallDetector(tk, threshold_ms=100, heartbeat_ms=10)
+    stall_detector.start()
+    yield stall_detector
+    stall_detector.stop()
+
+
+class TestStallDetector:
+
+    def test_prompt_heartbeat_is_not_a_stall(self, detector, registry):
+        time.sleep(0.01)
+        detector.widget.run_pending()
+        assert detector.report() == []
+        assert registry.snapshot()["histograms"]["tk.event_loop_lag"]["count"] == 1
+
+    def test_blocking_call_is_attributed_to_its_site(self, detector, registry):
+        slow_render(0.4)
+        detector.widget.run_pending()
+
+        [site] = detector.report()
+        assert site.site.startswith("slow_render (test_stall_detector.py:")
+        assert site.count == 1
+        assert site.max_seconds >= 0.3
+        assert any("slow_render" in line for line in site.example_stack)
+        snapshot = registry.snapshot()
+        assert snapshot["counters"]["tk.stalls"] == 1
+        assert snapshot["histograms"][f"tk.stall {site.site}"]["count"] == 1
+
+        # The next, prompt beat starts with no samples left over.
+        detector.widget.run_pending()
+        assert detector.report()[0].count == 1
+
+    def test_settings_toggle_and_threshold(self, detector):
+        detector.apply_settings({"stall_detector_enabled": False})
+        assert not detector.is_running
+        detector.apply_settings({"stall_threshold_ms": 5000})
+        assert detector.is_running
+        slow_render(0.2)
+        detector.widget.run_pending()
+        assert detector.report() == []
@@ -0,0 +1,102 @@
+import json
+import threading
+
+import pytest
+
+from src.utils.startup_benchmark import measure, summarize
+from src.utils.startup_trace import MARK_INTERACTIVE, MARK_WINDOW_SHOWN, StartupTracer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestStartupTracer:
+
+    def test_nested_spans_and_thread_names(self, clock):
+        tracer = StartupTracer(clock)
+        with tracer.span("deferred_initialization"):
+            clock.now += 0.5
+            with tracer.span("open TransactionDB", size="big"):
+                clock.now += 1.0
+
+        def worker():
+            with tracer.span("refresh_address_names"):
+                clock.now += 0.25
+
+        thread = threading.Thread(target=worker, name="_address_name_worker")
+        thread.start()
+        thread.join()
+
+        spans = {event["name"]: event for event in tracer.spans()}
+        outer, inner = spans["deferred_initialization"], spans["open TransactionDB"]
+        assert (outer["ts"], outer["dur"]) == (0, 1_500_000)
+        assert (inner["ts"], inner["dur"]) == (500_000, 1_000_000)
+        assert inner["args"] == {"size": "big"}
+        assert spans["refresh_address_names"]["tid"] != outer["tid"]
+
+        names = {
+            event["args"]["name"]
+            for event in tracer.to_chrome_trace()["traceEvents"]
+            if event["name"] == "thread_name"
+        }
+        assert names == {threading.current_thread().name, "_address_name_worker"}
+
+    def test_marks_once_and_stops_recording_at_finish(self, clock, tmp_path):
+        tracer = StartupTracer(clock)
+        clock.now += 0.8
+        assert tracer.mark(MARK_WINDOW_SHOWN) == pytest.approx(0.8)
+        assert tracer.mark(MARK_WINDOW_SHOWN) is None
+
+        path = tmp_path / "trace" / "startup.json"
+        tracer.configure(str(path))
+        assert tracer.finish() == str(path)
+        assert tracer.finish() is None
+
+        with tracer.span("after startup"):
+            pass
+        assert tracer.mark(MARK_INTERACTIVE) is None
+
+        trace = json.loads(path.read_text())
+        assert trace["otherData"]["marks"] == {MARK_WINDOW_SHOWN: pytest.approx(0.8)}
+        assert [e["name"] for e in trace["traceEvents"] if e["ph"] != "M"] == [
+            MARK_WINDOW_SHOWN
+        ]
+
+    def test_traced_decorator(self, clock):
+        tracer = StartupTracer(clock)
+
+        @tracer.traced()
+        def open_databases():
+            clock.now += 2
+            return "ok"
+
+        assert open_databases() == "ok"
+        assert tracer.spans()[0]["name"].endswith("open_databases")
+
+
+class TestStartupBenchmark:
+
+    def test_marks_are_measured_from_spawn(self):
+        trace = {"otherData": {"origin_epoch": 1000.5, "marks": {MARK_WINDOW_SHOWN: 1.0}}}
+        run = measure(trace, spawned_at=1000.0, wall=4.0)
+        assert run == {
+            "process_wall": 4.0,
+            "time_to_window": 1.5,
+            "time_to_interactive": None,
+        }
+
+    def test_summary(self):
+        runs = [{"time_to_window": value, "time_to_interactive": None} for value in (3, 1, 2)]
+        assert summarize(runs) == {
+            "time_to_window": {"min": 1, "median": 2, "p95": 3, "max": 3}
+        }